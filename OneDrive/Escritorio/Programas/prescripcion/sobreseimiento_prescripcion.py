@@ -17,9 +17,8 @@ Ejecución
 """
 from __future__ import annotations
 
-import sys, re
-from typing import List, Dict
-from collections import UserDict
+import os, sys, re
+from typing import List
 from pathlib import Path
 from datetime import datetime
 from PySide6.QtCore import Qt
@@ -31,30 +30,12 @@ from PySide6.QtWidgets import (
     QMessageBox, QSizePolicy
 )
 
-# ─────────────────────────────────────────────────────────── Helpers plantilla ──
+# el motor de plantillas está en la raíz del repositorio
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), *[os.pardir] * 4)))
 
-def _pronombres_imputados(sexos: List[str]) -> Dict[str, str]:
-    n = len(sexos)
-    cant_m = sexos.count("M"); cant_f = n - cant_m
-    if n == 1:
-        art = "el imputado" if sexos[0] == "M" else "la imputada"
-        asistido = "asistido" if sexos[0] == "M" else "asistida"
-        acusado = "acusado" if sexos[0] == "M" else "acusada"
-        le_les = "le"
-    else:
-        if cant_f == n:
-            art, asistido, acusado = "las imputadas", "asistidas", "acusadas"
-        elif cant_m == n:
-            art, asistido, acusado = "los imputados", "asistidos", "acusados"
-        else:
-            art, asistido, acusado = "los imputados", "asistidos", "acusados"
-        le_les = "les"
-    return {
-        "imputado_articulo": art,
-        "le_les": le_les,
-        "asistido_label": asistido,
-        "acusado_label": acusado,
-    }
+from motor_plantillas import compilar  # noqa: E402
+
+# ─────────────────────────────────────────────────────────── Helpers plantilla ──
 
 UNIDADES = (
     'cero', 'uno', 'dos', 'tres', 'cuatro', 'cinco',
@@ -113,11 +94,6 @@ def obtener_fecha_en_letras():
     mes_str = meses.get(mes_numero, '')
     return f"{dia_letras} de {mes_str} de {anio_letras}"
 
-class SafeDict(UserDict):
-    """Dict que devuelve el marcador sin reemplazar ante claves faltantes."""
-    def __missing__(self, key):
-        return "{" + key + "}"
-
 # Ordinales para numerar los hechos cuando hay más de uno
 ORDINALES_HECHOS = [
     "Primer",
@@ -137,56 +113,45 @@ ORDINALES_HECHOS = [
     "Decimoquinto",
 ]
 
-TEMPLATE = """
-<p align='justify'>Córdoba, {fecha_letras}.</p>
-<p align='justify'>VISTA: la presente causa caratulada {caratula}, venida a {este_esta} {tribunal} a los efectos de resolver la situación procesal de {nombre_apellido}</p>
-<p align='justify'>DE LA QUE RESULTA: Que {imputado_articulo} {nombre_apellido} se {le_les} atribuye {hechos_label}:</p>
-{hechos_html}
+def _ordinal(i: int) -> str:
+    return ORDINALES_HECHOS[i] if i < len(ORDINALES_HECHOS) else f"{i+1}°"
+
+TEMPLATE = compilar("""
+<p align='justify'>Córdoba, {{ fecha_letras }}.</p>
+<p align='justify'>VISTA: la presente causa caratulada {{ caratula }}, venida a {{ este_esta }} {{ tribunal }} a los efectos de resolver la situación procesal de {{ nombre_apellido }}</p>
+<p align='justify'>DE LA QUE RESULTA: Que {{ concordar(sexos, 'el imputado', 'la imputada', 'los imputados', 'las imputadas') }} {{ nombre_apellido }} se {{ numero(len(sexos), 'le', 'les') }} atribuye {{ numero(len(hechos), 'el siguiente hecho', 'los siguientes hechos') }}:</p>
+{% if len(hechos) == 1 %}
+<p align='justify'><i>{{ hechos[0] }}</i></p>
+{% elif hechos %}
+{% for i, hecho in enumerate(hechos) %}
+<p align='justify'><b>{{ ordinal(i) }} hecho:</b> <i>{{ hecho }}</i></p>
+{% endfor %}
+{% else %}
+[hechos]
+{% endif %}
 <p align='justify'><b>Y CONSIDERANDO:</b></p>
-<p align='justify'>I. Que durante la instrucción se colectaron los siguientes elementos probatorios: {prueba}</p>
-<p align='justify'>II. Que {fiscal_titulo} {fiscal} requiere el sobreseimiento {tipo_sobreseimiento} en la presente causa respecto de {nombre_apellido}, por {hechos_mencionados} supra, {encuadrado_bajo} bajo la calificación legal de {delitos}, en virtud de lo dispuesto por los arts. 348 y 350 inc. 4º del CPP, en función del art. 59 inc. 3º del CP, brindando los siguientes argumentos: {argumentos_fiscal}</p>
+<p align='justify'>I. Que durante la instrucción se colectaron los siguientes elementos probatorios: {{ prueba }}</p>
+<p align='justify'>II. Que {{ fiscal_titulo }} {{ fiscal }} requiere el sobreseimiento {{ tipo_sobreseimiento }} en la presente causa respecto de {{ nombre_apellido }}, por {{ hechos_mencionados }} supra, {{ encuadrado_bajo }} bajo la calificación legal de {{ delitos }}, en virtud de lo dispuesto por los arts. 348 y 350 inc. 4º del CPP, en función del art. 59 inc. 3º del CP, brindando los siguientes argumentos: {{ argumentos_fiscal }}</p>
 <p align='justify'><b>III. Conclusiones</b></p>
-<p align='justify'>Analizada la cuestión traída a estudio, se advierte que {hechos_atribuidos} a {nombre_apellido} {encuadra_n} efectivamente bajo la calificación legal de {delitos}, cuya pena máxima conminada en abstracto es de {penamaxima} de prisión. En este sentido, cabe aclarar que a los fines de computar el término para la prescripción del hecho imputado a {nombre_apellido} en los presentes autos se debe tener en cuenta {interrupcion}, conforme surge de la planilla prontuarial, del Registro Nacional de Reincidencia y del Sistema de Administración de Causas. En efecto, {fundamentacion}</p>
-<p align='justify'>Así, teniendo en cuenta los términos referidos, entiendo que corresponde desvincular de la presente causa al imputado {nombre_apellido} por la causal de procedencia descripta en el art. 350 inc. 4º del CPP. Ello así, porque, tal como lo manifestó {fiscal_articulo}, a la fecha, ha transcurrido con exceso el término establecido por el art. 62 inc. 2° del CP ({penamaxima} en este caso), el que desde la fecha {fechas_prescripcion} no fue interrumpido por la comisión de nuevos delitos, conforme surge de la planilla prontuarial y del informe del Registro Nacional de Reincidencia incorporados digitalmente, y no procede ninguna de las causales contempladas por el art. 67 del CP, motivo por el cual ha de tenerse a la prescripción como causal de previo y especial pronunciamiento. Así lo establece el alto tribunal de esta provincia: “…Esta Sala, compartiendo la posición ya asumida por otra integración y por mayoría (A. nº 76, 29/6/93, &quot;Cappa&quot;; A. nº 60, 14/6/94, &quot;Vivian&quot;), ha sostenido que habida cuenta de la naturaleza sustancial de las distintas causales de sobreseimiento, las extintivas de la acción deben ser de previa consideración (T.S.J., Sala Penal, A. n° 26, 19/2/99, &quot;Rivarola&quot;; &quot;Pérez&quot;, cit.). Por ello, la sola presencia de una causal extintiva de la acción -en el caso, la prescripción- debe ser estimada independientemente cualquiera sea la oportunidad de su producción y de su conocimiento por el Tribunal, toda vez que -en términos procesales- significa un impedimento para continuar ejerciendo los poderes de acción y de jurisdicción en procura de un pronunciamiento sobre el fondo (TSJ, Sala Penal, “CARUNCHIO, Oscar Rubén p.s.a. Homicidio Culposo -Recurso de Casación-” -Expte. &quot;C&quot;, 36/03-, S. n.° 104 de fecha 16/9/2005).</p>
-<p align='justify'>IV. En consecuencia, y de conformidad a lo normado por los arts. 59 inc. 3° y 62 inc. 2° del CP y 350 del CPP, corresponde declarar prescripta la pretensión punitiva penal emergente {hechos_configurativos} de {delitos} que se le {atribuia_n} a {nombre_apellido}.</p>
+<p align='justify'>Analizada la cuestión traída a estudio, se advierte que {{ hechos_atribuidos }} a {{ nombre_apellido }} {{ encuadra_n }} efectivamente bajo la calificación legal de {{ delitos }}, cuya pena máxima conminada en abstracto es de {{ penamaxima }} de prisión. En este sentido, cabe aclarar que a los fines de computar el término para la prescripción del hecho imputado a {{ nombre_apellido }} en los presentes autos se debe tener en cuenta {{ interrupcion }}, conforme surge de la planilla prontuarial, del Registro Nacional de Reincidencia y del Sistema de Administración de Causas. En efecto, {{ fundamentacion }}</p>
+<p align='justify'>Así, teniendo en cuenta los términos referidos, entiendo que corresponde desvincular de la presente causa {{ concordar(sexos, 'al imputado', 'a la imputada', 'a los imputados', 'a las imputadas') }} {{ nombre_apellido }} por la causal de procedencia descripta en el art. 350 inc. 4º del CPP. Ello así, porque, tal como lo manifestó {{ fiscal_articulo }}, a la fecha, ha transcurrido con exceso el término establecido por el art. 62 inc. 2° del CP ({{ penamaxima }} en este caso), el que desde la fecha {{ fechas_prescripcion }} no fue interrumpido por la comisión de nuevos delitos, conforme surge de la planilla prontuarial y del informe del Registro Nacional de Reincidencia incorporados digitalmente, y no procede ninguna de las causales contempladas por el art. 67 del CP, motivo por el cual ha de tenerse a la prescripción como causal de previo y especial pronunciamiento. Así lo establece el alto tribunal de esta provincia: “…Esta Sala, compartiendo la posición ya asumida por otra integración y por mayoría (A. nº 76, 29/6/93, &quot;Cappa&quot;; A. nº 60, 14/6/94, &quot;Vivian&quot;), ha sostenido que habida cuenta de la naturaleza sustancial de las distintas causales de sobreseimiento, las extintivas de la acción deben ser de previa consideración (T.S.J., Sala Penal, A. n° 26, 19/2/99, &quot;Rivarola&quot;; &quot;Pérez&quot;, cit.). Por ello, la sola presencia de una causal extintiva de la acción -en el caso, la prescripción- debe ser estimada independientemente cualquiera sea la oportunidad de su producción y de su conocimiento por el Tribunal, toda vez que -en términos procesales- significa un impedimento para continuar ejerciendo los poderes de acción y de jurisdicción en procura de un pronunciamiento sobre el fondo (TSJ, Sala Penal, “CARUNCHIO, Oscar Rubén p.s.a. Homicidio Culposo -Recurso de Casación-” -Expte. &quot;C&quot;, 36/03-, S. n.° 104 de fecha 16/9/2005).</p>
+<p align='justify'>IV. En consecuencia, y de conformidad a lo normado por los arts. 59 inc. 3° y 62 inc. 2° del CP y 350 del CPP, corresponde declarar prescripta la pretensión punitiva penal emergente {{ hechos_configurativos }} de {{ delitos }} que se le {{ atribuia_n }} a {{ nombre_apellido }}.</p>
 <p align='justify'>V. Finalmente, deberá oficiarse a la Policía de la Provincia de Córdoba y al Registro Nacional de Reincidencia a fin de informar lo aquí resuelto.</p>
 <p align='justify'>Por lo expresado y disposiciones legales citadas; <b>RESUELVO:</b></p>
-<p align='justify'>I. Sobreseer {sobreseimiento_tipo}, respecto {hecho_plural} de {fechas} {fechasdeloshechos}, a {nombre_apellido}, de condiciones personales ya relacionadas, por {hecho_calificado} como {delitos}, de conformidad con lo establecido por los arts. 348 y 350 inc. 4º del CPP, en función de los arts. 59 inc. 3º, 62 inc. 2º y 67 del CP.</p>
+<p align='justify'>I. Sobreseer {{ sobreseimiento_tipo }}, respecto {{ hecho_plural }} de {{ fechas }} {{ fechasdeloshechos }}, a {{ nombre_apellido }}, de condiciones personales ya relacionadas, por {{ hecho_calificado }} como {{ delitos }}, de conformidad con lo establecido por los arts. 348 y 350 inc. 4º del CPP, en función de los arts. 59 inc. 3º, 62 inc. 2º y 67 del CP.</p>
 <p align='justify'>II. Ofíciese a la Policía de la Provincia de Córdoba y al Registro Nacional de Reincidencia, a sus efectos.</p>
 <p align='justify'>PROTOCOLÍCESE Y NOTIFÍQUESE.</p>
-"""
-
-def render_prescripcion(*, sexos_imputados: List[str], nombres: List[str], hechos: List[str], **campos) -> str:
-    auto = _pronombres_imputados(sexos_imputados)
-    auto["hechos_label"] = "el siguiente hecho" if len(hechos) == 1 else "los siguientes hechos"
-
-    imp_lines = []
-    for idx, (nom, sx) in enumerate(zip(nombres, sexos_imputados), start=1):
-        art = "el imputado" if sx == "M" else "la imputada"
-        imp_lines.append(f"{idx}. {art} {nom}")
-    if len(hechos) == 1:
-        hechos_html = f"<p align='justify'><i>{hechos[0]}</i></p>"
-    else:
-        lines = []
-        for i, txt in enumerate(hechos):
-            ordinal = (
-                ORDINALES_HECHOS[i]
-                if i < len(ORDINALES_HECHOS)
-                else f"{i+1}°"
-            )
-            lines.append(
-                f"<p align='justify'><b>{ordinal} hecho:</b> <i>{txt}</i></p>"
-            )
-        hechos_html = "\n".join(lines)
+""", "prescripcion", ayudantes={"ordinal": _ordinal})
 
-    auto["imputados_html"] = "\n".join(
-        f"<p align='justify'>{l}</p>" for l in imp_lines
-    ) or "[imputados]"
-    auto["hechos_html"] = hechos_html or "[hechos]"
+def render_prescripcion(*, sexos_imputados: List[str], hechos: List[str], **campos) -> str:
+    """El auto de sobreseimiento; ``campos`` completa los datos de la plantilla.
 
-    data = SafeDict(auto)
-    data.update(campos)
-    return TEMPLATE.format_map(data)
+    Los que no vengan quedan a la vista como ``{nombre}``, para completarlos
+    a mano en el escrito.
+    """
+    contexto = {v: "{" + v + "}" for v in TEMPLATE.variables}
+    contexto.update(campos, sexos=sexos_imputados, hechos=hechos)
+    return TEMPLATE(**contexto)
 
 # ───────────────────────────────────────────────────────────── Widgets ──
 class ImputadoWidget(QWidget):
@@ -313,7 +278,6 @@ class PrescripcionGUI(QWidget):
         }
         html = render_prescripcion(
             sexos_imputados=sexos,
-            nombres=nombres_datos,
             hechos=hechos,
             **campos,
         )
@@ -0,0 +1,105 @@
+# anclas.py
+"""Registro de las anclas editables de la plantilla.
+
+Cada dato editable de la sentencia sale como ``<a href=…>``. Antes el
+``href`` era la clave legible (``edit_imp_nombre_3``) y al hacer clic se la
+volvía a desarmar con ``startswith``/``rsplit``. Ahora cada clave se registra
+una sola vez: recibe un id corto y estable (``a17``) que es lo que va en el
+``href``, y queda desarmada en un ``Ancla`` (grupo, campo, índice). Con eso:
+
+* el clic se resuelve con una búsqueda en un diccionario;
+* ``anchor()`` puede memorizar el HTML ya escapado de cada ancla, porque el
+  id de una clave no cambia entre renders;
+* cualquier otra herramienta puede recorrer las anclas registradas.
+"""
+from functools import lru_cache
+import html
+from threading import Lock
+from typing import Iterator, NamedTuple
+
+MAX_CACHE = 1024
+
+# grupos con índice: edit_<grupo>_<campo>_<n>
+_GRUPOS = ("imp", "hecho")
+
+
+class Ancla(NamedTuple):
+    """Un dato editable de la plantilla."""
+
+    clave: str               # "edit_imp_nombre_3", "edit_fiscal", "resuelvo"…
+    grupo: str               # "imp", "hecho" o "" (datos generales)
+    campo: str               # "nombre", "num_auto", "fiscal", "resuelvo"…
+    indice: int | None       # imputado/hecho, si corresponde
+    id: str                  # lo que va en el href
+
+
+def _desarmar(clave: str) -> tuple[str, str, int | None]:
+    resto = clave[len("edit_"):] if clave.startswith("edit_") else clave
+    for grupo in _GRUPOS:
+        if resto.startswith(grupo + "_"):
+            campo, _, n = resto[len(grupo) + 1:].rpartition("_")
+            if campo and n.isdigit():
+                return grupo, campo, int(n)
+    return "", resto, None
+
+
+class RegistroAnclas:
+    """Claves ↔ ids cortos, asignados al vuelo y estables de por vida."""
+
+    def __init__(self, prefijo: str = "a"):
+        self._prefijo = prefijo
+        self._por_clave: dict[str, Ancla] = {}
+        self._por_id: dict[str, Ancla] = {}
+        self._lock = Lock()
+
+    def registrar(self, clave: str) -> Ancla:
+        ancla = self._por_clave.get(clave)
+        if ancla is None:
+            with self._lock:
+                ancla = self._por_clave.get(clave)
+                if ancla is None:
+                    grupo, campo, indice = _desarmar(clave)
+                    ident = f"{self._prefijo}{len(self._por_clave)}"
+                    ancla = Ancla(clave, grupo, campo, indice, ident)
+                    self._por_clave[clave] = ancla
+                    self._por_id[ident] = ancla
+        return ancla
+
+    def id_de(self, clave: str) -> str:
+        return self.registrar(clave).id
+
+    def ancla(self, href: str) -> Ancla | None:
+        """El ``Ancla`` de un ``href`` de la plantilla (o ``None``)."""
+        return self._por_id.get(href)
+
+    def __iter__(self) -> Iterator[Ancla]:
+        return iter(list(self._por_clave.values()))
+
+    def __len__(self) -> int:
+        return len(self._por_clave)
+
+
+ANCLAS = RegistroAnclas()
+
+
+@lru_cache(maxsize=MAX_CACHE)
+def anchor(texto, clave, placeholder=None):
+    """Genera una ancla editable para la plantilla."""
+    if not texto.strip():
+        texto = placeholder or f"[{clave}]"
+    return (
+        f'<a href="{ANCLAS.id_de(clave)}" '
+        f'style="color:blue;text-decoration:none;">'
+        f"{html.escape(texto)}</a>"
+    )
+
+
+def anchor_html(html_text, clave, placeholder=None):
+    """Ancla que conserva HTML interno (negrita, p, etc.)."""
+    if not html_text.strip():
+        return anchor("", clave, placeholder)
+    return (
+        f'<a href="{ANCLAS.id_de(clave)}" '
+        f'style="color:blue;text-decoration:none;">'
+        f"{html_text}</a>"
+    )
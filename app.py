@@ -1,14 +1,26 @@
-from PySide6.QtWidgets import QApplication
-from core_data import CausaData
-from main import MainWindow
+import arranque                      # primero: desde acá se mide el arranque
 import sys
-from PySide6.QtGui import QIcon
-from main import resource_path
 
 if __name__ == "__main__":
+    if getattr(sys, "frozen", False):   # el pool de “Generar todo” en el .exe
+        import multiprocessing
+        multiprocessing.freeze_support()
+    # el resto recién acá: los procesos del pool (spawn, en Windows) vuelven
+    # a ejecutar este archivo y sólo necesitan ``exportar``, no Qt ni la ventana
+    from PySide6.QtWidgets import QApplication
+    from PySide6.QtGui import QIcon
+    from core_data import CausaData
+    from main import MainWindow, resource_path
+    import autoguardado
+
+    arranque.marcar("importaciones")
     app   = QApplication(sys.argv)
+    arranque.id_de_aplicacion()
     app.setWindowIcon(QIcon(resource_path("icono5.ico")))
     model = CausaData.instance()         # la única copia
     win   = MainWindow(model)
+    arranque.marcar("ventana armada")
+    # diario de la sesión y recuperación, ya con la ventana a la vista
+    arranque.al_primer_pintado(win, lambda: autoguardado.iniciar(model, win))
     win.show()
     sys.exit(app.exec())
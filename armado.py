@@ -0,0 +1,96 @@
+# armado.py
+"""Armado de los escritos en un hilo aparte.
+
+Los oficios se escribían directamente en el ``QTextEdit`` visible: cada
+inserción disparaba la diagramación incremental en el hilo de la interfaz y
+después venían las pasadas de negritas. Acá cada escrito se arma sobre un
+``QTextDocument`` suelto, sin editor, en un hilo de trabajo; el documento
+terminado se pasa al hilo de la interfaz y se cuelga del editor de una sola
+vez (``setDocument``), así que la interfaz nunca queda a mitad de camino.
+
+``armar`` es una función que recibe el documento vacío y lo completa; no
+puede tocar widgets: todo lo que lea del formulario tiene que venir ya
+resuelto en la clausura. Los pedidos corren de a uno (un solo hilo), así
+que las plantillas compartidas no se pisan entre sí. Si ``armar`` falla, en
+lugar de ``listo`` se emite ``fallo`` con la excepción, para que quien pidió
+no se quede esperando un documento que nunca va a llegar.
+"""
+from concurrent.futures import Future, ThreadPoolExecutor
+import traceback
+
+from PySide6.QtCore import QCoreApplication, QObject, Signal, Slot
+from PySide6.QtGui import QTextDocument
+
+
+def _armar(armar) -> QTextDocument:
+    doc = QTextDocument()
+    doc.setUndoRedoEnabled(False)
+    armar(doc)
+    # nace en el hilo de trabajo; sólo desde acá se lo puede mudar
+    doc.moveToThread(QCoreApplication.instance().thread())
+    return doc
+
+
+def _resultado(futuro: Future):
+    """El documento de ``futuro`` o, si ``armar`` falló, la excepción (ya informada)."""
+    try:
+        return futuro.result()
+    except Exception as e:
+        traceback.print_exception(e)
+        return e
+
+
+class ArmadoEnHilo(QObject):
+    """Arma documentos fuera de la interfaz; ``listo`` trae el último de cada clave."""
+
+    listo = Signal(object, object)        # clave, QTextDocument
+    fallo = Signal(object, object)        # clave, excepción de ``armar``
+    _terminado = Signal(object, int, object)
+
+    def __init__(self, parent: QObject | None = None):
+        super().__init__(parent)
+        self._pool = ThreadPoolExecutor(max_workers=1)
+        self._generacion = 0
+        # clave (cualquier valor hasheable) → (generación, futuro) del pedido vigente
+        self._pendientes: dict[object, tuple[int, Future]] = {}
+        self._terminado.connect(self._entregar)
+
+    @property
+    def ocupado(self) -> bool:
+        return bool(self._pendientes)
+
+    def pedir(self, clave, armar) -> None:
+        """Arma en segundo plano; un pedido nuevo de la misma clave pisa al anterior."""
+        self._generacion += 1
+        generacion = self._generacion
+        futuro = self._pool.submit(_armar, armar)
+        self._pendientes[clave] = (generacion, futuro)
+        futuro.add_done_callback(lambda f: self._avisar(clave, generacion, f))
+
+    def esperar(self, clave=None) -> None:
+        """Entrega ya lo pendiente (de ``clave`` o de todas), bloqueando si hace falta."""
+        claves = [clave] if clave is not None else list(self._pendientes)
+        for c in claves:
+            if c in self._pendientes:
+                generacion, futuro = self._pendientes[c]
+                self._entregar(c, generacion, _resultado(futuro))
+
+    def cancelar(self, clave) -> None:
+        """Descarta el pedido en curso de ``clave``."""
+        self._pendientes.pop(clave, None)
+
+    def _avisar(self, clave, generacion: int, futuro: Future) -> None:
+        # corre en el hilo de trabajo: sólo se emite (la conexión es encolada)
+        self._terminado.emit(clave, generacion, _resultado(futuro))
+
+    @Slot(object, int, object)
+    def _entregar(self, clave, generacion: int, resultado) -> None:
+        # un resultado viejo (o ya entregado por ``esperar``) llega tarde
+        vigente = self._pendientes.get(clave)
+        if vigente is None or vigente[0] != generacion:
+            return
+        del self._pendientes[clave]
+        if isinstance(resultado, Exception):
+            self.fallo.emit(clave, resultado)
+        else:
+            self.listo.emit(clave, resultado)
@@ -0,0 +1,80 @@
+# arranque.py
+"""Medición del arranque: importaciones y primer pintado de la ventana.
+
+Se importa antes que nada en el punto de entrada (``T0`` queda en ese
+instante) y ``marcar`` anota cada etapa. ``al_primer_pintado`` espera el
+primer ``Paint`` de la ventana principal para cerrar la cuenta: ese es el
+momento en que el usuario ve algo, que es lo que importa.
+
+Con la variable de entorno ``TRAMITES_ARRANQUE`` el informe sale por
+``stderr``; con ``TRAMITES_ARRANQUE=salir`` además la aplicación se cierra
+apenas pinta, que es lo que usa ``benchmarks/arranque.py`` para medir el
+arranque en frío y avisar si vuelve a cargarse algo pesado antes de tiempo.
+"""
+import os
+import sys
+import time
+
+T0 = time.perf_counter()
+_marcas: list[tuple[str, float]] = []
+
+# lo que no tiene por qué estar cargado cuando se muestra la ventana
+DIFERIDOS = ("docx", "tramsent", "sentencia_window", "concurrent.futures.process")
+
+
+def marcar(etapa: str) -> None:
+    _marcas.append((etapa, time.perf_counter()))
+
+
+def informe() -> str:
+    lineas, anterior = [], T0
+    for etapa, t in _marcas:
+        lineas.append(f"  {etapa:<22}{(t - anterior) * 1000:8.1f} ms"
+                      f"   (total {(t - T0) * 1000:7.1f} ms)")
+        anterior = t
+    cargados = [m for m in DIFERIDOS if m in sys.modules]
+    lineas.append("  diferidos ya cargados: " + (", ".join(cargados) or "ninguno"))
+    return "Arranque:\n" + "\n".join(lineas)
+
+
+def al_primer_pintado(ventana, luego=None) -> None:
+    """Marca ``primer pintado`` cuando ``ventana`` se pinta por primera vez.
+
+    ``luego`` (opcional) corre a continuación: lo que puede esperar a que la
+    ventana ya esté a la vista.
+    """
+    from PySide6.QtCore import QEvent, QObject, QTimer
+    from PySide6.QtWidgets import QApplication
+
+    modo = os.environ.get("TRAMITES_ARRANQUE", "")
+
+    class _Espia(QObject):
+        # sólo en la ventana: un filtro de toda la aplicación pasaría cada
+        # evento del arranque por Python y lo haría bastante más lento
+        def eventFilter(self, obj, ev):
+            if ev.type() == QEvent.Paint:
+                ventana.removeEventFilter(self)
+                # la ventana se pinta antes que sus hijos: se cuenta cuando
+                # termina esa vuelta de pintado
+                QTimer.singleShot(0, terminar)
+            return False
+
+    def terminar():
+        marcar("primer pintado")
+        if luego is not None:
+            luego()
+        if modo:
+            print(informe(), file=sys.stderr, flush=True)
+        if modo == "salir":
+            # ``exit`` y no ``quit``: ``quit`` pasa por el closeEvent que pregunta
+            QApplication.exit(0)
+
+    ventana.installEventFilter(_Espia(ventana))
+
+
+def id_de_aplicacion() -> None:
+    """Identificador propio en la barra de tareas de Windows (antes lo ponía tramsent)."""
+    if sys.platform == "win32":
+        import ctypes
+        ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(
+            "com.miempresa.miproducto.1.0")
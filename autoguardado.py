@@ -0,0 +1,259 @@
+# autoguardado.py
+"""Autoguardado de la causa en un diario por sesión, con recuperación.
+
+Hasta ahora nada se guardaba hasta apretar “Guardar causa”: si la
+aplicación se colgaba o se cortaba la luz se perdía todo lo cargado. Acá
+cada sesión lleva un diario en ``autoguardado/``:
+
+* ``sesion-….jsonl`` — una línea JSON por cambio del modelo (``Diario``
+  está suscripto a ``CausaData``), con un número de secuencia:
+  ``[n, campo, valor]``, ``[n, lista, índice, campo, valor]`` para un campo
+  de un imputado o hecho, o ``[n, lista, [registros…]]`` cuando cambia la
+  lista entera;
+* ``sesion-….json`` — una foto completa de la causa hasta cierta secuencia.
+  Cada tanto (``COMPACTAR_CADA`` cambios o ``FOTO_CADA_MS``) se saca una
+  nueva y el diario vuelve a empezar vacío;
+* ``sesion-….lock`` — un ``QLockFile`` que dice que la sesión sigue viva.
+
+Los cambios se juntan en memoria y se escriben a lo sumo una vez por
+``VOLCAR_CADA_MS``; la escritura (JSON incluido) corre en un hilo aparte,
+así que la interfaz nunca espera al disco. La foto se escribe en un
+temporal y se renombra, de modo que siempre hay una entera; una línea
+cortada al final del diario simplemente se ignora al recuperar.
+
+Al cerrar normalmente la sesión se borra. Si al arrancar queda una cuyo
+candado ya no tiene dueño, la aplicación se cerró mal: ``iniciar`` ofrece
+recuperarla (foto + cambios posteriores) antes de empezar la nueva.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+import os
+import traceback
+
+from PySide6.QtCore import QLockFile, QObject, QTimer
+from PySide6.QtWidgets import QApplication, QMessageBox
+
+from esquema_causa import cargar_json, volcar_json
+import historial
+
+CARPETA = Path("autoguardado")
+VOLCAR_CADA_MS = 1000           # los cambios se escriben a lo sumo una vez por segundo
+FOTO_CADA_MS = 5 * 60 * 1000
+COMPACTAR_CADA = 500            # cambios en el diario antes de sacar otra foto
+
+_LISTAS = ("imputados", "hechos")
+
+
+def _escribir_atomico(ruta: Path, datos: bytes) -> None:
+    """Escribe ``ruta`` entera o no la toca: temporal + ``os.replace``."""
+    temporal = ruta.with_name(ruta.name + ".tmp")
+    with open(temporal, "wb") as fh:
+        fh.write(datos)
+        fh.flush()
+        os.fsync(fh.fileno())
+    os.replace(temporal, ruta)
+
+
+def _en_hilo(funcion):
+    """Lo que corre en el hilo de escritura: un error se informa, no se propaga."""
+    def envoltura(*args):
+        try:
+            funcion(*args)
+        except Exception as e:          # el autoguardado nunca tira abajo la aplicación
+            traceback.print_exception(e)
+    return envoltura
+
+
+class Diario(QObject):
+    """Anota cada cambio de ``data`` en el diario de esta sesión."""
+
+    def __init__(self, data, carpeta: Path = CARPETA, parent: QObject | None = None):
+        super().__init__(parent)
+        carpeta.mkdir(exist_ok=True)
+        base = carpeta / f"sesion-{datetime.now():%Y%m%d-%H%M%S}-{os.getpid()}"
+        self._diario = base.with_suffix(".jsonl")
+        self._foto = base.with_suffix(".json")
+        self._candado = QLockFile(str(base.with_suffix(".lock")))
+        self._candado.lock()
+
+        self._data = data
+        self._hilo = ThreadPoolExecutor(max_workers=1)
+        self._secuencia = 0
+        self._pendientes: list[list] = []
+        self._desde_foto = 0
+        self._cerrado = False
+
+        self._volcado = QTimer(self, singleShot=True, interval=VOLCAR_CADA_MS)
+        self._volcado.timeout.connect(self._volcar)
+        self._periodica = QTimer(self, interval=FOTO_CADA_MS)
+        self._periodica.timeout.connect(self._foto_periodica)
+        self._periodica.start()
+
+        data.suscribir(self._cambio)
+        self.foto()
+
+    # — en el hilo de la interfaz —
+    def _cambio(self, campo: str, registro=None) -> None:
+        self._secuencia += 1
+        if registro is not None:
+            lista, clave = campo.split(".", 1)
+            idx = next((i for i, r in enumerate(getattr(self._data, lista))
+                        if r is registro), None)
+            if idx is None:             # un registro que ya no está en la causa
+                return
+            delta = [self._secuencia, lista, idx, clave, getattr(registro, clave)]
+        elif campo in _LISTAS:
+            delta = [self._secuencia, campo, [r.a_dict() for r in getattr(self._data, campo)]]
+        else:
+            delta = [self._secuencia, campo, getattr(self._data, campo)]
+        self._pendientes.append(delta)
+        self._desde_foto += 1
+        if not self._volcado.isActive():
+            self._volcado.start()
+
+    def _volcar(self) -> None:
+        if self._desde_foto >= COMPACTAR_CADA:
+            self.foto()
+        elif self._pendientes:
+            pendientes, self._pendientes = self._pendientes, []
+            self._hilo.submit(self._agregar, pendientes)
+
+    def _foto_periodica(self) -> None:
+        if self._desde_foto:
+            self.foto()
+
+    def foto(self) -> None:
+        """Saca una foto completa y deja el diario vacío (compactación)."""
+        foto = {
+            "secuencia": self._secuencia,
+            "guardada": datetime.now().isoformat(timespec="seconds"),
+            "causa": self._data.a_dict(),       # copia: el hilo no toca el modelo
+        }
+        self._pendientes.clear()
+        self._desde_foto = 0
+        self._hilo.submit(self._escribir_foto, foto)
+
+    def cerrar(self, descartar: bool = True) -> None:
+        """Fin de la sesión: borra el diario (o lo vuelca, si ``descartar`` es False)."""
+        if self._cerrado:
+            return
+        self._cerrado = True
+        self._volcado.stop()
+        self._periodica.stop()
+        self._data.desuscribir(self._cambio)
+        if descartar:
+            self._hilo.submit(self._borrar)
+        else:
+            self._volcar()
+        self._hilo.shutdown(wait=True)
+        self._candado.unlock()
+
+    # — en el hilo de escritura —
+    @_en_hilo
+    def _agregar(self, deltas: list) -> None:
+        with open(self._diario, "ab") as fh:
+            fh.write(b"".join(volcar_json(d) + b"\n" for d in deltas))
+            fh.flush()
+            os.fsync(fh.fileno())
+
+    @_en_hilo
+    def _escribir_foto(self, foto: dict) -> None:
+        _escribir_atomico(self._foto, volcar_json(foto))
+        # lo anterior a la foto ya está en ella: el diario vuelve a empezar
+        open(self._diario, "wb").close()
+
+    @_en_hilo
+    def _borrar(self) -> None:
+        for ruta in (self._diario, self._foto):
+            ruta.unlink(missing_ok=True)
+
+
+# ───────────── recuperación ─────────────
+def _aplicar(causa: dict, delta: list) -> None:
+    if len(delta) == 5:
+        _, lista, idx, clave, valor = delta
+        registros = causa.setdefault(lista, [])
+        while len(registros) <= idx:
+            registros.append({})
+        registros[idx][clave] = valor
+    elif len(delta) == 3:
+        _, campo, valor = delta
+        causa[campo] = valor
+
+
+def recuperar(foto: Path) -> tuple[dict, str]:
+    """La causa de una sesión: su foto más los cambios posteriores del diario.
+
+    Devuelve ``(causa, cuándo)``; ``cuándo`` es la hora del último cambio.
+    """
+    datos = cargar_json(foto.read_bytes())
+    causa, desde = datos["causa"], datos.get("secuencia", 0)
+    diario = foto.with_suffix(".jsonl")
+    if diario.exists():
+        for linea in diario.read_bytes().splitlines():
+            try:
+                delta = cargar_json(linea)
+            except ValueError:          # la última, cortada a mitad de escritura
+                continue
+            if isinstance(delta, list) and delta and delta[0] > desde:
+                _aplicar(causa, delta)
+    cuando = datetime.fromtimestamp(max(
+        foto.stat().st_mtime, diario.stat().st_mtime if diario.exists() else 0))
+    return causa, f"{cuando:%d/%m/%Y %H:%M}"
+
+
+def sesiones_perdidas(carpeta: Path = CARPETA) -> list[tuple[Path, QLockFile]]:
+    """Sesiones cuyo candado quedó sin dueño, la más reciente primero.
+
+    Cada una viene con su candado ya tomado, para que otra instancia de la
+    aplicación no la recupere al mismo tiempo.
+    """
+    perdidas = []
+    for foto in sorted(carpeta.glob("sesion-*.json"), reverse=True):
+        candado = QLockFile(str(foto.with_suffix(".lock")))
+        # un candado de un proceso que ya no existe se considera vencido
+        if candado.tryLock(0):
+            perdidas.append((foto, candado))
+    return perdidas
+
+
+def _descartar(foto: Path, candado: QLockFile) -> None:
+    for ruta in (foto, foto.with_suffix(".jsonl")):
+        ruta.unlink(missing_ok=True)
+    candado.unlock()
+
+
+def ofrecer_recuperacion(data, parent=None, carpeta: Path = CARPETA) -> bool:
+    """Si la sesión anterior terminó mal, pregunta si se recupera; True si se recuperó."""
+    if not carpeta.is_dir():
+        return False
+    perdidas = sesiones_perdidas(carpeta)
+    recuperada = False
+    for foto, candado in perdidas:
+        if not recuperada:
+            try:
+                causa, cuando = recuperar(foto)
+            except (OSError, ValueError, KeyError, TypeError):
+                causa = None            # foto ilegible: no hay nada que ofrecer
+            if causa is not None and QMessageBox.question(
+                parent, "Recuperar causa",
+                "La aplicación no se cerró correctamente.\n"
+                f"Hay datos sin guardar del {cuando}"
+                + (f" (causa «{causa.get('caratula')}»)" if causa.get("caratula") else "")
+                + ".\n\n¿Desea recuperarlos?",
+                QMessageBox.Yes | QMessageBox.No, QMessageBox.Yes,
+            ) == QMessageBox.Yes:
+                data.cargar(causa)
+                historial.de(data).limpiar()    # lo recuperado no se deshace
+                recuperada = True
+        _descartar(foto, candado)
+    return recuperada
+
+
+def iniciar(data, ventana) -> Diario:
+    """Ofrece recuperar la sesión anterior y empieza a anotar la nueva."""
+    ofrecer_recuperacion(data, ventana)
+    diario = Diario(data, parent=ventana)
+    QApplication.instance().aboutToQuit.connect(diario.cerrar)
+    return diario
@@ -0,0 +1,96 @@
+# benchmarks/arranque.py
+"""Arranque en frío de la aplicación: importaciones y primer pintado.
+
+Lanza ``app.py`` varias veces en procesos nuevos (cada uno en una carpeta
+temporal, para no tocar el autoguardado de verdad) con
+``TRAMITES_ARRANQUE=salir``: la aplicación imprime el informe de
+``arranque`` apenas pinta la ventana principal y se cierra. Muestra la
+mediana de cada etapa, los módulos que más tardan en importarse
+(``-X importtime``) y falla si el primer pintado pasa de ``--limite`` ms o
+si se cargó antes de tiempo algo de ``arranque.DIFERIDOS`` (python-docx,
+la sentencia…), que es lo que pasa cuando alguien vuelve a importarlo
+arriba de todo.
+
+    python benchmarks/arranque.py [--veces 5] [--limite 1500]
+
+Sin pantalla: ``QT_QPA_PLATFORM=offscreen python benchmarks/arranque.py``.
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(RAIZ, "app.py")
+
+_RE_ETAPA = re.compile(r"^\s+(.+?)\s+([\d.]+) ms\s+\(total\s+([\d.]+) ms\)")
+_RE_IMPORT = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def una_vez(*opciones: str) -> tuple[dict, str, str]:
+    """Corre la aplicación hasta el primer pintado; ``(etapas, diferidos, stderr)``."""
+    entorno = dict(os.environ, TRAMITES_ARRANQUE="salir",
+                   PYTHONPATH=RAIZ + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    with tempfile.TemporaryDirectory() as carpeta:
+        salida = subprocess.run(
+            [sys.executable, *opciones, APP], cwd=carpeta, env=entorno,
+            capture_output=True, text=True, timeout=120,
+        ).stderr
+    etapas, diferidos = {}, ""
+    for linea in salida.splitlines():
+        if m := _RE_ETAPA.match(linea):
+            etapas[m.group(1)] = (float(m.group(2)), float(m.group(3)))
+        elif "diferidos ya cargados:" in linea:
+            diferidos = linea.split(":", 1)[1].strip()
+    if "primer pintado" not in etapas:
+        raise SystemExit("la aplicación no llegó a pintar:\n" + salida)
+    return etapas, diferidos, salida
+
+
+def importaciones_lentas(stderr: str, cuantas: int) -> list[tuple[int, str]]:
+    """Los módulos de primer nivel que más tardan (acumulado, µs)."""
+    lentas = []
+    for linea in stderr.splitlines():
+        m = _RE_IMPORT.match(linea)
+        if m and len(m.group(3)) <= 1:          # los importados directamente
+            lentas.append((int(m.group(2)), m.group(4)))
+    return sorted(lentas, reverse=True)[:cuantas]
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--veces", type=int, default=5)
+    ap.add_argument("--limite", type=float, default=1500.0,
+                    help="ms máximos hasta el primer pintado (mediana)")
+    ap.add_argument("--modulos", type=int, default=12)
+    args = ap.parse_args()
+
+    corridas = [una_vez() for _ in range(args.veces)]
+    print(f"Arranque en frío, mediana de {args.veces} corridas:")
+    for etapa in corridas[0][0]:
+        parcial = statistics.median(c[0][etapa][0] for c in corridas)
+        total = statistics.median(c[0][etapa][1] for c in corridas)
+        print(f"  {etapa:<22}{parcial:8.1f} ms   (total {total:7.1f} ms)")
+
+    _, _, detalle = una_vez("-X", "importtime")
+    print("\nImportaciones más lentas, hasta el cierre (acumulado):")
+    for us, modulo in importaciones_lentas(detalle, args.modulos):
+        print(f"  {us / 1000:8.1f} ms  {modulo}")
+
+    fallas = []
+    pintado = statistics.median(c[0]["primer pintado"][1] for c in corridas)
+    if pintado > args.limite:
+        fallas.append(f"primer pintado en {pintado:.0f} ms (límite {args.limite:.0f} ms)")
+    diferidos = {c[1] for c in corridas} - {"ninguno"}
+    if diferidos:
+        fallas.append("se cargó antes de mostrar la ventana: " + "; ".join(sorted(diferidos)))
+    for falla in fallas:
+        print("\nFALLA: " + falla)
+    return 1 if fallas else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
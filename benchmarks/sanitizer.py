@@ -0,0 +1,277 @@
+# benchmarks/sanitizer.py
+"""Compara ``sanitizer.sanitizar`` con las cadenas de ``re.sub`` que reemplazó.
+
+Arma un resuelvo grande con el mismo HTML que devuelve ``QTextEdit.toHtml()``
+(párrafos con márgenes, spans de negrita/cursiva/subrayado, anclas, <br>),
+verifica que cada modo dé exactamente lo mismo que la cadena vieja y mide
+cuántos MB/s procesa cada uno.
+
+    python benchmarks/sanitizer.py [párrafos]
+"""
+import html
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sanitizer import sanitizar  # noqa: E402
+
+
+# ───────────── cadenas viejas (copiadas tal cual) ─────────────
+
+def viejo_completo(html_raw: str) -> str:
+    """
+    Devuelve SOLO el fragmento que estaba dentro de <body>,
+    manteniendo <b>, <i>, <u> y quitando todo estilo / saltos raros.
+    """
+    import re, html
+
+    # A)  ───── EXTRAEMOS SOLO <body> … </body> ─────
+    m = re.search(r"<body[^>]*>(.*?)</body>", html_raw, flags=re.I | re.S)
+    if m:
+        html_raw = m.group(1)
+    # (si por algún motivo no hay <body>, seguimos con lo que venga)
+
+    # eliminamos style/meta eventualmente incrustados en el cuerpo
+    html_raw = re.sub(r"<style[^>]*>.*?</style>", "", html_raw, flags=re.I | re.S)
+    html_raw = re.sub(r"<meta[^>]*>", "", html_raw, flags=re.I)
+
+    # B)  ───── A partir de aquí van los pasos que ya tenías ─────
+    # a) <strong>/<em> → <b>/<i>
+    html_raw = re.sub(
+        r"</?strong>",
+        lambda m: "<b>" if m.group(0)[1] != "/" else "</b>",
+        html_raw,
+        flags=re.I,
+    )
+    html_raw = re.sub(
+        r"</?em>",
+        lambda m: "<i>" if m.group(0)[1] != "/" else "</i>",
+        html_raw,
+        flags=re.I,
+    )
+
+    # b) <span style="font-weight:...">…</span> → <b>…</b>
+    html_raw = re.sub(
+        r'<span[^>]*style="[^"]*font-weight\s*:\s*(?:bold|700)[^"]*"[^>]*>(.*?)</span>',
+        r"<b>\1</b>",
+        html_raw,
+        flags=re.I | re.S,
+    )
+
+    # c) quitamos atributos style, class, dir, lang…
+    html_raw = re.sub(r'\s*(style|class|dir|lang)="[^"]*"', "", html_raw, flags=re.I)
+
+    # d) quitamos cualquier <span> remanente
+    html_raw = re.sub(r"</?span[^>]*>", "", html_raw, flags=re.I)
+    # eliminar enlaces <a name="..."> que aparecen al pegar desde Word
+    html_raw = re.sub(r"</?a[^>]*>", "", html_raw, flags=re.I)
+
+    # d-bis) fuera <br>
+    html_raw = re.sub(r"(?i)<br\s*/?>", " ", html_raw)
+
+    # d-ter) fuera párrafos vacíos de Qt
+    html_raw = re.sub(
+        r"<p[^>]*-qt-paragraph-type:empty[^>]*>\s*(<br\s*/?>)?\s*</p>",
+        " ",
+        html_raw,
+        flags=re.I,
+    )
+
+    # e) limpia saltos y nbsp
+    html_raw = re.sub(r"(\r\n|\r|\n|&#10;|&#13;|\u2028|\u2029|&nbsp;)", " ", html_raw)
+
+    # f) compacta espacios
+    html_raw = re.sub(r"\s+", " ", html_raw).strip()
+
+    # g) si el texto completo está envuelto en un único <p>…</p>, lo quitamos
+    if re.fullmatch(r"<p[^>]*>.*?</p>", html_raw, flags=re.I | re.S):
+        html_raw = re.sub(r"^<p[^>]*>|</p>$", "", html_raw, flags=re.I).strip()
+
+    return html.unescape(html_raw)
+
+
+def viejo_cursiva(html_raw: str) -> str:
+    """
+    Limpia el HTML e IMPIDE negrita/subrayado.
+    Si no hay cursiva explícita, envuelve todo en <i>…</i>.
+    """
+    import re, html
+
+    # Nos quedamos sólo con el <body> (igual que antes)
+    m = re.search(r"<body[^>]*>(.*?)</body>", html_raw, flags=re.I | re.S)
+    if m:
+        html_raw = m.group(1)
+
+    # eliminamos cualquier bloque <style>…</style> o meta etiquetas remanentes
+    html_raw = re.sub(r"<style[^>]*>.*?</style>", "", html_raw, flags=re.I | re.S)
+    html_raw = re.sub(r"<meta[^>]*>", "", html_raw, flags=re.I)
+
+    # 1) fuera <b>, </b>, <strong>, </strong>, <u>, </u>, y spans con font-weight
+    html_raw = re.sub(r"</?(b|strong|u)[^>]*>", "", html_raw, flags=re.I)
+    html_raw = re.sub(
+        r'<span[^>]*style="[^"]*font-weight\s*:\s*(?:bold|700)[^"]*"[^>]*>',
+        "",
+        html_raw,
+        flags=re.I,
+    )
+    html_raw = re.sub(r"</span>", "", html_raw, flags=re.I)
+
+    # 2) Nos quedamos *solo* con <i>/<em> –los demás tags fuera–
+    #    (primero <em>→<i> para unificar)
+    html_raw = re.sub(
+        r"</?em>",
+        lambda m: "<i>" if m.group(0)[1] != "/" else "</i>",
+        html_raw,
+        flags=re.I,
+    )
+    html_raw = re.sub(r"</?(?!i\b)[a-z][^>]*>", "", html_raw)  # quita todo salvo <i>
+
+    # 3) compactamos espacios/entidades raras
+    html_raw = re.sub(r"(\r\n|\r|\n|&nbsp;|\u2028|\u2029)", " ", html_raw)
+    html_raw = re.sub(r"\s+", " ", html_raw).strip()
+
+    # 4) Si NO quedó ningún <i>…</i>, lo rodeamos completo
+    if "<i>" not in html_raw.lower():
+        html_raw = f"<i>{html.escape(html_raw)}</i>"
+
+    return html_raw
+
+
+def viejo_en_linea(html_raw: str) -> str:
+    """
+    Convierte un blo-HTML en inline-HTML:
+
+    • quita <p>, </p>, <div>, </div>, <br>
+    • elimina separadores U+2028/U+2029, NBSP, \\r, \\n
+    • colapsa espacios consecutivos
+    """
+    import re, html
+
+    # print(repr(html_raw))
+    # A) fuera <p>, </p>, <div>, </div>
+    h = re.sub(r"</?p[^>]*>", " ", html_raw, flags=re.I)
+    h = re.sub(r"</?div[^>]*>", " ", h, flags=re.I)
+
+    # B) fuera <br> y variantes
+    h = re.sub(r"(?i)<br\s*/?>", " ", h)
+
+    # C) fuera saltos ocultos y nbsp
+    h = re.sub(r"(\r\n|\r|\n|&#10;|&#13;|\u2028|\u2029|&nbsp;)", " ", h)
+
+    # D) compactar espacios
+    h = re.sub(r"\s+", " ", h).strip()
+
+    return html.unescape(h)
+
+
+def viejo_parrafos(html_raw: str) -> str:
+    """
+    Convierte un bloque HTML a inline conservando los saltos de párrafo
+    como dos <br>. Mantiene <b>, <i> y <u>.
+    """
+    import re, html
+
+    # A) Abrir párrafos fuera
+    html_raw = re.sub(r"(?i)<p[^>]*>", "", html_raw)
+    # B) Cerrar párrafos → <br><br>
+    html_raw = re.sub(r"(?i)</p>", "<br><br>", html_raw)
+
+    # C) Fuera <div> y <br> sueltos
+    html_raw = re.sub(r"(?i)</?div[^>]*>", "", html_raw)
+    html_raw = re.sub(r"(?i)<br\s*/?>", "<br>", html_raw)
+
+    # D) Limpieza de saltos invisibles y nbsp
+    html_raw = re.sub(r"(\r\n|\r|\n|&#10;|&#13;|\u2028|\u2029|&nbsp;)", " ", html_raw)
+
+    # E) Colapsar espacios
+    html_raw = re.sub(r"\s+", " ", html_raw).strip()
+
+    return html.unescape(html_raw)
+
+
+def viejo_portapapeles(basic_html: str) -> str:
+    """Los pasos que hacía ``MainWindow.copy_to_clipboard`` sobre ``toHtml()``."""
+    basic_html = re.sub(r'font-size\s*:[^;"]+;?', '', basic_html, flags=re.I)
+    basic_html = re.sub(r'text-align\s*:\s*left\s*;?', '', basic_html, flags=re.I)
+    basic_html = re.sub(r'align="left"\s*', '', basic_html, flags=re.I)
+
+    def _ensure_justify(m):
+        tag = m.group(0)
+        if re.search(r'(text-align\s*:\s*(center|right))|(align="(center|right)")',
+                     tag, flags=re.I):
+            return tag
+        if 'style="' in tag:
+            return re.sub(r'style="([^"]*)"', lambda s:
+                          f'style="{s.group(1)}text-align:justify;"', tag)
+        return tag[:-1] + ' style="text-align:justify;">'
+
+    basic_html = re.sub(r'<p[^>]*>', _ensure_justify, basic_html)
+    return re.sub(r'style="\s*"', '', basic_html)
+
+
+# ───────────── documento de prueba ─────────────
+
+_CABECERA = (
+    '<!DOCTYPE HTML PUBLIC "-//W3C//DTD HTML 4.0//EN" "http://www.w3.org/TR/REC-html40/strict.dtd">\n'
+    '<html><head><meta name="qrichtext" content="1" /><meta charset="utf-8" />'
+    '<style type="text/css">\np, li { white-space: pre-wrap; }\nhr { height: 1px; border-width: 0; }\n'
+    "</style></head><body style=\" font-family:'Times New Roman'; font-size:12pt; "
+    'font-weight:400; font-style:normal;">\n'
+)
+_P = ('<p align="{al}" style=" margin-top:0px; margin-bottom:0px; margin-left:0px; '
+      'margin-right:0px; -qt-block-indent:0; text-indent:0px;">')
+
+
+def resuelvo_grande(parrafos: int) -> str:
+    partes = [_CABECERA]
+    for i in range(parrafos):
+        partes.append(_P.format(al=("justify", "center", "left")[i % 3]))
+        partes.append(
+            f'{i + 1}. Declarar a <span style=" font-weight:700;">Juan Pérez &amp; otro</span>, '
+            'ya filiado, autor penalmente responsable del delito de '
+            '<span style=" font-style:italic;">robo calificado</span>&nbsp;(art. 166 '
+            '<span style=" text-decoration: underline;">inc. 2°</span> CP) e imponerle '
+            '<a href="resuelvo"><span style=" font-size:14pt; color:#0000ff;">la pena</span></a>'
+            ' de cinco años de prisión,<br />con costas.</p>\n'
+        )
+    partes.append("</body></html>")
+    return "".join(partes)
+
+
+CASOS = {
+    "completo": viejo_completo,
+    "cursiva": viejo_cursiva,
+    "en_linea": viejo_en_linea,
+    "parrafos": viejo_parrafos,
+    "portapapeles": viejo_portapapeles,
+}
+
+
+def _medir(fn, texto: str, repeticiones: int) -> float:
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        fn(texto)
+    return (time.perf_counter() - inicio) / repeticiones
+
+
+def main(parrafos: int = 400) -> None:
+    doc = resuelvo_grande(parrafos)
+    mb = len(doc.encode("utf-8")) / 1e6
+    print(f"resuelvo de {parrafos} párrafos ({mb * 1000:.0f} KB)\n")
+    print(f"{'modo':<14}{'cadena vieja':>16}{'sanitizar':>14}{'×':>8}")
+    for modo, viejo in CASOS.items():
+        entrada = doc if modo not in ("en_linea", "parrafos") else viejo_completo(doc)
+        esperado = viejo(entrada)
+        assert sanitizar(entrada, modo) == esperado, f"«{modo}» no coincide con la cadena vieja"
+        mb = len(entrada.encode("utf-8")) / 1e6
+        rep = max(3, int(2 / max(mb, 1e-3)))
+        t_viejo = _medir(viejo, entrada, rep)
+        t_nuevo = _medir(lambda h: sanitizar(h, modo), entrada, rep)
+        print(f"{modo:<14}{mb / t_viejo:>11.1f} MB/s{mb / t_nuevo:>9.1f} MB/s{t_viejo / t_nuevo:>7.1f}×")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 400)
@@ -0,0 +1,182 @@
+# bloques.py
+"""Documento armado por fragmentos HTML que se actualiza por bloques.
+
+``setHtml`` sobre la sentencia entera obliga a Qt a volver a parsear y a
+diagramar decenas de páginas por cada tecla, y lleva el scroll al principio.
+``DocumentoEnBloques`` recuerda qué rango de ``QTextBlock`` ocupa cada
+fragmento (cada sección de la plantilla) y, al recibir la lista nueva,
+reemplaza sólo los bloques de los fragmentos que cambiaron: lo que cuesta
+diagramar es proporcional a la edición y el cursor y el scroll no se mueven.
+
+También lleva un índice de los enlaces (``href`` → tramos del documento),
+armado a lo sumo una vez por render y sólo cuando alguien lo consulta, para
+ubicar una sección sin buscar en el texto.
+
+Cada fragmento tiene que empezar un bloque nuevo (en la práctica, empezar con
+``<p``). Si algo no cuadra (el documento se tocó por fuera o la cantidad de
+bloques no es la esperada) se vuelve al ``setHtml`` completo.
+"""
+from PySide6.QtGui import QTextCursor, QTextDocument, QTextDocumentFragment
+from PySide6.QtWidgets import QTextEdit
+
+MAX_CACHE = 256
+
+
+class DocumentoEnBloques:
+    """Muestra en ``editor`` la concatenación de fragmentos, parchando bloques.
+
+    ``apertura`` y ``cierre`` envuelven el documento (y cada fragmento al
+    parsearlo suelto), p. ej. un ``<div>`` con la alineación.
+    """
+
+    def __init__(self, editor: QTextEdit, apertura: str = "", cierre: str = ""):
+        self._editor = editor
+        self._apertura = apertura
+        self._cierre = cierre
+        # [(fragmento, cantidad de bloques)] tal como está en el documento
+        self._actuales: list[tuple[str, int]] | None = None
+        # fragmento → documento suelto ya parseado (para contar sus bloques)
+        self._sueltos: dict[str, QTextDocument] = {}
+        # href → [(inicio, fin)] del documento actual (None: hay que armarlo)
+        self._anclas: dict[str, list[tuple[int, int]]] | None = None
+        # el editor es de sólo lectura: sin historial de deshacer, que
+        # crecería con cada parche
+        editor.document().setUndoRedoEnabled(False)
+
+    def invalidar(self) -> None:
+        """La próxima ``mostrar`` rehace el documento completo."""
+        self._actuales = None
+        self._anclas = None
+
+    def anclas(self) -> dict[str, list[tuple[int, int]]]:
+        """``href`` → tramos ``(inicio, fin)`` de todos los enlaces."""
+        if self._anclas is None:
+            self._anclas = self._indexar_anclas()
+        return self._anclas
+
+    def rangos_ancla(self, href: str) -> list[tuple[int, int]]:
+        """Tramos ``(inicio, fin)`` del documento enlazados a ``href``."""
+        return self.anclas().get(href, [])
+
+    def mostrar(self, fragmentos: list[str]) -> bool:
+        """Deja el documento igual a ``fragmentos`` unidos.
+
+        Devuelve ``True`` si alcanzó con parchar (o no había cambios) y
+        ``False`` si hubo que hacer ``setHtml`` del documento entero.
+        """
+        # un fragmento sin texto (p. ej. ``<p><i></i></p>``) no deja ningún
+        # bloque en el documento entero, pero suelto ocuparía uno
+        nuevos = [f for f in fragmentos if f and not self._suelto(f).isEmpty()]
+        self._anclas = None
+        if self._actuales is not None and self._parchar(nuevos):
+            return True
+        self._completo(nuevos)
+        return False
+
+    # ───────────── internos ─────────────
+    def _suelto(self, fragmento: str) -> QTextDocument:
+        doc = self._sueltos.get(fragmento)
+        if doc is None:
+            if len(self._sueltos) >= MAX_CACHE:
+                self._sueltos.clear()
+            doc = self._sueltos[fragmento] = QTextDocument()
+            doc.setDefaultFont(self._editor.document().defaultFont())
+            doc.setHtml(self._apertura + fragmento + self._cierre)
+        return doc
+
+    def _indexar_anclas(self) -> dict[str, list[tuple[int, int]]]:
+        anclas: dict[str, list[tuple[int, int]]] = {}
+        bloque = self._editor.document().begin()
+        while bloque.isValid():
+            it = bloque.begin()
+            while not it.atEnd():
+                frag = it.fragment()
+                fmt = frag.charFormat()
+                if fmt.isAnchor() and fmt.anchorHref():
+                    inicio = frag.position()
+                    fin = inicio + frag.length()
+                    rangos = anclas.setdefault(fmt.anchorHref(), [])
+                    # un enlace con negrita adentro viene en varios pedazos
+                    if rangos and rangos[-1][1] == inicio:
+                        rangos[-1] = (rangos[-1][0], fin)
+                    else:
+                        rangos.append((inicio, fin))
+                it += 1
+            bloque = bloque.next()
+        return anclas
+
+    def _completo(self, nuevos: list[str]) -> None:
+        doc = self._editor.document()
+        self._editor.setHtml(self._apertura + "".join(nuevos) + self._cierre)
+        actuales = [(f, self._suelto(f).blockCount()) for f in nuevos]
+        total = sum(n for _, n in actuales)
+        # si los fragmentos sueltos no suman los bloques del documento, no
+        # hay forma segura de ubicarlos: la próxima vez, completo otra vez
+        self._actuales = actuales if total == doc.blockCount() else None
+
+    def _parchar(self, nuevos: list[str]) -> bool:
+        doc = self._editor.document()
+        viejos = self._actuales
+        if sum(n for _, n in viejos) != doc.blockCount():
+            return False  # alguien tocó el documento por fuera
+
+        # prefijo y sufijo en común
+        limite = min(len(viejos), len(nuevos))
+        p = 0
+        while p < limite and viejos[p][0] == nuevos[p]:
+            p += 1
+        if p == len(viejos) == len(nuevos):
+            return True
+        q = 0
+        while q < limite - p and viejos[-1 - q][0] == nuevos[-1 - q]:
+            q += 1
+        # siempre se reemplaza al menos un fragmento por al menos otro:
+        # insertar o borrar a secas mezclaría bloques vecinos
+        if p + q == len(viejos) or p + q == len(nuevos):
+            if p:
+                p -= 1
+            elif q:
+                q -= 1
+            else:
+                return False
+        reemplazo = nuevos[p:len(nuevos) - q]
+
+        b0 = sum(n for _, n in viejos[:p])
+        b1 = b0 + sum(n for _, n in viejos[p:len(viejos) - q])
+        if len(reemplazo) == 1:
+            suelto = self._suelto(reemplazo[0])
+        else:
+            suelto = QTextDocument()
+            suelto.setDefaultFont(doc.defaultFont())
+            suelto.setHtml(self._apertura + "".join(reemplazo) + self._cierre)
+        k = suelto.blockCount()
+
+        ultimo = doc.findBlockByNumber(b1 - 1)
+        cursor = QTextCursor(doc)
+        cursor.beginEditBlock()
+        # se vacían los bloques b0..b1-1 (queda b0, vacío, con su separador
+        # hacia el siguiente) y se vuelca ahí el fragmento nuevo
+        cursor.setPosition(doc.findBlockByNumber(b0).position())
+        cursor.setPosition(ultimo.position() + ultimo.length() - 1, QTextCursor.KeepAnchor)
+        cursor.removeSelectedText()
+        cursor.insertFragment(QTextDocumentFragment(suelto))
+        # el formato de bloque no siempre viaja con el fragmento
+        bloque = doc.findBlockByNumber(b0)
+        origen = suelto.begin()
+        for _ in range(k):
+            c = QTextCursor(bloque)
+            c.setBlockFormat(origen.blockFormat())
+            c.setBlockCharFormat(origen.charFormat())
+            bloque = bloque.next()
+            origen = origen.next()
+        cursor.endEditBlock()
+
+        self._actuales = (
+            viejos[:p]
+            + [(f, self._suelto(f).blockCount()) for f in reemplazo]
+            + viejos[len(viejos) - q:]
+        )
+        if sum(n for _, n in self._actuales) != doc.blockCount():
+            self._actuales = None
+            return False
+        return True
@@ -0,0 +1,360 @@
+# causas_db.py
+"""Archivo de causas en SQLite, con índices y búsqueda de texto completo.
+
+Las causas se guardaban como un JSON suelto por archivo en
+``causas_guardadas`` y se abrían recorriendo la carpeta con el diálogo de
+archivos: para encontrar una por imputado, DNI o fiscal había que abrirlas
+de a una. Acá todas viven en una sola base (``causas.sqlite3``):
+
+* ``causas`` guarda el JSON completo de cada causa (``datos``) junto con las
+  columnas que se buscan —carátula, fiscal, imputados, DNI—, indexadas sin
+  distinguir mayúsculas;
+* ``causas_imputados`` tiene una fila por imputado, con índice por nombre y
+  por DNI (sólo dígitos: “12.345.678” y “12345678” son el mismo);
+* ``causas_fts`` (FTS5, sin acentos) indexa carátula, nombres, hechos y
+  fiscal para buscar por palabras sueltas o prefijos. Si el SQLite de la máquina no
+  trae FTS5 se busca con ``LIKE`` sobre las mismas columnas.
+
+Cada causa se guarda en el formato de ``esquema_causa`` (las de versiones
+anteriores se migran al guardarlas o al leerlas); el archivo no la
+interpreta más que para sacar lo que indexa (``_indice``). La primera vez
+que se abre, importa los ``.json`` de ``causas_guardadas`` para que no se
+pierda nada de lo anterior.
+"""
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+import re
+import sqlite3
+import sys
+
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtWidgets import (
+    QApplication, QDialog, QDialogButtonBox, QLabel, QLineEdit, QMessageBox,
+    QTreeWidget, QTreeWidgetItem, QVBoxLayout,
+)
+
+from html_plano import html_a_texto
+import esquema_causa
+
+DB_PATH = Path("causas.sqlite3")
+CARPETA_ANTERIOR = Path("causas_guardadas")
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS causas (
+    id         INTEGER PRIMARY KEY,
+    caratula   TEXT NOT NULL DEFAULT '',
+    fiscal     TEXT NOT NULL DEFAULT '',
+    imputados  TEXT NOT NULL DEFAULT '',
+    dnis       TEXT NOT NULL DEFAULT '',
+    modificada TEXT NOT NULL,
+    origen     TEXT UNIQUE,
+    datos      TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS causas_caratula ON causas (caratula COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS causas_fiscal   ON causas (fiscal COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS causas_modificada ON causas (modificada);
+
+CREATE TABLE IF NOT EXISTS causas_imputados (
+    causa_id INTEGER NOT NULL REFERENCES causas (id) ON DELETE CASCADE,
+    nombre   TEXT NOT NULL DEFAULT '',
+    dni      TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS causas_imputados_nombre
+    ON causas_imputados (nombre COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS causas_imputados_dni   ON causas_imputados (dni);
+CREATE INDEX IF NOT EXISTS causas_imputados_causa ON causas_imputados (causa_id);
+"""
+
+_FTS = """
+CREATE VIRTUAL TABLE IF NOT EXISTS causas_fts USING fts5 (
+    caratula, nombres, hechos, fiscal,
+    tokenize = 'unicode61 remove_diacritics 2'
+)
+"""
+
+
+@dataclass(frozen=True)
+class Resumen:
+    """Una fila del buscador: lo justo para reconocer la causa."""
+    id: int
+    caratula: str
+    imputados: str
+    fiscal: str
+    modificada: str
+
+
+# ───────────── qué se indexa de cada causa ─────────────
+def _solo_digitos(texto: str) -> str:
+    return re.sub(r"\D", "", texto or "")
+
+
+def _plano(texto) -> str:
+    texto = str(texto or "")
+    return html_a_texto(texto) if "<" in texto else texto
+
+
+def _indice(causa: dict) -> dict:
+    """Carátula, fiscal, imputados (nombre, DNI) y hechos de una causa ya migrada."""
+    imputados = [imp for imp in causa.get("imputados") or [] if isinstance(imp, dict)]
+    # los hechos de la sentencia y lo que de ellos se anota en cada imputado
+    hechos = [_plano(h.get("descripcion", "")) + " " + str(h.get("aclaraciones", ""))
+              for h in causa.get("hechos") or [] if isinstance(h, dict)]
+    hechos += [str(imp.get(k) or "") for imp in imputados
+               for k in ("delitos", "victimas", "fechas")]
+    personas = [(str(imp.get("nombre") or "").strip(), _solo_digitos(str(imp.get("dni") or "")))
+                for imp in imputados]
+    personas = [(n, d) for n, d in personas if n or d]
+    return {
+        "caratula": str(causa.get("caratula") or "").strip(),
+        "fiscal": str(causa.get("fiscal_nombre") or "").strip(),
+        "personas": personas,
+        "hechos": " ".join(h for h in hechos if h.strip()),
+    }
+
+
+def _consulta_fts(texto: str) -> str:
+    """Cada palabra como prefijo entre comillas: “gonz perez” → ``"gonz"* "perez"*``."""
+    palabras = re.findall(r"\w+", texto)
+    return " ".join(f'"{p}"*' for p in palabras)
+
+
+# ───────────── el archivo ─────────────
+class ArchivoCausas:
+    """Causas guardadas en SQLite: guardar, cargar, eliminar y buscar."""
+
+    def __init__(self, ruta: str | Path = DB_PATH):
+        self.ruta = Path(ruta)
+        self._db = sqlite3.connect(self.ruta)
+        self._db.execute("PRAGMA foreign_keys = ON")
+        self._db.execute("PRAGMA journal_mode = WAL")
+        self._db.executescript(_ESQUEMA)
+        try:
+            self._db.execute(_FTS)
+            self.fts = True
+        except sqlite3.OperationalError:        # SQLite compilado sin FTS5
+            self.fts = False
+        self._db.commit()
+
+    def cerrar(self) -> None:
+        self._db.close()
+
+    # — escritura —
+    def guardar(self, datos: dict, id: int | None = None, origen: str | None = None) -> int:
+        """Guarda ``datos`` (nueva si ``id`` es None); devuelve el id de la causa."""
+        with self._db:
+            return self._guardar(datos, id, origen)
+
+    def _guardar(self, datos: dict, id: int | None, origen: str | None) -> int:
+        causa = esquema_causa.migrar(dict(datos))
+        ind = _indice(causa)
+        fila = (
+            ind["caratula"], ind["fiscal"],
+            "; ".join(n for n, _ in ind["personas"] if n),
+            " ".join(d for _, d in ind["personas"] if d),
+            datetime.now().isoformat(timespec="seconds"),
+            esquema_causa.volcar_json(causa).decode("utf-8"),
+        )
+        if id is None:
+            id = self._db.execute(
+                "INSERT INTO causas (caratula, fiscal, imputados, dnis, modificada,"
+                " datos, origen) VALUES (?, ?, ?, ?, ?, ?, ?)", fila + (origen,),
+            ).lastrowid
+        elif not self._db.execute(
+                "UPDATE causas SET caratula = ?, fiscal = ?, imputados = ?, dnis = ?,"
+                " modificada = ?, datos = ? WHERE id = ?", fila + (id,)).rowcount:
+            # la borraron mientras estaba abierta: vuelve con el mismo id
+            self._db.execute(
+                "INSERT INTO causas (caratula, fiscal, imputados, dnis, modificada,"
+                " datos, id) VALUES (?, ?, ?, ?, ?, ?, ?)", fila + (id,))
+        self._db.execute("DELETE FROM causas_imputados WHERE causa_id = ?", (id,))
+        self._db.executemany(
+            "INSERT INTO causas_imputados (causa_id, nombre, dni) VALUES (?, ?, ?)",
+            [(id, n, d) for n, d in ind["personas"]])
+        if self.fts:
+            self._db.execute("DELETE FROM causas_fts WHERE rowid = ?", (id,))
+            self._db.execute(
+                "INSERT INTO causas_fts (rowid, caratula, nombres, hechos, fiscal)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (id, ind["caratula"], fila[2], ind["hechos"], ind["fiscal"]))
+        return id
+
+    def eliminar(self, id: int) -> None:
+        with self._db:
+            self._db.execute("DELETE FROM causas WHERE id = ?", (id,))
+            if self.fts:
+                self._db.execute("DELETE FROM causas_fts WHERE rowid = ?", (id,))
+
+    # — lectura —
+    def cargar(self, id: int) -> dict:
+        """La causa ``id`` en el formato actual (las guardadas antes se migran)."""
+        fila = self._db.execute("SELECT datos FROM causas WHERE id = ?", (id,)).fetchone()
+        if fila is None:
+            raise KeyError(f"no existe la causa {id}")
+        return esquema_causa.migrar(esquema_causa.cargar_json(fila[0]))
+
+    def __len__(self) -> int:
+        return self._db.execute("SELECT count(*) FROM causas").fetchone()[0]
+
+    def buscar(self, texto: str = "", limite: int = 200) -> list[Resumen]:
+        """Causas que coinciden con ``texto``, las últimas modificadas primero.
+
+        Un texto de sólo números (con o sin puntos) busca por DNI; cualquier
+        otro, por palabras en carátula, imputados, hechos y fiscal. Vacío
+        devuelve las últimas causas.
+        """
+        columnas = "c.id, c.caratula, c.imputados, c.fiscal, c.modificada"
+        texto = texto.strip()
+        dni = _solo_digitos(texto)
+        if not texto:
+            sql, args = f"SELECT {columnas} FROM causas c", ()
+        elif dni and not re.sub(r"[\d.\s]", "", texto):
+            # los DNI se guardan sólo con dígitos: el prefijo es un rango,
+            # que (a diferencia de LIKE) usa el índice ``causas_imputados_dni``
+            hasta = dni[:-1] + chr(ord(dni[-1]) + 1)
+            sql = (f"SELECT {columnas} FROM causas c WHERE c.id IN ("
+                   "SELECT causa_id FROM causas_imputados WHERE dni >= ? AND dni < ?)")
+            args = (dni, hasta)
+        elif self.fts and _consulta_fts(texto):
+            sql = (f"SELECT {columnas} FROM causas c WHERE c.id IN ("
+                   "SELECT rowid FROM causas_fts WHERE causas_fts MATCH ?)")
+            args = (_consulta_fts(texto),)
+        else:
+            patron = f"%{texto}%"
+            sql = (f"SELECT {columnas} FROM causas c WHERE c.caratula LIKE ?"
+                   " OR c.imputados LIKE ? OR c.fiscal LIKE ? OR c.datos LIKE ?")
+            args = (patron,) * 4
+        sql += " ORDER BY c.modificada DESC, c.id DESC LIMIT ?"
+        try:
+            filas = self._db.execute(sql, args + (limite,)).fetchall()
+        except sqlite3.OperationalError:        # consulta FTS que no se pudo armar
+            return []
+        return [Resumen(*f) for f in filas]
+
+    # — lo anterior —
+    def importar_carpeta(self, carpeta: str | Path = CARPETA_ANTERIOR,
+                         errores: list | None = None) -> int:
+        """Importa los ``.json`` de ``carpeta`` que todavía no estén; devuelve cuántos.
+
+        Se leen de a uno y van todos en una sola transacción. Los que no se
+        pueden leer no frenan al resto: se anotan en ``errores`` como
+        ``(ruta, motivo)``.
+        """
+        carpeta = Path(carpeta)
+        if not carpeta.is_dir():
+            return 0
+        ya = {o for (o,) in self._db.execute(
+            "SELECT origen FROM causas WHERE origen IS NOT NULL")}
+        nuevas = 0
+        with self._db:
+            for ruta, causa, error in esquema_causa.leer_carpeta(carpeta, ya):
+                if causa is None:
+                    if errores is not None:
+                        errores.append((ruta, error))
+                    continue
+                self._guardar(causa, None, str(ruta))
+                nuevas += 1
+        return nuevas
+
+
+_archivo: ArchivoCausas | None = None
+
+
+def archivo(parent=None) -> ArchivoCausas:
+    """El archivo de la aplicación; la primera vez importa ``causas_guardadas``.
+
+    Los archivos viejos que no se pudieron leer se avisan (a ``parent``): se
+    vuelven a intentar en cada arranque hasta que se corrijan o se quiten.
+    """
+    global _archivo
+    if _archivo is None:
+        _archivo = ArchivoCausas()
+        errores: list = []
+        _archivo.importar_carpeta(errores=errores)
+        if errores:
+            _avisar_no_importadas(errores, parent)
+    return _archivo
+
+
+def _avisar_no_importadas(errores: list, parent=None, mostrar: int = 10) -> None:
+    for ruta, motivo in errores:
+        print(f"causas_db: no se pudo importar {ruta}: {motivo}", file=sys.stderr)
+    if QApplication.instance() is None:
+        return
+    lineas = [f"• {Path(ruta).name}: {motivo}" for ruta, motivo in errores[:mostrar]]
+    if len(errores) > mostrar:
+        lineas.append(f"… y {len(errores) - mostrar} más.")
+    QMessageBox.warning(
+        parent, "Causas sin importar",
+        f"No se pudieron leer {len(errores)} archivo(s) de «{CARPETA_ANTERIOR}»; "
+        "no están en el archivo de causas:\n\n" + "\n".join(lineas),
+    )
+
+
+# ───────────── selector ─────────────
+class SelectorCausa(QDialog):
+    """Buscador de causas: se escribe y la lista se filtra mientras tanto."""
+
+    def __init__(self, archivo: ArchivoCausas, titulo: str = "Abrir causa",
+                 parent=None):
+        super().__init__(parent)
+        self.setWindowTitle(titulo)
+        self.resize(760, 460)
+        self._archivo = archivo
+        self.id: int | None = None
+
+        self.busqueda = QLineEdit()
+        self.busqueda.setPlaceholderText("Carátula, imputado, DNI, fiscal o hechos…")
+        self.busqueda.setClearButtonEnabled(True)
+        self.lista = QTreeWidget()
+        self.lista.setHeaderLabels(["Carátula", "Imputados", "Fiscal", "Modificada"])
+        self.lista.setRootIsDecorated(False)
+        self.lista.setUniformRowHeights(True)
+        self.lista.setColumnWidth(0, 300)
+        self.lista.setColumnWidth(1, 200)
+        self.cuenta = QLabel()
+        botones = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+
+        lay = QVBoxLayout(self)
+        lay.addWidget(self.busqueda)
+        lay.addWidget(self.lista)
+        lay.addWidget(self.cuenta)
+        lay.addWidget(botones)
+
+        # una consulta por pausa al tipear, no una por tecla
+        self._demora = QTimer(self, singleShot=True, interval=120)
+        self._demora.timeout.connect(self._filtrar)
+        self.busqueda.textChanged.connect(self._demora.start)
+        self.busqueda.returnPressed.connect(self.accept)
+        self.lista.itemDoubleClicked.connect(self.accept)
+        botones.accepted.connect(self.accept)
+        botones.rejected.connect(self.reject)
+        self._filtrar()
+
+    def _filtrar(self) -> None:
+        self.lista.clear()
+        resultados = self._archivo.buscar(self.busqueda.text())
+        for r in resultados:
+            item = QTreeWidgetItem([r.caratula or "(sin carátula)", r.imputados,
+                                    r.fiscal, r.modificada.replace("T", " ")])
+            item.setData(0, Qt.UserRole, r.id)
+            self.lista.addTopLevelItem(item)
+        if resultados:
+            self.lista.setCurrentItem(self.lista.topLevelItem(0))
+        self.cuenta.setText(f"{len(resultados)} de {len(self._archivo)} causas")
+
+    def accept(self) -> None:
+        if self._demora.isActive():         # Enter antes de que se filtrara
+            self._demora.stop()
+            self._filtrar()
+        item = self.lista.currentItem()
+        if item is None:
+            return
+        self.id = item.data(0, Qt.UserRole)
+        super().accept()
+
+
+def elegir_causa(parent, titulo: str = "Abrir causa") -> int | None:
+    """Muestra el selector; devuelve el id elegido o None."""
+    dlg = SelectorCausa(archivo(parent), titulo, parent)
+    return dlg.id if dlg.exec() == QDialog.Accepted else None
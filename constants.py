@@ -25,3 +25,32 @@ TRIBUNALES = [
     "Juzgado de Control y Faltas N° 11",
     "Juzgado de Control de Lucha contra el Narcotráfico",
 ]
+
+ESTABLECIMIENTOS = [
+    "Complejo Carcelario n.° 1 (Bouwer)",
+    "Establecimiento Penitenciario n.° 9 (UCA)",
+    "Establecimiento Penitenciario n.° 3 (para mujeres)",
+    "Complejo Carcelario n.° 2 (Cruz del Eje)",
+    "Establecimiento Penitenciario n.° 4 (Colonia Abierta Monte Cristo)",
+    "Establecimiento Penitenciario n.° 5 (Villa María)",
+    "Establecimiento Penitenciario n.° 6 (Río Cuarto)",
+    "Establecimiento Penitenciario n.° 7 (San Francisco)",
+    "Establecimiento Penitenciario n.° 8 (Villa Dolores)",
+]
+
+TRATAMIENTO_SPC = (
+    "se le brinde un tratamiento interdisciplinario acorde a la problemática "
+    "de adicción a sustancias estupefacientes que padece"
+)
+
+# Espera (ms) desde la última edición antes de regenerar las plantillas y
+# tope máximo (ms) para que la vista no quede congelada mientras se tipea.
+RENDER_DELAY_MS = 150
+RENDER_MAX_WAIT_MS = 600
+
+# Resaltado de cambios en la vista previa: si el tramo que cambió supera
+# este tamaño (en caracteres) se resalta entero, sin buscar la diferencia
+# fina; con RESALTADO_EN_SEGUNDO_PLANO el cálculo corre fuera del hilo de la
+# interfaz.
+RESALTADO_MAX_CARACTERES = 20000
+RESALTADO_EN_SEGUNDO_PLANO = False
@@ -1,19 +1,214 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import List, Dict, Any
+from typing import List, Any, ClassVar
 
 from PySide6.QtCore import QSignalBlocker
-import json, dataclasses, pathlib
-from PySide6.QtWidgets import (
-    QFileDialog, QMessageBox, QLineEdit, QComboBox, QCheckBox
-)
-from pathlib import Path
+import dataclasses, pathlib
+from widgets import poner_valor as _poner, leer_valor
+from html_plano import html_en_linea
+from constants import ESTABLECIMIENTOS, TRATAMIENTO_SPC
+import esquema_causa
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from main import MainWindow
     from tramsent import SentenciaWidget
 
+# campo del modelo → widget de MainWindow que lo edita
+_CAMPOS_MAIN = (
+    ("caratula",        "entry_caratula"),
+    ("articulo",        "combo_articulo"),
+    ("tribunal",        "entry_tribunal"),
+    ("secretaria",      "entry_secretaria"),
+    ("sala",            "combo_sala"),
+    ("fecha_audiencia", "entry_fecha"),
+    ("hora_audiencia",  "combo_hora"),
+    ("funcionario",     "entry_funcionario"),
+    ("fiscal_nombre",   "entry_fiscal"),
+    ("sentencia_num",   "entry_sentencia"),
+    ("firmantes",       "entry_firmantes"),
+)
+
+
+def _como(valor, defecto):
+    """``valor`` (leído de un JSON) ajustado al tipo de ``defecto``; si no se puede, ``defecto``."""
+    if isinstance(defecto, bool):
+        if isinstance(valor, str):
+            return valor.strip().lower() in ("sí", "si", "true", "1")
+        return bool(valor)
+    if isinstance(defecto, int):
+        try:
+            return int(valor)
+        except (TypeError, ValueError):
+            return defecto
+    if isinstance(defecto, str):
+        return defecto if valor is None else str(valor)
+    return valor
+
+
+# ---------------------------------------------------------------------------
+#  Registros de imputados y hechos
+# ---------------------------------------------------------------------------
+class _Registro:
+    """Base de ``Imputado``/``Hecho``: anota qué campos cambiaron.
+
+    Cada asignación que realmente modifica un valor agrega el nombre del campo
+    a ``_cambios``; ``tomar_cambios()`` los devuelve y deja el registro limpio.
+    Si el registro pertenece a una ``CausaData``, además se le avisa (``_aviso``)
+    para que notifique a sus suscriptores.
+    """
+    __slots__ = ("_cambios", "_aviso")
+
+    # clave vieja (otras versiones / otra ventana) → campo
+    _ALIAS: dict[str, str] = {}
+
+    def __post_init__(self):
+        object.__setattr__(self, "_cambios", set())
+        object.__setattr__(self, "_aviso", None)
+
+    def __setattr__(self, nombre, valor):
+        cambios = getattr(self, "_cambios", None)
+        if cambios is None or getattr(self, nombre) == valor:
+            object.__setattr__(self, nombre, valor)
+            return
+        object.__setattr__(self, nombre, valor)
+        cambios.add(nombre)
+        if self._aviso is not None:
+            self._aviso(self, nombre)
+
+    def actualizar(self, **valores) -> set[str]:
+        """Asigna sólo los campos que difieren; devuelve cuáles cambiaron."""
+        cambiados = set()
+        for nombre, valor in valores.items():
+            if getattr(self, nombre) != valor:
+                setattr(self, nombre, valor)
+                cambiados.add(nombre)
+        return cambiados
+
+    def tomar_cambios(self) -> set[str]:
+        cambios = self._cambios
+        object.__setattr__(self, "_cambios", set())
+        return cambios
+
+    @classmethod
+    def desde_dict(cls, raw: dict) -> "_Registro":
+        """Adaptador para el JSON viejo: traduce alias e ignora claves ajenas."""
+        if isinstance(raw, cls):
+            return raw
+        base = cls()
+        defectos = {f.name: getattr(base, f.name) for f in dataclasses.fields(cls)}
+        valores = {}
+        for clave, valor in cls._adaptar(dict(raw)).items():
+            clave = cls._ALIAS.get(clave, clave)
+            if clave in defectos:
+                valores[clave] = _como(valor, defectos[clave])
+        return cls(**valores)
+
+    @staticmethod
+    def _adaptar(raw: dict) -> dict:
+        return raw
+
+    def a_dict(self) -> dict:
+        return {f.name: getattr(self, f.name) for f in dataclasses.fields(self)}
+
+
+@dataclass(slots=True, eq=False)
+class Imputado(_Registro):
+    # ─── comunes ───
+    nombre: str = ""
+    datos: str = ""              # datos personales
+    defensa: str = ""
+    delitos: str = ""
+    condena: str = ""
+    # ─── pantalla de trámites ───
+    tipo: str = "efectiva"       # tipo de pena: efectiva / condicional
+    dni: str = ""
+    estable: str = ESTABLECIMIENTOS[0]   # establecimiento penitenciario
+    detenc: str = ""
+    victimas: str = ""
+    hechos_n: str = "uno"        # «uno» / «más»
+    fechas: str = ""
+    decreto: str = ""
+    firm_dec: str = ""
+    trat: str = TRATAMIENTO_SPC
+    punto: str = ""
+    cumpl: str = ""
+    neuro: bool = False
+    civ: bool = False
+    # ─── sentencia ───
+    sexo: str = "M"
+    tipo_def: str = ""           # defensor Público / Privado
+    condiciones: str = ""
+    anteced_no: bool = True
+    anteced: str = ""
+    confesion: str = ""
+    ultima: str = ""
+    pautas: str = ""
+
+    _ALIAS = {
+        "defensor": "defensa",
+        "sexo_cb": "sexo",
+        "antecedentes": "anteced",
+    }
+
+    @staticmethod
+    def _adaptar(raw: dict) -> dict:
+        # La sentencia guardaba el tipo de defensor en «tipo», la misma clave
+        # que usa la pantalla de trámites para el tipo de pena.
+        if raw.get("tipo") in ("Público", "Privado"):
+            raw.setdefault("tipo_def", raw.pop("tipo"))
+        return raw
+
+
+@dataclass(slots=True, eq=False)
+class Hecho(_Registro):
+    descripcion: str = ""        # HTML
+    aclaraciones: str = ""
+    oficina: str = ""
+    juzgado: bool = True         # False → Fiscalía
+    num_auto: str = ""
+    fecha_elev: str = ""
+
+
+# widget de SentenciaWidget → campo de Imputado
+_CLAVES_SENTENCIA = {
+    "nombre": "nombre",
+    "sexo_cb": "sexo",
+    "datos": "datos",
+    "defensor": "defensa",
+    "tipo_def": "tipo_def",
+    "delitos": "delitos",
+    "condena": "condena",
+    "condiciones": "condiciones",
+    "antecedentes": "anteced",
+    "confesion": "confesion",
+    "ultima": "ultima",
+    "pautas": "pautas",
+}
+
+
+_FALTA = object()
+
+
+# widgets de la sección de un hecho (cualquier ventana) que escriben un campo
+_CLAVES_HECHO = ("descripcion", "aclaraciones", "oficina", "rb_j", "num_auto", "fecha_elev")
+
+
+def campo_hecho(w: dict, clave: str, limpiar: bool = False) -> tuple[str, Any]:
+    """``(campo, valor)`` de ``Hecho`` que corresponde al widget ``clave``."""
+    if clave == "descripcion":
+        return "descripcion", w["descripcion"].property("html") or w["descripcion"].text()
+    if clave in ("rb_j", "rb_f"):
+        return "juzgado", w["rb_j"].isChecked()
+    texto = w[clave].text()
+    return clave, texto.strip() if limpiar else texto
+
+
+def valores_hecho(w: dict, limpiar: bool = False) -> dict:
+    """Todos los campos de ``Hecho`` leídos de la sección de un hecho."""
+    return dict(campo_hecho(w, clave, limpiar) for clave in _CLAVES_HECHO)
+
+
 # ---------------------------------------------------------------------------
 @dataclass
 class CausaData:
@@ -31,8 +226,11 @@ class CausaData:
     fiscal_nombre: str = ""
     fiscal_sexo: str = "M"
 
+    secretaria: str = ""
+
     sentencia_num: str = ""      # «123/2025»
-    resuelvo: str = ""
+    resuelvo: str = ""           # texto plano (una línea)
+    resuelvo_html: str = ""
     firmantes: str = ""
     renuncia: bool = False
 
@@ -64,8 +262,85 @@ class CausaData:
     caso_vf: str = "No"
 
     # Listas
-    imputados: List[Dict[str, Any]] = field(default_factory=list)
-    hechos: List[Dict[str, Any]] = field(default_factory=list)
+    imputados: List[Imputado] = field(default_factory=list)
+    hechos: List[Hecho] = field(default_factory=list)
+
+    def __post_init__(self):
+        object.__setattr__(self, "_oyentes", [])
+        # re-asignar pasa por __setattr__, que convierte los dicts
+        self.imputados = self.imputados
+        self.hechos = self.hechos
+
+    # ---------------------------------------------------------------------
+    #  OBSERVADORES
+    # ---------------------------------------------------------------------
+    #  Cada asignación que cambia un campo avisa a los suscriptores con
+    #  ``oyente(campo, registro)``: ``registro`` es None para los campos
+    #  generales y el ``Imputado``/``Hecho`` tocado para «imputados.<campo>»
+    #  y «hechos.<campo>». Si cambia la cantidad de registros se avisa
+    #  «imputados» / «hechos» a secas.
+
+    def suscribir(self, oyente) -> None:
+        if oyente not in self._oyentes:
+            self._oyentes.append(oyente)
+
+    def desuscribir(self, oyente) -> None:
+        if oyente in self._oyentes:
+            self._oyentes.remove(oyente)
+
+    def avisar(self, campo: str, registro=None) -> None:
+        for oyente in list(getattr(self, "_oyentes", ())):
+            oyente(campo, registro)
+
+    def __setattr__(self, nombre, valor):
+        anterior = self.__dict__.get(nombre, _FALTA)
+        if nombre in ("imputados", "hechos"):
+            # JSON viejo (o armado a mano): listas de dicts → registros
+            tipo = Imputado if nombre == "imputados" else Hecho
+            valor = [tipo.desde_dict(r) if isinstance(r, dict) else r for r in valor]
+            self._adoptar(valor)
+        object.__setattr__(self, nombre, valor)
+        if nombre[0] != "_" and anterior is not _FALTA and anterior != valor:
+            self.avisar(nombre)
+
+    def _adoptar(self, registros) -> None:
+        for reg in registros:
+            object.__setattr__(reg, "_aviso", self._aviso_registro)
+
+    def _aviso_registro(self, reg, campo: str) -> None:
+        lista = "imputados" if isinstance(reg, Imputado) else "hechos"
+        self.avisar(f"{lista}.{campo}", reg)
+
+    def _ajustar(self, lista: str, n: int) -> list:
+        """Deja la lista ``lista`` con ``n`` registros (recorta o agrega vacíos)."""
+        registros = getattr(self, lista)
+        if len(registros) == n:
+            return registros
+        tipo = Imputado if lista == "imputados" else Hecho
+        del registros[n:]
+        while len(registros) < n:
+            registros.append(tipo())
+        self._adoptar(registros)
+        self.avisar(lista)
+        return registros
+
+    def ajustar_imputados(self, n: int) -> list[Imputado]:
+        return self._ajustar("imputados", n)
+
+    def ajustar_hechos(self, n: int) -> list[Hecho]:
+        return self._ajustar("hechos", n)
+
+    def imputado(self, idx: int) -> Imputado:
+        """Registro del imputado ``idx``, creando los que falten."""
+        if idx >= len(self.imputados):
+            self.ajustar_imputados(idx + 1)
+        return self.imputados[idx]
+
+    def hecho(self, idx: int) -> Hecho:
+        """Registro del hecho ``idx``, creando los que falten."""
+        if idx >= len(self.hechos):
+            self.ajustar_hechos(idx + 1)
+        return self.hechos[idx]
 
     # ---------------------------------------------------------------------
     #  MÉTODOS  – SYNC CON WIDGETS
@@ -89,6 +364,7 @@ class CausaData:
         self.fecha_audiencia = getattr(win, "entry_fecha",        None).text() if hasattr(win, "entry_fecha") else self.fecha_audiencia
         self.hora_audiencia  = getattr(win, "combo_hora",         None).currentText() if hasattr(win, "combo_hora") else self.hora_audiencia
         self.funcionario     = getattr(win, "entry_funcionario",  None).text() if hasattr(win, "entry_funcionario") else self.funcionario
+        self.secretaria      = getattr(win, "entry_secretaria",   None).text() if hasattr(win, "entry_secretaria") else self.secretaria
         self.fiscal_nombre   = getattr(win, "entry_fiscal",       None).text() if hasattr(win, "entry_fiscal") else self.fiscal_nombre
         self.sentencia_num   = getattr(win, "entry_sentencia",    None).text() if hasattr(win, "entry_sentencia") else self.sentencia_num
         if hasattr(win, "entry_resuelvo"):
@@ -99,135 +375,106 @@ class CausaData:
             html_full = win.entry_resuelvo.property("html") or ""
 
             self.resuelvo_html = html_full
-            from PySide6.QtGui import QTextDocument
-            doc = QTextDocument(); doc.setHtml(html_full)
-            self.resuelvo = doc.toPlainText().replace("\n", " ")
+            self.resuelvo = html_en_linea(html_full)
         self.firmantes       = getattr(win, "entry_firmantes",    None).text() if hasattr(win, "entry_firmantes") else self.firmantes
         self.renuncia        = getattr(win, "combo_renuncia",     None).currentText() == "Sí" if hasattr(win, "combo_renuncia") else self.renuncia
         self.n_imputados     = int(getattr(win, "combo_n",        None).currentText()) if hasattr(win, "combo_n") else self.n_imputados
 
-        # Imputados — copiamos todos los widgets actuales sin perder datos previos
-        old = list(self.imputados)
-        self.imputados.clear()
-        if hasattr(win, "imputados_widgets"):
-            for idx, w in enumerate(win.imputados_widgets):
-                nuevos = {
-                    key: (
-                        widget.text()        if isinstance(widget, QLineEdit) else
-                        widget.currentText() if isinstance(widget, QComboBox) else
-                        widget.isChecked()   if isinstance(widget, QCheckBox) else None
-                    )
-                    for key, widget in w.items()
-                }
-
-                if idx < len(old):
-                    base = old[idx].copy()
-                    base.update(nuevos)
-                else:
-                    base = nuevos
-
-                self.imputados.append(base)
+        # Imputados — se reusan los registros (conservan lo cargado en la
+        # sentencia) y sólo se asignan los campos que cambiaron
+        imps_w = getattr(win, "imputados_widgets", [])
+        imps = self.ajustar_imputados(len(imps_w))
+        for imp, w in zip(imps, imps_w):
+            for key, widget in w.items():
+                setattr(imp, key, leer_valor(widget))
 
         # Hechos
-        self.hechos.clear()
         if hasattr(win, "hechos_widgets"):
             self.num_hechos = win.spin_hechos.value()
-            for w in win.hechos_widgets:
-                self.hechos.append({
-                    "descripcion": w["descripcion"].property("html") or w["descripcion"].text(),
-                    "aclaraciones": w["aclaraciones"].text(),
-                    "oficina": w["oficina"].text(),
-                    "juzgado": w["rb_j"].isChecked(),
-                    "num_auto": w["num_auto"].text(),
-                    "fecha_elev": w["fecha_elev"].text(),
-                })
+            hechos = self.ajustar_hechos(len(win.hechos_widgets))
+            for hecho, w in zip(hechos, win.hechos_widgets):
+                hecho.actualizar(**valores_hecho(w))
         else:
-            self.num_hechos = len(self.hechos)
+            self.hechos.clear()
+            self.num_hechos = 0
         # print("[DEBUG from_main] Modelo después:", self.imputados)
 
-    def apply_to_main(self, win: "MainWindow") -> None:
-        """Carga los widgets de MainWindow con los valores guardados."""
+    def apply_to_main(self, win: "MainWindow", campos=None) -> set[str]:
+        """Lleva al formulario de MainWindow sólo lo que difiere del modelo.
+
+        Es una sincronización en un solo sentido (modelo → widgets): no se
+        toca ningún widget cuyo valor ya coincide, y las pestañas de
+        imputados/hechos se reconstruyen únicamente si cambió la cantidad.
+        ``campos`` limita los campos a revisar (por defecto, todos).
+        Devuelve el conjunto de campos que efectivamente cambiaron.
+        """
         if not hasattr(win, "entry_caratula"):
-            return  # aún no está construida la UI
-        # (usamos "setText" / "setCurrentText" solo cuando el valor difiere para evitar señales infinitas)
-        _set = lambda w, val: w.setText(val)         if w.text() != val else None
-        _setc= lambda w, val: w.setCurrentText(val)  if w.currentText() != val else None
-
-        _set(win.entry_caratula, self.caratula)
-        _setc(win.combo_articulo, self.articulo)
-        # Tribunal: si es combo editable, usamos setCurrentText; si no, volvemos a setText
-        trib_widget = getattr(win, "entry_tribunal", None)
-        if trib_widget is not None:
-            if hasattr(trib_widget, "setCurrentText"):
-                if trib_widget.currentText() != self.tribunal:
-                    trib_widget.setCurrentText(self.tribunal)
-            else:
-                # sigue usando _set para QLineEdit u otros
-                _set(trib_widget, self.tribunal)
-
-        _setc(win.combo_sala, self.sala)
-        _set(win.entry_fecha, self.fecha_audiencia)
-        _setc(win.combo_hora, self.hora_audiencia)
-        _set(win.entry_funcionario, self.funcionario)
-        _set(win.entry_fiscal, self.fiscal_nombre)
-        _set(win.entry_sentencia, self.sentencia_num)
-        if hasattr(win, "entry_resuelvo"):
-            blocker = QSignalBlocker(win.entry_resuelvo)
-            html_full = getattr(self, "resuelvo_html", self.resuelvo)
-            win.entry_resuelvo.setProperty("html", html_full)
-            win.entry_resuelvo.setHtml(html_full)
-        _set(win.entry_firmantes, self.firmantes)
-        _setc(win.combo_renuncia, "Sí" if self.renuncia else "No")
-        # Evito que al cambiar combo_n se dispare update_template() → data.from_main()
-        was_blocked = win.combo_n.blockSignals(True)
-        win.combo_n.setCurrentText(str(self.n_imputados))
-        win.combo_n.blockSignals(was_blocked)
-        # reconstruir pestañas y volcar datos imputados
-        win.rebuild_imputados()
+            return set()  # aún no está construida la UI
+        quiere = (lambda c: True) if campos is None else set(campos).__contains__
+        cambios: set[str] = set()
+
+        for campo, attr in _CAMPOS_MAIN:
+            widget = getattr(win, attr, None)
+            if widget is not None and quiere(campo):
+                if _poner(widget, getattr(self, campo)):
+                    cambios.add(campo)
+        if quiere("renuncia") and _poner(win.combo_renuncia, "Sí" if self.renuncia else "No"):
+            cambios.add("renuncia")
+
+        if quiere("resuelvo") and hasattr(win, "entry_resuelvo"):
+            html_full = self.resuelvo_html or self.resuelvo
+            if (win.entry_resuelvo.property("html") or "") != html_full:
+                with QSignalBlocker(win.entry_resuelvo):
+                    win.entry_resuelvo.setProperty("html", html_full)
+                    win.entry_resuelvo.setHtml(html_full)
+                cambios.add("resuelvo")
+
+        # --- Imputados ---
+        if quiere("imputados"):
+            n = self.n_imputados or 1
+            # Evito que al cambiar combo_n se dispare la reconstrucción por señal
+            if win.combo_n.currentText() != str(n):
+                with QSignalBlocker(win.combo_n):
+                    win.combo_n.setCurrentText(str(n))
+            if len(win.imputados_widgets) != n:
+                win.rebuild_imputados()
+                cambios.add("imputados")
+            for idx, w in enumerate(win.imputados_widgets):
+                if idx >= len(self.imputados):
+                    break
+                dato = self.imputados[idx]
+                for k, widget in w.items():
+                    if _poner(widget, getattr(dato, k)):
+                        cambios.add("imputados")
+            if "imputados" in cambios:
+                win._refresh_imp_names_in_selector()
 
         # --- Hechos ---
-        if hasattr(win, "spin_hechos"):
-            was_blocked = win.spin_hechos.blockSignals(True)
-            win.spin_hechos.setValue(self.num_hechos or len(self.hechos) or 1)
-            win.spin_hechos.blockSignals(was_blocked)
-            win.rebuild_hechos()
+        if quiere("hechos") and hasattr(win, "spin_hechos"):
+            n = self.num_hechos or len(self.hechos) or 1
+            if win.spin_hechos.value() != n:
+                with QSignalBlocker(win.spin_hechos):
+                    win.spin_hechos.setValue(n)
+            if len(win.hechos_widgets) != n:
+                win.rebuild_hechos()
+                cambios.add("hechos")
             for idx, datos in enumerate(self.hechos):
                 if idx >= len(win.hechos_widgets):
                     break
                 w = win.hechos_widgets[idx]
-                w["descripcion"].setProperty("html", datos.get("descripcion", ""))
-                from PySide6.QtGui import QTextDocument
-                doc = QTextDocument(); doc.setHtml(datos.get("descripcion", ""))
-                w["descripcion"].setText(doc.toPlainText().replace("\n", " "))
-                w["aclaraciones"].setText(datos.get("aclaraciones", ""))
-                w["oficina"].setText(datos.get("oficina", ""))
-                if datos.get("juzgado", True):
-                    w["rb_j"].setChecked(True)
-                else:
-                    w["rb_f"].setChecked(True)
-                w["num_auto"].setText(datos.get("num_auto", ""))
-                w["fecha_elev"].setText(datos.get("fecha_elev", ""))
-
-        # bucle de copia
-        for idx, w in enumerate(win.imputados_widgets):
-            if idx >= len(self.imputados):
-                break
-            dato = self.imputados[idx]
-            for k, widget in w.items():
-                if k not in dato:
-                    continue
-                if isinstance(widget, QLineEdit):
-                    widget.setText(dato[k])
-                elif isinstance(widget, QComboBox):
-                    widget.setCurrentText(dato[k])
-                elif isinstance(widget, QCheckBox):
-                    widget.setChecked(bool(dato[k]))
-
-        win._refresh_imp_names_in_selector()
-
-        # (Quedaba un segundo bucle duplicado; si realmente lo necesitas, pégalo aquí,
-        # pero normalmente basta con uno solo)
-
+                if (w["descripcion"].property("html") or "") != datos.descripcion:
+                    w["descripcion"].setProperty("html", datos.descripcion)
+                    _poner(w["descripcion"], html_en_linea(datos.descripcion))
+                    cambios.add("hechos")
+                for k in ("aclaraciones", "oficina", "num_auto", "fecha_elev"):
+                    if _poner(w[k], getattr(datos, k)):
+                        cambios.add("hechos")
+                rb = w["rb_j"] if datos.juzgado else w["rb_f"]
+                if not rb.isChecked():
+                    rb.setChecked(True)
+                    cambios.add("hechos")
+
+        return cambios
 
     # ------------- SentenciaWidget ↔ modelo ----------------
 # ------------- SentenciaWidget ↔ modelo ----------------
@@ -257,54 +504,24 @@ class CausaData:
         self.n_imputados     = sw.var_num_imputados.value()
         html_full = sw.var_resuelvo.property("html") or ""
         self.resuelvo_html = html_full
-        from PySide6.QtGui import QTextDocument
-        doc = QTextDocument(); doc.setHtml(html_full)
-        self.resuelvo = doc.toPlainText().replace("\n", " ")
+        self.resuelvo = html_en_linea(html_full)
         self.alegato_fiscal  = sw.var_alegato_fiscal
         self.alegato_defensa = sw.var_alegato_defensa
 
-        old = list(self.imputados)
-        self.imputados.clear()
-
-        # Usamos enumerate normal (idx empieza en 0)
-        for idx, imp_w in enumerate(sw.imputados):
-            nuevos = {
-                "nombre"      : imp_w["nombre"].text().strip(),
-                "sexo"        : imp_w["sexo_cb"].currentText(),
-                "datos"       : imp_w["datos"].text().strip(),
-                "defensa"     : imp_w["defensor"].text().strip(),
-                "tipo"        : imp_w["tipo_def"].currentText().strip(),
-                "delitos"     : imp_w["delitos"].text().strip(),
-                "condena"     : imp_w["condena"].text().strip(),
-                "condiciones" : imp_w["condiciones"].text().strip(),
-                "anteced_no"  : imp_w["antecedentes_opcion"][0].isChecked(),
-                "anteced"     : imp_w["antecedentes"].text().strip(),
-                "confesion"   : imp_w["confesion"].text().strip(),
-                "ultima"      : imp_w["ultima"].text().strip(),
-                "pautas"      : imp_w["pautas"].text().strip(),
-            }
-
-            if idx < len(old):
-                base = old[idx].copy()
-                base.update(nuevos)
-            else:
-                base = nuevos
-
-            # print(f"[from_sentencia] imputado #{idx+1} fused →", base)
-            self.imputados.append(base)
+        # Los registros se reusan: lo que sólo edita la pantalla de trámites
+        # (DNI, establecimiento…) queda intacto
+        imps = self.ajustar_imputados(len(sw.imputados))
+        for imp, imp_w in zip(imps, sw.imputados):
+            for clave, campo in _CLAVES_SENTENCIA.items():
+                valor = leer_valor(imp_w[clave])
+                setattr(imp, campo, valor.strip() if isinstance(valor, str) else valor)
+            imp.anteced_no = imp_w["antecedentes_opcion"][0].isChecked()
 
         # Hechos
-        self.hechos.clear()
         self.num_hechos = sw.var_num_hechos.value()
-        for h_w in sw.hechos:
-            self.hechos.append({
-                "descripcion": h_w["descripcion"].property("html") or h_w["descripcion"].text(),
-                "aclaraciones": h_w["aclaraciones"].text().strip(),
-                "oficina": h_w["oficina"].text().strip(),
-                "juzgado": h_w["rb_j"].isChecked(),
-                "num_auto": h_w["num_auto"].text().strip(),
-                "fecha_elev": h_w["fecha_elev"].text().strip(),
-            })
+        hechos = self.ajustar_hechos(len(sw.hechos))
+        for hecho, h_w in zip(hechos, sw.hechos):
+            hecho.actualizar(**valores_hecho(h_w, limpiar=True))
 
         # print("[DEBUG from_sentencia] Modelo después:", self.imputados)
 
@@ -321,14 +538,12 @@ class CausaData:
         sw.combo_fiscal_sexo.setCurrentText(self.fiscal_sexo)
         sw.var_dia_audiencia.setText(self.fecha_audiencia)
         sw.var_num_imputados.setValue(self.n_imputados)
-        html_full = getattr(self, "resuelvo_html", self.resuelvo)
+        html_full = self.resuelvo_html or self.resuelvo
         sw.var_resuelvo.setProperty("html", html_full)
         if hasattr(sw.var_resuelvo, "setHtml"):
             sw.var_resuelvo.setHtml(html_full)
         else:
-            from PySide6.QtGui import QTextDocument
-            doc = QTextDocument(); doc.setHtml(html_full)
-            sw.var_resuelvo.setText(doc.toPlainText().replace("\n", " "))
+            sw.var_resuelvo.setText(html_en_linea(html_full))
         sw.var_alegato_fiscal  = self.alegato_fiscal
         sw.var_alegato_defensa = self.alegato_defensa
 
@@ -340,21 +555,15 @@ class CausaData:
             if idx >= len(sw.imputados):
                 break
             w = sw.imputados[idx]
-            w["nombre"].setText( datos_imp.get("nombre", "") )
-            w["sexo_cb"].setCurrentText(datos_imp.get("sexo", "M"))
-            w["datos"].setText( datos_imp.get("datos","") )
-            w["defensor"].setText( datos_imp.get("defensa","") )
-            w["tipo_def"].setCurrentText( datos_imp.get("tipo","") )
-            w["delitos"].setText( datos_imp.get("delitos","") )
-            w["condena"].setText( datos_imp.get("condena","") )
-            w["condiciones"].setText( datos_imp.get("condiciones","") )
+            for clave, campo in _CLAVES_SENTENCIA.items():
+                valor = getattr(datos_imp, campo)
+                if clave in ("sexo_cb", "tipo_def"):
+                    w[clave].setCurrentText(valor)
+                else:
+                    w[clave].setText(valor)
             # antecedentes (QRadioButton + QLineEdit)
-            w["antecedentes_opcion"][0].setChecked( datos_imp.get("anteced_no",True) )
-            w["antecedentes_opcion"][1].setChecked(not datos_imp.get("anteced_no",True))
-            w["antecedentes"].setText( datos_imp.get("anteced","") )
-            w["confesion"].setText( datos_imp.get("confesion","") )
-            w["ultima"].setText( datos_imp.get("ultima","") )
-            w["pautas"].setText( datos_imp.get("pautas","") )
+            w["antecedentes_opcion"][0].setChecked(datos_imp.anteced_no)
+            w["antecedentes_opcion"][1].setChecked(not datos_imp.anteced_no)
 
         # 3) Ahora sincronizamos los hechos:
         count_hechos = len(self.hechos)
@@ -364,70 +573,68 @@ class CausaData:
             if idx >= len(sw.hechos):
                 break
             w = sw.hechos[idx]
-            w["descripcion"].setProperty("html", datos_hec.get("descripcion", ""))
-            from PySide6.QtGui import QTextDocument
-            doc = QTextDocument(); doc.setHtml(datos_hec.get("descripcion", ""))
-            w["descripcion"].setText(doc.toPlainText().replace("\n", " "))
-            w["aclaraciones"].setText(datos_hec.get("aclaraciones", ""))
-            w["oficina"].setText(datos_hec.get("oficina", ""))
-            if datos_hec.get("juzgado", True):
+            w["descripcion"].setProperty("html", datos_hec.descripcion)
+            w["descripcion"].setText(html_en_linea(datos_hec.descripcion))
+            w["aclaraciones"].setText(datos_hec.aclaraciones)
+            w["oficina"].setText(datos_hec.oficina)
+            if datos_hec.juzgado:
                 w["rb_j"].setChecked(True)
             else:
                 w["rb_f"].setChecked(True)
-            w["num_auto"].setText(datos_hec.get("num_auto", ""))
-            w["fecha_elev"].setText(datos_hec.get("fecha_elev", ""))
+            w["num_auto"].setText(datos_hec.num_auto)
+            w["fecha_elev"].setText(datos_hec.fecha_elev)
 
         sw.actualizar_plantilla()
 
-    def to_json(self, path: str | pathlib.Path) -> None:
-        with open(path, "w", encoding="utf-8") as fh:
-            json.dump(dataclasses.asdict(self), fh, ensure_ascii=False, indent=2)
+    # ---------------------------------------------------------------------
+    #  PERSISTENCIA  (formato de ``esquema_causa``)
+    # ---------------------------------------------------------------------
+    def a_dict(self) -> dict:
+        """La causa en el formato guardado actual."""
+        return {"version": esquema_causa.VERSION, **dataclasses.asdict(self)}
 
     @classmethod
+    def desde_dict(cls, raw: dict) -> "CausaData":
+        """Causa de cualquier versión; ignora claves ajenas y ajusta los tipos."""
+        raw = esquema_causa.migrar(dict(raw))
+        base = cls()
+        valores = {}
+        for f in dataclasses.fields(cls):
+            if f.name not in raw:
+                continue
+            valor = raw[f.name]
+            if f.name in ("imputados", "hechos"):
+                # ``__setattr__`` convierte cada dict en su registro
+                valores[f.name] = [r for r in valor if isinstance(r, dict)] \
+                    if isinstance(valor, list) else []
+            else:
+                valores[f.name] = _como(valor, getattr(base, f.name))
+        causa = cls(**valores)
+        if causa.resuelvo_html and not causa.resuelvo:
+            causa.resuelvo = html_en_linea(causa.resuelvo_html)
+        return causa
+
+    def cargar(self, raw: dict) -> None:
+        """Reemplaza el contenido por el de ``raw`` sin cambiar de instancia.
+
+        Las ventanas comparten esta ``CausaData``: cada campo que cambia se
+        avisa a los suscriptores como cualquier otra edición.
+        """
+        nueva = type(self).desde_dict(raw)
+        for f in dataclasses.fields(self):
+            setattr(self, f.name, getattr(nueva, f.name))
 
-    def from_json(cls, path: str | pathlib.Path) -> "CausaData":
-        with open(path, "r", encoding="utf-8") as fh:
-            raw = json.load(fh)
-        return cls(**raw)
-
-    # Guardar causa
-    def guardar_causa(self):
-        CAUSAS_DIR = Path("causas_guardadas")
-        CAUSAS_DIR.mkdir(exist_ok=True)
-        self.data.from_main(self)                           # sincroniza
-        path, _ = QFileDialog.getSaveFileName(
-            self, "Guardar causa", str(CAUSAS_DIR), "JSON (*.json)")
-        if path:
-            self.data.to_json(path)
-            QMessageBox.information(self, "OK", "Causa guardada.")
-
-    # Cargar causa
-    def cargar_causa(self):
-        CAUSAS_DIR = Path("causas_guardadas")
-        CAUSAS_DIR.mkdir(exist_ok=True)
-        path, _ = QFileDialog.getOpenFileName(
-            self, "Cargar causa", str(CAUSAS_DIR), "JSON (*.json)")
-        if path:
-            self.data = CausaData.from_json(path)           # ¡nueva instancia!
-            self.data.apply_to_main(self)                   # refresca widgets
-
-# Eliminar causa  (sin cambios relevantes)
-    def eliminar_causa(self):
-        CAUSAS_DIR = Path("causas_guardadas")
-        CAUSAS_DIR.mkdir(exist_ok=True)
-        path, _ = QFileDialog.getOpenFileName(self, "Eliminar causa",
-                                              str(CAUSAS_DIR), "JSON (*.json)")
-        if path and QMessageBox.question(
-            self, "Confirmar", f"¿Eliminar {Path(path).name}?"
-        ) == QMessageBox.Yes:
-            Path(path).unlink(missing_ok=True)
-
+    def to_json(self, path: str | pathlib.Path) -> None:
+        esquema_causa.escribir(path, self.a_dict())
 
+    @classmethod
+    def from_json(cls, path: str | pathlib.Path) -> "CausaData":
+        return cls.desde_dict(esquema_causa.leer(path))
 
     # ------------------------------------------------------------------
     #  Factory / singleton (opcional)
     # ------------------------------------------------------------------
-    _singleton: "CausaData | None" = None
+    _singleton: ClassVar["CausaData | None"] = None
 
     @classmethod
     def instance(cls) -> "CausaData":
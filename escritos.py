@@ -0,0 +1,321 @@
+# escritos.py
+"""Plantillas de los escritos de la ventana principal (oficios, actas, decretos).
+
+Cada ``MainWindow._plantilla_*`` junta los datos en un diccionario, llama a la
+plantilla que le toca y vuelca el resultado con ``motor_plantillas.escribir``.
+El marcado es el subconjunto que entiende ``escribir``: ``<p>`` (con
+``align="right"``/``"center"``; sin ``align``, justificado), ``<b>``, ``<i>``,
+``<u>`` y ``<br>``. ``<p></p>`` es una línea en blanco.
+
+Las negritas van en la plantilla, alrededor del dato (la carátula, el
+penado, los firmantes): no se buscan después en el documento, así que un
+mismo texto que aparezca de casualidad en otra parte no se marca.
+"""
+from motor_plantillas import compilar
+
+PEDIDO = compilar("""
+<p>Córdoba, {{ fecha }}.</p>
+<p>Atento al requerimiento de audiencia oral de juicio abreviado inicial,
+admítase la solicitud y requiérase vía e‑oficio a la Oficina de Gestión de
+Audiencias (OGA) que fije día y hora de realización de la audiencia presencial
+y asigne la sala para su desarrollo (art. 336 del CPP y Anexo II del AR
+n.º 1747 Serie “A” de fecha 1/4/2022).</p>
+""", "pedido")
+
+OFICIO_OGA = compilar("""
+<p align="right">{{ fecha }}</p>
+<p></p>
+<p><b>Sr. Director de</b></p>
+<p><b>OGA Penal</b></p>
+<p><b>S ____________/______________D</b></p>
+<p></p>
+<p>En los autos caratulados <b>{{ caratula }}</b>, que se tramitan en {{ articulo }}
+{{ tribunal }}, secretaría a cargo de {{ secretaria }}, se ha resuelto librar
+a Ud. el presente oficio a fin de solicitar fecha y hora de audiencia de
+juicio abreviado inicial, conforme la información que se suministra por
+archivo adjunto.</p>
+<p></p>
+<p align="center"><b>Saludo a Ud. atentamente.</b></p>
+""", "oficio_oga")
+
+DECRETO_AUDIENCIA = compilar("""
+<p>Córdoba, {{ fecha }}.</p>
+<p></p>
+<p>Atento a lo informado por la Oficina de Gestión de Audiencias (OGA)
+mediante oficio electrónico, notifíquese a las partes que se ha fijado
+audiencia a los fines de resolver la situación procesal
+{% if len(nombres) > 1 %}
+de los imputados {{ lista_y(nombres) }}
+{% else %}
+del imputado{% if nombres %} {{ nombres[0] }}{% endif %}
+{% endif %}
+para el <b><u>día {{ fecha_audiencia }} a las {{ hora }} h en la {{ sala }}
+de Tribunales II</u></b> (art. 336 del CPP).</p>
+""", "decreto_audiencia")
+
+OFICIO_NOTIFICACION = compilar("""
+<p align="right">{{ fecha }}</p>
+<p></p>
+<p><b>Sra. Jefa del Servicio Penitenciario</b></p>
+<p><b>de la Provincia de Córdoba</b></p>
+<p><b>S ____________/______________D</b></p>
+<p></p>
+<p>En los autos caratulados <b>{{ caratula }}</b>, que se tramitan en
+{{ articulo }} {{ tribunal }} se ha resuelto enviar el presente oficio a fin
+de solicitarle quiera tener a bien notificar la siguiente cédula al imputado
+<b>{{ nombre }}</b>, DNI n.° {{ dni }}, cuya constancia de diligenciamiento
+deberá ser remitida a esta dependencia judicial:<br></p>
+<p align="center"><b><u>CÉDULA DE NOTIFICACIÓN</u></b></p>
+<p>TRIBUNAL: {{ tribunal }}.</p>
+<p>SECRETARÍA: {{ secretaria }}.</p>
+<p>SEÑOR/A: {{ nombre }}.</p>
+<p>DOMICILIO: {{ establecimiento }}.</p>
+<p></p>
+<p>Se le hace saber a Ud. que en los autos caratulados <b>{{ caratula }}</b>,
+que se tramitan en {{ articulo }} {{ tribunal }} se ha dictado la siguiente
+resolución: “{{ resolucion }}” Fdo.: {{ funcionario }}.</p>
+<p></p>
+<p align="center"><b>QUEDA UD. DEBIDAMENTE NOTIFICADO.</b></p>
+<p align="center"><b>Sin otro particular, saludo a Ud. atte.</b></p>
+""", "oficio_notificacion")
+
+ACTA_RENUNCIA = compilar("""
+{% if not renuncia %}
+<p>No hubo renuncia a los plazos para interponer recurso de casación.</p>
+{% else %}
+<p>En la ciudad de Córdoba, el {{ fecha }}, siendo las {{ hora }} horas, en los
+presentes autos caratulados {{ caratula }}, luego de haberse impuesto los
+fundamentos y el veredicto del día de la fecha, {{ fiscal }};
+{{ lista_y(defensas) or "Sin datos de defensa" }}; y
+{{ numero(len(nombres), "el imputado", "los imputados") }}
+{{ lista_y(nombres) or "Sin datos del penado" }} manifestaron su voluntad de
+renunciar al plazo para interponer el recurso establecido en los arts. 468 y
+469 del CPP, conforme lo estipulado por el art. 474 del CPP.</p>
+<p></p>
+<p>Con lo que dio por terminado el acto, el que previa lectura dada en alta
+voz y ratificación de su contenido, firman las partes, todo por ante mí, de lo
+que doy fe.</p>
+{% endif %}
+""", "acta_renuncia")
+
+CONSTANCIA_GRABACION = compilar("""
+<p>Por medio de la presente, adjunto el archivo PDF que contiene el enlace de
+la grabación de la audiencia de juicio abreviado inicial celebrada con fecha
+{{ fecha_audiencia }}, en la que se resolvió la situación procesal de
+{{ lista_y(nombres) }}. Of., {{ fecha }}.</p>
+""", "constancia_grabacion")
+
+CERTIFICADO_VICTIMAS = compilar("""
+<p>Certifico: que en el día de la fecha logré entablar comunicación con
+{{ lista_y(victimas) }}, damnificado/s en la presente causa, a fin de
+hacerle/s conocer la sentencia recaída en autos y conocer su voluntad respecto
+de las facultades que le/s confiere el art. 11 bis de la Ley 24.660. En dicha
+ocasión, {{ lista_y(victimas) }} manifestó/aron su voluntad de SER / NO SER
+anoticiado/s de los eventuales beneficios de libertad. Of., {{ fecha }}.</p>
+""", "certificado_victimas")
+
+OFICIO_NEURO = compilar("""
+<p align="right">{{ fecha }}</p>
+<p></p>
+<p><b>AL SR. DIRECTOR</b></p>
+<p><b>DEL HOSPITAL</b></p>
+<p><b>NEUROPSIQUIÁTRICO</b></p>
+<p><b>PROVINCIAL</b></p>
+<p><b><u>(Rector León Morra 160)</u></b></p>
+<p><b>S___________/___________D</b></p>
+<p></p>
+<p>En los autos caratulados <b>{{ caratula }}</b>, que se tramitan ante {{ articulo }}
+{{ tribunal }}, se ha resuelto librar a Ud. el presente a fin de solicitarle
+que arbitre los medios necesarios para que <b>{{ nombre }}</b>, DNI n.° {{ dni }},
+reciba en la institución a su cargo un tratamiento interdisciplinario acorde
+con la problemática de adicción a sustancias estupefacientes que padece.
+Fundamenta el presente lo resuelto por veredicto dictado por este tribunal en
+el día de la fecha, en el que se impuso a la persona nombrada la pena bajo una
+serie de condiciones, entre ellas: <i>“Iniciar un tratamiento
+interdisciplinario acorde a la problemática de adicción a sustancias
+estupefacientes que padece, debiendo presentar constancia del inicio del mismo
+en el término de 15 días ante el tribunal de ejecución interviniente”. </i>En
+consecuencia, se solicita a Ud. la elaboración de un informe periódico dirigido
+a este tribunal, en el que comente la asistencia al tratamiento, así como su
+avance, y todo otro dato de interés.</p>
+<p></p>
+<p align="center"><b>Saluda a Ud. atte.</b></p>
+""", "oficio_neuro")
+
+OFICIO_CIV = compilar("""
+<p align="right">{{ fecha }}</p>
+<p></p>
+<p><b>AL SR. DIRECTOR DEL</b></p>
+<p><b><u>CENTRO INTEGRAL DE VARONES</u></b></p>
+<p><b>(Rondeau 258, Nueva Córdoba)</b></p>
+<p><b>S______________/______________D</b></p>
+<p></p>
+<p>En los presentes autos caratulados <b>{{ caratula }}</b>, que se tramitan por ante
+{{ articulo }} {{ tribunal }}, secretaría a cargo de {{ secretaria }}, por
+disposición de S.S. se dirige a Ud. el presente oficio a fin de solicitarle
+disponga los medios necesarios para brindar asistencia psicoterapéutica a
+<b>{{ nombre }}</b>, DNI n.° {{ dni }}, con relación a su problemática de violencia de
+género. Tal petición encuentra razón en que este Tribunal dispuso como
+condición de su libertad la realización de dicho tratamiento.</p>
+<p></p>
+<p align="center"><b>Sin otro particular, saluda a Ud. atte.</b></p>
+""", "oficio_civ")
+
+OFICIO_LIBERTAD = compilar("""
+<p align="right">{{ fecha }}</p>
+<p><b>A LA SRA. JEFA DEL</b></p>
+<p><b>SERVICIO PENITENCIARIO</b></p>
+<p><b>DE LA PROVINCIA DE CÓRDOBA</b></p>
+<p><b>S___________/___________D</b></p>
+<p></p>
+<p>En los autos caratulados <b>{{ caratula }}</b> que se tramitan ante {{ articulo }}
+{{ tribunal }}, se ha dispuesto dirigir a Ud. el presente a fin de que disponga
+lo necesario para que se ponga inmediatamente en libertad, desde la Alcaidía
+de Tribunales II, a <b>{{ nombre }}</b>, DNI n.° {{ dni }}, en virtud de que por
+veredicto de este tribunal dictado en el día de la fecha se le impuso la pena
+de {{ condena }}, disponiéndose su inmediata libertad. Deberá labrarse el acta
+respectiva y deberá requerírsele a la persona condenada que fije domicilio, el
+que deberá quedar consignado en el acta de libertad. La libertad se deberá
+disponer previa constatación de que el nombrado no se encuentre a disposición
+de otro tribunal.</p>
+<p></p>
+<p align="center"><b>Sin otro particular, saludo a Ud. atte.</b></p>
+""", "oficio_libertad")
+
+OFICIO_POLICIA = compilar("""
+<p align="right">{{ fecha }}</p>
+<p><b>AL SEÑOR DIRECTOR DE LA</b></p>
+<p><b>DIVISIÓN DOCUMENTACIÓN PERSONAL</b></p>
+<p><b>POLICÍA DE LA PROVINCIA DE CÓRDOBA</b></p>
+<p><b>S______________/______________D</b></p>
+<p></p>
+<p>En los autos caratulados <b>{{ caratula }}</b>, tramitados por ante {{ articulo }}
+{{ tribunal }}, se ha resuelto librar a Ud. el presente a fin de que proceda a
+la anotación correspondiente de la <b>sentencia n.° {{ sentencia }}</b> en los
+presentes autos, con relación a <b>{{ penado }}</b>, DNI n.° {{ dni }}, por
+{{ hechos }} de fecha {{ fechas_hechos }}, que <b>RESUELVE:</b> <i>“{{ resuelvo }}”</i>.
+<b>Fdo.: {{ firmantes }}</b>.</p>
+<p></p>
+<p align="center"><b>Saludo a Ud. atte.</b></p>
+""", "oficio_policia")
+
+OFICIO_REINCIDENCIA = compilar("""
+<p align="center">MINISTERIO DE JUSTICIA, SEGURIDAD Y DERECHOS HUMANOS</p>
+<p align="center">REGISTRO NACIONAL DE REINCIDENCIA</p>
+<p align="center"></p>
+<p align="center"><b><u>TESTIMONIO DE SENTENCIA CONDENATORIA</u></b></p>
+<p align="center"></p>
+{% for titulo, valor in datos %}
+<p><b>{{ titulo }}: </b>{{ valor }}</p>
+{% endfor %}
+<p><b>•    Pena: </b>{{ pena }}</p>
+<p><b><u>TESTIMONIO</u>: </b><i>"(...) {{ punto }} (...)"</i></p>
+{% for titulo, valor in cierre %}
+<p><b>{{ titulo }}: </b>{{ valor }}</p>
+{% endfor %}
+""", "oficio_reincidencia")
+
+OFICIO_COMPUTO = compilar("""
+<p align="right">{{ fecha }}</p>
+<p><b>SRA. JEFA DEL SERVICIO</b></p>
+<p><b>PENITENCIARIO DE LA</b></p>
+<p><b>PROVINCIA DE CÓRDOBA</b></p>
+<p><b>S______________/______________D</b></p>
+<p></p>
+<p>En los autos caratulados <b>{{ caratula }}</b>, que se tramitan por ante
+{{ articulo }} {{ tribunal }}, se ha resuelto enviar el presente oficio a fin
+de solicitarle quiera tener a bien notificar la siguiente cédula a
+<b>{{ penado }}</b>, DNI n.° {{ dni }}, cuya constancia de diligenciamiento deberá ser
+remitida a esta dependencia judicial:<br></p>
+<p></p>
+<p align="center"><b><u>CÉDULA DE NOTIFICACIÓN</u></b></p>
+<p></p>
+<p>TRIBUNAL: {{ tribunal }}, Fructuoso Rivera n.° 720, Palacio de Tribunales II.</p>
+<p>SECRETARÍA: {{ secretaria }}.</p>
+<p>SEÑOR: <b>{{ penado }}</b>.</p>
+<p>DOMICILIO: {{ establecimiento }}.</p>
+<p></p>
+<p>Se hace saber a Ud. que en los autos caratulados <b>{{ caratula }}</b>, que se
+tramitan por ante {{ articulo }} {{ tribunal }}, se ha dictado la siguiente
+resolución: <i>“{{ decreto }}”</i>. <b>Fdo.: {{ firmantes }}</b>.</p>
+<p align="right">Of. {{ fecha_oficio }}.</p>
+<p align="center"><b>Saludo a Ud. atte.</b></p>
+""", "oficio_computo")
+
+OFICIO_SPC = compilar("""
+<p align="right">{{ fecha }}</p>
+<p><b>SR. DIRECTOR DEL</b></p>
+<p><b>ESTABLECIMIENTO PENITENCIARIO</b></p>
+<p><b>PBRO. LUCHESSE –BOWER–</b></p>
+<p><b>S__________________/__________________D</b></p>
+<p></p>
+<p>En los autos caratulados <b>{{ caratula }}</b>, que se tramitan por ante
+{{ articulo }} {{ tribunal }}, se ha dispuesto librar a Ud. el presente, a fin
+de que cumplimente con lo resuelto por este tribunal en la <b>sentencia n.°
+{{ sentencia }}</b>, con relación a <b>{{ penado }}</b>, DNI n.° {{ dni }}, a los efectos
+de que arbitre los medios necesarios para que {{ tratamiento }}.</p>
+<p></p>
+<p>Para mayor recaudo se transcribe la parte resolutiva que así lo dispone:
+<i>“{{ punto }}”</i>. <b>Fdo.: {{ firmantes }}</b>.</p>
+<p></p>
+<p align="center"><b>Saludo a Ud. atte.</b></p>
+""", "oficio_spc")
+
+OFICIO_COMUNICACION = compilar("""
+<p align="right">{{ fecha }}</p>
+<p><b>SRA. JEFA DEL SERVICIO</b></p>
+<p><b>PENITENCIARIO DE LA</b></p>
+<p><b>PROVINCIA DE CÓRDOBA</b></p>
+<p><b>S______________/______________D</b></p>
+<p></p>
+<p>En los autos caratulados <b>{{ caratula }}</b>, tramitados por ante {{ articulo }}
+{{ tribunal }}, se ha resuelto librar a Ud. el presente a fin de informarle que
+el imputado <b>{{ penado }}</b>, DNI n.° {{ dni }}, ha sido condenado a la pena de
+<b>{{ condena }}</b>. Ello en virtud de que se ha llevado a cabo un juicio abreviado
+inicial y mediante <b>sentencia n.° {{ sentencia }}</b>, se resolvió:
+<i>“{{ resuelvo }}”</i>. <b>Fdo.: {{ firmantes }}</b>.</p>
+<p></p>
+<p>Asimismo, se hace saber que dicha sentencia quedó firme con fecha
+{% if renuncia %}
+{{ fecha_audiencia }} por renuncia expresa de las partes a los plazos para
+interponer recurso de casación{% endif %}. A continuación, se transcribe el
+decreto que establece el cómputo definitivo de la pena impuesta:
+<i>“{{ decreto }}”</i>. <b>Fdo.: {{ firmantes_decreto }}</b>.</p>
+<p></p>
+<p align="center"><b>Saludo a Ud. atte.</b></p>
+""", "oficio_comunicacion")
+
+LEGAJO = compilar("""
+<p align="center"><b><u>LEGAJO DE REMISIÓN AL JUZGADO DE EJECUCIÓN PENAL</u></b></p>
+<p align="center"><b>Pena privativa de la libertad{% if condicional %} de ejecución
+condicional{% endif %}</b></p>
+{% for titulo, contenido in campos %}
+<p></p>
+<p><u>{{ titulo }}</u>: {{ contenido }}</p>
+{% endfor %}
+<p></p>
+<p>-La sentencia recaída en autos se encuentra firme y el cómputo de pena es
+definitivo.</p>
+<p>-Se hace saber a Ud. que ya se han remitido los correspondientes oficios al
+Servicio Penitenciario en cumplimiento del art. 505 del Código Procesal Penal
+de la Provincia de Córdoba, a la Policía de la Provincia de Córdoba y al
+Registro Nacional de Reincidencia, comunicando la sentencia dictada en autos y
+el cómputo de pena.</p>
+""", "legajo")
+
+PUESTA_DISPOSICION = compilar("""
+<p align="right">{{ fecha }}</p>
+<p><b>SRA. JEFA DEL SERVICIO</b></p>
+<p><b>PENITENCIARIO DE LA</b></p>
+<p><b>PROVINCIA DE CÓRDOBA</b></p>
+<p><b>S______________/______________D</b></p>
+<p></p>
+<p>En los autos caratulados <b>{{ caratula }}</b>, que se tramitan ante {{ articulo }}
+{{ tribunal }}, se le hace saber que el condenado <b>{{ penado }}</b>, DNI n.°
+{{ dni }}, queda a exclusiva disposición del Juzgado de Ejecución Penal
+n.° ……, bajo las actuaciones del <b>Cuerpo de Ejecución de Pena Privativa de
+Libertad</b> de <b>{{ penado }}</b> (SAC n.º ……), siempre que no se encuentre a
+disposición de otro tribunal.</p>
+<p></p>
+<p align="center"><b>Sin otro particular, saludo a Ud. atte.</b></p>
+""", "puesta_disposicion")
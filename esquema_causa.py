@@ -0,0 +1,158 @@
+# esquema_causa.py
+"""Formato único y versionado de una causa guardada.
+
+Convivían dos JSON incompatibles: el de la ventana principal
+(``{"generales": {...}, "imputados": [...]}``, con claves propias como
+``fecha`` o ``sentencia``) y el plano de ``CausaData.to_json``
+(``dataclasses.asdict``). Ahora hay uno solo, el plano con una clave
+``version``; los anteriores se llevan hasta él con migraciones hacia
+adelante, de a un paso:
+
+* versión 0 — el de la ventana principal;
+* versión 1 — el plano de ``CausaData`` sin ``version``;
+* versión 2 — el actual (``VERSION``).
+
+``migrar`` sólo mueve y renombra claves: no descarta las desconocidas ni
+valida tipos. Eso lo hace ``CausaData.desde_dict``, que se queda con lo que
+entiende y ajusta cada valor al tipo del campo, así que un archivo de otra
+versión (o editado a mano) se abre igual.
+
+La lectura y la escritura usan ``orjson`` si está instalado (bastante más
+rápido que ``json``, que queda de respaldo) y trabajan sobre bytes.
+``leer_carpeta`` recorre un archivo entero de causas de a un JSON por vez,
+sin cargarlos todos: los que no se pueden leer se informan y se saltean.
+"""
+from pathlib import Path
+import html
+import json
+
+VERSION = 2
+
+# clave de ``generales`` (ventana principal) → campo de ``CausaData``
+_GENERALES = {
+    "fecha": "fecha_audiencia",
+    "hora": "hora_audiencia",
+    "fiscal": "fiscal_nombre",
+    "sentencia": "sentencia_num",
+    "resuelvo": "resuelvo_html",
+}
+
+
+# ───────────── JSON ─────────────
+_orjson = False                     # False: todavía no se probó importarlo
+
+
+def _rapido():
+    """``orjson`` si está instalado (opcional: sin él se usa ``json``), o None.
+
+    Se importa recién en la primera lectura o escritura: el arranque no lo necesita.
+    """
+    global _orjson
+    if _orjson is False:
+        try:
+            import orjson as _orjson
+        except ImportError:
+            _orjson = None
+    return _orjson
+
+
+def cargar_json(datos: bytes | str):
+    """``datos`` (UTF-8, con o sin BOM) a objetos de Python."""
+    if isinstance(datos, str):
+        datos = datos.encode("utf-8")
+    if datos.startswith(b"\xef\xbb\xbf"):
+        datos = datos[3:]
+    try:
+        datos.decode("utf-8")
+    except UnicodeDecodeError:
+        # guardado desde otro programa en la codificación de Windows
+        datos = datos.decode("cp1252", errors="replace").encode("utf-8")
+    orjson = _rapido()
+    if orjson is not None:
+        return orjson.loads(datos)
+    return json.loads(datos)
+
+
+def volcar_json(obj, indentar: bool = False) -> bytes:
+    """``obj`` como JSON en UTF-8 (sin escapar los acentos)."""
+    orjson = _rapido()
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indentar else 0)
+    return json.dumps(obj, ensure_ascii=False,
+                      indent=2 if indentar else None).encode("utf-8")
+
+
+# ───────────── versiones ─────────────
+def version_de(raw: dict) -> int:
+    if "version" in raw:
+        try:
+            return max(0, int(raw["version"]))
+        except (TypeError, ValueError):
+            return VERSION
+    return 0 if "generales" in raw else 1
+
+
+def _de_principal(raw: dict) -> dict:
+    """0 → 1: ``generales`` se aplana con los nombres de ``CausaData``."""
+    causa = {}
+    for clave, valor in (raw.get("generales") or {}).items():
+        causa[_GENERALES.get(clave, clave)] = valor
+    resuelvo = causa.get("resuelvo_html")
+    if isinstance(resuelvo, str) and resuelvo and "<" not in resuelvo:
+        # texto plano viejo: la principal lo cargaba con ``setPlainText``
+        causa["resuelvo_html"] = html.escape(resuelvo).replace("\n", "<br>")
+    if "renuncia" in causa and isinstance(causa["renuncia"], str):
+        causa["renuncia"] = causa["renuncia"] == "Sí"
+    imputados = raw.get("imputados") or []
+    causa["imputados"] = imputados
+    causa["n_imputados"] = max(1, len(imputados))
+    # la principal no guardaba los hechos
+    return causa
+
+
+def _de_plana(raw: dict) -> dict:
+    """1 → 2: el mismo formato, ahora con ``version``."""
+    causa = dict(raw)
+    causa.setdefault("n_imputados", max(1, len(causa.get("imputados") or [])))
+    return causa
+
+
+_MIGRACIONES = {0: _de_principal, 1: _de_plana}
+
+
+def migrar(raw: dict) -> dict:
+    """Lleva una causa guardada en cualquier versión a la actual."""
+    if not isinstance(raw, dict):
+        raise ValueError("una causa guardada tiene que ser un objeto JSON")
+    version = version_de(raw)
+    while version < VERSION:
+        raw = _MIGRACIONES[version](raw)
+        version += 1
+    raw["version"] = VERSION
+    return raw
+
+
+# ───────────── archivos ─────────────
+def leer(ruta: str | Path) -> dict:
+    """La causa de ``ruta``, ya migrada."""
+    return migrar(cargar_json(Path(ruta).read_bytes()))
+
+
+def escribir(ruta: str | Path, causa: dict) -> None:
+    Path(ruta).write_bytes(volcar_json(causa, indentar=True))
+
+
+def leer_carpeta(carpeta: str | Path, saltear=frozenset()):
+    """Recorre los ``.json`` de ``carpeta`` de a uno: ``(ruta, causa, error)``.
+
+    ``causa`` es None cuando el archivo no se pudo leer; ``error`` dice por qué.
+    Las rutas (absolutas) que estén en ``saltear`` ni se abren.
+    """
+    for ruta in sorted(Path(carpeta).glob("*.json")):
+        ruta = ruta.resolve()
+        if str(ruta) in saltear:
+            continue
+        try:
+            yield ruta, leer(ruta), None
+        except (OSError, ValueError) as e:  # orjson.JSONDecodeError es un ValueError
+            yield ruta, None, str(e)
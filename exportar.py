@@ -0,0 +1,139 @@
+# exportar.py
+"""Escritos a archivos DOCX, RTF y HTML, sin Qt.
+
+Parte del mismo marcado que ``motor_plantillas.escribir`` vuelca en los
+editores (``<p align>``, ``<b>``, ``<i>``, ``<u>``, ``<br>``), ya pasado a
+párrafos con ``parrafos``. Como no toca widgets ni documentos de Qt,
+``exportar`` puede correr en otro proceso (``ProcessPoolExecutor``): así
+“Generar todo” reparte los escritos de todos los imputados entre los
+núcleos de la máquina.
+"""
+from pathlib import Path
+import html
+import re
+
+from motor_plantillas import parrafos
+
+FORMATOS = ("docx", "rtf", "html")
+
+_RE_PROHIBIDOS = re.compile(r'[<>:"/\\|?*\x00-\x1f]+')
+
+
+def nombre_archivo(texto: str) -> str:
+    """``texto`` sin los caracteres que Windows no acepta en un nombre de archivo."""
+    limpio = _RE_PROHIBIDOS.sub(" ", texto)
+    return re.sub(r"\s+", " ", limpio).strip(" .") or "escrito"
+
+
+# ───────────── HTML ─────────────
+def a_html(marcado: str) -> str:
+    """Página HTML completa, Times 12, con la alineación de cada párrafo."""
+    cuerpo = []
+    for alineacion, tramos in parrafos(marcado):
+        partes = []
+        for texto, negrita, cursiva, subrayado in tramos:
+            t = html.escape(texto, quote=False).replace("\n", "<br>")
+            for tag, activo in (("u", subrayado), ("i", cursiva), ("b", negrita)):
+                if activo:
+                    t = f"<{tag}>{t}</{tag}>"
+            partes.append(t)
+        # un párrafo vacío es una línea en blanco: sin contenido no ocupa lugar
+        cuerpo.append(f'<p align="{alineacion}">{"".join(partes) or "&nbsp;"}</p>')
+    return (
+        "<!DOCTYPE html><html><head><meta charset='UTF-8'>"
+        "<style>"
+        "body{font-family:'Times New Roman',serif;font-size:12pt;line-height:1.0;}"
+        "p{margin:0;}"
+        "</style></head><body>\n"
+        + "\n".join(cuerpo) +
+        "\n</body></html>\n"
+    )
+
+
+# ───────────── RTF ─────────────
+_ALINEACION_RTF = {"left": r"\ql", "right": r"\qr", "center": r"\qc", "justify": r"\qj"}
+
+
+def _rtf_texto(texto: str) -> str:
+    salida = []
+    for c in texto:
+        if c in "\\{}":
+            salida.append("\\" + c)
+        elif c == "\n":
+            salida.append(r"\line ")
+        elif ord(c) < 128:
+            salida.append(c)
+        else:
+            # RTF sólo admite ASCII: el resto va como \uN (con signo, 16 bits)
+            n = ord(c)
+            if n > 0xFFFF:
+                salida.append("?")
+                continue
+            salida.append(rf"\u{n - 0x10000 if n > 0x7FFF else n}?")
+    return "".join(salida)
+
+
+def a_rtf(marcado: str) -> str:
+    """Documento RTF, Times 12, con alineación y negrita/cursiva/subrayado."""
+    cuerpo = []
+    for alineacion, tramos in parrafos(marcado):
+        cuerpo.append(r"\pard" + _ALINEACION_RTF.get(alineacion, r"\qj") + " ")
+        for texto, negrita, cursiva, subrayado in tramos:
+            cuerpo.append(
+                (r"\b" if negrita else r"\b0")
+                + (r"\i" if cursiva else r"\i0")
+                + (r"\ul" if subrayado else r"\ulnone")
+                + " " + _rtf_texto(texto)
+            )
+        cuerpo.append(r"\par" + "\n")
+    return (
+        r"{\rtf1\ansi\deff0{\fonttbl{\f0 Times New Roman;}}\f0\fs24" + "\n"
+        + "".join(cuerpo) + "}"
+    )
+
+
+# ───────────── DOCX ─────────────
+def a_docx(marcado: str, ruta: str) -> None:
+    """Guarda en ``ruta`` un DOCX Times 12 con los párrafos de ``marcado``."""
+    from docx import Document
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
+    from docx.shared import Pt
+
+    alineaciones = {"left": WD_ALIGN_PARAGRAPH.LEFT, "right": WD_ALIGN_PARAGRAPH.RIGHT,
+                    "center": WD_ALIGN_PARAGRAPH.CENTER,
+                    "justify": WD_ALIGN_PARAGRAPH.JUSTIFY}
+    doc = Document()
+    normal = doc.styles["Normal"]
+    normal.font.name = "Times New Roman"
+    normal.font.size = Pt(12)
+    normal.paragraph_format.space_after = Pt(0)
+    for alineacion, tramos in parrafos(marcado):
+        p = doc.add_paragraph()
+        p.alignment = alineaciones.get(alineacion, WD_ALIGN_PARAGRAPH.JUSTIFY)
+        for texto, negrita, cursiva, subrayado in tramos:
+            for i, linea in enumerate(texto.split("\n")):
+                if i:
+                    p.add_run().add_break()         # <br>
+                run = p.add_run(linea)
+                run.bold, run.italic, run.underline = negrita, cursiva, subrayado
+    doc.save(ruta)
+
+
+def exportar(marcado: str, base: str, formatos=FORMATOS) -> list[str]:
+    """Escribe ``marcado`` en ``base``.docx/.rtf/.html; devuelve las rutas.
+
+    Es lo que corre en cada proceso del pool: recibe y devuelve sólo texto.
+    """
+    rutas = []
+    for formato in formatos:
+        ruta = f"{base}.{formato}"      # ``base`` puede tener puntos (“n.°”)
+        if formato == "docx":
+            a_docx(marcado, ruta)
+        elif formato == "rtf":
+            Path(ruta).write_text(a_rtf(marcado), encoding="ascii")
+        elif formato == "html":
+            Path(ruta).write_text(a_html(marcado), encoding="utf-8")
+        else:
+            raise ValueError(f"formato desconocido: {formato}")
+        rutas.append(ruta)
+    return rutas
@@ -0,0 +1,178 @@
+# historial.py
+"""Deshacer/rehacer a nivel del modelo (``CausaData``).
+
+Lo que se edita desde las anclas (``_on_anchor_clicked`` → ``QInputDialog``),
+los diálogos de texto enriquecido o los campos del formulario sólo se podía
+deshacer campo por campo, dentro de cada ``QLineEdit``. ``Historial`` está
+suscripto al modelo y anota cada cambio como un delta:
+
+* ``("c", campo, antes, después)`` — un campo general;
+* ``("r", registro, campo, antes, después)`` — un campo de un imputado o hecho;
+* ``("l", lista, antes, después)`` — la lista de imputados/hechos entera
+  (tuplas con los mismos registros).
+
+Los deltas no copian nada: guardan referencias a los mismos valores
+(cadenas inmutables) y registros que ya tiene el modelo, así que un paso
+cuesta lo que sus tuplas. Para saber el valor de *antes* se lleva una
+sombra del último valor visto de cada campo, que también comparte los
+objetos con el modelo.
+
+Los cambios de una misma vuelta del bucle de eventos forman un paso (lo que
+dispara una sola acción del usuario); el tipeo seguido en un mismo campo se
+junta en uno solo. La pila tiene un tope (``LIMITE``) y lo más viejo se
+descarta. Deshacer vuelve a asignar los valores en el modelo: los avisos
+de siempre llevan el cambio a los widgets y marcan sólo las plantillas de
+esos campos, así que se re-renderiza únicamente lo afectado.
+"""
+from collections import deque
+import dataclasses
+import time
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+LIMITE = 200                # pasos que se recuerdan
+JUNTAR_SEG = 1.0            # tipeo en el mismo campo dentro de este lapso = un paso
+
+_LISTAS = ("imputados", "hechos")
+
+
+class Historial(QObject):
+    """Pilas de deshacer/rehacer de una ``CausaData``."""
+
+    cambio = Signal()       # cambió lo que se puede deshacer o rehacer
+
+    def __init__(self, data, limite: int = LIMITE, parent: QObject | None = None):
+        super().__init__(parent)
+        self._data = data
+        self._deshacer: deque[list] = deque(maxlen=limite)
+        self._rehacer: deque[list] = deque(maxlen=limite)
+        self._paso: list | None = None
+        self._ultimo = None                 # (clave, hora) del último paso, para juntar
+        self._aplicando = False
+
+        self._sombra = {f.name: getattr(data, f.name)
+                        for f in dataclasses.fields(data) if f.name not in _LISTAS}
+        self._listas = {l: tuple(getattr(data, l)) for l in _LISTAS}
+        self._registros: dict = {}
+        self._seguir_registros()
+
+        self._cierre = QTimer(self, singleShot=True, interval=0)
+        self._cierre.timeout.connect(self._cerrar_paso)
+        data.suscribir(self._anotar)
+
+    # — consulta —
+    @property
+    def puede_deshacer(self) -> bool:
+        return bool(self._deshacer or self._paso)
+
+    @property
+    def puede_rehacer(self) -> bool:
+        return bool(self._rehacer)
+
+    # — anotación —
+    def _seguir_registros(self) -> None:
+        """Sombra de los registros que están hoy en la causa (y de ninguno más)."""
+        actuales = {}
+        for lista in _LISTAS:
+            for reg in getattr(self._data, lista):
+                actuales[reg] = self._registros.get(reg) or reg.a_dict()
+        self._registros = actuales
+
+    def _anotar(self, campo: str, registro=None) -> None:
+        if registro is not None:
+            clave = campo.split(".", 1)[1]
+            sombra = self._registros.setdefault(registro, {})
+            despues = getattr(registro, clave)
+            delta = ("r", registro, clave, sombra.get(clave, despues), despues)
+            sombra[clave] = despues
+        elif campo in _LISTAS:
+            antes, despues = self._listas[campo], tuple(getattr(self._data, campo))
+            self._listas[campo] = despues
+            self._seguir_registros()
+            if antes == despues:            # los registros se comparan por identidad
+                return
+            delta = ("l", campo, antes, despues)
+        else:
+            despues = getattr(self._data, campo)
+            delta = ("c", campo, self._sombra.get(campo, despues), despues)
+            self._sombra[campo] = despues
+        if self._aplicando or delta[-2] == delta[-1]:
+            return
+        if self._paso is None:
+            self._paso = []
+            self._cierre.start()
+        self._paso.append(delta)
+        if self._rehacer:
+            self._rehacer.clear()
+            self.cambio.emit()
+
+    def _cerrar_paso(self) -> None:
+        paso, self._paso = self._paso, None
+        if not paso:
+            return
+        ahora = time.monotonic()
+        clave = paso[0][:-2] if len(paso) == 1 and paso[0][0] != "l" else None
+        if (clave is not None and self._deshacer and self._ultimo is not None
+                and self._ultimo[0] == clave and ahora - self._ultimo[1] < JUNTAR_SEG):
+            # otra tecla en el mismo campo: se estira el paso anterior
+            anterior = self._deshacer[-1][0]
+            self._deshacer[-1] = [anterior[:-1] + paso[0][-1:]]
+        else:
+            self._deshacer.append(paso)
+        self._ultimo = (clave, ahora)
+        self.cambio.emit()
+
+    # — deshacer / rehacer —
+    def deshacer(self) -> bool:
+        self._cerrar_paso()
+        if not self._deshacer:
+            return False
+        paso = self._deshacer.pop()
+        self._aplicar(reversed(paso), -2)
+        self._rehacer.append(paso)
+        self._ultimo = None
+        self.cambio.emit()
+        return True
+
+    def rehacer(self) -> bool:
+        self._cerrar_paso()
+        if not self._rehacer:
+            return False
+        paso = self._rehacer.pop()
+        self._aplicar(paso, -1)
+        self._deshacer.append(paso)
+        self._ultimo = None
+        self.cambio.emit()
+        return True
+
+    def _aplicar(self, deltas, cual: int) -> None:
+        """Asigna el valor ``cual`` (-2 antes, -1 después) de cada delta."""
+        self._aplicando = True
+        try:
+            for delta in deltas:
+                valor = delta[cual]
+                if delta[0] == "c":
+                    setattr(self._data, delta[1], valor)
+                elif delta[0] == "r":
+                    setattr(delta[1], delta[2], valor)
+                else:
+                    # la lista se reemplaza: ``CausaData`` adopta los registros
+                    setattr(self._data, delta[1], list(valor))
+        finally:
+            self._aplicando = False
+
+    def limpiar(self) -> None:
+        self._cerrar_paso()
+        self._deshacer.clear()
+        self._rehacer.clear()
+        self._ultimo = None
+        self.cambio.emit()
+
+
+def de(data) -> Historial:
+    """El historial de ``data`` (uno solo por causa, compartido por las ventanas)."""
+    historial = getattr(data, "_historial", None)
+    if historial is None:
+        historial = Historial(data)
+        object.__setattr__(data, "_historial", historial)
+    return historial
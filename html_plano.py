@@ -0,0 +1,110 @@
+# html_plano.py
+"""Conversión HTML → texto plano con caché.
+
+El mismo HTML guardado (el resuelvo, la descripción de cada hecho, los datos
+de cada imputado…) se pasa a texto una y otra vez en cada sincronización y en
+cada render. Antes cada llamada creaba un ``QTextDocument`` descartable; acá
+hay un único punto de conversión:
+
+* una caché LRU acotada, indexada por el contenido, que devuelve al instante
+  lo ya convertido;
+* un camino rápido en Python puro para el texto sin etiquetas, que reproduce
+  lo que devolvería ``QTextDocument.toPlainText()``;
+* y, para el HTML de verdad (el que producen los sanitizadores o el completo
+  de Qt), un único ``QTextDocument`` reusado en vez de uno nuevo por llamada.
+"""
+from functools import lru_cache
+import re
+
+from PySide6.QtGui import QTextDocument
+
+MAX_CACHE = 512
+
+_ENTIDADES = {"amp": "&", "lt": "<", "gt": ">", "quot": '"', "nbsp": "\u00a0"}
+
+_RE_ENTIDAD = re.compile(r"&(?:#(\d+)|#[xX]([0-9a-fA-F]+)|([a-zA-Z]+));")
+_RE_ESPACIOS = re.compile(r"[ \t\n\r\f\v]+")
+# otros espacios Unicode (U+2028, U+202F…) que Qt trata a su manera
+_RE_ESPACIO_RARO = re.compile(r"(?![ \t\n\r\f\v\u00a0])\s")
+
+
+class _NoSoportado(Exception):
+    """El HTML se sale del subconjunto que resuelve el camino rápido."""
+
+
+def _decodificar(texto: str) -> str:
+    if "&" not in texto:
+        return texto
+
+    def _ent(m):
+        dec, hexa, nombre = m.groups()
+        if nombre is not None:
+            if nombre not in _ENTIDADES:
+                raise _NoSoportado
+            return _ENTIDADES[nombre]
+        cp = int(dec) if dec is not None else int(hexa, 16)
+        if cp == 0 or 0xD800 <= cp <= 0xDFFF or cp > 0x10FFFF:
+            raise _NoSoportado
+        return chr(cp)
+
+    sueltos = texto.count("&")
+    texto, n = _RE_ENTIDAD.subn(_ent, texto)
+    if n != sueltos:
+        # hay un «&» suelto o una entidad sin «;»: que decida Qt
+        raise _NoSoportado
+    return texto
+
+
+def _rapido(html: str) -> str:
+    """Texto plano de ``html`` sin pasar por Qt (o ``_NoSoportado``).
+
+    Sólo cubre texto sin etiquetas (lo que guarda un QLineEdit que nunca
+    pasó por el editor enriquecido): espacios colapsados, sin los del
+    principio, y entidades comunes. Con etiquetas, un parser en Python no le
+    gana al de Qt, así que eso va siempre al ``QTextDocument`` reusado.
+    """
+    if "<" in html:
+        raise _NoSoportado
+    texto = _RE_ESPACIOS.sub(" ", _decodificar(html))
+    if _RE_ESPACIO_RARO.search(texto):
+        raise _NoSoportado
+    if texto.startswith(" "):
+        texto = texto[1:]
+    return texto.replace("\u00a0", " ")
+
+
+_doc: QTextDocument | None = None
+
+
+def _con_qt(html: str) -> str:
+    global _doc
+    if _doc is None:
+        _doc = QTextDocument()
+    _doc.setHtml(html)
+    return _doc.toPlainText()
+
+
+@lru_cache(maxsize=MAX_CACHE)
+def html_a_texto(html: str) -> str:
+    """Lo mismo que ``QTextDocument.toPlainText()`` tras ``setHtml(html)``."""
+    if not html:
+        return ""
+    try:
+        return _rapido(html)
+    except _NoSoportado:
+        return _con_qt(html)
+
+
+def html_en_linea(html: str) -> str:
+    """Texto plano de ``html`` en una sola línea (lo que muestra un QLineEdit)."""
+    return html_a_texto(html).replace("\n", " ") if html else ""
+
+
+def html_a_plano(html: str, mantener_saltos: bool = True) -> str:
+    """Texto plano con los espacios duros normalizados; opcionalmente en una línea."""
+    if not html:
+        return ""
+    texto = html_a_texto(html).replace("\u00a0", " ").replace("\u202f", " ")
+    if not mantener_saltos:
+        texto = texto.replace("\n", " ")
+    return texto
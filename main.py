@@ -3,35 +3,45 @@
 Generador de documentos judiciales – PySide6
 Interfaz: datos generales + pestañas de imputados (sin colores forzados)
 """
-import sys, os, json
+import arranque                 # primero: desde acá se mide el arranque
+import sys, os
+from concurrent.futures import FIRST_COMPLETED, wait
 from datetime import datetime
-from pathlib import Path
 
-from PySide6.QtCore    import Qt
+from PySide6.QtCore    import Qt, QTimer
 from PySide6.QtGui     import QIcon, QClipboard, QAction
 from html import unescape
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QLabel, QLineEdit, QTextEdit,
     QComboBox, QPushButton, QGridLayout, QVBoxLayout, QTabWidget,
     QFileDialog, QMessageBox, QSplitter, QCheckBox, QScrollArea, QDialog,
-    QDialogButtonBox, QRadioButton, QButtonGroup
+    QDialogButtonBox, QRadioButton, QButtonGroup, QInputDialog, QProgressDialog
 )
 from PySide6.QtGui import QFont
-from PySide6.QtGui import QTextBlockFormat
 from PySide6.QtGui import QTextCharFormat
-from PySide6.QtGui import QTextCursor 
+from PySide6.QtGui import QTextCursor
+from PySide6.QtGui import QTextDocument
 from datetime import timedelta
-from core_data import CausaData
-from tramsent import SentenciaWidget
-from docx import Document
+from core_data import CausaData, Hecho, campo_hecho
 from PySide6.QtCore import QSignalBlocker
-from sentencia_window import SentenciaWindow
-from PySide6.QtGui import QTextDocument
 import re
 from PySide6.QtCore import QMimeData
 from PySide6.QtWidgets import QHBoxLayout
-from widgets import NoWheelComboBox, NoWheelSpinBox
-from constants import TRIBUNALES
+from widgets import (NoWheelComboBox, NoWheelSpinBox, poner_valor, leer_valor,
+                     reiniciar_valores)
+from html_plano import html_a_texto, html_en_linea, html_a_plano as _html_a_plano
+from sanitizer import sanitizar
+from secciones import Seccion, SeccionReconciliador
+from constants import (TRIBUNALES, ESTABLECIMIENTOS, TRATAMIENTO_SPC,
+                       RENDER_DELAY_MS, RENDER_MAX_WAIT_MS)
+from render_scheduler import RenderScheduler
+from motor_plantillas import en_linea, escribir
+from armado import ArmadoEnHilo
+from exportar import FORMATOS, exportar, nombre_archivo
+import escritos
+import causas_db
+import autoguardado
+import historial
 def _DEBUG_unicode(tag: str, txt: str, n: int = 120):
     # imprime los primeros “n” caracteres con su code-point
     print(f"\n{tag}:")
@@ -45,9 +55,6 @@ def resource_path(rel: str) -> str:
         return os.path.join(sys._MEIPASS, rel)          # type: ignore
     return os.path.join(os.path.abspath("."), rel)
 
-CAUSAS_DIR = Path("causas_guardadas")
-CAUSAS_DIR.mkdir(exist_ok=True)
-
 _UNIDADES = (
     '', 'uno', 'dos', 'tres', 'cuatro', 'cinco', 'seis',
     'siete', 'ocho', 'nueve', 'diez', 'once', 'doce',
@@ -174,64 +181,90 @@ def num_letras(n:int)->str:
 def fecha_letras(dt:datetime)->str:
     return f"{num_letras(dt.day)} de {_MESES[dt.month]} de {num_letras(dt.year)}"
 
-def _sanitize_html(html_raw: str) -> str:
-    """
-    Devuelve SOLO el fragmento que estaba dentro de <body>,
-    manteniendo <b>, <i>, <u> y quitando todo estilo / saltos raros.
-    """
-    import re, html
-
-    # A)  ───── EXTRAEMOS SOLO <body> … </body> ─────
-    m = re.search(r'<body[^>]*>(.*?)</body>', html_raw, flags=re.I | re.S)
-    if m:
-        html_raw = m.group(1)
-    # (si por algún motivo no hay <body>, seguimos con lo que venga)
-
-    # B)  ───── A partir de aquí van los pasos que ya tenías ─────
-    # a) <strong>/<em> → <b>/<i>
-    html_raw = re.sub(r'</?strong>', lambda m: '<b>' if m.group(0)[1] != '/' else '</b>', html_raw, flags=re.I)
-    html_raw = re.sub(r'</?em>',     lambda m: '<i>' if m.group(0)[1] != '/' else '</i>', html_raw, flags=re.I)
-
-    # b) <span style="font-weight:...">…</span> → <b>…</b>
-    html_raw = re.sub(
-        r'<span[^>]*style="[^"]*font-weight\s*:\s*(?:bold|700)[^"]*"[^>]*>(.*?)</span>',
-        r'<b>\1</b>',
-        html_raw,
-        flags=re.I | re.S
-    )
-
-    # c) quitamos atributos style, class, dir, lang…
-    html_raw = re.sub(r'\s*(style|class|dir|lang)="[^"]*"', '', html_raw, flags=re.I)
-
-    # d) quitamos cualquier <span> remanente
-    html_raw = re.sub(r'</?span[^>]*>', '', html_raw, flags=re.I)
-
-    # d-bis) fuera <br>
-    html_raw = re.sub(r'(?i)<br\s*/?>', ' ', html_raw)
-
-    # d-ter) fuera párrafos vacíos de Qt
-    html_raw = re.sub(
-        r'<p[^>]*-qt-paragraph-type:empty[^>]*>\s*(<br\s*/?>)?\s*</p>',
-        ' ',
-        html_raw,
-        flags=re.I
-    )
-
-    # e) limpia saltos y nbsp
-    html_raw = re.sub(
-        r'(\r\n|\r|\n|&#10;|&#13;|\u2028|\u2029|&nbsp;)',
-        ' ',
-        html_raw
-    )
-
-    # f) compacta espacios
-    html_raw = re.sub(r'\s+', ' ', html_raw).strip()
+# ───────────── dependencias de las plantillas ─────────────
+# Cada ``_plantilla_*`` declara qué campos del modelo lee. Las claves de
+# imputado van con prefijo: ``imp.<clave>`` (sólo el imputado activo del
+# selector) o ``imps.<clave>`` (cualquiera de los imputados).
+TODAS_LAS_PLANTILLAS = "*"  # marca especial: regenerar todas las plantillas
+
+def depende_de(*campos: str):
+    """Anota en la plantilla los campos de los que depende."""
+    def deco(fn):
+        fn.campos = frozenset(campos)
+        return fn
+    return deco
+
+# Cada ``_plantilla_*`` lee el formulario (en el hilo de la interfaz) y
+# devuelve el marcado del escrito o un ``_Aviso``. Ese valor resume todo lo
+# que se leyó: si no cambió, el documento ya armado sirve tal cual. El
+# documento se arma en el hilo de ``ArmadoEnHilo`` con ``_armador``.
+class _Aviso(str):
+    """Mensaje en texto plano (“No aplica…”) en lugar del escrito."""
+
+
+def _armador(contenido: str):
+    """``armar(doc)`` para ``ArmadoEnHilo``: no toca ningún widget."""
+    if not isinstance(contenido, _Aviso):
+        return lambda doc: escribir(doc, contenido)
+
+    def armar(doc):
+        doc.setPlainText(contenido)
+        fmt = QTextCharFormat()
+        fmt.setFontFamily("Times New Roman")
+        fmt.setFontPointSize(12)
+        cursor = QTextCursor(doc)
+        cursor.select(QTextCursor.Document)
+        cursor.mergeCharFormat(fmt)
+    return armar
+
+# pestaña → plantilla, en el orden en que se generan
+PLANTILLAS = (
+    ("Pedido de audiencia",  "_plantilla_pedido"),
+    ("Oficio OGA",           "_plantilla_oficio_oga"),
+    ("Decreto audiencia",    "_plantilla_decreto_audiencia"),
+    ("Oficio notificación",  "_plantilla_oficio_notificacion"),
+    ("Acta renuncia",        "_plantilla_acta_renuncia"),
+    ("Constancia grabación", "_plantilla_constancia_grabacion"),
+    ("Certificado víctimas", "_plantilla_certificado_victimas"),
+    ("Oficio Neuro",         "_plantilla_oficio_neuro"),
+    ("Oficio CIV",           "_plantilla_oficio_civ"),
+    ("Oficio libertad",      "_plantilla_oficio_libertad"),
+    ("Oficio Policía",       "_plantilla_oficio_policia"),
+    ("Oficio Reincidencia",  "_plantilla_oficio_reincidencia"),
+    ("Oficio cómputo",       "_plantilla_oficio_computo"),
+    ("Oficio SPC",           "_plantilla_oficio_spc"),
+    ("Oficio comunicación",  "_plantilla_oficio_comunicacion"),
+    ("Legajo",               "_plantilla_legajo"),
+    ("Puesta a disposición", "_plantilla_puesta_disposicion"),
+)
 
-    # g) si quedó un único <p> que envuelve todo, lo quitamos
-    if html_raw.lower().startswith('<p') and html_raw.lower().endswith('</p>'):
-        html_raw = re.sub(r'^<p[^>]*>|</p>$', '', html_raw, flags=re.I).strip()
+# widget del formulario → campo del modelo que representa
+CAMPOS_FORM = {
+    "entry_caratula":    "caratula",
+    "combo_articulo":    "articulo",
+    "entry_tribunal":    "tribunal",
+    "entry_secretaria":  "secretaria",
+    "entry_fiscal":      "fiscal_nombre",
+    "entry_fecha":       "fecha_audiencia",
+    "combo_hora":        "hora_audiencia",
+    "combo_sala":        "sala",
+    "entry_funcionario": "funcionario",
+    "entry_sentencia":   "sentencia_num",
+    "entry_firmantes":   "firmantes",
+    "combo_renuncia":    "renuncia",
+}
+# campo del modelo → widget del formulario (para el sentido modelo → widget)
+WIDGET_DE_CAMPO = {campo: attr for attr, campo in CAMPOS_FORM.items()}
+
+_DEPS_DECRETO = ("imps.nombre", "fecha_audiencia", "hora_audiencia", "sala")
+
+_METODO_DE = dict(PLANTILLAS)
+
+# pestañas que se pre-generan en segundo plano aunque no estén visibles
+PESTANAS_PRECALENTAR = (
+    "Decreto audiencia", "Oficio notificación", "Oficio OGA", "Acta renuncia",
+)
 
-    return html.unescape(html_raw)
 
 class MainWindow(QMainWindow):
     def __init__(self, data: CausaData, parent=None): 
@@ -243,6 +276,32 @@ class MainWindow(QMainWindow):
         self.imputados_widgets: list[dict[str, object]] = []
         self.tabs_imp: QTabWidget | None = None
 
+        # Las ediciones no regeneran las plantillas en el acto: se agrupan y
+        # se renderiza una sola vez cuando el usuario hace una pausa.
+        self._campos_sucios: set[str] = {TODAS_LAS_PLANTILLAS}
+        # pestañas desactualizadas: se generan recién al mostrarlas/copiarlas
+        self._tabs_sucias: set[str] = set()
+        # imputados cuyos escritos de ``POR_IMPUTADO`` pueden estar viejos
+        self._imps_sucios: set[int] = set()
+        self._precalentar = QTimer(self)
+        self._precalentar.setSingleShot(True)
+        self._precalentar.setInterval(0)
+        self._precalentar.timeout.connect(self._precalentar_siguiente)
+        self._render = RenderScheduler(
+            self._regenerar_plantillas, RENDER_DELAY_MS, RENDER_MAX_WAIT_MS, parent=self
+        )
+        # los documentos se arman fuera del hilo de la interfaz
+        self._armado = ArmadoEnHilo(self)
+        self._armado.listo.connect(self._documento_listo)
+        self._armado.fallo.connect(self._documento_fallido)
+        # (pestaña, imputado o None) → (contenido, documento ya armado); las
+        # pestañas de imputado se arman para todos, así cambiar de imputado
+        # en el selector sólo cuelga un documento que ya existe
+        self._documentos: dict[tuple, tuple[str, object]] = {}
+        self._en_curso: dict[tuple, str] = {}     # lo pedido a ``_armado``
+        self._mostrados: dict[str, object] = {}   # documento de cada pestaña
+        self._causa_id: int | None = None         # la abierta en ``causas_db``
+
         # ---------- splitter (izq. datos | der. plantillas) -----------------
         splitter = QSplitter(Qt.Horizontal, self)
         self.setCentralWidget(splitter)
@@ -256,6 +315,8 @@ class MainWindow(QMainWindow):
         right_layout.addWidget(self.selector_imp)
 
         self.tabs_txt = QTabWidget()              # plantillas generadas
+        self.tabs_txt.currentChanged.connect(
+            lambda i: self._render_tab(self.tabs_txt.tabText(i)))
         right_layout.addWidget(self.tabs_txt, 1)  # “1” => ocupa todo el resto
         splitter.addWidget(right_panel)
         splitter.setStretchFactor(1, 1)
@@ -297,15 +358,18 @@ class MainWindow(QMainWindow):
 
         def add_line(attr: str, text: str) -> QLineEdit:
             label(text)
-            le = QLineEdit(); le.textChanged.connect(self.update)
+            campo = CAMPOS_FORM.get(attr, TODAS_LAS_PLANTILLAS)
+            le = QLineEdit()
+            le.textChanged.connect(lambda t, c=campo: self._a_modelo(c, t))
             self.form.addWidget(le, self._row, 1); self._row += 1
             setattr(self, attr, le); return le
 
         def add_combo(attr: str, text: str, items: list[str], editable=False) -> QComboBox:
             label(text)
             cb = NoWheelComboBox(); cb.addItems(items); cb.setEditable(editable)
-            cb.currentIndexChanged.connect(self.update_template)
-            cb.editTextChanged.connect(self.update_template)
+            campo = CAMPOS_FORM.get(attr, TODAS_LAS_PLANTILLAS)
+            cb.currentIndexChanged.connect(lambda _=None, c=campo, cb=cb: self._a_modelo(c, cb.currentText()))
+            cb.editTextChanged.connect(lambda _=None, c=campo, cb=cb: self._a_modelo(c, cb.currentText()))
             self.form.addWidget(cb, self._row, 1); self._row += 1
             setattr(self, attr, cb); return cb
 
@@ -367,6 +431,12 @@ class MainWindow(QMainWindow):
         self.form.addWidget(self.spin_hechos, self._row, 1); self._row += 1
 
         self.tabs_hechos = QTabWidget()
+        self._secciones_hechos = SeccionReconciliador(
+            self._crear_seccion_hecho,
+            lambda sec, idx: self.tabs_hechos.addTab(sec.contenedor, f"Hecho {idx + 1}"),
+            lambda sec, idx: self.tabs_hechos.removeTab(idx),
+            self._reiniciar_hecho,
+        )
         self.form.addWidget(self.tabs_hechos, self._row, 0, 1, 2)
         self._row += 1
         
@@ -376,6 +446,8 @@ class MainWindow(QMainWindow):
         self.entry_secretaria.setText(getattr(self.data, "secretaria", ""))
         self.entry_fecha.setText(self.data.fecha_audiencia)
         self.combo_hora      .setCurrentText(getattr(self.data, "hora_audiencia", ""))
+        if not self.data.sala:    # sin sala guardada se adopta la primera opción
+            self.data.sala = self.combo_sala.currentText()
         self.combo_sala.setCurrentText(self.data.sala)
         self.entry_funcionario.setText(getattr(self.data, 'funcionario', ''))
         self.entry_fiscal.setText(self.data.fiscal_nombre)
@@ -394,17 +466,22 @@ class MainWindow(QMainWindow):
 
         label("Número de imputados:")
         self.combo_n = NoWheelComboBox(); self.combo_n.addItems([str(i) for i in range(1, 21)])
-        self.combo_n.currentIndexChanged.connect(self.update_template)
         self.form.addWidget(self.combo_n, self._row, 1); self._row += 1
         # Número de imputados (dispara rebuild_imputados con la cantidad correcta)
         self.combo_n.setCurrentText(str(self.data.n_imputados or 1))
 
         # Construcción de pestañas de imputados
         self.tabs_imp = QTabWidget()
+        self._secciones_imp = SeccionReconciliador(
+            self._crear_seccion_imputado,
+            lambda sec, idx: self.tabs_imp.addTab(sec.contenedor, f"Imputado {idx + 1}"),
+            lambda sec, idx: self.tabs_imp.removeTab(idx),
+            lambda sec: reiniciar_valores(sec.widgets),
+        )
         self.form.addWidget(self.tabs_imp, self._row, 0, 1, 2)
         self._row += 1
         
-        self.combo_n.currentIndexChanged.connect(self.rebuild_imputados)
+        self.combo_n.currentIndexChanged.connect(self._on_imputados_changed)
         
         # Reconstruir dinámicamente a partir de self.data.imputados
         self.imputados_widgets = []
@@ -412,9 +489,25 @@ class MainWindow(QMainWindow):
 
         for txt, slot in (("Guardar causa", self.guardar_causa),
                         ("Abrir causa",  self.cargar_causa),
-                        ("Eliminar causa",self.eliminar_causa)):
+                        ("Eliminar causa",self.eliminar_causa),
+                        ("Generar todos los escritos", self.generar_todo)):
             btn = QPushButton(txt); btn.clicked.connect(slot)
             self.form.addWidget(btn, self._row, 0, 1, 2); self._row += 1
+
+        # deshacer/rehacer de la causa entera (cada QLineEdit conserva su Ctrl+Z)
+        self._historial = historial.de(self.data)
+        fila_hist = QHBoxLayout()
+        self.btn_deshacer = QPushButton("↶ Deshacer")
+        self.btn_rehacer = QPushButton("↷ Rehacer")
+        for btn, atajo, slot in ((self.btn_deshacer, "Ctrl+Shift+Z", self._historial.deshacer),
+                                 (self.btn_rehacer, "Ctrl+Shift+Y", self._historial.rehacer)):
+            btn.setToolTip(atajo)
+            btn.clicked.connect(slot)
+            self.addAction(QAction(self, shortcut=atajo, triggered=slot))
+            fila_hist.addWidget(btn)
+        self._historial.cambio.connect(self._historial_cambio)
+        self._historial_cambio()
+        self.form.addLayout(fila_hist, self._row, 0, 1, 2); self._row += 1
         
         btn_sentencia = QPushButton("▶ Ver sentencia")
         btn_sentencia.clicked.connect(self.abrir_sentencia)
@@ -422,17 +515,29 @@ class MainWindow(QMainWindow):
         self._row += 1
 
         self.data.apply_to_main(self)
+        # lo que el modelo no traía queda con el valor por defecto del
+        # formulario; a partir de acá el vínculo es campo a campo
+        self.data.from_main(self)
+        self.data.suscribir(self._modelo_cambio)
         splitter.setSizes([400, 700])
         self.update_template()
+        self._render.flush()
+
 
+    def _historial_cambio(self) -> None:
+        self.btn_deshacer.setEnabled(self._historial.puede_deshacer)
+        self.btn_rehacer.setEnabled(self._historial.puede_rehacer)
 
     def abrir_sentencia(self) -> None:
         """Salta a la pantalla de ‘Sentencia’."""
 
-        # 1) Guardar los cambios hechos en Trámites
-        self.data.from_main(self)
+        # 1) El modelo ya está al día (cada edición se vuelca al instante);
+        #    sólo queda aplicar el render pendiente
+        self._render.flush()
 
         if getattr(self, "_sent_win", None) is None:
+            # la sentencia (tramsent, python-docx) se carga recién la primera vez
+            from sentencia_window import SentenciaWindow
             # instanciamos sin parent para que tenga su propia entrada en la barra de tareas
             self._sent_win = SentenciaWindow(self.data, parent=None)
             # nos guardamos el main para luego re-show() cuando cierren la sentencia
@@ -450,7 +555,9 @@ class MainWindow(QMainWindow):
 
     def showEvent(self, ev):
         super().showEvent(ev)
-        self.data.apply_to_main(self)
+        # al volver de la sentencia sólo se actualiza lo que cambió allí
+        if self.data.apply_to_main(self):
+            self.update()
     def closeEvent(self, event):
         """Intercepta el cierre de la pantalla de trámites."""
         confirm_and_quit(self)
@@ -473,271 +580,229 @@ class MainWindow(QMainWindow):
             self._sent_widget.abrir_tramites()
     
     def rebuild_imputados(self):
-        """Reconstruye las pestañas de imputados SIN perder lo escrito."""
-            # ←– bloquea re-entradas
+        """Ajusta las pestañas de imputados a ``combo_n`` SIN perder lo escrito.
+
+        Sólo se agregan o quitan las pestañas de diferencia (reusando las del
+        pool); las que ya estaban siguen vivas con sus widgets y señales.
+        """
         if getattr(self, "_building", False):
             return
-        self._building = True       
-        # 1) Guardar lo ya cargado
-        prev_data: list[dict[str, object]] = []
-        for w in getattr(self, "imputados_widgets", []):
-            dato = {}
-            for k, widget in w.items():
-                if isinstance(widget, QLineEdit):
-                    dato[k] = widget.text()
-                elif isinstance(widget, QComboBox):
-                    dato[k] = widget.currentText()
-                elif isinstance(widget, QCheckBox):
-                    dato[k] = widget.isChecked()
-            prev_data.append(dato)
-
-        self.tabs_imp.clear()
-        self.imputados_widgets = []
+        self._building = True
         n = int(self.combo_n.currentText())
+        agregados, quitados = self._secciones_imp.reconciliar(n)
+        self.imputados_widgets = [sec.widgets for sec in self._secciones_imp.secciones]
+
+        # las pestañas nuevas se cargan con lo que haya en el modelo
+        for idx in agregados:
+            if idx < len(self.data.imputados):
+                dato = self.data.imputados[idx]
+                for k, widget in self.imputados_widgets[idx].items():
+                    with QSignalBlocker(widget):
+                        poner_valor(widget, getattr(dato, k))
+
+        # selector: se quitan/agregan sólo los ítems de diferencia
+        for idx in quitados:
+            self.selector_imp.removeItem(idx)
+        for idx in agregados:
+            self.selector_imp.addItem(f"Imputado {idx + 1}")
+        self.imp_index = min(max(self.selector_imp.currentIndex(), 0), n - 1)
+        self._refresh_imp_names_in_selector()
+        self._building = False
+        # un registro por pestaña (las nuevas quedan con los valores por defecto)
+        self.data.ajustar_imputados(n)
+
+    def _crear_seccion_imputado(self, idx: int) -> Seccion:
+        """Arma la pestaña (todavía sin montar) de un imputado."""
+        tab = QWidget()
+        grid = QGridLayout(tab)
+        row = 0
+
+        def add_pair(text, widget):
+            nonlocal row
+            grid.addWidget(QLabel(text), row, 0)
+            grid.addWidget(widget, row, 1)
+            row += 1
 
-        for i in range(1, n + 1):
-            tab = QWidget()
-            grid = QGridLayout(tab)
-            row = 0
+        def mk_line():
+            return QLineEdit()
 
-            def add_pair(text, widget):
-                nonlocal row
-                grid.addWidget(QLabel(text), row, 0)
-                grid.addWidget(widget, row, 1)
-                row += 1
+        def mk_combo(items, editable=False):
+            cb = NoWheelComboBox()
+            cb.addItems(items)
+            cb.setEditable(editable)
+            return cb
 
-            def mk_line():
-                le = QLineEdit()
-                le.textChanged.connect(self.update)
-                return le
+        w: dict[str, object] = {}
+        # Crear widgets
+        w['tipo'] = mk_combo(['efectiva', 'condicional'])
+        add_pair("Tipo de pena:", w['tipo'])
 
-            def mk_combo(items, editable=False):
-                cb = NoWheelComboBox()
-                cb.addItems(items)
-                cb.setEditable(editable)
-                cb.currentIndexChanged.connect(self.update)
-                cb.editTextChanged.connect(self.update)
-                return cb
+        w['nombre'] = mk_line()
+        w['nombre'].textChanged.connect(self._refresh_imp_names_in_selector)
+        add_pair("Nombre y apellido:", w['nombre'])
 
-            w: dict[str, object] = {}
-            # Crear widgets
-            w['tipo'] = mk_combo(['efectiva', 'condicional'])
-            add_pair("Tipo de pena:", w['tipo'])
+        w['dni'] = mk_line()
+        add_pair("DNI:", w['dni'])
 
-            w['nombre'] = mk_line()
-            w['nombre'].textChanged.connect(self._refresh_imp_names_in_selector)
-            add_pair("Nombre y apellido:", w['nombre'])
+        w['estable'] = mk_combo(ESTABLECIMIENTOS, editable=True)
 
-            w['dni'] = mk_line()
-            add_pair("DNI:", w['dni'])
+        add_pair("Establecimiento:", w['estable'])
 
-            w['estable'] = mk_combo([
-                "Complejo Carcelario n.° 1 (Bouwer)",
-                "Establecimiento Penitenciario n.° 9 (UCA)",
-                "Establecimiento Penitenciario n.° 3 (para mujeres)",
-                "Complejo Carcelario n.° 2 (Cruz del Eje)",
-                "Establecimiento Penitenciario n.° 4 (Colonia Abierta Monte Cristo)",
-                "Establecimiento Penitenciario n.° 5 (Villa María)",
-                "Establecimiento Penitenciario n.° 6 (Río Cuarto)",
-                "Establecimiento Penitenciario n.° 7 (San Francisco)",
-                "Establecimiento Penitenciario n.° 8 (Villa Dolores)"
-            ], editable=True)
 
-            add_pair("Establecimiento:", w['estable'])
+        w['defensa'] = mk_line()
+        add_pair("Defensa:", w['defensa'])
 
+        w['detenc'] = mk_line()
+        add_pair("Duración detención:", w['detenc'])
 
-            w['defensa'] = mk_line()
-            add_pair("Defensa:", w['defensa'])
+        w['delitos'] = mk_line()
+        add_pair("Delitos atribuidos:", w['delitos'])
 
-            w['detenc'] = mk_line()
-            add_pair("Duración detención:", w['detenc'])
+        w['victimas'] = mk_line()
+        add_pair("Víctimas:", w['victimas'])
 
-            w['delitos'] = mk_line()
-            add_pair("Delitos atribuidos:", w['delitos'])
+        w['condena'] = mk_line()
+        add_pair("Condena:", w['condena'])
 
-            w['victimas'] = mk_line()
-            add_pair("Víctimas:", w['victimas'])
+        w['hechos_n'] = mk_combo(['uno', 'más'])
+        add_pair("Hechos (uno/más):", w['hechos_n'])
 
-            w['condena'] = mk_line()
-            add_pair("Condena:", w['condena'])
+        w['fechas'] = mk_line()
+        add_pair("Fechas de los hechos:", w['fechas'])
 
-            w['hechos_n'] = mk_combo(['uno', 'más'])
-            add_pair("Hechos (uno/más):", w['hechos_n'])
+        w['decreto'] = mk_line()
+        add_pair("Decreto cómputo:", w['decreto'])
 
-            w['fechas'] = mk_line()
-            add_pair("Fechas de los hechos:", w['fechas'])
+        w['firm_dec'] = mk_line()
+        add_pair("Firmantes cómputo:", w['firm_dec'])
 
-            w['decreto'] = mk_line()
-            add_pair("Decreto cómputo:", w['decreto'])
+        w['trat'] = mk_combo([TRATAMIENTO_SPC], editable=True)
+        add_pair("Tratamiento SPC:", w['trat'])
 
-            w['firm_dec'] = mk_line()
-            add_pair("Firmantes cómputo:", w['firm_dec'])
+        w['punto'] = mk_line()
+        add_pair("Punto que ordena tratamientos:", w['punto'])
 
-            w['trat'] = mk_combo(['se le brinde un tratamiento interdisciplinario acorde a la problemática de adicción a sustancias estupefacientes que padece'], editable=True)
-            add_pair("Tratamiento SPC:", w['trat'])
+        w['datos'] = mk_line()
+        add_pair("Datos personales:", w['datos'])
 
-            w['punto'] = mk_line()
-            add_pair("Punto que ordena tratamientos:", w['punto'])
+        w['cumpl'] = mk_line()
+        add_pair("Fecha cumplimiento total:", w['cumpl'])
 
-            w['datos'] = mk_line()
-            add_pair("Datos personales:", w['datos'])
+        w['neuro'] = QCheckBox("Incluir Oficio al Neuropsiquiátrico")
+        grid.addWidget(w['neuro'], row, 0, 1, 2)
+        row += 1
 
-            w['cumpl'] = mk_line()
-            add_pair("Fecha cumplimiento total:", w['cumpl'])
+        w['civ'] = QCheckBox("Incluir Oficio al Centro Integral de Varones")
+        grid.addWidget(w['civ'], row, 0, 1, 2)
 
-            w['neuro'] = QCheckBox("Incluir Oficio al Neuropsiquiátrico")
-            w['neuro'].stateChanged.connect(self.update)
-            grid.addWidget(w['neuro'], row, 0, 1, 2)
-            row += 1
 
-            w['civ'] = QCheckBox("Incluir Oficio al Centro Integral de Varones")
-            w['civ'].stateChanged.connect(self.update)
-            grid.addWidget(w['civ'], row, 0, 1, 2)
-
-            # Recuperar datos guardados en prev_data
-            if i-1 < len(prev_data):
-                old = prev_data[i-1]
-                for k, val in old.items():
-                    if k in w:
-                        if isinstance(w[k], QLineEdit):
-                            w[k].setText(val)
-                        elif isinstance(w[k], QComboBox):
-                            w[k].setCurrentText(val)
-                        elif isinstance(w[k], QCheckBox):
-                            w[k].setChecked(bool(val))
-
-            if i-1 < len(self.data.imputados):
-                dato = self.data.imputados[i-1]
-                with QSignalBlocker(w['nombre']):
-                    w['nombre'].setText(dato.get('nombre', ''))
-                with QSignalBlocker(w['datos']):
-                    w['datos'].setText(dato.get('datos', ''))
-                with QSignalBlocker(w['defensa']):
-                    w['defensa'].setText(dato.get('defensa', ''))
-                with QSignalBlocker(w['delitos']):
-                    w['delitos'].setText(dato.get('delitos', ''))
-                with QSignalBlocker(w['condena']):    
-                    w['condena'].setText(dato.get('condena', ''))
-                # Campos opcionales:
-                w['dni'].setText(dato.get('dni', ''))
-                w['estable'].setCurrentText(dato.get('estable', ''))
-                with QSignalBlocker(w['victimas']):
-                    w['victimas'].setText(dato.get('victimas', ''))
-                w['decreto'].setText(dato.get('decreto', ''))
-                w['firm_dec'].setText(dato.get('firm_dec', ''))
-                w['trat'].setCurrentText(dato.get('trat', ''))
-                w['punto'].setText(dato.get('punto', ''))
-                with QSignalBlocker(w['detenc']):
-                    w['detenc'].setText(dato.get('detenc', ''))
-                with QSignalBlocker(w['fechas']):
-                    w['fechas'].setText(dato.get('fechas', ''))
-                w['cumpl'].setText(dato.get('cumpl', ''))
-                w['hechos_n'].setCurrentText(dato.get('hechos_n', ''))
-                w['tipo'].setCurrentText(dato.get('tipo', ''))
-                w['neuro'].setChecked(bool(dato.get('neuro', False)))
-                w['civ'].setChecked(bool(dato.get('civ', False)))
-
-            self.tabs_imp.addTab(tab, f"Imputado {i}")
-            self.imputados_widgets.append(w)
-            print(f"[rebuild_imputados] pestaña {i}: claves creadas →", list(w.keys()))
-        # Actualizar selector y disparar actualización general
-        self.selector_imp.clear()
-        self.selector_imp.addItems([f"Imputado {i}" for i in range(1, n+1)])
-        self.imp_index = 0
-        self.selector_imp.setCurrentIndex(0)
-        self._refresh_imp_names_in_selector()
-        self._building = False
+        # cada widget escribe sólo su campo en el registro de su imputado
+        for k, widget in w.items():
+            slot = lambda *_, w=w, k=k: self._editado_imp(w, k)
+            if isinstance(widget, QLineEdit):
+                widget.textChanged.connect(slot)
+            elif isinstance(widget, QComboBox):
+                widget.currentIndexChanged.connect(slot)
+                widget.editTextChanged.connect(slot)
+            elif isinstance(widget, QCheckBox):
+                widget.stateChanged.connect(slot)
+        return Seccion(tab, w)
 
     def rebuild_hechos(self):
+        """Ajusta las pestañas de hechos a ``spin_hechos`` (igual que imputados)."""
         if getattr(self, "_building_hechos", False):
             return
         self._building_hechos = True
-
-        prev_data = []
-        for w in getattr(self, "hechos_widgets", []):
-            dato = {}
-            for k, widget in w.items():
-                if isinstance(widget, QLineEdit):
-                    dato[k] = widget.text()
-                elif isinstance(widget, QRadioButton):
-                    dato[k] = widget.isChecked()
-            prev_data.append(dato)
-
-        self.tabs_hechos.clear()
-        self.hechos_widgets = []
         n = self.spin_hechos.value()
+        agregados, _ = self._secciones_hechos.reconciliar(n)
+        self.hechos_widgets = [sec.widgets for sec in self._secciones_hechos.secciones]
 
-        for i in range(1, n + 1):
-            tab = QWidget()
-            grid = QGridLayout(tab)
-            row = 0
-
-            def add_pair(text, widget):
-                nonlocal row
-                grid.addWidget(QLabel(text), row, 0)
-                grid.addWidget(widget, row, 1)
-                row += 1
-
-            le_desc = QLineEdit(); le_desc.setReadOnly(True)
-            btn_desc = QPushButton("Redactar el hecho")
-            btn_desc.clicked.connect(lambda _=False, idx=i-1: self.abrir_ventana_hecho_desc(idx))
-            grid.addWidget(QLabel(f"Descripción suceso #{i}"), row, 0)
-            grid.addWidget(btn_desc, row, 1); row += 1
-
-            le_aclar = QLineEdit(); add_pair("Aclaraciones:", le_aclar)
-            le_ofi = QLineEdit(); add_pair("Oficina que elevó:", le_ofi)
-            rb_j = QRadioButton("Juzgado"); rb_f = QRadioButton("Fiscalía"); rb_j.setChecked(True)
-            grp = QButtonGroup(tab); grp.addButton(rb_j); grp.addButton(rb_f)
-            grid.addWidget(rb_j, row, 0); grid.addWidget(rb_f, row, 1); row += 1
-            le_auto = QLineEdit(); add_pair("N° del auto:", le_auto)
-            le_fec = QLineEdit(); add_pair("Fecha de elevación:", le_fec)
-
-            for w in [le_desc, le_aclar, le_ofi, le_auto, le_fec]:
-                w.textChanged.connect(self.update)
-            for w in [rb_j, rb_f]:
-                w.toggled.connect(self.update)
-
-            self.tabs_hechos.addTab(tab, f"Hecho {i}")
-            self.hechos_widgets.append({
-                "descripcion": le_desc,
-                "aclaraciones": le_aclar,
-                "oficina": le_ofi,
-                "rb_j": rb_j,
-                "rb_f": rb_f,
-                "num_auto": le_auto,
-                "fecha_elev": le_fec,
-            })
-
-            if i-1 < len(prev_data):
-                old = prev_data[i-1]
-                le_desc.setText(old.get("descripcion", ""))
-                le_aclar.setText(old.get("aclaraciones", ""))
-                le_ofi.setText(old.get("oficina", ""))
-                rb_j.setChecked(old.get("rb_j", True))
-                rb_f.setChecked(old.get("rb_f", False))
-                le_auto.setText(old.get("num_auto", ""))
-                le_fec.setText(old.get("fecha_elev", ""))
-
-            if i-1 < len(self.data.hechos):
-                dato = self.data.hechos[i-1]
-                le_desc.setProperty("html", dato.get("descripcion", ""))
-                doc = QTextDocument(); doc.setHtml(dato.get("descripcion", ""))
-                le_desc.setText(doc.toPlainText().replace("\n", " "))
-                le_aclar.setText(dato.get("aclaraciones", ""))
-                le_ofi.setText(dato.get("oficina", ""))
-                rb_j.setChecked(dato.get("juzgado", True))
-                rb_f.setChecked(not dato.get("juzgado", True))
-                le_auto.setText(dato.get("num_auto", ""))
-                le_fec.setText(dato.get("fecha_elev", ""))
+        # las pestañas nuevas (o recicladas) se cargan con lo que haya en el modelo
+        for idx in agregados:
+            if idx < len(self.data.hechos):
+                self._cargar_hecho(self.hechos_widgets[idx], self.data.hechos[idx])
 
         self._building_hechos = False
+        self.data.ajustar_hechos(n)
         # ``update_template`` se llamará únicamente cuando el usuario cambie
         # manualmente la cantidad de hechos para evitar recursividad indeseada
         # al reconstruir desde ``apply_to_main``.
 
+    def _crear_seccion_hecho(self, idx: int) -> Seccion:
+        """Arma la pestaña (todavía sin montar) de un hecho."""
+        tab = QWidget()
+        grid = QGridLayout(tab)
+        row = 0
+
+        def add_pair(text, widget):
+            nonlocal row
+            grid.addWidget(QLabel(text), row, 0)
+            grid.addWidget(widget, row, 1)
+            row += 1
+
+        le_desc = QLineEdit(); le_desc.setReadOnly(True)
+        btn_desc = QPushButton("Redactar el hecho")
+        grid.addWidget(QLabel(f"Descripción suceso #{idx + 1}"), row, 0)
+        grid.addWidget(btn_desc, row, 1); row += 1
+
+        le_aclar = QLineEdit(); add_pair("Aclaraciones:", le_aclar)
+        le_ofi = QLineEdit(); add_pair("Oficina que elevó:", le_ofi)
+        rb_j = QRadioButton("Juzgado"); rb_f = QRadioButton("Fiscalía"); rb_j.setChecked(True)
+        grp = QButtonGroup(tab); grp.addButton(rb_j); grp.addButton(rb_f)
+        grid.addWidget(rb_j, row, 0); grid.addWidget(rb_f, row, 1); row += 1
+        le_auto = QLineEdit(); add_pair("N° del auto:", le_auto)
+        le_fec = QLineEdit(); add_pair("Fecha de elevación:", le_fec)
+
+        widgets = {
+            "descripcion": le_desc,
+            "aclaraciones": le_aclar,
+            "oficina": le_ofi,
+            "rb_j": rb_j,
+            "rb_f": rb_f,
+            "num_auto": le_auto,
+            "fecha_elev": le_fec,
+        }
+        btn_desc.clicked.connect(
+            lambda _=False, w=widgets: self.abrir_ventana_hecho_desc(
+                self._secciones_hechos.indice(w))
+        )
+        # ninguna plantilla de trámites usa los hechos: sólo hay que
+        # llevarlos al modelo
+        for k in ("descripcion", "aclaraciones", "oficina", "num_auto", "fecha_elev"):
+            widgets[k].textChanged.connect(
+                lambda _=None, w=widgets, k=k: self._editado_hecho(w, k))
+        rb_j.toggled.connect(lambda _=None, w=widgets: self._editado_hecho(w, "rb_j"))
+        return Seccion(tab, widgets)
+
+    @staticmethod
+    def _reiniciar_hecho(sec: Seccion):
+        reiniciar_valores(sec.widgets)
+        with QSignalBlocker(sec.widgets["rb_j"]):
+            sec.widgets["rb_j"].setChecked(True)
+
+    @staticmethod
+    def _cargar_hecho(w: dict, hecho: Hecho):
+        """Vuelca un hecho del modelo en su pestaña sin emitir señales."""
+        bloqueos = [QSignalBlocker(widget) for widget in w.values()]
+        w["descripcion"].setProperty("html", hecho.descripcion)
+        poner_valor(w["descripcion"], html_en_linea(hecho.descripcion))
+        for k in ("aclaraciones", "oficina", "num_auto", "fecha_elev"):
+            poner_valor(w[k], getattr(hecho, k))
+        (w["rb_j"] if hecho.juzgado else w["rb_f"]).setChecked(True)
+        del bloqueos
+
     def _on_hechos_changed(self, _=None):
         """Actualiza pestañas y plantilla tras un cambio del usuario."""
+        self._render.flush()        # las pestañas nuevas se cargan del modelo
+        self.data.num_hechos = self.spin_hechos.value()
         self.rebuild_hechos()
+        self.update_template("hechos")
+
+    def _on_imputados_changed(self, _=None):
+        """Cambió ``combo_n``: es lo único que reconstruye las pestañas de imputados."""
+        self._render.flush()        # las pestañas nuevas se cargan del modelo
+        self.data.n_imputados = int(self.combo_n.currentText())
+        self.rebuild_imputados()
         self.update_template()
 
     def abrir_ventana_resuelvo(self):
@@ -755,21 +820,20 @@ class MainWindow(QMainWindow):
         self.entry_resuelvo.setProperty("html", clean)
         self.entry_resuelvo.setHtml(clean)
         # 2) texto plano sin límite
-        doc = QTextDocument()
-        doc.setHtml(clean)
-        preview = doc.toPlainText().replace("\n", " ")
-        # 3) actualizo tu modelo con HTML y texto completo
+        preview = html_en_linea(clean)
+        # 3) actualizo tu modelo con HTML y texto completo (el aviso del
+        #    modelo marca las plantillas que dependen del resuelvo)
         self.data.resuelvo_html = clean
         self.data.resuelvo      = preview
-        # 4) refresco la plantilla
-        self.update_template()
 
     def _guardar_html_lineedit(self, qlineedit, html):
         clean = html.strip()
         qlineedit.setProperty("html", clean)
-        doc = QTextDocument(); doc.setHtml(clean)
-        qlineedit.setText(doc.toPlainText().replace("\n", " "))
-        self.update_template()
+        qlineedit.setText(html_en_linea(clean))
+        # si sólo cambió el formato, textChanged no se emite
+        for w in self.hechos_widgets:
+            if w["descripcion"] is qlineedit:
+                self._editado_hecho(w, "descripcion")
 
     def abrir_ventana_hecho_desc(self, idx: int):
         qle = self.hechos_widgets[idx]["descripcion"]
@@ -831,7 +895,7 @@ class MainWindow(QMainWindow):
 
         def _on_ok():
             raw = editor.toHtml()
-            clean = _sanitize_html(raw)
+            clean = sanitizar(raw)
             clean = unescape(clean)
             on_accept(clean)
             dlg.accept()
@@ -843,19 +907,7 @@ class MainWindow(QMainWindow):
 
     @staticmethod
     def html_a_plano(html: str, mantener_saltos: bool = True) -> str:
-        if not html:
-            return ""
-
-        doc = QTextDocument(); doc.setHtml(html)
-        texto = doc.toPlainText()
-
-        # → equivale a &nbsp; y &nbsp; finos (202F)
-        texto = texto.replace("\u00A0", " ").replace("\u202F", " ")
-
-        if not mantener_saltos:
-            texto = texto.replace("\n", " ")
-
-        return texto.strip()
+        return _html_a_plano(html, mantener_saltos).strip()
 
     def _refresh_imp_names_in_selector(self):
         """Muestra el nombre si está cargado (“Imputado 1 – Pérez”)."""
@@ -866,17 +918,11 @@ class MainWindow(QMainWindow):
     def update_for_imp(self, idx: int):
         """Se llama cuando el usuario elige otro imputado."""
         self.imp_index = min(idx, len(self.imputados_widgets) - 1)
-        self._plantilla_oficio_notificacion()
-        self._plantilla_oficio_neuro()        # ← idem
-        self._plantilla_oficio_civ()
-        self._plantilla_oficio_libertad()
-        self._plantilla_oficio_policia()
-        self._plantilla_oficio_reincidencia()
-        self._plantilla_oficio_computo()
-        self._plantilla_oficio_spc()
-        self._plantilla_oficio_comunicacion()
-        self._plantilla_legajo()
-        self._plantilla_puesta_disposicion()
+        # sólo las plantillas que miran al imputado activo (casi siempre
+        # ya están armadas en ``_documentos``)
+        self._tabs_sucias.update(POR_IMPUTADO)
+        self._render_tab(self._tab_actual())
+        self._precalentar.start()
 
     def _imp(self):
         """Devuelve el dict del imputado activo o {} si el índice está fuera de rango."""
@@ -895,40 +941,23 @@ class MainWindow(QMainWindow):
         from PySide6.QtWidgets import QApplication
         from PySide6.QtGui     import QClipboard
 
+        # si quedó un render pendiente, lo copiado tiene que estar al día
+        self._render.flush()
+        for nombre, editor in self.text_edits.items():
+            if editor is te:
+                self._render_tab(nombre)
+                self._armado.esperar(self._clave(nombre))
+
         # ---------- 1) texto sin formato --------------------------------------
         plain_text = te.toPlainText().strip()
 
 
 # ---------- 2) HTML limpio + CSS Times 12 ---------------------------------
-        basic_html = te.toHtml()
-
-        # 1) limpiar tamaños de fuente
-        basic_html = re.sub(r'font-size\s*:[^;"]+;?', '', basic_html, flags=re.I)
-
-        # 2) limpiar "text-align:left" y align="left"
-        basic_html = re.sub(r'text-align\s*:\s*left\s*;?', '', basic_html, flags=re.I)
-        basic_html = re.sub(r'align="left"\s*', '', basic_html, flags=re.I)
-
-        # 3) a cada <p …> que NO traiga center/right le agregamos justify inline
-        def _ensure_justify(m):
-            tag = m.group(0)
-            # si ya tiene center/right, lo dejamos
-            if re.search(r'(text-align\s*:\s*(center|right))|(align="(center|right)")',
-                        tag, flags=re.I):
-                return tag
-            # si ya tiene style="", insertar el justify antes del cierre
-            if 'style="' in tag:
-                return re.sub(r'style="([^"]*)"', lambda s:
-                            f'style="{s.group(1)}text-align:justify;"', tag)
-            # no tenía style → agregamos uno
-            return tag[:-1] + ' style="text-align:justify;">'
-
-        basic_html = re.sub(r'<p[^>]*>', _ensure_justify, basic_html)
-
-        # 4) borrar style="" vacíos que hayan quedado
-        basic_html = re.sub(r'style="\s*"', '', basic_html)
-
-        # 5) armar el fragmento completo (¡sin regla CSS que fuerce justify!)
+        # sin tamaños de letra ni alineación a la izquierda, y cada <p> que
+        # no esté centrado/a la derecha queda justificado (una sola pasada)
+        basic_html = sanitizar(te.toHtml(), "portapapeles")
+
+        # armar el fragmento completo (¡sin regla CSS que fuerce justify!)
         html_full = (
             "<!DOCTYPE html><html><head><meta charset='UTF-8'>"
             "<style>"
@@ -959,183 +988,288 @@ class MainWindow(QMainWindow):
 
 
     def update(self):
+        """Pide regenerar todas las plantillas; el render real se agrupa y difiere."""
+        self._editado(TODAS_LAS_PLANTILLAS)
+
+    def update_template(self, campo: str = TODAS_LAS_PLANTILLAS):
+        """Registra el cambio de ``campo`` y agenda el re-render.
+
+        Los campos del formulario ya avisan solos a través del modelo; esto
+        queda para los cambios que no pasan por él (cantidad de pestañas…).
+        """
+        self._editado(campo)
+
+    def _editado(self, campo: str):
+        """Registra que cambió ``campo`` y agenda el re-render."""
+        self._campos_sucios.add(campo)
+        self._render.schedule()
+
+    def _editado_imp(self, w: dict, clave: str):
+        """El widget ``clave`` del imputado ``w`` cambió: se escribe ese campo."""
+        idx = self._secciones_imp.indice(w)
+        if idx >= 0:
+            setattr(self.data.imputado(idx), clave, leer_valor(w[clave]))
+
+    def _editado_hecho(self, w: dict, clave: str):
+        idx = self._secciones_hechos.indice(w)
+        if idx >= 0:
+            campo, valor = campo_hecho(w, clave)
+            setattr(self.data.hecho(idx), campo, valor)
+
+    def _a_modelo(self, campo: str, valor) -> None:
+        """Un widget del formulario cambió: se escribe sólo su campo del modelo.
+
+        El aviso del modelo (``_modelo_cambio``) es el que marca las plantillas.
+        """
+        if campo == TODAS_LAS_PLANTILLAS:
+            self._editado(TODAS_LAS_PLANTILLAS)
+            return
+        if campo == "renuncia":
+            valor = valor == "Sí"
+        setattr(self.data, campo, valor)
+        if campo == "articulo":
+            # Sincronizamos el cargo del juez con el tipo de tribunal
+            self.data.juez_cargo = "vocal" if valor.startswith("Cámara") else "juez"
+
+    def _modelo_cambio(self, campo: str, registro=None) -> None:
+        """Suscriptor del modelo: lleva el cambio al formulario (si hace falta)
+        y marca sólo las plantillas que dependen de ese campo."""
+        if registro is not None:
+            lista, clave = campo.split(".", 1)
+            if lista == "imputados":
+                self._imputado_cambio(registro, clave)
+            elif registro in self.data.hechos:
+                idx = self.data.hechos.index(registro)
+                if idx < len(self.hechos_widgets):
+                    self._cargar_hecho(self.hechos_widgets[idx], registro)
+                self._editado("hechos")
+            return
+
+        if campo in ("n_imputados", "imputados"):
+            # otra cantidad o lista nueva (p. ej. desde la sentencia): el
+            # volcado es por diferencias, así que si ya coincide no toca nada
+            if self.data.apply_to_main(self, {"imputados"}):
+                self._editado(TODAS_LAS_PLANTILLAS)
+        elif campo in ("num_hechos", "hechos"):
+            if self.data.apply_to_main(self, {"hechos"}):
+                self._editado("hechos")
+        elif campo in WIDGET_DE_CAMPO:
+            valor = getattr(self.data, campo)
+            if campo == "renuncia":
+                valor = "Sí" if valor else "No"
+            widget = getattr(self, WIDGET_DE_CAMPO[campo])
+            with QSignalBlocker(widget):
+                poner_valor(widget, valor)
+            self._editado(campo)
+        elif campo in ("resuelvo", "resuelvo_html"):
+            html = self.data.resuelvo_html or self.data.resuelvo
+            if (self.entry_resuelvo.property("html") or "") != html:
+                with QSignalBlocker(self.entry_resuelvo):
+                    self.entry_resuelvo.setProperty("html", html)
+                    self.entry_resuelvo.setHtml(html)
+            self._editado("resuelvo")
+
+    def _imputado_cambio(self, imp, clave: str) -> None:
+        if imp not in self.data.imputados:
+            return
+        idx = self.data.imputados.index(imp)
+        if idx >= len(self.imputados_widgets):
+            return
+        w = self.imputados_widgets[idx]
+        widget = w.get(clave)
+        if widget is None:
+            return              # campo que sólo usa la sentencia
+        with QSignalBlocker(widget):
+            if poner_valor(widget, getattr(imp, clave)) and clave == "nombre":
+                self._refresh_imp_names_in_selector()
+        self._campos_sucios.add(f"imps.{clave}")
+        self._imps_sucios.add(idx)
+        if self._imp() is w:
+            self._campos_sucios.add(f"imp.{clave}")
+        self._render.schedule()
+
+    def flush_render(self) -> None:
+        """Ejecuta ya cualquier render pendiente (antes de copiar/guardar/exportar)."""
+        self._render.flush()
+
+    def _regenerar_plantillas(self):
         if getattr(self, "_building", False):
             return            # todavía estamos construyendo pestañas
-        # ------------ plantillas ------------
-        self._plantilla_pedido()
-        self._plantilla_oficio_oga()
-        self._plantilla_decreto_audiencia()
-        self._plantilla_oficio_notificacion()
-        self._plantilla_acta_renuncia()
-        self._plantilla_constancia_grabacion()
-        self._plantilla_certificado_victimas()
-        self._plantilla_oficio_neuro()
-        self._plantilla_oficio_civ()
-        self._plantilla_oficio_libertad()
-        self._plantilla_oficio_policia()
-        self._plantilla_oficio_reincidencia()
-        self._plantilla_oficio_computo()
-        self._plantilla_oficio_spc()
-        self._plantilla_oficio_comunicacion()
-        self._plantilla_legajo()
-        self._plantilla_puesta_disposicion()
+        sucios, self._campos_sucios = self._campos_sucios, set()
+        # ------------ plantillas (sólo las afectadas) ------------
+        # se marcan y se genera ya únicamente la pestaña visible
+        for nombre, metodo in PLANTILLAS:
+            campos = getattr(self, metodo).campos
+            if TODAS_LAS_PLANTILLAS in sucios or campos & sucios:
+                self._tabs_sucias.add(nombre)
+        # los escritos de cada imputado: un campo propio ya marcó a ese
+        # imputado en ``_imputado_cambio``; los demás campos, a todos
+        if TODAS_LAS_PLANTILLAS in sucios or _CAMPOS_DE_TODOS_LOS_IMPUTADOS & sucios:
+            self._imps_sucios.update(range(len(self.imputados_widgets)))
+        self._render_tab(self._tab_actual())
+        self._precalentar.start()
 
         # ------------ demo para pestañas sin implementar ------------
         demo = "(Plantilla no implementada todavía)"
+        implementadas = {nombre for nombre, _ in PLANTILLAS}
         for k, te in self.text_edits.items():
-            if k not in (
-                "Pedido de audiencia", "Oficio OGA", "Decreto audiencia",
-                "Oficio notificación", "Acta renuncia", "Constancia grabación",
-                "Certificado víctimas", "Oficio Neuro", "Oficio CIV",
-                "Oficio libertad", "Oficio Policía", "Oficio Reincidencia",
-                "Oficio cómputo", "Oficio SPC", "Oficio comunicación",
-                "Legajo", "Puesta a disposición"
-            ):
+            if k not in implementadas:
                 te.setPlainText(demo)
 
-        self.data.from_main(self)
+    def _tab_actual(self) -> str:
+        return self.tabs_txt.tabText(self.tabs_txt.currentIndex())
 
-    def update_template(self):
-        self.data.from_main(self)
-        self.update()
-        # sólo reflejo el modelo en la UI si ya construí las pestañas
-        if hasattr(self, 'tabs_imp') and self.tabs_imp is not None:
-            self.data.apply_to_main(self)
+    def _render_tab(self, nombre: str) -> None:
+        """Genera la plantilla de la pestaña ``nombre`` si quedó desactualizada."""
+        if nombre not in self._tabs_sucias or getattr(self, "_building", False):
+            return
+        self._tabs_sucias.discard(nombre)
+        clave = self._clave(nombre)
+        contenido = getattr(self, _METODO_DE[nombre])()
+        hecho = self._documentos.get(clave)
+        if hecho is not None and hecho[0] == contenido:
+            self._armado.cancelar(clave)
+            self._en_curso.pop(clave, None)
+            self._colgar_documento(nombre, hecho[1])
+        else:
+            self._pedir_documento(clave, contenido)
+
+    def _clave(self, nombre: str, idx: int | None = None) -> tuple:
+        """Clave de ``_documentos``: la pestaña y, si mira al imputado, cuál."""
+        if nombre not in POR_IMPUTADO:
+            return (nombre, None)
+        return (nombre, getattr(self, "imp_index", 0) if idx is None else idx)
+
+    def _pedir_documento(self, clave: tuple, contenido: str) -> None:
+        if self._en_curso.get(clave) != contenido:
+            self._en_curso[clave] = contenido
+            self._armado.pedir(clave, _armador(contenido))
+
+    def _documento_listo(self, clave: tuple, doc) -> None:
+        self._documentos[clave] = (self._en_curso.pop(clave), doc)
+        nombre = clave[0]
+        # si la pestaña ya muestra otra cosa (otro imputado, o hay que
+        # regenerarla), queda guardado para cuando haga falta
+        if clave == self._clave(nombre) and nombre not in self._tabs_sucias:
+            self._colgar_documento(nombre, doc)
+
+    def _documento_fallido(self, clave: tuple, error: Exception) -> None:
+        """No se pudo armar: se muestra el error y se reintenta la próxima vez."""
+        self._en_curso.pop(clave, None)
+        nombre = clave[0]
+        if clave == self._clave(nombre) and nombre not in self._tabs_sucias:
+            # sucia: al volver a mostrarla o en el próximo render se pide de nuevo
+            self._tabs_sucias.add(nombre)
+            doc = QTextDocument()
+            _armador(_Aviso(f"No se pudo generar «{nombre}»:\n{error}"))(doc)
+            self._colgar_documento(nombre, doc)
+
+    def _colgar_documento(self, nombre: str, doc) -> None:
+        """Reemplaza de una vez el documento de la pestaña por el ya armado."""
+        te = self.text_edits[nombre]
+        if te.document() is not doc:
+            # la referencia en ``_mostrados`` lo mantiene vivo aunque salga
+            # de ``_documentos``: el editor no es su dueño
+            self._mostrados[nombre] = doc
+            te.setDocument(doc)
+
+    def render_all_tabs(self) -> None:
+        """Deja al día todas las pestañas (no sólo la visible)."""
+        self._render.flush()
+        for nombre, _ in PLANTILLAS:
+            self._render_tab(nombre)
+        self._armado.esperar()
+
+    def _precalentar_siguiente(self):
+        """En ratos libres, genera de a una las pestañas más usadas y después
+        los escritos de cada imputado."""
+        if self._render.pending or getattr(self, "_building", False):
+            return            # el usuario sigue editando; el próximo render reprograma
+        for nombre in PESTANAS_PRECALENTAR:
+            if nombre in self._tabs_sucias:
+                self._render_tab(nombre)
+                self._precalentar.start()
+                return
+        n = len(self.imputados_widgets)
+        for clave in [c for c in self._documentos if c[1] is not None and c[1] >= n]:
+            del self._documentos[clave]         # imputados que ya no están
+        # sólo los marcados, y cada uno una vez: la vuelta siguiente sigue
+        # con el próximo en lugar de volver a revisar desde el primero
+        while self._imps_sucios:
+            idx = min(self._imps_sucios)
+            self._imps_sucios.discard(idx)
+            if idx < n and self._precalcular_imputado(idx):
+                self._precalentar.start()
+                return
+
+    def _precalcular_imputado(self, idx: int) -> bool:
+        """Pide los escritos del imputado ``idx`` que no estén al día.
+
+        Devuelve ``True`` si pidió alguno.
+        """
+        pedidos = False
+        for nombre in POR_IMPUTADO:
+            clave = self._clave(nombre, idx)
+            contenido = self._contenido(nombre, idx)
+            hecho = self._documentos.get(clave)
+            if (hecho is None or hecho[0] != contenido) \
+                    and self._en_curso.get(clave) != contenido:
+                self._pedir_documento(clave, contenido)
+                pedidos = True
+        return pedidos
+
+    def _contenido(self, nombre: str, idx: int | None = None) -> str:
+        """Lo que da la plantilla de ``nombre`` para el imputado ``idx``
+        (por omisión, el activo del selector)."""
+        if idx is None:
+            return getattr(self, _METODO_DE[nombre])()
+        activo = getattr(self, "imp_index", 0)
+        self.imp_index = idx              # ``_imp()`` lee el índice
+        try:
+            return getattr(self, _METODO_DE[nombre])()
+        finally:
+            self.imp_index = activo
 
+    # sólo depende de la fecha del día: se regenera con los renders completos
+    @depende_de()
     def _plantilla_pedido(self):
-        fecha=fecha_letras(datetime.now())
-        texto=(f"Córdoba, {fecha}.\n"
-               "Atento al requerimiento de audiencia oral de juicio abreviado inicial, "
-               "admítase la solicitud y requiérase vía e‑oficio a la Oficina de Gestión de Audiencias (OGA) "
-               "que fije día y hora de realización de la audiencia presencial y asigne la sala para su desarrollo "
-               "(art. 336 del CPP y Anexo II del AR n.º 1747 Serie “A” de fecha 1/4/2022).")
-        te=self.text_edits["Pedido de audiencia"]; te.clear()
-        self._insert_paragraph(te,texto,Qt.AlignJustify)
+        marcado = escritos.PEDIDO(fecha=fecha_letras(datetime.now()))
+        return marcado
 
+    @depende_de("caratula", "articulo", "tribunal", "secretaria")
     def _plantilla_oficio_oga(self):
-        te=self.text_edits["Oficio OGA"]; te.clear()
-        cur=te.textCursor()
-
-        blk_right=QTextBlockFormat(); blk_right.setAlignment(Qt.AlignRight)
-        blk_left =QTextBlockFormat(); blk_left .setAlignment(Qt.AlignJustify)
-        blk_just =QTextBlockFormat(); blk_just.setAlignment(Qt.AlignJustify)
-        blk_center=QTextBlockFormat(); blk_center.setAlignment(Qt.AlignCenter)
-
-        fmt=QTextCharFormat(); fmt.setFontFamily("Times New Roman"); fmt.setFontPointSize(12)
-        fmt_bold=QTextCharFormat(fmt); fmt_bold.setFontWeight(QFont.Bold) # Bold
-
-        def insert(text: str, blk: QTextBlockFormat, cfmt: QTextCharFormat = fmt):
-            cur.insertBlock(blk)
-            cur.setCharFormat(cfmt)         # 1º formato …
-            cur.insertText(text) 
-
-        hoy=datetime.now(); fecha=f"Córdoba, {hoy.day} de {_MESES[hoy.month]} de {hoy.year}."
-        insert(fecha, blk_right)
-
-        cur.insertBlock(blk_left)
-
-        insert("Sr. Director de", blk_left, fmt_bold)
-        insert("OGA Penal",        blk_left, fmt_bold)
-        insert("S ____________/______________D", blk_left, fmt_bold)
-
-        cur.insertBlock(blk_left)
-
-        car=self.entry_caratula.text()
-        camara=self.combo_articulo.currentText().split()[0].lower()  # “esta” / “este”
-        articulo = "esta" if camara=="cámara" else "este"
-        sec=self.entry_secretaria.text()
-
-        cuerpo=(f"En los autos caratulados {car}, que se tramitan en {articulo} "
-                f"{self.entry_tribunal.currentText()}, secretaría a cargo de {sec}, "
-                "se ha resuelto librar a Ud. el presente oficio a fin de solicitar fecha y "
-                "hora de audiencia de juicio abreviado inicial, conforme la información que se "
-                "suministra por archivo adjunto.")
-        insert(cuerpo, blk_just, fmt)
-        cur.insertBlock(blk_left)
-        self._bold_occurrences(te, [car])
-        insert("Saludo a Ud. atentamente.", blk_center, fmt_bold)
-    
-    def _plantilla_decreto_audiencia(self):
-        te = self.text_edits["Decreto audiencia"]
-        te.clear()
-        cur = te.textCursor()
-
-        blk_left   = QTextBlockFormat(); blk_left.setAlignment(Qt.AlignJustify)
-        blk_just   = QTextBlockFormat(); blk_just.setAlignment(Qt.AlignJustify)
-
-        fmt_norm   = QTextCharFormat()
-        fmt_norm.setFontFamily("Times New Roman"); fmt_norm.setFontPointSize(12)
-
-        fmt_bu     = QTextCharFormat(fmt_norm)           # bold & underline
-        fmt_bu.setFontWeight(QFont.Bold)
-        fmt_bu.setFontUnderline(True)
-
-        fmt_it = QTextCharFormat(fmt_norm)          # ***nuevo*** – cursiva
-        fmt_it.setFontItalic(True)
-
-        cur.insertBlock(blk_left); cur.setCharFormat(fmt_norm)
-        cur.insertText(f"Córdoba, {fecha_letras(datetime.now())}.")
-
-        cur.insertBlock(blk_left)   # línea en blanco
+        car = self.entry_caratula.text()
+        marcado = escritos.OFICIO_OGA(
+            fecha=self._fecha_encabezado(),
+            caratula=car,
+            articulo=self._articulo(),
+            tribunal=self.entry_tribunal.currentText(),
+            secretaria=self.entry_secretaria.text(),
+        )
+        return marcado
 
+    def _decreto_audiencia(self) -> str:
         nombres = [w['nombre'].text().strip() for w in self.imputados_widgets
-                if w['nombre'].text().strip()]
-        def lista(l):
-            if not l:                return ""
-            if len(l)==1:            return l[0]
-            if len(l)==2:            return f"{l[0]} y {l[1]}"
-            return ", ".join(l[:-1])+f" y {l[-1]}"
-
-        if   len(nombres)==0: sit = "del imputado"
-        elif len(nombres)==1: sit = f"del imputado {nombres[0]}"
-        else:                 sit = f"de los imputados {lista(nombres)}"
-
-        texto_ini = ("Atento a lo informado por la Oficina de Gestión de Audiencias (OGA) "
-                    "mediante oficio electrónico, notifíquese a las partes que se ha fijado "
-                    "audiencia a los fines de resolver la situación procesal "
-                    f"{sit} para el ")
-
-        cur.insertBlock(blk_just); cur.setCharFormat(fmt_norm)
-        cur.insertText(texto_ini)
-
-        fecha_aud = self.entry_fecha.text()
-        hora_aud  = self.combo_hora.currentText()
-        sala_aud  = self.combo_sala.currentText()
-
-        cur.setCharFormat(fmt_bu)
-        cur.insertText(f"día {fecha_aud} a las {hora_aud} h en la {sala_aud} de Tribunales II")
+                   if w['nombre'].text().strip()]
+        return escritos.DECRETO_AUDIENCIA(
+            fecha=fecha_letras(datetime.now()),
+            nombres=nombres,
+            fecha_audiencia=self.entry_fecha.text(),
+            hora=self.combo_hora.currentText(),
+            sala=self.combo_sala.currentText(),
+        )
 
-        cur.setCharFormat(fmt_norm)
-        cur.insertText(" (art. 336 del CPP).")
+    @depende_de(*_DEPS_DECRETO)
+    def _plantilla_decreto_audiencia(self):
+        marcado = self._decreto_audiencia()
+        return marcado
 
+    @depende_de("caratula", "articulo", "tribunal", "secretaria", "funcionario",
+                "imp.nombre", "imp.dni", "imp.estable", *_DEPS_DECRETO)
     def _plantilla_oficio_notificacion(self):
-        te = self.text_edits["Oficio notificación"]
-        te.clear()
-        cur = te.textCursor()
-
-        blk_right  = QTextBlockFormat(); blk_right.setAlignment(Qt.AlignRight)
-        blk_left   = QTextBlockFormat(); blk_left .setAlignment(Qt.AlignJustify)
-        blk_just   = QTextBlockFormat(); blk_just .setAlignment(Qt.AlignJustify)
-        blk_center = QTextBlockFormat(); blk_center.setAlignment(Qt.AlignCenter)
-
-        fmt_norm = QTextCharFormat()
-        fmt_norm.setFontFamily("Times New Roman"); fmt_norm.setFontPointSize(12)
-
-        fmt_bold = QTextCharFormat(fmt_norm); fmt_bold.setFontWeight(QFont.Bold)
-        fmt_bu   = QTextCharFormat(fmt_bold); fmt_bu.setFontUnderline(True)
-
-        def insert(text, blk, fmt=fmt_norm):
-            cur.insertBlock(blk); cur.setCharFormat(fmt); cur.insertText(text)
-
-        car  = self.entry_caratula.text()
-        art  = "esta" if self.combo_articulo.currentText().startswith("Cámara") else "este"
-        trib = self.entry_tribunal.currentText()
-        sec  = self.entry_secretaria.text()
-        func = self.entry_funcionario.text()
-
         imp = self._imp()
         if not imp:                 # ← puede ocurrir en el milisegundo inicial
-            return                  #   (todavía no existen los tabs)
+            return _Aviso("")       #   (todavía no existen los tabs)
 
         nombre_w  = imp.get('nombre')
         dni_w     = imp.get('dni')
@@ -1156,120 +1290,25 @@ class MainWindow(QMainWindow):
             "EP7 (San Francisco)":"Establecimiento Penitenciario n.° 7 (San Francisco)",
             "EP8 (Villa Dolores)": "Establecimiento Penitenciario n.° 8 (Villa Dolores)",
         }
-        estab = map_est.get(estable, estable)
-
-        hoy = datetime.now()
-        fecha_num = f"Córdoba, {hoy.day} de {_MESES[hoy.month]} de {hoy.year}."
-
-        insert(fecha_num, blk_right)
-
-        cur.insertBlock(blk_left)          # línea en blanco
-
-        for linea in (
-            "Sra. Jefa del Servicio Penitenciario",
-            "de la Provincia de Córdoba",
-            "S ____________/______________D",
-        ):
-            insert(linea, blk_left, fmt_bold)
-
-        cur.insertBlock(blk_left)          # línea en blanco
-
-        texto = (
-            f"En los autos caratulados {car}, que se tramitan en {art} {trib} "
-            f"se ha resuelto enviar el presente oficio a fin de solicitarle quiera tener a bien "
-            "notificar la siguiente cédula al imputado "
-            f"{nombre}, DNI n.° {dni}, cuya constancia de diligenciamiento deberá ser remitida "
-            "a esta dependencia judicial:\n"
+        marcado = escritos.OFICIO_NOTIFICACION(
+            fecha=self._fecha_encabezado(),
+            caratula=self.entry_caratula.text(),
+            articulo=self._articulo(),
+            tribunal=self.entry_tribunal.currentText(),
+            secretaria=self.entry_secretaria.text(),
+            funcionario=self.entry_funcionario.text(),
+            nombre=nombre,
+            dni=dni,
+            establecimiento=map_est.get(estable, estable),
+            # el decreto se transcribe en una línea, con su negrita+subrayado
+            resolucion=en_linea(self._decreto_audiencia()),
         )
-        # parte con negritas (carátula y nombre)
-        insert(texto, blk_just, fmt_norm)
-        # resaltar carátula y penado
-        self._bold_occurrences(te, [car, nombre])
-
-        insert("CÉDULA DE NOTIFICACIÓN", blk_center, fmt_bu)
-
-        for linea in (
-            f"TRIBUNAL: {trib}.",
-            f"SECRETARÍA: {sec}.",
-            f"SEÑOR/A: {nombre}.",
-            f"DOMICILIO: {estab}.",
-        ):
-            insert(linea, blk_left, fmt_norm)
-
-        cur.insertBlock(blk_left)          # línea en blanco
-        # ---- 6) párrafo con resolución (traemos texto del decreto) -------------
-        res = self.text_edits["Decreto audiencia"].toPlainText().replace("\n", " ")
-
-        texto_res = (f"Se le hace saber a Ud. que en los autos caratulados {car}, "
-                    f"que se tramitan en {art} {trib} se ha dictado la siguiente resolución: “")
-
-        cur.insertBlock(blk_just)      # ← 1 solo bloque para todo el párrafo
-        cur.setCharFormat(fmt_norm)
-        cur.insertText(texto_res)
-        self._bold_occurrences(te, [car])          # carátula en negrita opcional
-        cur.insertText(res.strip())                # decreto sin salto extra
-        cur.insertText(f"” Fdo.: {func}.")         # cierra comilla + firma
-
-        cur.insertBlock(blk_left)                  # línea en blanco real
-        self._bu_between(te, "día ", "Tribunales II")  # negrita+subrayado al tramo
-        insert("QUEDA UD. DEBIDAMENTE NOTIFICADO.", blk_center, fmt_bold)
-        insert("Sin otro particular, saludo a Ud. atte.", blk_center, fmt_bold)
-
-    def _bold_occurrences(self, te: QTextEdit, words: list[str]):
-        """Pone en negrita cada aparición literal de las palabras dadas."""
-        doc = te.document()
-
-        # formato “Times 12 pt” en negrita
-        fmt_b = QTextCharFormat()
-        fmt_b.setFontFamily("Times New Roman")
-        fmt_b.setFontPointSize(12)
-        fmt_b.setFontWeight(QFont.Bold)
-
-        for w in words:
-            cursor = QTextCursor(doc)       # empieza al principio
-            while True:
-                cursor = doc.find(w, cursor)
-                if cursor.isNull():
-                    break                   # ya no hay más coincidencias
-                cursor.mergeCharFormat(fmt_b)
-    def _bu_between(self, te: QTextEdit, start_word: str, end_word: str):
-        """Pone Bold+Underline desde la 1.ª aparición de start_word
-        hasta la 1.ª aparición de end_word (inclusive)."""
-        doc = te.document()
-        cur_ini = doc.find(start_word)
-        cur_end = doc.find(end_word, cur_ini)
-        if cur_ini.isNull() or cur_end.isNull():
-            return
-        cur_ini.setPosition(cur_ini.selectionEnd())   # salto al final de start
-        cur_end.setPosition(cur_end.selectionEnd())   # fin incluido
-        cursor = QTextCursor(doc)
-        cursor.setPosition(cur_ini.position())
-        cursor.setPosition(cur_end.position(),
-                        QTextCursor.KeepAnchor)
-
-        fmt = QTextCharFormat()
-        fmt.setFontFamily("Times New Roman")
-        fmt.setFontPointSize(12)
-        fmt.setFontWeight(QFont.Bold)
-        fmt.setFontUnderline(True)
-        cursor.mergeCharFormat(fmt)
+        return marcado
 
+    @depende_de("renuncia", "hora_audiencia", "caratula", "fiscal_nombre",
+                "imps.nombre", "imps.defensa")
     def _plantilla_acta_renuncia(self):
-        te = self.text_edits["Acta renuncia"]
-        te.clear()
-        cur = te.textCursor()
-
-        blk_just = QTextBlockFormat(); blk_just.setAlignment(Qt.AlignJustify)
-        fmt_norm = QTextCharFormat()
-        fmt_norm.setFontFamily("Times New Roman"); fmt_norm.setFontPointSize(12)
-
-        def insert(text, blk=blk_just, fmt=fmt_norm):
-            cur.insertBlock(blk); cur.setCharFormat(fmt); cur.insertText(text)
-
-        if self.combo_renuncia.currentText() != "Sí":
-            insert("No hubo renuncia a los plazos para interponer recurso de casación.")
-            return                                         # ← nada más que hacer
-
+        renuncia = self.combo_renuncia.currentText() == "Sí"
         hora_aud = self.combo_hora.currentText()
         try:
             hora_ren = (datetime.strptime(hora_aud, "%H:%M") +
@@ -1278,263 +1317,83 @@ class MainWindow(QMainWindow):
             hora_ren = "Hora inválida" if hora_aud else "Hora no especificada"
 
         hoy = datetime.now()
-        fecha_letras = f"{hoy.day} de {_MESES[hoy.month]} de {hoy.year}"
-
-        car = self.entry_caratula.text()
-        fiscal = self.entry_fiscal.text() or "Sin datos de fiscal"
-
         imps  = self.imputados_widgets
-        nombres = [w['nombre'].text().strip() for w in imps if w['nombre'].text().strip()]
-        defensas = list({w['defensa'].text().strip() for w in imps if w['defensa'].text().strip()})
-
-        imp_txt = ("el imputado" if len(nombres)==1 else "los imputados")
-        nombres_txt = "Sin datos del penado" if not nombres else \
-                    nombres[0] if len(nombres)==1 else ", ".join(nombres[:-1]) + f" y {nombres[-1]}"
-        def_txt = "Sin datos de defensa" if not defensas else \
-                defensas[0] if len(defensas)==1 else ", ".join(defensas[:-1]) + f" y {defensas[-1]}"
-
-        plantilla1 = (
-            f"En la ciudad de Córdoba, el {fecha_letras}, siendo las {hora_ren} horas, "
-            f"en los presentes autos caratulados {car}, luego de haberse impuesto los "
-            "fundamentos y el veredicto del día de la fecha, "
-            f"{fiscal}; {def_txt}; y {imp_txt} {nombres_txt} "
-            "manifestaron su voluntad de renunciar al plazo para interponer el recurso "
-            "establecido en los arts. 468 y 469 del CPP, conforme lo estipulado por el "
-            "art. 474 del CPP."
-        )
-        plantilla2 = (
-            "Con lo que dio por terminado el acto, el que previa lectura dada en alta voz "
-            "y ratificación de su contenido, firman las partes, todo por "
-            "ante mí, de lo que doy fe."
+        marcado = escritos.ACTA_RENUNCIA(
+            renuncia=renuncia,
+            fecha=f"{hoy.day} de {_MESES[hoy.month]} de {hoy.year}",
+            hora=hora_ren,
+            caratula=self.entry_caratula.text(),
+            fiscal=self.entry_fiscal.text() or "Sin datos de fiscal",
+            nombres=[w['nombre'].text().strip() for w in imps if w['nombre'].text().strip()],
+            defensas=list({w['defensa'].text().strip() for w in imps
+                           if w['defensa'].text().strip()}),
         )
+        return marcado
 
-        insert(plantilla1)
-        insert("")                # línea en blanco
-        insert(plantilla2)
-
+    @depende_de("fecha_audiencia", "imps.nombre")
     def _plantilla_constancia_grabacion(self):
         """Genera la constancia con el enlace a la grabación."""
-        te = self.text_edits["Constancia grabación"]
-        te.clear()
-        cur = te.textCursor()
-
-        blk = QTextBlockFormat(); blk.setAlignment(Qt.AlignJustify)
-        fmt = QTextCharFormat()
-        fmt.setFontFamily("Times New Roman"); fmt.setFontPointSize(12)
-
-        def insert(text):
-            cur.insertBlock(blk); cur.setCharFormat(fmt); cur.insertText(text)
-
-        fecha_aud   = self.entry_fecha.text().strip()
-        hoy         = datetime.now().strftime("%d/%m/%Y")
-
-        nombres = [w['nombre'].text().strip()
-                for w in self.imputados_widgets if w['nombre'].text().strip()]
-
-        if len(nombres) == 0:
-            nombres_txt = ""
-        elif len(nombres) == 1:
-            nombres_txt = nombres[0]
-        else:
-            nombres_txt = ", ".join(nombres[:-1]) + f" y {nombres[-1]}"
-
-        plantilla = (
-            "Por medio de la presente, adjunto el archivo PDF que contiene el enlace "
-            "de la grabación de la audiencia de juicio abreviado inicial celebrada "
-            f"con fecha {fecha_aud}, en la que se resolvió la situación procesal "
-            f"de {nombres_txt}. Of., {hoy}."
+        marcado = escritos.CONSTANCIA_GRABACION(
+            fecha_audiencia=self.entry_fecha.text().strip(),
+            nombres=[w['nombre'].text().strip()
+                     for w in self.imputados_widgets if w['nombre'].text().strip()],
+            fecha=datetime.now().strftime("%d/%m/%Y"),
         )
-        insert(plantilla)
+        return marcado
 
+    @depende_de("imps.victimas")
     def _plantilla_certificado_victimas(self):
         """Completa la pestaña “Certificado víctimas”."""
-        te = self.text_edits["Certificado víctimas"]
-        te.clear()
-        cur = te.textCursor()
-
-        blk = QTextBlockFormat(); blk.setAlignment(Qt.AlignJustify)
-        fmt = QTextCharFormat()
-        fmt.setFontFamily("Times New Roman"); fmt.setFontPointSize(12)
-
-        def insert(text):
-            cur.insertBlock(blk); cur.setCharFormat(fmt); cur.insertText(text)
-
         victimas = [w['victimas'].text().strip()
                     for w in self.imputados_widgets
                     if w['victimas'].text().strip()]
-
-        seen = set(); victimas = [v for v in victimas if not (v in seen or seen.add(v))]
-
-        if len(victimas) == 0:
-            vict_txt = ""
-        elif len(victimas) == 1:
-            vict_txt = victimas[0]
-        else:
-            vict_txt = ", ".join(victimas[:-1]) + f" y {victimas[-1]}"
-
-        hoy = datetime.now().strftime("%d/%m/%Y")
-
-        plantilla = (
-            f"Certifico: que en el día de la fecha logré entablar comunicación con "
-            f"{vict_txt}, damnificado/s en la presente causa, a fin de hacerle/s conocer "
-            "la sentencia recaída en autos y conocer su voluntad respecto de las facultades "
-            "que le/s confiere el art. 11 bis de la Ley 24.660. En dicha ocasión, "
-            f"{vict_txt} manifestó/aron su voluntad de SER / NO SER anoticiado/s de los "
-            f"eventuales beneficios de libertad. Of., {hoy}."
+        marcado = escritos.CERTIFICADO_VICTIMAS(
+            victimas=list(dict.fromkeys(victimas)),        # sin repetidas
+            fecha=datetime.now().strftime("%d/%m/%Y"),
         )
-        insert(plantilla)
+        return marcado
 
+    @depende_de("caratula", "articulo", "tribunal",
+                "imp.neuro", "imp.tipo", "imp.nombre", "imp.dni")
     def _plantilla_oficio_neuro(self):
-        te = self.text_edits["Oficio Neuro"]
-        te.clear()
-        cur = te.textCursor()
-        
         imp = self._imp()
         if not imp or not imp['neuro'].isChecked() \
         or imp['tipo'].currentText() != "condicional":
-            te.setPlainText("No aplica para penas efectivas o no seleccionado.")
-            return
-
-        blk_left   = QTextBlockFormat(); blk_left.setAlignment(Qt.AlignJustify)
-        blk_right  = QTextBlockFormat(); blk_right.setAlignment(Qt.AlignRight)
-        blk_center = QTextBlockFormat(); blk_center.setAlignment(Qt.AlignCenter)
-        blk_just   = QTextBlockFormat(); blk_just.setAlignment(Qt.AlignJustify)
-
-        fmt_norm = QTextCharFormat()
-        fmt_norm.setFontFamily("Times New Roman")
-        fmt_norm.setFontPointSize(12)
-
-        fmt_b  = QTextCharFormat(fmt_norm)      # negrita
-        fmt_b.setFontWeight(QFont.Bold)
+            return _Aviso("No aplica para penas efectivas o no seleccionado.")
 
-        fmt_bu = QTextCharFormat(fmt_b)         # negrita + subrayado
-        fmt_bu.setFontUnderline(True)
-
-        fmt_it = QTextCharFormat(fmt_norm)      # cursiva
-        fmt_it.setFontItalic(True)
-
-        def ins(text, blk, fmt=fmt_norm):
-            cur.insertBlock(blk)
-            cur.setCharFormat(fmt)
-            cur.insertText(text)
-
-        hoy = datetime.now()
-        ins(f"Córdoba, {hoy.day} de {_MESES[hoy.month]} de {hoy.year}.", blk_right)
-
-        cur.insertBlock(blk_left)            # línea en blanco real
-
-        for i, linea in enumerate((
-            "AL SR. DIRECTOR",
-            "DEL HOSPITAL",
-            "NEUROPSIQUIÁTRICO",
-            "PROVINCIAL",
-            "(Rector León Morra 160)",       # ← solo esta va subrayada
-            "S___________/___________D",
-        )):
-            fmt = fmt_bu if i == 4 else fmt_b
-            ins(linea, blk_left, fmt)
-
-        cur.insertBlock(blk_left)            # línea en blanco
-
-        car  = self.entry_caratula.text()
-        art  = ("esta" if self.combo_articulo.currentText()
-                        .startswith("Cámara") else "este")
-        trib = self.entry_tribunal.currentText()
-        imp  = self._imp()
-        nom  = imp.get("nombre").text()
-        dni  = imp.get("dni").text()
-
-        texto1 = (f"En los autos caratulados {car}, que se tramitan ante {art} "
-                f"{trib}, se ha resuelto librar a Ud. el presente a fin de "
-                f"solicitarle que arbitre los medios necesarios para que "
-                f"{nom}, DNI n.° {dni}, reciba en la institución a su cargo un "
-                "tratamiento interdisciplinario acorde con la problemática de "
-                "adicción a sustancias estupefacientes que padece. Fundamenta el "
-                "presente lo resuelto por veredicto dictado por este tribunal en "
-                "el día de la fecha, en el que se impuso a la persona nombrada la "
-                "pena bajo una serie de condiciones, entre ellas: ")
-        ins(texto1, blk_just)
-        self._bold_occurrences(te, [car, nom])
-        cur.setCharFormat(fmt_it)
-        cur.insertText(
-            "“Iniciar un tratamiento interdisciplinario acorde a la problemática de "
-            "adicción a sustancias estupefacientes que padece, debiendo presentar "
-            "constancia del inicio del mismo en el término de 15 días ante el "
-            "tribunal de ejecución interviniente”. "
+        car = self.entry_caratula.text()
+        nom = imp.get("nombre").text()
+        marcado = escritos.OFICIO_NEURO(
+            fecha=self._fecha_encabezado(),
+            caratula=car,
+            articulo=self._articulo(),
+            tribunal=self.entry_tribunal.currentText(),
+            nombre=nom,
+            dni=imp.get("dni").text(),
         )
-        cur.setCharFormat(fmt_norm)
-
-        texto2 = ("En consecuencia, se solicita a Ud. la elaboración de un informe "
-                "periódico dirigido a este tribunal, en el que comente la "
-                "asistencia al tratamiento, así como su avance, y todo otro dato "
-                "de interés.")
-        cur.insertText(texto2)
-
-        cur.insertBlock(blk_left) 
-        # ---------- 4) Cierre --------------------------------------------
-        ins("Saluda a Ud. atte.", blk_center, fmt_b)
+        return marcado
 
+    @depende_de("caratula", "articulo", "tribunal", "secretaria",
+                "imp.civ", "imp.tipo", "imp.nombre", "imp.dni")
     def _plantilla_oficio_civ(self):
-        te = self.text_edits["Oficio CIV"]
-        te.clear()
-        cur = te.textCursor()
-
         imp = self._imp()
         if not imp or not imp['civ'].isChecked() \
         or imp['tipo'].currentText() != "condicional":
-            te.setPlainText("No aplica para penas efectivas o no seleccionado.")
-            return
-
-        blk_r = QTextBlockFormat(); blk_r.setAlignment(Qt.AlignRight)
-        blk_l = QTextBlockFormat(); blk_l.setAlignment(Qt.AlignJustify)
-        blk_j = QTextBlockFormat(); blk_j.setAlignment(Qt.AlignJustify)
-        blk_c = QTextBlockFormat(); blk_c.setAlignment(Qt.AlignCenter)
-
-        fmt   = QTextCharFormat()
-        fmt.setFontFamily("Times New Roman"); fmt.setFontPointSize(12)
-        fmt_b = QTextCharFormat(fmt); fmt_b.setFontWeight(QFont.Bold)
-        fmt_bu= QTextCharFormat(fmt_b); fmt_bu.setFontUnderline(True)
-
-        def ins(t,b,f=fmt): cur.insertBlock(b); cur.setCharFormat(f); cur.insertText(t)
-
-        hoy     = datetime.now()
-        fecha_r = f"Córdoba, {hoy.day} de {_MESES[hoy.month]} de {hoy.year}."
-        car     = self.entry_caratula.text()
-        art     = "esta" if self.combo_articulo.currentText().startswith("Cámara") else "este"
-        trib    = self.entry_tribunal.currentText()
-        sec     = self.entry_secretaria.text()
-        penado  = imp['nombre'].text()
-        dni     = imp['dni'].text()
-
-        ins(fecha_r, blk_r)
-
-        cur.insertBlock(blk_l)
-
-        for i,linea in enumerate((
-            "AL SR. DIRECTOR DEL",
-            "CENTRO INTEGRAL DE VARONES",   # ← subrayado
-            "(Rondeau 258, Nueva Córdoba)",
-            "S______________/______________D",
-        )):
-            ins(linea, blk_l, fmt_bu if i==1 else fmt_b)
-
-        cur.insertBlock(blk_l)
-
-        cuerpo = (
-            f"En los presentes autos caratulados {car}, que se tramitan por ante {art} "
-            f"{trib}, secretaría a cargo de {sec}, por disposición de S.S. se dirige a Ud. "
-            f"el presente oficio a fin de solicitarle disponga los medios necesarios para "
-            f"brindar asistencia psicoterapéutica a {penado}, DNI n.° {dni}, con relación a "
-            "su problemática de violencia de género. Tal petición encuentra razón en que "
-            "este Tribunal dispuso como condición de su libertad la realización de dicho "
-            "tratamiento."
+            return _Aviso("No aplica para penas efectivas o no seleccionado.")
+
+        car    = self.entry_caratula.text()
+        penado = imp['nombre'].text()
+        marcado = escritos.OFICIO_CIV(
+            fecha=self._fecha_encabezado(),
+            caratula=car,
+            articulo=self._articulo(),
+            tribunal=self.entry_tribunal.currentText(),
+            secretaria=self.entry_secretaria.text(),
+            nombre=penado,
+            dni=imp['dni'].text(),
         )
-        ins(cuerpo, blk_j)
-        self._bold_occurrences(te, [car, penado])
-        cur.insertBlock(blk_l)
+        return marcado
 
-        ins("Sin otro particular, saluda a Ud. atte.", blk_c, fmt_b)
- 
     def _recopila_datos_imp(self) -> dict[str, str]:
         imp = self._imp() or {}
 
@@ -1542,8 +1401,7 @@ class MainWindow(QMainWindow):
             if isinstance(w, QLineEdit):
                 html = w.property("html")
                 if html:
-                    doc = QTextDocument(); doc.setHtml(html)
-                    return doc.toPlainText()
+                    return html_a_texto(html)
                 return w.text()
             if isinstance(w, QComboBox):
                 return w.currentText()
@@ -1575,7 +1433,7 @@ class MainWindow(QMainWindow):
             'computo_pena' : _txt(imp.get('decreto')),
             'defensa'      : _txt(imp.get('defensa')),
             'victimas'     : _txt(imp.get('victimas')),
-            'datos'        : _txt(imp.get('datos')),    
+            'datos'        : _txt(imp.get('datos')),
             'renuncia'     : self.combo_renuncia.currentText(),
             'fecha_aud'    : self.entry_fecha.text(),
             'tipo_pena'    : _txt(imp.get('tipo')),
@@ -1589,214 +1447,67 @@ class MainWindow(QMainWindow):
         h = datetime.now()
         return f"Córdoba, {h.day:02d}/{h.month:02d}/{h.year}"
 
-    def _insert_encabezado(self, cursor, lineas, blk_left, fmt_b, idx_sub=None):
-        """Escribe las líneas de ‘encabezado_lineas’ (negrita; la posición
-        idx_sub –si se da– irá negrita + subrayado)."""
-        fmt_bu = QTextCharFormat(fmt_b)
-        fmt_bu.setFontUnderline(True)
-        for i, ln in enumerate(lineas):
-            cursor.insertBlock(blk_left)
-            cursor.setCharFormat(fmt_bu if i == idx_sub else fmt_b)
-            cursor.insertText(ln)
+    def _fecha_encabezado(self) -> str:
+        """“Córdoba, 5 de mayo de 2025.”, como va arriba a la derecha."""
+        h = datetime.now()
+        return f"Córdoba, {h.day} de {_MESES[h.month]} de {h.year}."
+
+    def _articulo(self) -> str:
+        """“esta” (Cámara) o “este” (Juzgado), según el tribunal."""
+        return "esta" if self.combo_articulo.currentText().startswith("Cámara") else "este"
 
+    @depende_de("caratula", "articulo", "tribunal",
+                "imp.tipo", "imp.nombre", "imp.dni", "imp.condena")
     def _plantilla_oficio_libertad(self):
-        te = self.text_edits["Oficio libertad"]
-        te.clear()
-
         imp = self._imp()                                    # imputado activo
         tipo_w = imp.get("tipo") if imp else None
         if not imp or not isinstance(tipo_w, QComboBox):
-            te.setPlainText("Aún no hay datos del imputado.")
-            return
+            return _Aviso("Aún no hay datos del imputado.")
         if tipo_w.currentText() != "condicional":            # sólo para penas condicionales
-            te.setPlainText("No aplica para penas efectivas.")
-            return
-
-        cur = te.textCursor()
-        blk_r, blk_l, blk_c, blk_j = (QTextBlockFormat() for _ in range(4))
-        blk_r.setAlignment(Qt.AlignRight)
-        blk_l.setAlignment(Qt.AlignJustify)
-        blk_c.setAlignment(Qt.AlignCenter)
-        blk_j.setAlignment(Qt.AlignJustify)
-
-        fmt     = QTextCharFormat(); fmt.setFontFamily("Times New Roman"); fmt.setFontPointSize(12)
-        fmt_b   = QTextCharFormat(fmt);  fmt_b.setFontWeight(QFont.Bold)
-        fmt_it  = QTextCharFormat(fmt);  fmt_it.setFontItalic(True)
+            return _Aviso("No aplica para penas efectivas.")
 
-        def ins(text, blk, f=fmt):
-            cur.insertBlock(blk); cur.setCharFormat(f); cur.insertText(text)
-
-        hoy = datetime.now()
-        ins(f"Córdoba, {hoy.day} de {_MESES[hoy.month]} de {hoy.year}.", blk_r)
-
-        self._insert_encabezado(
-            cur,
-            (
-                "A LA SRA. JEFA DEL",
-                "SERVICIO PENITENCIARIO",
-                "DE LA PROVINCIA DE CÓRDOBA",
-                "S___________/___________D",
-            ),
-            blk_l, fmt_b
-        )
-        cur.insertBlock(blk_l)          # línea en blanco real
-
-        car   = self.entry_caratula.text()
-        trib  = self.entry_tribunal.currentText()
-        art   = "esta" if self.combo_articulo.currentText().startswith("Cámara") else "este"
-
-        nom   = imp['nombre'].text()
-        dni   = imp['dni'].text()
-        con   = imp['condena'].text()
-
-        texto = (
-            f"En los autos caratulados {car} que se tramitan ante {art} {trib}, "
-            "se ha dispuesto dirigir a Ud. el presente a fin de que disponga lo necesario "
-            "para que se ponga inmediatamente en libertad, desde la Alcaidía de Tribunales II, "
-            f"a {nom}, DNI n.° {dni}, en virtud de que por veredicto de este tribunal dictado "
-            f"en el día de la fecha se le impuso la pena de {con}, disponiéndose su inmediata libertad. "
-            "Deberá labrarse el acta respectiva y deberá requerírsele a la persona condenada que fije "
-            "domicilio, el que deberá quedar consignado en el acta de libertad. La libertad se deberá "
-            "disponer previa constatación de que el nombrado no se encuentre a disposición de otro tribunal."
+        car = self.entry_caratula.text()
+        nom = imp['nombre'].text()
+        marcado = escritos.OFICIO_LIBERTAD(
+            fecha=self._fecha_encabezado(),
+            caratula=car,
+            articulo=self._articulo(),
+            tribunal=self.entry_tribunal.currentText(),
+            nombre=nom,
+            dni=imp['dni'].text(),
+            condena=imp['condena'].text(),
         )
-        ins(texto, blk_j)
-        self._bold_occurrences(te, [car, nom])
-        ins("", blk_l)                  # línea en blanco
-        ins("Sin otro particular, saludo a Ud. atte.", blk_c, fmt_b)
+        return marcado
 
+    @depende_de("caratula", "articulo", "tribunal", "sentencia_num", "resuelvo", "firmantes",
+                "imp.nombre", "imp.dni", "imp.hechos_n", "imp.fechas")
     def _plantilla_oficio_policia(self):
-        te = self.text_edits["Oficio Policía"]
-        te.clear()
-        cur = te.textCursor()
-        blk_left  = QTextBlockFormat(); blk_left .setAlignment(Qt.AlignJustify)
-        blk_right = QTextBlockFormat(); blk_right.setAlignment(Qt.AlignRight)
-        blk_center= QTextBlockFormat(); blk_center.setAlignment(Qt.AlignCenter)
-        blk_just  = QTextBlockFormat(); blk_just .setAlignment(Qt.AlignJustify)
-        imp = self._imp()                       # ← ① recupero el imputado activo
-        tipo_widget = imp.get("tipo") if imp else None  
-
-        fmt = QTextCharFormat(); fmt.setFontFamily("Times New Roman"); fmt.setFontPointSize(12)
-        fmt_b = QTextCharFormat(fmt); fmt_b.setFontWeight(QFont.Bold)
-        # ---------- FORMATOS DE CARÁCTER -------------------------------
-        fmt_norm = QTextCharFormat()
-        fmt_norm.setFontFamily("Times New Roman")
-        fmt_norm.setFontPointSize(12)
-
-        fmt_b  = QTextCharFormat(fmt_norm)      # negrita
-        fmt_b.setFontWeight(QFont.Bold)
-
-        fmt_bu = QTextCharFormat(fmt_b)         # negrita + subrayado
-        fmt_bu.setFontUnderline(True)
-
-        fmt_it = QTextCharFormat(fmt_norm)      # cursiva
-        fmt_it.setFontItalic(True)
-        # helper local
-        def ins(text, blk, fmt=fmt_norm):
-            cur.insertBlock(blk)
-            cur.setCharFormat(fmt)
-            cur.insertText(text)
-
-        hoy = datetime.now()
-        ins(f"Córdoba, {hoy.day} de {_MESES[hoy.month]} de {hoy.year}.", blk_right)
-
-        self._insert_encabezado(
-            cur,
-            (
-                "AL SEÑOR DIRECTOR DE LA",
-                "DIVISIÓN DOCUMENTACIÓN PERSONAL",
-                "POLICÍA DE LA PROVINCIA DE CÓRDOBA",
-                "S______________/______________D",
-            ),
-            blk_left, fmt_b
-        )
-        cur.insertBlock(blk_left)        # línea en blanco
-
         d = self._recopila_datos_imp()
-        camara=self.combo_articulo.currentText().split()[0].lower()  # “esta” / “este”
-        articulo = "esta" if camara=="cámara" else "este"
-
-        texto1 = (
-            f"En los autos caratulados {d['caratula']}, tramitados por ante "
-            f"{articulo} {d['tribunal']}, se ha resuelto librar a Ud. el presente "
-            f"a fin de que proceda a la anotación correspondiente de la sentencia n.° {d['sentencia']} en "
-            f"los presentes autos, con relación a {d['penado']}, DNI n.° {d['dni']}, por {d['hechos']} "
-            f"de fecha {d['fechas_hechos']}, que RESUELVE: "
-        )
-
-        cur.insertBlock(blk_just); cur.setCharFormat(fmt); cur.insertText(texto1)
-        cur.setCharFormat(fmt_it)
-   # ------------------------------------------------------------------------
-        cur.insertText(f"“{d['resuelvo']}”")
-
-        cur.setCharFormat(fmt)
-        cur.insertText(f". Fdo.: {d['firmantes']}.")
-
-        self._bold_occurrences(
-            te,
-            [d['caratula'], "sentencia n.°", d['sentencia'],
-            d['penado'], "RESUELVE:", "Fdo.:", d['firmantes']]
+        marcado = escritos.OFICIO_POLICIA(
+            fecha=self._fecha_encabezado(),
+            caratula=d['caratula'],
+            articulo=self._articulo(),
+            tribunal=d['tribunal'],
+            sentencia=d['sentencia'],
+            penado=d['penado'],
+            dni=d['dni'],
+            hechos=d['hechos'],
+            fechas_hechos=d['fechas_hechos'],
+            resuelvo=d['resuelvo'],
+            firmantes=d['firmantes'],
         )
-        cur.insertBlock(blk_left) # línea en blanco real
-        # ── 4) Saludo centrado en negrita ────────────────────────────────
-        cur.insertBlock(blk_center); cur.setCharFormat(fmt_b)
-        cur.insertText("Saludo a Ud. atte.")
+        return marcado
 
+    @depende_de("sentencia_num", "tribunal", "secretaria", "caratula", "resuelvo",
+                "renuncia", "fecha_audiencia", "imp.datos", "imp.fechas", "imp.victimas",
+                "imp.tipo", "imp.condena", "imp.cumpl")
     def _plantilla_oficio_reincidencia(self):
         """Genera el oficio para el Registro Nacional de Reincidencia según el nuevo modelo."""
-        import re
-        from datetime import datetime
-
-        te = self.text_edits["Oficio Reincidencia"]
-        te.clear()
-        cur = te.textCursor()
-
-        # — formatos de bloque y carácter —
-        blk_center = QTextBlockFormat(); blk_center.setAlignment(Qt.AlignCenter)
-        blk_left   = QTextBlockFormat(); blk_left .setAlignment(Qt.AlignJustify)
-
-        fmt_norm = QTextCharFormat()
-        fmt_norm.setFontFamily("Times New Roman"); fmt_norm.setFontPointSize(12)
-
-        fmt_bold  = QTextCharFormat(fmt_norm); fmt_bold.setFontWeight(QFont.Bold)
-        fmt_bu    = QTextCharFormat(fmt_bold);  fmt_bu.setFontUnderline(True)
-        fmt_italic= QTextCharFormat(fmt_norm);  fmt_italic.setFontItalic(True)
-
-        def ins(text: str, blk: QTextBlockFormat, fmt: QTextCharFormat):
-            cur.insertBlock(blk); cur.setCharFormat(fmt); cur.insertText(text)
-
-        def ins_pair(title: str, value: str):
-            cur.insertBlock(blk_left)
-            cur.setCharFormat(fmt_bold)
-            cur.insertText(f"{title}: ")
-            cur.setCharFormat(fmt_norm)
-            cur.insertText(value)
-
-        # — encabezado centrado —
-        ins("MINISTERIO DE JUSTICIA, SEGURIDAD Y DERECHOS HUMANOS", blk_center, fmt_norm)
-        ins("REGISTRO NACIONAL DE REINCIDENCIA",                  blk_center, fmt_norm)
-        cur.insertBlock(blk_center)  # espacio antes del título
-        ins("TESTIMONIO DE SENTENCIA CONDENATORIA",               blk_center, fmt_bu)
-        cur.insertBlock(blk_center)  # espacio antes del título
-        # — datos del expediente —
-        ins_pair("Sentencia", f"N° {self.entry_sentencia.text().strip()}")
-        ins_pair("Tribunal interviniente", 
-                 f"{self.entry_tribunal.currentText()}, Secretaría n.° {self.entry_secretaria.text().strip()}")
-        ins_pair("Otros juzgados o tribunales intervinientes en la causa con anterioridad", "")
-        ins_pair("Expediente",           self.entry_caratula.text().strip())
-
         imp = self._imp()
-        ins_pair("Datos personales",            imp.get("datos").text().strip()    if imp.get("datos")    else "")
-        ins_pair("Fecha de comisión del delito", imp.get("fechas").text().strip()   if imp.get("fechas")   else "")
-        ins_pair("Localidad de comisión del delito", "Córdoba")
-        ins_pair("Damnificado",                  imp.get("victimas").text().strip() if imp.get("victimas") else "")
-        ins_pair("Descripción de la pena",       f"prisión de ejecución {imp.get('tipo').currentText()}" if imp.get("tipo") else "")
-
-        # — pena con viñeta —
-        cur.insertBlock(blk_left)
-        cur.setCharFormat(fmt_bold)
-        cur.insertText("•    Pena: ")
-        cur.setCharFormat(fmt_norm)
-        cur.insertText(imp.get("condena").text().strip() if imp.get("condena") else "")
+
+        def campo(clave):
+            w = imp.get(clave)
+            return w.text().strip() if w else ""
 
         # — extraer sólo el punto con 'Declarar' —
         # 1) obtener el HTML original y aplanarlo sin saltos
@@ -1804,65 +1515,50 @@ class MainWindow(QMainWindow):
         full = self.html_a_plano(raw, mantener_saltos=False)
         pattern = r'\b([IVX]+|\d+)\.\s+([\s\S]*?)(?=(?:[IVX]+|\d+)\.\s+|$)'
 
-
-
         declarar = []
         for m in re.finditer(pattern, full, re.DOTALL|re.IGNORECASE):
             num, txt = m.group(1), m.group(2).strip()
             if re.search(r'\bdeclar', txt, re.IGNORECASE):
                 declarar.append(f"{num}. {txt}")
-        punto = ' '.join(declarar)
-
-        # — TESTIMONIO: en cursiva, entre comillas y con puntos suspensivos —
-        cur.insertBlock(blk_left)
-        cur.setCharFormat(fmt_bu)
-        cur.insertText("TESTIMONIO")
-        # continuar en negrita sin subrayado para ":" y espacio
-        cur.setCharFormat(fmt_bold)
-        cur.insertText(": ")
-        cur.setCharFormat(fmt_italic)
-        cur.insertText(f'"(...) {punto} (...)"')
-        # restaurar formato normal
-        cur.setCharFormat(fmt_norm)
-
-        # — siguientes campos —
-        ins_pair("Fecha de cumplimiento total de la pena",
-                 imp.get("cumpl").text().strip() if imp.get("cumpl") else "")
-
-        if self.combo_renuncia.currentText() == "Sí":
-            fecha_firme = self.entry_fecha.text().strip()
-        else:
-            fecha_firme = ""
-        ins_pair("Fecha en que la sentencia quedó firme", fecha_firme)
 
-        ins_pair("Fecha de envío del testimonio", datetime.now().strftime("%d/%m/%Y"))
-        ins_pair("Organismo remitente", "Poder Judicial de la Provincia de Córdoba")
+        fecha_firme = self.entry_fecha.text().strip() if self.combo_renuncia.currentText() == "Sí" else ""
+        marcado = escritos.OFICIO_REINCIDENCIA(
+            datos=(
+                ("Sentencia", f"N° {self.entry_sentencia.text().strip()}"),
+                ("Tribunal interviniente",
+                 f"{self.entry_tribunal.currentText()}, Secretaría n.° {self.entry_secretaria.text().strip()}"),
+                ("Otros juzgados o tribunales intervinientes en la causa con anterioridad", ""),
+                ("Expediente", self.entry_caratula.text().strip()),
+                ("Datos personales", campo("datos")),
+                ("Fecha de comisión del delito", campo("fechas")),
+                ("Localidad de comisión del delito", "Córdoba"),
+                ("Damnificado", campo("victimas")),
+                ("Descripción de la pena",
+                 f"prisión de ejecución {imp.get('tipo').currentText()}" if imp.get("tipo") else ""),
+            ),
+            pena=campo("condena"),
+            punto=' '.join(declarar),
+            cierre=(
+                ("Fecha de cumplimiento total de la pena", campo("cumpl")),
+                ("Fecha en que la sentencia quedó firme", fecha_firme),
+                ("Fecha de envío del testimonio", datetime.now().strftime("%d/%m/%Y")),
+                ("Organismo remitente", "Poder Judicial de la Provincia de Córdoba"),
+            ),
+        )
+        return marcado
 
+    @depende_de("caratula", "articulo", "tribunal", "secretaria", "imp.tipo",
+                "imp.nombre", "imp.dni", "imp.estable", "imp.decreto", "imp.firm_dec")
     def _plantilla_oficio_computo(self):
-        te = self.text_edits["Oficio cómputo"]
-        te.clear()
-
         imp = self._imp()                                    # imputado activo
         tipo_w = imp.get("tipo") if imp else None            # widget ‘tipo de pena’
         if not imp or not isinstance(tipo_w, QComboBox):
-            te.setPlainText("Aún no hay datos del imputado.")
-            return
+            return _Aviso("Aún no hay datos del imputado.")
         if tipo_w.currentText() != "efectiva":               # sólo para penas efectivas
-            te.setPlainText("No aplica para penas condicionales.")
-            return
-
-        cur = te.textCursor()
+            return _Aviso("No aplica para penas condicionales.")
 
-        blk_r, blk_l, blk_c, blk_j = (QTextBlockFormat() for _ in range(4))
-        blk_r.setAlignment(Qt.AlignRight)
-        blk_l.setAlignment(Qt.AlignJustify)
-        blk_c.setAlignment(Qt.AlignCenter)
-        blk_j.setAlignment(Qt.AlignJustify)
-        imp = self._imp()                       # ← ① recupero el imputado activo
-        tipo_widget = imp.get("tipo") if imp else None 
         # ── datos que ya tenemos centralizados ─────────────────────────────
-        d    = self._recopila_datos_imp()
-        sec  = self.entry_secretaria.text()
+        d = self._recopila_datos_imp()
 
         mapa_est = {
             "CC1 (Bouwer)": "Complejo Carcelario n.° 1 (Bouwer)",
@@ -1875,364 +1571,126 @@ class MainWindow(QMainWindow):
             "EP7 (San Francisco)": "Establecimiento Penitenciario n.° 7 (San Francisco)",
             "EP8 (Villa Dolores)": "Establecimiento Penitenciario n.° 8 (Villa Dolores)",
         }
-        estab = mapa_est.get(self._imp()['estable'].currentText(),
-                            self._imp()['estable'].currentText())
-
-        fmt = QTextCharFormat(); fmt.setFontFamily("Times New Roman"); fmt.setFontPointSize(12)
-        fmt_b = QTextCharFormat(fmt); fmt_b.setFontWeight(QFont.Bold)
-        # ---------- FORMATOS DE CARÁCTER -------------------------------
-        fmt_norm = QTextCharFormat()
-        fmt_norm.setFontFamily("Times New Roman")
-        fmt_norm.setFontPointSize(12)
-
-        fmt_b  = QTextCharFormat(fmt_norm)      # negrita
-        fmt_b.setFontWeight(QFont.Bold)
-
-        fmt_bu = QTextCharFormat(fmt_b)         # negrita + subrayado
-        fmt_bu.setFontUnderline(True)
-
-        fmt_it = QTextCharFormat(fmt_norm)      # cursiva
-        fmt_it.setFontItalic(True)
-        # helper local
-        def ins(text, blk, fmt=fmt_norm):
-            cur.insertBlock(blk)
-            cur.setCharFormat(fmt)
-            cur.insertText(text)
-
-        hoy = datetime.now()
-        ins(f"Córdoba, {hoy.day} de {_MESES[hoy.month]} de {hoy.year}.", blk_r)
-
-        self._insert_encabezado(
-            cur,
-            (
-                "SRA. JEFA DEL SERVICIO",
-                "PENITENCIARIO DE LA",
-                "PROVINCIA DE CÓRDOBA",
-                "S______________/______________D",
-            ),
-            blk_l, fmt_b
-        )
-        cur.insertBlock(blk_l)    # línea en blanco
-        camara=self.combo_articulo.currentText().split()[0].lower()  # “esta” / “este”
-        articulo = "esta" if camara=="cámara" else "este"
-        # ── 3) cuerpo 1 ────────────────────────────────────────────────────
-        txt1 = (
-            f"En los autos caratulados {d['caratula']}, que se tramitan por ante "
-            f"{articulo} {d['tribunal']}, se ha resuelto enviar el presente oficio "
-            f"a fin de solicitarle quiera tener a bien notificar la siguiente cédula a "
-            f"{d['penado']}, DNI n.° {d['dni']}, cuya constancia de diligenciamiento deberá "
-            f"ser remitida a esta dependencia judicial:\n"
-        )
-        cur.insertBlock(blk_j); cur.setCharFormat(fmt); cur.insertText(txt1)
-
-        cur.insertBlock(blk_l)
-        cur.insertBlock(blk_c); cur.setCharFormat(fmt_bu)
-        cur.insertText("CÉDULA DE NOTIFICACIÓN")
-        cur.insertBlock(blk_l)
-
-        datos_ced = (
-            f"TRIBUNAL: {d['tribunal']}, Fructuoso Rivera n.° 720, Palacio de Tribunales II.",
-            f"SECRETARÍA: {sec}.",
-            f"SEÑOR: {d['penado']}.",
-            f"DOMICILIO: {estab}.",
-        )
-        for ln in datos_ced:
-            cur.insertBlock(blk_l); cur.setCharFormat(fmt); cur.insertText(ln)
-        cur.insertBlock(blk_l)
-
-        txt2 = (
-            f"Se hace saber a Ud. que en los autos caratulados {d['caratula']}, que se "
-            f"tramitan por ante {articulo} {d['tribunal']}, se ha dictado la siguiente resolución: "
-        )
-        cur.insertBlock(blk_j); cur.setCharFormat(fmt); cur.insertText(txt2)
-
-        cur.setCharFormat(fmt_it)
-        cur.insertText(f"“{d['decreto_computo']}”")
-        cur.setCharFormat(fmt)
-        cur.insertText(f". Fdo.: {d['firmantes_decreto']}.")
-
-        cur.insertBlock(blk_r); cur.setCharFormat(fmt)
-        cur.insertText(f"Of. {self._fecha_num()}.")
-        cur.insertBlock(blk_c); cur.setCharFormat(fmt_b)
-        cur.insertText("Saludo a Ud. atte.")
-
-        self._bold_occurrences(
-            te,
-            [d['caratula'], d['penado'], "Fdo.:", d['firmantes_decreto']]
+        estable = imp['estable'].currentText()
+
+        marcado = escritos.OFICIO_COMPUTO(
+            fecha=self._fecha_encabezado(),
+            caratula=d['caratula'],
+            articulo=self._articulo(),
+            tribunal=d['tribunal'],
+            secretaria=self.entry_secretaria.text(),
+            penado=d['penado'],
+            dni=d['dni'],
+            establecimiento=mapa_est.get(estable, estable),
+            decreto=d['decreto_computo'],
+            firmantes=d['firmantes_decreto'],
+            fecha_oficio=self._fecha_num(),
         )
+        return marcado
 
+    @depende_de("caratula", "articulo", "tribunal", "sentencia_num", "firmantes",
+                "imp.tipo", "imp.nombre", "imp.dni", "imp.trat", "imp.punto")
     def _plantilla_oficio_spc(self):
-        te = self.text_edits["Oficio SPC"]
-        te.clear()
-
         imp = self._imp()                                    # imputado activo
         tipo_w = imp.get("tipo") if imp else None            # widget ‘tipo de pena’
         if not imp or not isinstance(tipo_w, QComboBox):
-            te.setPlainText("Aún no hay datos del imputado.")
-            return
+            return _Aviso("Aún no hay datos del imputado.")
         if tipo_w.currentText() != "efectiva":               # sólo para penas efectivas
-            te.setPlainText("No aplica para penas condicionales.")
-            return
-        cur = te.textCursor()
+            return _Aviso("No aplica para penas condicionales.")
 
-        blk_r, blk_l, blk_c, blk_j = (QTextBlockFormat() for _ in range(4))
-        blk_r.setAlignment(Qt.AlignRight);  blk_l.setAlignment(Qt.AlignJustify)
-        blk_c.setAlignment(Qt.AlignCenter); blk_j.setAlignment(Qt.AlignJustify)
-
-        fmt   = QTextCharFormat(); fmt.setFontFamily("Times New Roman"); fmt.setFontPointSize(12)
-        fmt_b = QTextCharFormat(fmt); fmt_b.setFontWeight(QFont.Bold)
-        fmt_it= QTextCharFormat(fmt); fmt_it.setFontItalic(True)
-        # ── datos que ya tenemos centralizados ─────────────────────────────
-        d    = self._recopila_datos_imp()
-        sec  = self.entry_secretaria.text()
-        # Helper local
-        def ins(text, blk, f=fmt):
-            cur.insertBlock(blk); cur.setCharFormat(f); cur.insertText(text)
-
-        hoy = datetime.now()
-        ins(f"Córdoba, {hoy.day} de {_MESES[hoy.month]} de {hoy.year}.", blk_r)
-
-        self._insert_encabezado(
-            cur,
-            (
-                "SR. DIRECTOR DEL",
-                "ESTABLECIMIENTO PENITENCIARIO",
-                "PBRO. LUCHESSE –BOWER–",
-                "S__________________/__________________D",
-            ),
-            blk_l, fmt_b
-        )
-        cur.insertBlock(blk_l)        # línea en blanco
-
-        articulo = "esta" if self.combo_articulo.currentText().startswith("Cámara") else "este"
-
-        txt1 = (
-            f"En los autos caratulados {d['caratula']}, que se tramitan por ante "
-            f"{articulo} {d['tribunal']}, se ha dispuesto librar a Ud. el presente, "
-            f"a fin de que cumplimente con lo resuelto por este tribunal en la sentencia n.° "
-            f"{d['sentencia']}, con relación a {d['penado']}, DNI n.° {d['dni']}, a los efectos de que "
-            f"arbitre los medios necesarios para que {d['tratamiento_ordenado']}."
-        )
-        ins(txt1, blk_j)
-
-        ins("", blk_l)                         # salto real
-        ins("Para mayor recaudo se transcribe la parte resolutiva que así lo dispone: ", blk_j)
-        cur.setCharFormat(fmt_it)
-        cur.insertText(f"“{d['parte_resuelvo_tratamiento']}”")
-        cur.setCharFormat(fmt)
-        cur.insertText(f". Fdo.: {d['firmantes']}.")
-
-        cur.insertBlock(blk_l)                # línea en blanco real
-        # ── 5) saludo ──────────────────────────────────────────────────────
-        cur.insertBlock(blk_c); cur.setCharFormat(fmt_b)
-        cur.insertText("Saludo a Ud. atte.")
-
-        self._bold_occurrences(
-            te,
-            [d['caratula'], "sentencia n.°", d['sentencia'],
-            d['penado'], "Fdo.:", d['firmantes']]
+        d = self._recopila_datos_imp()
+        marcado = escritos.OFICIO_SPC(
+            fecha=self._fecha_encabezado(),
+            caratula=d['caratula'],
+            articulo=self._articulo(),
+            tribunal=d['tribunal'],
+            sentencia=d['sentencia'],
+            penado=d['penado'],
+            dni=d['dni'],
+            tratamiento=d['tratamiento_ordenado'],
+            punto=d['parte_resuelvo_tratamiento'],
+            firmantes=d['firmantes'],
         )
+        return marcado
 
+    @depende_de("caratula", "articulo", "tribunal", "sentencia_num", "resuelvo",
+                "firmantes", "renuncia", "fecha_audiencia", "imp.tipo", "imp.nombre",
+                "imp.dni", "imp.condena", "imp.decreto", "imp.firm_dec")
     def _plantilla_oficio_comunicacion(self):
-        te = self.text_edits["Oficio comunicación"]
-        te.clear()
-
         imp = self._imp()                               # imputado activo
         tipo_w = imp.get("tipo") if imp else None       # widget “tipo de pena”
         if not imp or not isinstance(tipo_w, QComboBox):
-            te.setPlainText("Aún no hay datos del imputado.")
-            return
+            return _Aviso("Aún no hay datos del imputado.")
         if tipo_w.currentText() != "efectiva":          # sólo aplica a penas efectivas
-            te.setPlainText("No es necesario en penas de ejecución condicional.")
-            return
-
-        cur = te.textCursor()
-        blk_r, blk_l, blk_c, blk_j = (QTextBlockFormat() for _ in range(4))
-        blk_r.setAlignment(Qt.AlignRight);  blk_l.setAlignment(Qt.AlignJustify)
-        blk_c.setAlignment(Qt.AlignCenter); blk_j.setAlignment(Qt.AlignJustify)
-
-        fmt   = QTextCharFormat(); fmt.setFontFamily("Times New Roman"); fmt.setFontPointSize(12)
-        fmt_b = QTextCharFormat(fmt); fmt_b.setFontWeight(QFont.Bold)
-        fmt_it= QTextCharFormat(fmt); fmt_it.setFontItalic(True)
-
-        def ins(text, blk, f=fmt):
-            cur.insertBlock(blk); cur.setCharFormat(f); cur.insertText(text)
-
-        hoy = datetime.now()
-        ins(f"Córdoba, {hoy.day} de {_MESES[hoy.month]} de {hoy.year}.", blk_r)
-
-        self._insert_encabezado(
-            cur,
-            (
-                "SRA. JEFA DEL SERVICIO",
-                "PENITENCIARIO DE LA",
-                "PROVINCIA DE CÓRDOBA",
-                "S______________/______________D",
-            ),
-            blk_l, fmt_b
-        )
-        cur.insertBlock(blk_l)
+            return _Aviso("No es necesario en penas de ejecución condicional.")
 
         d = self._recopila_datos_imp()
-        articulo = "esta" if self.combo_articulo.currentText().startswith("Cámara") else "este"
-
-        txt1 = (
-            f"En los autos caratulados {d['caratula']}, tramitados por ante "
-            f"{articulo} {d['tribunal']}, se ha resuelto librar a Ud. el presente "
-            f"a fin de informarle que el imputado {d['penado']}, DNI n.° {d['dni']}, "
-            f"ha sido condenado a la pena de {d['condena']}. Ello en virtud de que se "
-            f"ha llevado a cabo un juicio abreviado inicial y mediante sentencia n.° "
-            f"{d['sentencia']}, se resolvió: "
-        )
-        ins(txt1, blk_j)
-
-        cur.setCharFormat(fmt_it)
-        cur.insertText(f"“{d['resuelvo']}”")
-        cur.setCharFormat(fmt)
-        cur.insertText(f". Fdo.: {d['firmantes']}.")
-        self._bold_occurrences(
-            te,
-            [d['caratula'], d['penado'], "sentencia n.°", d['sentencia'],
-            d['condena'], "Fdo.:", d['firmantes']]
+        marcado = escritos.OFICIO_COMUNICACION(
+            fecha=self._fecha_encabezado(),
+            caratula=d['caratula'],
+            articulo=self._articulo(),
+            tribunal=d['tribunal'],
+            penado=d['penado'],
+            dni=d['dni'],
+            condena=d['condena'],
+            sentencia=d['sentencia'],
+            resuelvo=d['resuelvo'],
+            firmantes=d['firmantes'],
+            renuncia=d['renuncia'] == "Sí",
+            fecha_audiencia=d['fecha_aud'],
+            decreto=d['decreto_computo'],
+            firmantes_decreto=d['firmantes_decreto'],
         )
+        return marcado
 
-        cur.insertBlock(blk_j)
-        add = "Asimismo, se hace saber que dicha sentencia quedó firme con fecha"
-        if d['renuncia'] == "Sí":
-            add += f" {d['fecha_aud']} por renuncia expresa de las partes a los plazos para interponer recurso de casación"
-        add += ". A continuación, se transcribe el decreto que establece el cómputo definitivo de la pena impuesta: "
-        ins(add, blk_j)
-
-        cur.setCharFormat(fmt_it)
-        cur.insertText(f"“{d['decreto_computo']}”")
-        cur.setCharFormat(fmt)
-        cur.insertText(f". Fdo.: {d['firmantes_decreto']}.")
-        self._bold_occurrences(te, ["Fdo.:", d['firmantes_decreto']])
-        cur.insertBlock(blk_l)                # línea en blanco real
-        # ── 7) saludo ─────────────────────────────────────────────────────
-        cur.insertBlock(blk_c); cur.setCharFormat(fmt_b)
-        cur.insertText("Saludo a Ud. atte.")
-
+    @depende_de("caratula", "tribunal", "sentencia_num", "imp.tipo", "imp.nombre",
+                "imp.datos", "imp.detenc", "imp.delitos", "imp.condena", "imp.cumpl",
+                "imp.defensa", "imp.victimas")
     def _plantilla_legajo(self):
-        te = self.text_edits["Legajo"]
-        te.clear()
-
         d   = self._recopila_datos_imp()
         imp = self._imp()
         if not imp or not isinstance(imp.get("tipo"), QComboBox):
-            te.setPlainText("Aún no hay datos del imputado.")
-            return
-
-        cur = te.textCursor()
-        blk_l  = QTextBlockFormat(); blk_l.setAlignment(Qt.AlignJustify)
-        blk_c  = QTextBlockFormat(); blk_c.setAlignment(Qt.AlignCenter)
-        blk_j  = QTextBlockFormat(); blk_j.setAlignment(Qt.AlignJustify)
-
-        fmt    = QTextCharFormat(); fmt.setFontFamily("Times New Roman"); fmt.setFontPointSize(12)
-        fmt_b  = QTextCharFormat(fmt); fmt_b.setFontWeight(QFont.Bold)
-        fmt_bu = QTextCharFormat(fmt_b); fmt_bu.setFontUnderline(True)
-        fmt_u  = QTextCharFormat(fmt);  fmt_u.setFontUnderline(True)
-
-        def ins(text, blk, f=fmt):
-            cur.insertBlock(blk); cur.setCharFormat(f); cur.insertText(text)
-
-        ins("LEGAJO DE REMISIÓN AL JUZGADO DE EJECUCIÓN PENAL", blk_c, fmt_bu)
-        subt = "Pena privativa de la libertad de ejecución condicional" \
-            if d['tipo_pena'] == "condicional" else "Pena privativa de la libertad"
-        ins(subt, blk_c, fmt_b)
-
-        campos = (
-            ("Causa caratulada", d['caratula']),
-            ("Tribunal",         d['tribunal']),
-            ("Penado",           f"{d['penado']}, {d['datos']}"),
-            ("Detención",        d['detencion']),
-            ("Sentencia",        f"n.° {d['sentencia']}"),
-            ("Delitos",          d['delitos']),
-            ("Condena",          d['condena']),
-            ("Cómputo de pena",   d.get('cumpl', "")),
-            ("Defensa",          d['defensa']),
-            ("Víctimas",         d['victimas']),
+            return _Aviso("Aún no hay datos del imputado.")
+
+        marcado = escritos.LEGAJO(
+            condicional=d['tipo_pena'] == "condicional",
+            campos=(
+                ("Causa caratulada", d['caratula']),
+                ("Tribunal",         d['tribunal']),
+                ("Penado",           f"{d['penado']}, {d['datos']}"),
+                ("Detención",        d['detencion']),
+                ("Sentencia",        f"n.° {d['sentencia']}"),
+                ("Delitos",          d['delitos']),
+                ("Condena",          d['condena']),
+                ("Cómputo de pena",  d.get('cumpl', "")),
+                ("Defensa",          d['defensa']),
+                ("Víctimas",         d['victimas']),
+            ),
         )
+        return marcado
 
-        for titulo, contenido in campos:
-            ins("", blk_l)                         # línea en blanco
-            ins(titulo, blk_l, fmt_u)              # sub‑raya el título
-            cur.insertText(f": {contenido}", fmt)  # contenido normal
-
-        ins("", blk_l)
-        ins("-La sentencia recaída en autos se encuentra firme y el cómputo de pena es definitivo.", blk_j)
-        ins("-Se hace saber a Ud. que ya se han remitido los correspondientes oficios al Servicio Penitenciario en cumplimiento del art. 505 del Código Procesal Penal de la Provincia de Córdoba, a la Policía de la Provincia de Córdoba y al Registro Nacional de Reincidencia, comunicando la sentencia dictada en autos y el cómputo de pena.", blk_j)
-
+    @depende_de("caratula", "articulo", "tribunal",
+                "imp.tipo", "imp.nombre", "imp.dni")
     def _plantilla_puesta_disposicion(self):
-        te = self.text_edits["Puesta a disposición"]
-        te.clear()
-
         imp  = self._imp() or {}
         tipo = imp.get("tipo").currentText() if isinstance(imp.get("tipo"), QComboBox) else ""
 
         if tipo != "efectiva":
-            te.setPlainText("No es necesario en penas de ejecución condicional.")
-            return
+            return _Aviso("No es necesario en penas de ejecución condicional.")
 
-        cur = te.textCursor()
-        blk_r = QTextBlockFormat(); blk_r.setAlignment(Qt.AlignRight)
-        blk_l = QTextBlockFormat(); blk_l.setAlignment(Qt.AlignJustify)
-        blk_c = QTextBlockFormat(); blk_c.setAlignment(Qt.AlignCenter)
-        blk_j = QTextBlockFormat(); blk_j.setAlignment(Qt.AlignJustify)
-
-        fmt   = QTextCharFormat(); fmt.setFontFamily("Times New Roman"); fmt.setFontPointSize(12)
-        fmt_b = QTextCharFormat(fmt); fmt_b.setFontWeight(QFont.Bold)
-        fmt_bu= QTextCharFormat(fmt_b); fmt_bu.setFontUnderline(True)
-
-        def ins(text, blk, f=fmt):
-            cur.insertBlock(blk); cur.setCharFormat(f); cur.insertText(text)
-
-        d        = self._recopila_datos_imp()
-        articulo = "esta" if self.combo_articulo.currentText().startswith("Cámara") else "este"
-        hoy      = datetime.now()
-        fecha    = f"Córdoba, {hoy.day} de {_MESES[hoy.month]} de {hoy.year}."
-
-        ins(fecha, blk_r)
-
-        self._insert_encabezado(
-            cur,
-            (
-                "SRA. JEFA DEL SERVICIO",
-                "PENITENCIARIO DE LA",
-                "PROVINCIA DE CÓRDOBA",
-                "S______________/______________D",
-            ),
-            blk_l, fmt_b
-        )
-        cur.insertBlock(blk_l)   # línea en blanco
-
-        texto = (
-            f"En los autos caratulados {d['caratula']}, que se tramitan ante "
-            f"{articulo} {d['tribunal']}, se le hace saber que el condenado "
-            f"{d['penado']}, DNI n.° {d['dni']}, queda a exclusiva disposición del "
-            "Juzgado de Ejecución Penal n.° ……, bajo las actuaciones del Cuerpo de "
-            f"Ejecución de Pena Privativa de Libertad de {d['penado']} (SAC n.º ……), "
-            "siempre que no se encuentre a disposición de otro tribunal."
-        )
-        ins(texto, blk_j)
-
-        self._bold_occurrences(
-            te,
-            [d['caratula'], d['penado'],
-            "Cuerpo de Ejecución", "de Pena Privativa de Libertad"]
+        d = self._recopila_datos_imp()
+        marcado = escritos.PUESTA_DISPOSICION(
+            fecha=self._fecha_encabezado(),
+            caratula=d['caratula'],
+            articulo=self._articulo(),
+            tribunal=d['tribunal'],
+            penado=d['penado'],
+            dni=d['dni'],
         )
-
-        cur.insertBlock(blk_l)
-        ins("Sin otro particular, saludo a Ud. atte.", blk_c, fmt_b)
-
-    def _insert_paragraph(self, te:QTextEdit, text:str, align:int):
-        cur=te.textCursor()
-        blk=QTextBlockFormat(); blk.setAlignment(align)
-        fmt=QTextCharFormat(); fmt.setFontFamily("Times New Roman"); fmt.setFontPointSize(12)
-        for p in text.split("\n"):
-            cur.insertBlock(blk); cur.setCharFormat(fmt); cur.insertText(p)
+        return marcado
 
     def generate_planilla_oga(self):
+        self._render.flush()
         from docx import Document
         from docx.shared import Pt
         from docx.enum.text import WD_ALIGN_PARAGRAPH
@@ -2321,84 +1779,154 @@ class MainWindow(QMainWindow):
             doc.save(path)
             QMessageBox.information(self, "OK", "Planilla para OGA generada correctamente.")
 
+    def generar_todo(self):
+        """Escribe en una carpeta todos los escritos, los de cada imputado incluidos.
+
+        Los marcados se juntan acá (leen el formulario) y los archivos se
+        escriben en un pool de procesos; el diálogo de progreso permite
+        cancelar lo que todavía no empezó (lo ya empezado se termina).
+        """
+        self._render.flush()
+        carpeta = QFileDialog.getExistingDirectory(self, "Carpeta para los escritos")
+        if not carpeta:
+            return
+        formato, ok = QInputDialog.getItem(
+            self, "Generar todos los escritos", "Formato:",
+            ["DOCX", "RTF", "HTML", "Los tres"], 0, False)
+        if not ok:
+            return
+        formatos = FORMATOS if formato == "Los tres" else (formato.lower(),)
+
+        trabajos = []
+        for nombre, _ in PLANTILLAS:
+            if nombre not in POR_IMPUTADO:
+                destinos = [(None, nombre)]
+            else:
+                destinos = []
+                for idx, w in enumerate(self.imputados_widgets):
+                    quien = w['nombre'].text().strip()
+                    destinos.append((idx, f"{nombre} - Imputado {idx + 1}"
+                                          + (f" - {quien}" if quien else "")))
+            for idx, titulo in destinos:
+                contenido = self._contenido(nombre, idx)
+                if isinstance(contenido, _Aviso):
+                    continue            # “No aplica…”: no hay escrito
+                trabajos.append((contenido, os.path.join(carpeta, nombre_archivo(titulo)),
+                                 formatos))
+
+        progreso = QProgressDialog("Generando escritos…", "Cancelar", 0, len(trabajos), self)
+        progreso.setWindowTitle("Generar todos los escritos")
+        progreso.setWindowModality(Qt.WindowModal)
+        progreso.setMinimumDuration(0)
+        archivos, errores = [], []
+
+        def recoger(futuros):
+            for futuro in futuros:
+                if futuro.cancelled():
+                    continue
+                try:
+                    archivos.extend(futuro.result())
+                except Exception as e:
+                    errores.append(str(e))
+
+        from concurrent.futures import ProcessPoolExecutor   # arrastra multiprocessing
+        pool = ProcessPoolExecutor()
+        pendientes = set()
+        try:
+            pendientes = {pool.submit(exportar, *t) for t in trabajos}
+            while pendientes and not progreso.wasCanceled():
+                listos, pendientes = wait(pendientes, timeout=0.05,
+                                          return_when=FIRST_COMPLETED)
+                recoger(listos)
+                progreso.setValue(len(trabajos) - len(pendientes))
+                QApplication.processEvents()
+        finally:
+            cancelado = progreso.wasCanceled()
+            if cancelado:
+                progreso.setLabelText("Terminando los escritos ya empezados…")
+                QApplication.processEvents()
+            # al cancelar se descarta lo que no empezó; lo que ya se estaba
+            # escribiendo termina igual, así que se espera y se cuenta
+            pool.shutdown(wait=True, cancel_futures=True)
+            progreso.close()
+        recoger(pendientes)
+
+        resumen = f"Se generaron {len(archivos)} archivos en {carpeta}."
+        if cancelado:
+            resumen = "Generación cancelada. " + resumen
+        if errores:
+            QMessageBox.warning(self, "Generar todos los escritos",
+                                resumen + "\n\nErrores:\n" + "\n".join(errores[:10]))
+        else:
+            QMessageBox.information(self, "Generar todos los escritos", resumen)
+
+    def _datos_causa(self) -> dict:
+        """La causa del formulario, tal como se guarda en el archivo."""
+        self.data.from_main(self)           # por las dudas: el vínculo es campo a campo
+        return self.data.a_dict()
+
+    def _poner_causa(self, datos: dict) -> None:
+        """Vuelca en el modelo (y de ahí al formulario) una causa guardada.
+
+        ``datos`` puede venir en cualquier versión del formato: ``CausaData``
+        la migra y descarta lo que no entiende.
+        """
+        self.data.cargar(datos)
+        self.data.apply_to_main(self)
+        self.update_template()
+        # abrir otra causa no se deshace: volvería a la anterior con el
+        # ``_causa_id`` de ésta y el próximo guardado la pisaría
+        self._historial.limpiar()
+
     def guardar_causa(self):
-        path, _ = QFileDialog.getSaveFileName(self, "Guardar causa",
-                                              str(CAUSAS_DIR), "JSON (*.json)")
-        if not path: return
-        gen = {
-            'caratula': self.entry_caratula.text(),
-            'articulo': self.combo_articulo.currentText(),
-            'tribunal': self.entry_tribunal.currentText(),
-            'secretaria': self.entry_secretaria.text(),
-            'fecha': self.entry_fecha.text(),
-            'hora': self.combo_hora.currentText(),
-            'sala': self.combo_sala.currentText(),
-            'funcionario': self.entry_funcionario.text(),
-            'fiscal': self.entry_fiscal.text(),
-            'sentencia': self.entry_sentencia.text(),
-            'resuelvo': self.entry_resuelvo.property("html") or "",
-            'firmantes': self.entry_firmantes.text(),
-            'renuncia': self.combo_renuncia.currentText()
-        }
-        imps = []
-        for w in self.imputados_widgets:
-            imps.append({k: (
-                w[k].text() if isinstance(w[k], QLineEdit) else
-                w[k].currentText() if isinstance(w[k], QComboBox) else
-                w[k].isChecked()
-            ) for k in w})
-
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump({'generales': gen, 'imputados': imps},
-                      f, ensure_ascii=False, indent=2)
+        self._render.flush()
+        id_ = self._causa_id
+        if id_ is not None:
+            r = QMessageBox.question(
+                self, "Guardar causa",
+                "¿Reemplazar la causa abierta?\n(«No» la guarda como una causa nueva.)",
+                QMessageBox.Yes | QMessageBox.No | QMessageBox.Cancel, QMessageBox.Yes)
+            if r == QMessageBox.Cancel: return
+            if r == QMessageBox.No: id_ = None
+        try:
+            self._causa_id = causas_db.archivo(self).guardar(self._datos_causa(), id_)
+        except Exception as e:
+            QMessageBox.critical(self, "Error", str(e))
+            return
         QMessageBox.information(self, "OK", "Causa guardada.")
 
     def cargar_causa(self):
-        path, _ = QFileDialog.getOpenFileName(self, "Cargar causa",
-                                              str(CAUSAS_DIR), "JSON (*.json)")
-        if not path: return
+        id_ = causas_db.elegir_causa(self, "Abrir causa")
+        if id_ is None: return
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            g = data.get("generales", {})
-            self.entry_caratula.setText(g.get("caratula", ""))
-            self.combo_articulo.setCurrentText(g.get("articulo", ""))
-            self.entry_tribunal.setCurrentText(g.get("tribunal", ""))
-            self.entry_secretaria.setText(g.get("secretaria", ""))
-            self.entry_fecha.setText(g.get("fecha", ""))
-            self.combo_hora.setCurrentText(g.get("hora", ""))
-            self.combo_sala.setCurrentText(g.get("sala", ""))
-            self.entry_funcionario.setText(g.get("funcionario", ""))
-            self.entry_fiscal.setText(g.get("fiscal", ""))
-            self.entry_sentencia.setText(g.get("sentencia", ""))
-            txt = g.get("resuelvo", "")
-            if "<" in txt:
-                self.entry_resuelvo.setHtml(txt)
-            else:
-                self.entry_resuelvo.setPlainText(txt)
-            self.entry_resuelvo.setProperty("html", txt)
-            self.entry_firmantes.setText(g.get("firmantes", ""))
-            self.combo_renuncia.setCurrentText(g.get("renuncia", ""))
-
-            imps = data.get("imputados", [])
-            self.combo_n.setCurrentText(str(max(1, len(imps))))
-            for idx, imp in enumerate(imps):
-                w = self.imputados_widgets[idx]
-                for k, v in imp.items():
-                    if isinstance(w[k], QLineEdit):   w[k].setText(v)
-                    elif isinstance(w[k], QComboBox): w[k].setCurrentText(v)
-                    elif isinstance(w[k], QCheckBox): w[k].setChecked(bool(v))
-            self.update_template()
+            self._poner_causa(causas_db.archivo(self).cargar(id_))
+            self._causa_id = id_
         except Exception as e:
             QMessageBox.critical(self, "Error", str(e))
 
     def eliminar_causa(self):
-        path, _ = QFileDialog.getOpenFileName(self, "Eliminar causa",
-                                              str(CAUSAS_DIR), "JSON (*.json)")
-        if path and QMessageBox.question(
-            self, "Confirmar", f"¿Eliminar {Path(path).name}?"
+        id_ = causas_db.elegir_causa(self, "Eliminar causa")
+        if id_ is None: return
+        datos = causas_db.archivo(self).cargar(id_)
+        caratula = datos.get("caratula", "")
+        if QMessageBox.question(
+            self, "Confirmar", f"¿Eliminar la causa «{caratula or id_}»?"
         ) == QMessageBox.Yes:
-            Path(path).unlink(missing_ok=True)
+            causas_db.archivo(self).eliminar(id_)
+            if self._causa_id == id_:
+                self._causa_id = None
+
+# pestañas que miran al imputado activo del selector
+POR_IMPUTADO = tuple(
+    nombre for nombre, metodo in PLANTILLAS
+    if any(c.startswith("imp.") for c in getattr(MainWindow, metodo).campos)
+)
+# campos que cambian los escritos de todos los imputados (no sólo del propio)
+_CAMPOS_DE_TODOS_LOS_IMPUTADOS = frozenset(
+    campo for nombre in POR_IMPUTADO
+    for campo in getattr(MainWindow, _METODO_DE[nombre]).campos
+    if not campo.startswith("imp.")
+)
 
 # utils.py  ─────────────────────────────────────────────────────────────
 from PySide6.QtWidgets import QApplication, QMessageBox
@@ -2416,9 +1944,17 @@ def confirm_and_quit(widget) -> None:
         QApplication.quit()
 
 def main():
+    if getattr(sys, "frozen", False):   # el pool de “Generar todo” en el .exe
+        import multiprocessing
+        multiprocessing.freeze_support()
+    arranque.marcar("importaciones")
     app  = QApplication(sys.argv)
+    arranque.id_de_aplicacion()
     data = CausaData()          # ① instancia compartida
     win  = MainWindow(data)     # ② pásala a la ventana principal
+    arranque.marcar("ventana armada")
+    # ③ lo que recupera un cierre inesperado espera a que la ventana se vea
+    arranque.al_primer_pintado(win, lambda: autoguardado.iniciar(data, win))
     win.show()
     sys.exit(app.exec())
 
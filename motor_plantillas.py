@@ -0,0 +1,425 @@
+# motor_plantillas.py
+"""Motor de plantillas para los escritos (oficios, actas y la sentencia).
+
+Una plantilla es texto con marcas al estilo Jinja:
+
+* ``{{ expr }}``                     → valor de una expresión de Python;
+* ``{% if expr %}`` … ``{% elif expr %}`` … ``{% else %}`` … ``{% endif %}``;
+* ``{% for a, b in expr %}`` … ``{% endfor %}``;
+* ``{% set nombre = expr %}``;
+* ``{# comentario #}``.
+
+Se compila una sola vez (``compilar`` guarda el resultado) a una función de
+Python generada: cada variable libre de la plantilla pasa a ser una variable
+local leída una vez del contexto, y las marcas se vuelven ``if``/``for``
+de verdad. Cada ``Plantilla`` además recuerda sus últimos resultados según
+el contexto recibido.
+
+Espacios: se ignoran la sangría, los espacios al final de cada línea y las
+líneas en blanco; una línea que sólo tiene marcas ``{% … %}``/``{# … #}``
+desaparece entera. Un salto entre dos líneas de texto vale un espacio, salvo
+entre párrafos (la línea anterior termina en ``<p …>``, ``</p>`` o ``<br>``, o
+la siguiente empieza con una de ellas), donde no deja nada. Así un párrafo
+largo puede partirse en varias líneas sin ensuciar la salida.
+
+Con ``escapar=True`` los valores de ``{{ }}`` se escapan como HTML (para
+plantillas con texto de usuario), salvo los ``Marcado``; con ``escapar=False``
+se insertan tal cual (cuando los valores ya son HTML, como las anclas de la
+sentencia).
+
+Además de lo que traiga cada plantilla, las expresiones ven las funciones de
+concordancia de ``AYUDANTES`` (género, número, listas en castellano).
+"""
+from collections import OrderedDict
+from functools import lru_cache
+import ast
+import builtins
+import html
+import re
+
+MAX_CACHE = 128
+MAX_PLANTILLAS = 256
+
+
+class Marcado(str):
+    """Texto que ya es marcado: ``{{ }}`` lo inserta sin escapar."""
+
+
+class ErrorPlantilla(Exception):
+    """Plantilla mal formada o contexto incompleto."""
+
+
+# ───────────── ayudantes de concordancia ─────────────
+def genero(sexo: str, masculino: str, femenino: str) -> str:
+    """``femenino`` si ``sexo`` es "F"; si no, ``masculino``."""
+    return femenino if sexo == "F" else masculino
+
+
+def numero(n: int, singular: str, plural: str) -> str:
+    return singular if n == 1 else plural
+
+
+def concordar(sexos, masc: str, fem: str, masc_pl: str, fem_pl: str) -> str:
+    """Forma que corresponde a un grupo de personas según sus sexos.
+
+    Una sola: según su sexo. Varias: femenino plural sólo si son todas
+    mujeres; si no, masculino plural.
+    """
+    if len(sexos) == 1:
+        return fem if sexos[0] == "F" else masc
+    return fem_pl if all(s == "F" for s in sexos) else masc_pl
+
+
+def lista_y(items) -> str:
+    """"a", "a y b", "a, b y c" (se omiten los vacíos)."""
+    items = [i for i in items if i.strip()]
+    if len(items) <= 1:
+        return items[0] if items else ""
+    return f"{', '.join(items[:-1])} y {items[-1]}"
+
+
+def lista_punto_y_coma(items) -> str:
+    """"a", "a; y b", "a; b; y c" (se omiten los vacíos)."""
+    items = [i.strip() for i in items if i.strip()]
+    if len(items) <= 1:
+        return items[0] if items else ""
+    return "; ".join(items[:-1]) + f"; y {items[-1]}"
+
+
+AYUDANTES = {
+    "genero": genero,
+    "numero": numero,
+    "concordar": concordar,
+    "lista_y": lista_y,
+    "lista_punto_y_coma": lista_punto_y_coma,
+}
+
+
+# ───────────── compilación ─────────────
+_RE_MARCA = re.compile(r"({{.*?}}|{%.*?%}|{#.*?#})", re.S)
+# una marca de control o comentario (sin pasar por encima de su cierre)
+_RE_CONTROL = r"(?:{%(?:(?!%}).)*%}|{#(?:(?!#}).)*#})"
+_RE_SOLO_CONTROL = re.compile(rf"(?:{_RE_CONTROL})+")
+_RE_CONTROL_FINAL = re.compile(rf"(?:{_RE_CONTROL})+$")
+_RE_CONTROL_INICIAL = re.compile(rf"^(?:{_RE_CONTROL})+")
+_RE_BLOQUE_INICIAL = re.compile(r"<(?:/?p\b|br\b)", re.I)
+_RE_BLOQUE_FINAL = re.compile(r"(?:</?p\b[^>]*|<br\s*/?)>$", re.I)
+_RE_FOR = re.compile(r"for\s+(.+?)\s+in\s+(.+)$", re.S)
+_RE_SET = re.compile(r"set\s+([A-Za-z_]\w*)\s*=\s*(.+)$", re.S)
+
+
+def _unir_lineas(fuente: str) -> str:
+    """Quita sangrías y líneas de control, y resuelve los saltos de línea.
+
+    El salto entre dos líneas de texto se pone justo antes de la segunda
+    (después de las marcas de control que haya en el medio), así queda del
+    lado de adentro de un ``{% if %}`` que abre en su propia línea.
+    """
+    salida: list[str] = []
+    anterior = None     # última línea de texto emitida (sin marcas al final)
+    # lo que había antes de cada if/for abierto: cada rama de un if sigue a
+    # ese texto, no al de la rama anterior
+    previos: list = []
+    for linea in fuente.split("\n"):
+        # sólo espacios y tabs: un espacio duro al borde es parte del texto
+        s = linea.strip(" \t\r")
+        if not s:
+            continue
+        if _RE_SOLO_CONTROL.fullmatch(s):
+            salida.append(s)
+            for marca in _RE_MARCA.findall(s):
+                palabra = (marca[2:-2].split() or [""])[0]
+                if palabra in ("if", "for"):
+                    previos.append(anterior)
+                elif palabra in ("elif", "else") and previos:
+                    anterior = previos[-1]
+                elif palabra in ("endif", "endfor") and previos:
+                    previos.pop()
+            continue
+        if (anterior is not None and not _RE_BLOQUE_FINAL.search(anterior)
+                and not _RE_BLOQUE_INICIAL.match(_RE_CONTROL_INICIAL.sub("", s))):
+            salida.append(" ")
+        salida.append(s)
+        anterior = _RE_CONTROL_FINAL.sub("", s) or anterior
+    return "".join(salida)
+
+
+def _nombres(expr: str, donde: str) -> tuple[set[str], set[str]]:
+    """(nombres leídos, nombres asignados) de una expresión o un destino."""
+    try:
+        arbol = ast.parse(expr.strip(), mode="eval")
+    except SyntaxError as e:
+        raise ErrorPlantilla(f"{donde}: expresión inválida {expr.strip()!r}") from e
+    leidos, asignados = set(), set()
+    for nodo in ast.walk(arbol):
+        if isinstance(nodo, ast.Name):
+            (asignados if isinstance(nodo.ctx, ast.Store) else leidos).add(nodo.id)
+        elif isinstance(nodo, ast.arg):
+            asignados.add(nodo.arg)         # parámetros de un lambda
+    return leidos - asignados, asignados
+
+
+class Plantilla:
+    """Plantilla compilada; se llama con el contexto como argumentos."""
+
+    def __init__(self, fuente: str, nombre: str = "plantilla", escapar: bool = True,
+                 ayudantes: dict | None = None):
+        self.nombre = nombre
+        self.fuente = fuente
+        globales = {"_escapar": _escapar if escapar else str}
+        globales.update(AYUDANTES)
+        globales.update(ayudantes or {})
+        codigo, self.variables = self._generar(fuente, set(globales))
+        try:
+            exec(compile(codigo, f"<{nombre}>", "exec"), globales)
+        except SyntaxError as e:
+            raise ErrorPlantilla(f"{nombre}: {e.msg}") from e
+        self._funcion = globales["_render"]
+        self._cache: OrderedDict = OrderedDict()
+
+    def __call__(self, **contexto) -> str:
+        try:
+            clave = _congelar(contexto)
+            hash(clave)
+        except TypeError:
+            return self._render(contexto)
+        res = self._cache.get(clave)
+        if res is not None:
+            self._cache.move_to_end(clave)
+            return res
+        res = self._render(contexto)
+        self._cache[clave] = res
+        if len(self._cache) > MAX_CACHE:
+            self._cache.popitem(last=False)
+        return res
+
+    def _render(self, contexto: dict) -> str:
+        faltan = [v for v in self.variables if v not in contexto]
+        if faltan:
+            raise ErrorPlantilla(f"{self.nombre}: faltan {', '.join(sorted(faltan))}")
+        return self._funcion(contexto)
+
+    @staticmethod
+    def _generar(fuente: str, conocidos: set[str]) -> tuple[str, list[str]]:
+        fuente = _unir_lineas(fuente)
+        cuerpo: list[str] = []
+        leidos: set[str] = set()
+        locales: set[str] = set()
+        pila: list[str] = []
+
+        def linea(texto: str) -> None:
+            cuerpo.append("    " * (len(pila) + 1) + texto)
+
+        for trozo in _RE_MARCA.split(fuente):
+            if not trozo:
+                continue
+            if trozo.startswith("{#"):
+                continue
+            if trozo.startswith("{{"):
+                expr = trozo[2:-2].strip()
+                leidos |= _nombres(expr, "{{ }}")[0]
+                linea(f"_a(_escapar({expr}))")
+                continue
+            if not trozo.startswith("{%"):
+                linea(f"_a({trozo!r})")
+                continue
+
+            marca = trozo[2:-2].strip()
+            palabra = marca.split(None, 1)[0] if marca else ""
+            if palabra == "if":
+                leidos |= _nombres(marca[2:], "if")[0]
+                linea(f"if {marca[2:].strip()}:")
+                pila.append("if")
+            elif palabra in ("elif", "else"):
+                if not pila or pila[-1] != "if":
+                    raise ErrorPlantilla(f"{{% {palabra} %}} fuera de un if")
+                pila.pop()
+                if palabra == "elif":
+                    leidos |= _nombres(marca[4:], "elif")[0]
+                    linea(f"elif {marca[4:].strip()}:")
+                else:
+                    linea("else:")
+                pila.append("if")
+            elif palabra == "for":
+                m = _RE_FOR.match(marca)
+                if not m:
+                    raise ErrorPlantilla(f"for inválido: {marca!r}")
+                destino, origen = m.groups()
+                locales |= _nombres(f"[0 for {destino} in ()]", "for")[1]
+                leidos |= _nombres(origen, "for")[0]
+                linea(f"for {destino} in {origen}:")
+                pila.append("for")
+            elif palabra == "set":
+                m = _RE_SET.match(marca)
+                if not m:
+                    raise ErrorPlantilla(f"set inválido: {marca!r}")
+                nombre, expr = m.groups()
+                locales.add(nombre)
+                leidos |= _nombres(expr, "set")[0]
+                linea(f"{nombre} = {expr.strip()}")
+            elif palabra in ("endif", "endfor"):
+                if not pila or pila[-1] != palabra[3:]:
+                    raise ErrorPlantilla(f"{{% {palabra} %}} sin apertura")
+                pila.pop()
+                linea("pass")
+            else:
+                raise ErrorPlantilla(f"marca desconocida: {{% {marca} %}}")
+        if pila:
+            raise ErrorPlantilla(f"falta {{% end{pila[-1]} %}}")
+
+        variables = sorted(
+            n for n in leidos - locales - conocidos if not hasattr(builtins, n)
+        )
+        prologo = ["def _render(_ctx):", "    _salida = []", "    _a = _salida.append"]
+        prologo += [f"    {v} = _ctx[{v!r}]" for v in variables]
+        return "\n".join(prologo + cuerpo + ["    return ''.join(_salida)"]), variables
+
+
+def _escapar(valor) -> str:
+    if isinstance(valor, Marcado):
+        return valor
+    return html.escape(str(valor), quote=False)
+
+
+def _congelar(valor):
+    """Versión inmutable (y hasheable) del contexto, para la caché."""
+    if isinstance(valor, dict):
+        return tuple(sorted((k, _congelar(v)) for k, v in valor.items()))
+    if isinstance(valor, (list, tuple)):
+        return tuple(_congelar(v) for v in valor)
+    if isinstance(valor, Marcado):
+        return (Marcado, str(valor))     # no se confunde con el mismo texto sin marcar
+    return valor
+
+
+_compiladas: OrderedDict = OrderedDict()
+
+
+def compilar(fuente: str, nombre: str = "plantilla", escapar: bool = True,
+             ayudantes: dict | None = None) -> Plantilla:
+    """La ``Plantilla`` de ``fuente`` (compilada sólo la primera vez)."""
+    clave = (fuente, escapar, tuple(sorted((ayudantes or {}).items())))
+    plantilla = _compiladas.get(clave)
+    if plantilla is None:
+        plantilla = Plantilla(fuente, nombre, escapar, ayudantes)
+        _compiladas[clave] = plantilla
+        if len(_compiladas) > MAX_PLANTILLAS:
+            _compiladas.popitem(last=False)
+    return plantilla
+
+
+# ───────────── salida a un QTextEdit ─────────────
+# Los oficios de la ventana principal se escriben con QTextCursor (bloque por
+# bloque, Times New Roman 12). La plantilla produce un HTML mínimo —<p> con
+# align, <b>, <i>, <u> y <br>— que acá se pasa a párrafos y se vuelca con los
+# mismos formatos que antes se armaban a mano en cada método.
+_RE_ETIQUETA = re.compile(r"<(/?)(p|b|i|u|br)\b([^>]*)>", re.I)
+_RE_ALIGN = re.compile(r"""align\s*=\s*["']?(\w+)""", re.I)
+
+
+@lru_cache(maxsize=MAX_CACHE)
+def parrafos(marcado: str) -> tuple:
+    """``marcado`` → ``((alineación, ((texto, negrita, cursiva, subrayado), …)), …)``."""
+    resultado = []
+    actual = None
+    estilo = {"b": 0, "i": 0, "u": 0}
+    pos = 0
+    for m in _RE_ETIQUETA.finditer(marcado):
+        texto = marcado[pos:m.start()]
+        pos = m.end()
+        if texto:
+            if actual is None:
+                if texto.strip():
+                    raise ErrorPlantilla(f"texto fuera de un párrafo: {texto[:40]!r}")
+            else:
+                actual[1].append((html.unescape(texto), estilo["b"] > 0,
+                                  estilo["i"] > 0, estilo["u"] > 0))
+        cierre, tag, atributos = m.group(1), m.group(2).lower(), m.group(3)
+        if tag == "p":
+            if cierre:
+                if actual is not None:
+                    resultado.append((actual[0], tuple(actual[1])))
+                actual = None
+            else:
+                alin = _RE_ALIGN.search(atributos)
+                actual = (alin.group(1).lower() if alin else "justify", [])
+        elif tag == "br":
+            if actual is not None:
+                actual[1].append(("\n", estilo["b"] > 0, estilo["i"] > 0, estilo["u"] > 0))
+        else:
+            estilo[tag] += -1 if cierre else 1
+    if marcado[pos:].strip() or actual is not None:
+        raise ErrorPlantilla("párrafo sin cerrar al final de la plantilla")
+    return tuple(resultado)
+
+
+def en_linea(marcado: str) -> Marcado:
+    """Los párrafos de ``marcado`` seguidos en una sola línea, con sus formatos.
+
+    Para transcribir un escrito dentro de otro: cada salto de párrafo o
+    ``<br>`` vale un espacio (como el texto plano del documento con los saltos
+    reemplazados), y se conservan las negritas, cursivas y subrayados.
+    """
+    tramos = []
+    for _, runs in parrafos(marcado):
+        tramos.append((" ", False, False, False))
+        tramos.extend((t.replace("\n", " "), b, i, u) for t, b, i, u in runs)
+    llenos = [n for n, (t, *_) in enumerate(tramos) if t.strip()]
+    if not llenos:
+        return Marcado("")
+    primero, ultimo = llenos[0], llenos[-1]
+    salida = []
+    for n in range(primero, ultimo + 1):
+        texto, negrita, cursiva, subrayado = tramos[n]
+        if n == primero:
+            texto = texto.lstrip()
+        if n == ultimo:
+            texto = texto.rstrip()
+        if not texto:
+            continue
+        texto = html.escape(texto, quote=False)
+        for tag, activo in (("u", subrayado), ("i", cursiva), ("b", negrita)):
+            if activo:
+                texto = f"<{tag}>{texto}</{tag}>"
+        salida.append(texto)
+    return Marcado("".join(salida))
+
+
+def escribir(destino, marcado: str) -> None:
+    """Agrega los párrafos de ``marcado`` al final de ``destino``.
+
+    ``destino`` es un ``QTextEdit`` o un ``QTextDocument`` suelto (los
+    documentos que se arman fuera del hilo de la interfaz).
+    """
+    from PySide6.QtCore import Qt
+    from PySide6.QtGui import (QFont, QTextBlockFormat, QTextCharFormat, QTextCursor,
+                               QTextDocument)
+
+    alineaciones = {"right": Qt.AlignRight, "center": Qt.AlignCenter,
+                    "left": Qt.AlignLeft, "justify": Qt.AlignJustify}
+    bloques: dict = {}
+    formatos: dict = {}
+    doc = destino if isinstance(destino, QTextDocument) else destino.document()
+    cur = QTextCursor(doc)
+    cur.movePosition(QTextCursor.End)
+    for alineacion, tramos in parrafos(marcado):
+        blk = bloques.get(alineacion)
+        if blk is None:
+            blk = bloques[alineacion] = QTextBlockFormat()
+            blk.setAlignment(alineaciones.get(alineacion, Qt.AlignJustify))
+        cur.insertBlock(blk)
+        for texto, negrita, cursiva, subrayado in tramos:
+            clave = (negrita, cursiva, subrayado)
+            fmt = formatos.get(clave)
+            if fmt is None:
+                fmt = formatos[clave] = QTextCharFormat()
+                fmt.setFontFamily("Times New Roman")
+                fmt.setFontPointSize(12)
+                if negrita:
+                    fmt.setFontWeight(QFont.Bold)
+                if cursiva:
+                    fmt.setFontItalic(True)
+                if subrayado:
+                    fmt.setFontUnderline(True)
+            cur.setCharFormat(fmt)
+            cur.insertText(texto)
@@ -0,0 +1,72 @@
+# render_scheduler.py
+from time import monotonic
+
+from PySide6.QtCore import QObject, QTimer
+
+
+class RenderScheduler(QObject):
+    """Agrupa ráfagas de cambios en un único re-render diferido.
+
+    Cada ``schedule()`` reinicia la espera de ``delay_ms``; cuando el usuario
+    deja de tipear durante ese lapso se llama una sola vez a ``callback``.
+    Con ``max_wait_ms`` se garantiza que, aun tipeando sin pausa, la vista se
+    refresque al menos cada tanto. ``flush()`` fuerza el render pendiente
+    (antes de copiar, guardar o exportar).
+    """
+
+    def __init__(self, callback, delay_ms: int = 150, max_wait_ms: int | None = None,
+                 parent: QObject | None = None):
+        super().__init__(parent)
+        self._callback = callback
+        self._delay = max(0, int(delay_ms))
+        self._max_wait = max_wait_ms
+        self._first_request: float | None = None   # inicio de la ráfaga actual
+        self._running = False
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self.flush)
+
+    # ------------------------------------------------------------------
+    @property
+    def pending(self) -> bool:
+        """``True`` si hay un render pedido que todavía no se ejecutó."""
+        return self._first_request is not None
+
+    def delay(self) -> int:
+        return self._delay
+
+    def setDelay(self, ms: int) -> None:
+        self._delay = max(0, int(ms))
+
+    def setMaxWait(self, ms: int | None) -> None:
+        self._max_wait = ms
+
+    # ------------------------------------------------------------------
+    def schedule(self, *_):
+        """Pide un render; acepta (e ignora) los argumentos de cualquier señal."""
+        now = monotonic()
+        if self._first_request is None:
+            self._first_request = now
+        espera = self._delay
+        if self._max_wait is not None:
+            restante = self._max_wait - int((now - self._first_request) * 1000)
+            espera = max(0, min(espera, restante))
+        self._timer.start(espera)
+
+    def flush(self) -> None:
+        """Ejecuta ya el render pendiente (si lo hay)."""
+        self._timer.stop()
+        if self._first_request is None or self._running:
+            return
+        self._first_request = None
+        self._running = True
+        try:
+            self._callback()
+        finally:
+            self._running = False
+
+    def cancel(self) -> None:
+        """Descarta el render pendiente sin ejecutarlo."""
+        self._timer.stop()
+        self._first_request = None
@@ -0,0 +1,156 @@
+# resaltado.py
+"""Tramos del texto nuevo que cambiaron respecto del anterior.
+
+Antes cada render pasaba ``difflib.SequenceMatcher`` sobre la sentencia
+entera (decenas de miles de caracteres) para saber qué pintar de amarillo.
+Acá:
+
+* primero se recortan el prefijo y el sufijo comunes, comparando rebanadas
+  (en C) en vez de carácter por carácter; una edición típica deja un tramo
+  central de pocos caracteres;
+* sobre ese tramo corre un diff de Myers, O((N+M)·D), acotado a
+  ``MAX_EDICIONES`` diferencias;
+* si el tramo supera ``max_caracteres`` o hay demasiadas diferencias, se
+  devuelve el tramo central entero sin diff fino.
+
+``CalculoEnHilo`` hace lo mismo fuera del hilo de la interfaz y entrega sólo
+el resultado del último pedido.
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+from PySide6.QtCore import QObject, Signal, Slot
+
+MAX_CARACTERES = 20000
+MAX_EDICIONES = 400
+
+
+def _comun(a: str, i: int, b: str, j: int) -> int:
+    """Largo del prefijo común de ``a[i:]`` y ``b[j:]``."""
+    n = min(len(a) - i, len(b) - j)
+    if n <= 0 or a[i] != b[j]:
+        return 0
+    # se duplica el largo probado mientras coincida y después se bisecta
+    bajo, alto = 1, 1
+    while True:
+        alto = min(bajo * 2, n)
+        if a[i:i + alto] != b[j:j + alto]:
+            break
+        bajo = alto
+        if bajo == n:
+            return n
+    while alto - bajo > 1:
+        medio = (bajo + alto) // 2
+        if a[i:i + medio] == b[j:j + medio]:
+            bajo = medio
+        else:
+            alto = medio
+    return bajo
+
+
+def _insertados(a: str, b: str, max_d: int) -> list[int] | None:
+    """Índices de ``b`` que no vienen de ``a`` (Myers) o ``None`` si D > max_d."""
+    n, m = len(a), len(b)
+    desplazamiento = max_d + 1
+    v = [0] * (2 * max_d + 3)
+    rastro = []
+    for d in range(max_d + 1):
+        # sólo la ventana de diagonales que se usa en este paso
+        rastro.append(v[desplazamiento - d - 1:desplazamiento + d + 2])
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and v[desplazamiento + k - 1] < v[desplazamiento + k + 1]):
+                x = v[desplazamiento + k + 1]
+            else:
+                x = v[desplazamiento + k - 1] + 1
+            y = x - k
+            if x < n and y < m:
+                avance = _comun(a, x, b, y)
+                x += avance
+                y += avance
+            v[desplazamiento + k] = x
+            if x >= n and y >= m:
+                return _recorrer(rastro, n, m)
+    return None
+
+
+def _recorrer(rastro: list[list[int]], x: int, y: int) -> list[int]:
+    insertados = []
+    for d in range(len(rastro) - 1, 0, -1):
+        v = rastro[d]
+        k = x - y
+        if k == -d or (k != d and v[k - 1 + d + 1] < v[k + 1 + d + 1]):
+            previo_k = k + 1
+        else:
+            previo_k = k - 1
+        previo_x = v[previo_k + d + 1]
+        previo_y = previo_x - previo_k
+        if previo_k == k + 1:  # bajó: se insertó b[previo_y]
+            insertados.append(previo_y)
+        x, y = previo_x, previo_y
+    insertados.reverse()
+    return insertados
+
+
+def _agrupar(b: str, indices: list[int], base: int) -> list[tuple[int, int]]:
+    """Índices sueltos → tramos; los separados por letras sin espacios se unen."""
+    rangos: list[list[int]] = []
+    for i in indices:
+        if rangos and not any(c.isspace() for c in b[rangos[-1][1]:i]):
+            rangos[-1][1] = i + 1
+        else:
+            rangos.append([i, i + 1])
+    return [(base + i, base + j) for i, j in rangos]
+
+
+def rangos_cambiados(viejo: str, nuevo: str,
+                     max_caracteres: int = MAX_CARACTERES) -> list[tuple[int, int]]:
+    """Tramos ``(inicio, fin)`` de ``nuevo`` que no estaban en ``viejo``.
+
+    Los borrados puros no dejan nada que resaltar y no aparecen.
+    """
+    if viejo == nuevo:
+        return []
+    p = _comun(viejo, 0, nuevo, 0)
+    s = _comun(viejo[::-1], 0, nuevo[::-1], 0)
+    s = min(s, len(viejo) - p, len(nuevo) - p)
+    a, b = viejo[p:len(viejo) - s], nuevo[p:len(nuevo) - s]
+    if not b:
+        return []
+    if not a:
+        return [(p, p + len(b))]
+    if len(a) + len(b) <= max_caracteres:
+        indices = _insertados(a, b, MAX_EDICIONES)
+        if indices is not None:
+            return _agrupar(b, indices, p)
+    return [(p, p + len(b))]
+
+
+class CalculoEnHilo(QObject):
+    """``rangos_cambiados`` en un hilo aparte; ``listo`` trae el último pedido."""
+
+    listo = Signal(object)
+    _terminado = Signal(int, object)
+
+    def __init__(self, max_caracteres: int = MAX_CARACTERES, parent: QObject | None = None):
+        super().__init__(parent)
+        self._max = max_caracteres
+        self._pool = ThreadPoolExecutor(max_workers=1)
+        self._generacion = 0
+        self._terminado.connect(self._entregar)
+
+    def pedir(self, viejo: str, nuevo: str) -> None:
+        self._generacion += 1
+        generacion = self._generacion
+        futuro = self._pool.submit(rangos_cambiados, viejo, nuevo, self._max)
+        futuro.add_done_callback(
+            lambda f: self._terminado.emit(generacion, f.result())
+        )
+
+    def cancelar(self) -> None:
+        """Descarta lo que esté en curso."""
+        self._generacion += 1
+
+    @Slot(int, object)
+    def _entregar(self, generacion: int, rangos) -> None:
+        # un resultado viejo llega tarde: el texto ya es otro
+        if generacion == self._generacion:
+            self.listo.emit(rangos)
@@ -0,0 +1,228 @@
+# sanitizer.py
+"""Limpieza del HTML que sale de los editores (``QTextEdit.toHtml()``).
+
+Antes cada variante encadenaba una decena de ``re.sub`` sobre el documento
+entero. Acá hay una sola expresión que parte la entrada en etiquetas y
+texto; el texto pasa tal cual y cada etiqueta se resuelve en el momento
+según el modo. Después queda una única pasada que compacta los espacios.
+
+Modos de ``sanitizar``:
+
+* ``"completo"``     → fragmento del <body> con <b>, <i>, <u> y <p>, sin
+                       estilos, spans, enlaces ni <br> (el de siempre).
+* ``"cursiva"``      → sólo cursiva; si no hay ninguna, todo va en <i>.
+* ``"en_linea"``     → sin párrafos ni saltos: una sola línea.
+* ``"parrafos"``     → en línea, pero cada fin de párrafo pasa a ``<br><br>``.
+* ``"portapapeles"`` → el documento entero, sin tamaños de letra ni
+                       alineación a la izquierda y con cada <p> justificado.
+
+El resultado es el mismo que daban las cadenas de ``re.sub`` originales
+(ver ``benchmarks/sanitizer.py``).
+"""
+import html
+import re
+
+# una etiqueta (o comentario) o un bloque <style>…</style> entero
+_RE_ETIQUETA = re.compile(r"<style[^>]*>.*?</style>|<[^<>]*>", re.I | re.S)
+_RE_NOMBRE = re.compile(r"<(/?)([a-zA-Z][a-zA-Z0-9]*)?")
+_RE_ATRIBUTOS = re.compile(r'\s*(style|class|dir|lang)="[^"]*"', re.I)
+_RE_BR = re.compile(r"<br\s*/?>", re.I)
+_RE_NEGRITA = re.compile(r'style="[^"]*font-weight\s*:\s*(?:bold|700)[^"]*"', re.I)
+_RE_P_UNICO = re.compile(r"<p[^>]*>.*?</p>", re.I | re.S)
+_RE_P_BORDES = re.compile(r"^<p[^>]*>|</p>$", re.I)
+
+# portapapeles
+_RE_FONT_SIZE = re.compile(r'font-size\s*:[^;"]+;?', re.I)
+_RE_ALIGN_LEFT = re.compile(r'text-align\s*:\s*left\s*;?|align="left"\s*', re.I)
+_RE_CENTRO_DERECHA = re.compile(
+    r'(text-align\s*:\s*(center|right))|(align="(center|right)")', re.I
+)
+_RE_STYLE = re.compile(r'style="([^"]*)"')
+_RE_STYLE_VACIO = re.compile(r'style="\s*"')
+
+
+def _es_bloque_style(t: str) -> bool:
+    return t[-8:].lower() == "</style>"
+
+
+def _compactar(h: str) -> str:
+    """``re.sub(r"\s+", " ", h).strip()`` pero bastante más rápido."""
+    return " ".join(h.split())
+
+
+def _body(h: str) -> str:
+    """Lo que hay entre el primer <body …> y su </body> (o todo, si no hay)."""
+    bajo = h.lower()
+    i = bajo.find("<body")
+    while i != -1:
+        j = bajo.find(">", i)
+        if j == -1:
+            break
+        k = bajo.find("</body>", j)
+        if k != -1:
+            return h[j + 1:k]
+        i = bajo.find("<body", i + 1)
+    return h
+
+
+# Cada etiqueta se resuelve una sola vez por texto exacto: un documento de
+# Qt repite miles de veces las mismas (`<span style=" font-weight:700;">`,
+# `</span>`, el mismo `<p …>` en cada párrafo…).
+_SPAN_NEGRITA = object()   # <span> en negrita: <b> si después hay un </span>
+_SPAN_CIERRE = object()    # </span> exacto: cierra esa <b>, si la hay
+_MAX_MEMO = 4096
+
+
+def _memo(resolver):
+    memo: dict[str, object] = {}
+
+    def resolver_memo(t: str):
+        r = memo.get(t)
+        if r is None:
+            if len(memo) > _MAX_MEMO:
+                memo.clear()
+            r = memo[t] = resolver(t)
+        return r
+    return resolver_memo
+
+
+@_memo
+def _etiqueta_completo(t: str):
+    cierre, nombre = _RE_NOMBRE.match(t).groups()
+    nombre = (nombre or "").lower()
+    if nombre.startswith("style") and _es_bloque_style(t):
+        return ""
+    if nombre.startswith("meta") and not cierre:
+        return ""
+    if nombre in ("strong", "em") and len(t) == len(nombre) + 2 + len(cierre):
+        return f"<{cierre}{'b' if nombre == 'strong' else 'i'}>"
+    if nombre.startswith("span"):
+        if cierre:
+            return _SPAN_CIERRE if t.lower() == "</span>" else ""
+        return _SPAN_NEGRITA if _RE_NEGRITA.search(t) else ""
+    if nombre[:1] == "a":
+        return ""                                   # <a name=…> de Word
+    t = _RE_ATRIBUTOS.sub("", t)
+    if nombre == "br" and _RE_BR.fullmatch(t):
+        return " "
+    return t
+
+
+def _completo(fuente: str) -> str:
+    ultimo_cierre = fuente.lower().rfind("</span>")
+    negrita_abierta = False
+
+    def etiqueta(m):
+        # un span en negrita se vuelve <b> hasta el primer </span>
+        nonlocal negrita_abierta
+        r = _etiqueta_completo(m.group(0))
+        if r is _SPAN_NEGRITA:
+            if negrita_abierta or m.start() > ultimo_cierre:
+                return ""
+            negrita_abierta = True
+            return "<b>"
+        if r is _SPAN_CIERRE:
+            if negrita_abierta:
+                negrita_abierta = False
+                return "</b>"
+            return ""
+        return r
+
+    h = _RE_ETIQUETA.sub(etiqueta, fuente)
+    h = _compactar(h.replace("&#10;", " ").replace("&#13;", " ").replace("&nbsp;", " "))
+    # si el texto completo está envuelto en un único <p>…</p>, lo quitamos
+    if _RE_P_UNICO.fullmatch(h):
+        h = _RE_P_BORDES.sub("", h).strip()
+    return html.unescape(h)
+
+
+@_memo
+def _etiqueta_cursiva(t: str) -> str:
+    cierre, nombre = _RE_NOMBRE.match(t).groups()
+    bajo = (nombre or "").lower()
+    if bajo.startswith("style") and _es_bloque_style(t):
+        return ""
+    if bajo.startswith("meta") and not cierre:
+        return ""
+    # fuera negrita y subrayado (y, como siempre, todo lo que empiece con
+    # b/u: <br>, <body>, <ul>…)
+    if bajo[:1] in ("b", "u") or bajo.startswith("strong"):
+        return ""
+    if bajo.startswith("span"):
+        if cierre and t.lower() == "</span>":
+            return ""
+        if not cierre and _RE_NEGRITA.search(t):
+            return ""
+    if bajo == "em" and len(t) == 4 + len(cierre):
+        return f"<{cierre}i>"
+    # quedan sólo las <i> (y lo que no empiece con minúscula)
+    if nombre and "a" <= nombre[0] <= "z":
+        return t if nombre == "i" else ""
+    return t
+
+
+def _cursiva(fuente: str) -> str:
+    h = _RE_ETIQUETA.sub(lambda m: _etiqueta_cursiva(m.group(0)), fuente)
+    h = _compactar(h.replace("&nbsp;", " "))
+    if "<i>" not in h.lower():
+        h = f"<i>{html.escape(h)}</i>"
+    return h
+
+
+def _etiqueta_en_linea(t: str, parrafos: bool) -> str:
+    cierre, nombre = _RE_NOMBRE.match(t).groups()
+    nombre = (nombre or "").lower()
+    if nombre[:1] == "p":
+        if not parrafos:
+            return " "
+        return "<br><br>" if t.lower() == "</p>" else ("" if not cierre else t)
+    if nombre.startswith("div"):
+        return "" if parrafos else " "
+    if nombre == "br" and _RE_BR.fullmatch(t):
+        return "<br>" if parrafos else " "
+    return t
+
+
+_etiqueta_plano = _memo(lambda t: _etiqueta_en_linea(t, False))
+_etiqueta_parrafos = _memo(lambda t: _etiqueta_en_linea(t, True))
+
+
+def _en_linea(fuente: str, parrafos: bool) -> str:
+    resolver = _etiqueta_parrafos if parrafos else _etiqueta_plano
+    h = _RE_ETIQUETA.sub(lambda m: resolver(m.group(0)), fuente)
+    h = _compactar(h.replace("&#10;", " ").replace("&#13;", " ").replace("&nbsp;", " "))
+    return html.unescape(h)
+
+
+@_memo
+def _etiqueta_portapapeles(t: str) -> str:
+    if "=" in t or ":" in t:
+        t = _RE_ALIGN_LEFT.sub("", _RE_FONT_SIZE.sub("", t))
+    if t.startswith("<p") and not _RE_CENTRO_DERECHA.search(t):
+        # a cada <p …> que no esté centrado/a la derecha, justify en línea
+        if 'style="' in t:
+            t = _RE_STYLE.sub(lambda s: f'style="{s.group(1)}text-align:justify;"', t)
+        else:
+            t = t[:-1] + ' style="text-align:justify;">'
+    if "style" in t:
+        t = _RE_STYLE_VACIO.sub("", t)
+    return t
+
+
+def _portapapeles(fuente: str) -> str:
+    return _RE_ETIQUETA.sub(lambda m: _etiqueta_portapapeles(m.group(0)), fuente)
+
+
+def sanitizar(html_raw: str, modo: str = "completo") -> str:
+    """Limpia ``html_raw`` según ``modo`` (ver el docstring del módulo)."""
+    if modo == "completo":
+        return _completo(_body(html_raw))
+    if modo == "parrafos":
+        return _en_linea(html_raw, parrafos=True)
+    if modo == "en_linea":
+        return _en_linea(html_raw, parrafos=False)
+    if modo == "cursiva":
+        return _cursiva(_body(html_raw))
+    if modo == "portapapeles":
+        return _portapapeles(html_raw)
+    raise ValueError(f"modo de sanitizado desconocido: {modo!r}")
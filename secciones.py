@@ -0,0 +1,87 @@
+# secciones.py
+"""Reconciliador de secciones repetidas (pestañas de imputados, hechos…).
+
+En vez de borrar y volver a crear las N secciones cada vez que cambia la
+cantidad, se agregan o quitan sólo las del final. Las que se quitan quedan
+en un pool y se reutilizan (ya limpias) si la cantidad vuelve a crecer, así
+que pasar de 7 a 8 imputados cuesta una sola pestaña.
+
+El pool es una pila: la sección que se quitó última es la primera que se
+reusa, de modo que cada sección vuelve siempre a la misma posición que tenía
+(sus rótulos "#3" y los índices capturados en sus señales siguen valiendo).
+"""
+from PySide6.QtWidgets import QWidget
+
+
+class Seccion:
+    """Una sección viva: su contenedor y el dict de widgets por clave."""
+    __slots__ = ("contenedor", "widgets")
+
+    def __init__(self, contenedor: QWidget, widgets: dict):
+        self.contenedor = contenedor
+        self.widgets = widgets
+
+
+class SeccionReconciliador:
+    """Mantiene ``len(secciones) == n`` tocando sólo la diferencia.
+
+    * ``crear(idx)``            → arma una ``Seccion`` nueva.
+    * ``montar(sec, idx)``      → la agrega a la interfaz en la posición ``idx``.
+    * ``desmontar(sec, idx)``   → la saca de la interfaz (sin destruirla).
+    * ``reiniciar(sec)``        → (opcional) la deja en blanco antes de reusarla.
+    """
+
+    def __init__(self, crear, montar, desmontar, reiniciar=None, max_pool: int = 20):
+        self._crear = crear
+        self._montar = montar
+        self._desmontar = desmontar
+        self._reiniciar = reiniciar
+        self._max_pool = max_pool
+        self._activas: list[Seccion] = []
+        self._pool: list[Seccion] = []
+
+    @property
+    def secciones(self) -> list[Seccion]:
+        return self._activas
+
+    def __len__(self) -> int:
+        return len(self._activas)
+
+    def reconciliar(self, n: int) -> tuple[list[int], list[int]]:
+        """Lleva la cantidad de secciones a ``n``.
+
+        Devuelve ``(agregados, quitados)``: los índices montados (en orden
+        creciente) y los desmontados (en orden decreciente).
+        """
+        quitados: list[int] = []
+        while len(self._activas) > n:
+            sec = self._activas.pop()
+            idx = len(self._activas)
+            self._desmontar(sec, idx)
+            quitados.append(idx)
+            self._pool.append(sec)
+            if len(self._pool) > self._max_pool:
+                # se descarta la de índice más alto (fondo de la pila) para
+                # que el tope siga siendo la que corresponde a ``len(activas)``
+                self._pool.pop(0).contenedor.deleteLater()
+
+        agregados: list[int] = []
+        while len(self._activas) < n:
+            idx = len(self._activas)
+            if self._pool:
+                sec = self._pool.pop()
+                if self._reiniciar:
+                    self._reiniciar(sec)
+            else:
+                sec = self._crear(idx)
+            self._activas.append(sec)
+            self._montar(sec, idx)
+            agregados.append(idx)
+        return agregados, quitados
+
+    def indice(self, widgets: dict) -> int:
+        """Posición actual de la sección dueña de ``widgets`` (-1 si no está)."""
+        for i, sec in enumerate(self._activas):
+            if sec.widgets is widgets:
+                return i
+        return -1
@@ -1,28 +1,23 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-import ctypes
 import html
 import os
 import re
 import sys
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from datetime import datetime
-from functools import partial
+from functools import lru_cache, partial, wraps
 from html import unescape
+from typing import NamedTuple
 
-from docx import Document
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.shared import Pt
-
-from PySide6.QtCore import QEvent, QTimer, Qt, Signal
+from PySide6.QtCore import QEvent, QSignalBlocker, QTimer, Qt, Signal
 from PySide6.QtGui import (
     QAction,
     QFont,
     QIcon,
     QPainter,
     QTextCharFormat,
-    QTextDocument,
 )
 from PySide6.QtWidgets import (
     QAbstractSpinBox,
@@ -50,13 +45,24 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from core_data import CausaData
-from widgets import NoWheelComboBox, NoWheelSpinBox
-from constants import TRIBUNALES
-
-
-myappid = "com.miempresa.miproducto.1.0"  # Identificador único
-ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(myappid)
+from core_data import CausaData, Imputado, campo_hecho
+from widgets import NoWheelComboBox, NoWheelSpinBox, leer_valor, reiniciar_valores
+from html_plano import html_a_texto, html_en_linea, html_a_plano as _html_a_plano
+from sanitizer import sanitizar
+from constants import (
+    TRIBUNALES,
+    RENDER_DELAY_MS,
+    RENDER_MAX_WAIT_MS,
+    RESALTADO_MAX_CARACTERES,
+    RESALTADO_EN_SEGUNDO_PLANO,
+)
+from render_scheduler import RenderScheduler
+from secciones import Seccion, SeccionReconciliador
+from bloques import DocumentoEnBloques
+from resaltado import CalculoEnHilo, rangos_cambiados
+from anclas import ANCLAS, Ancla, anchor, anchor_html
+from motor_plantillas import compilar
+import historial
 
 
 ###############################################################################
@@ -262,125 +268,6 @@ def numero_a_letras(num: int) -> str:
     return str(num)
 
 
-def _sanitize_html_italic_only(html_raw: str) -> str:
-    """
-    Limpia el HTML e IMPIDE negrita/subrayado.
-    Si no hay cursiva explícita, envuelve todo en <i>…</i>.
-    """
-    import re, html
-
-    # Nos quedamos sólo con el <body> (igual que antes)
-    m = re.search(r"<body[^>]*>(.*?)</body>", html_raw, flags=re.I | re.S)
-    if m:
-        html_raw = m.group(1)
-
-    # eliminamos cualquier bloque <style>…</style> o meta etiquetas remanentes
-    html_raw = re.sub(r"<style[^>]*>.*?</style>", "", html_raw, flags=re.I | re.S)
-    html_raw = re.sub(r"<meta[^>]*>", "", html_raw, flags=re.I)
-
-    # 1) fuera <b>, </b>, <strong>, </strong>, <u>, </u>, y spans con font-weight
-    html_raw = re.sub(r"</?(b|strong|u)[^>]*>", "", html_raw, flags=re.I)
-    html_raw = re.sub(
-        r'<span[^>]*style="[^"]*font-weight\s*:\s*(?:bold|700)[^"]*"[^>]*>',
-        "",
-        html_raw,
-        flags=re.I,
-    )
-    html_raw = re.sub(r"</span>", "", html_raw, flags=re.I)
-
-    # 2) Nos quedamos *solo* con <i>/<em> –los demás tags fuera–
-    #    (primero <em>→<i> para unificar)
-    html_raw = re.sub(
-        r"</?em>",
-        lambda m: "<i>" if m.group(0)[1] != "/" else "</i>",
-        html_raw,
-        flags=re.I,
-    )
-    html_raw = re.sub(r"</?(?!i\b)[a-z][^>]*>", "", html_raw)  # quita todo salvo <i>
-
-    # 3) compactamos espacios/entidades raras
-    html_raw = re.sub(r"(\r\n|\r|\n|&nbsp;|\u2028|\u2029)", " ", html_raw)
-    html_raw = re.sub(r"\s+", " ", html_raw).strip()
-
-    # 4) Si NO quedó ningún <i>…</i>, lo rodeamos completo
-    if "<i>" not in html_raw.lower():
-        html_raw = f"<i>{html.escape(html_raw)}</i>"
-
-    return html_raw
-
-
-def _sanitize_html(html_raw: str) -> str:
-    """
-    Devuelve SOLO el fragmento que estaba dentro de <body>,
-    manteniendo <b>, <i>, <u> y quitando todo estilo / saltos raros.
-    """
-    import re, html
-
-    # A)  ───── EXTRAEMOS SOLO <body> … </body> ─────
-    m = re.search(r"<body[^>]*>(.*?)</body>", html_raw, flags=re.I | re.S)
-    if m:
-        html_raw = m.group(1)
-    # (si por algún motivo no hay <body>, seguimos con lo que venga)
-
-    # eliminamos style/meta eventualmente incrustados en el cuerpo
-    html_raw = re.sub(r"<style[^>]*>.*?</style>", "", html_raw, flags=re.I | re.S)
-    html_raw = re.sub(r"<meta[^>]*>", "", html_raw, flags=re.I)
-
-    # B)  ───── A partir de aquí van los pasos que ya tenías ─────
-    # a) <strong>/<em> → <b>/<i>
-    html_raw = re.sub(
-        r"</?strong>",
-        lambda m: "<b>" if m.group(0)[1] != "/" else "</b>",
-        html_raw,
-        flags=re.I,
-    )
-    html_raw = re.sub(
-        r"</?em>",
-        lambda m: "<i>" if m.group(0)[1] != "/" else "</i>",
-        html_raw,
-        flags=re.I,
-    )
-
-    # b) <span style="font-weight:...">…</span> → <b>…</b>
-    html_raw = re.sub(
-        r'<span[^>]*style="[^"]*font-weight\s*:\s*(?:bold|700)[^"]*"[^>]*>(.*?)</span>',
-        r"<b>\1</b>",
-        html_raw,
-        flags=re.I | re.S,
-    )
-
-    # c) quitamos atributos style, class, dir, lang…
-    html_raw = re.sub(r'\s*(style|class|dir|lang)="[^"]*"', "", html_raw, flags=re.I)
-
-    # d) quitamos cualquier <span> remanente
-    html_raw = re.sub(r"</?span[^>]*>", "", html_raw, flags=re.I)
-    # eliminar enlaces <a name="..."> que aparecen al pegar desde Word
-    html_raw = re.sub(r"</?a[^>]*>", "", html_raw, flags=re.I)
-
-    # d-bis) fuera <br>
-    html_raw = re.sub(r"(?i)<br\s*/?>", " ", html_raw)
-
-    # d-ter) fuera párrafos vacíos de Qt
-    html_raw = re.sub(
-        r"<p[^>]*-qt-paragraph-type:empty[^>]*>\s*(<br\s*/?>)?\s*</p>",
-        " ",
-        html_raw,
-        flags=re.I,
-    )
-
-    # e) limpia saltos y nbsp
-    html_raw = re.sub(r"(\r\n|\r|\n|&#10;|&#13;|\u2028|\u2029|&nbsp;)", " ", html_raw)
-
-    # f) compacta espacios
-    html_raw = re.sub(r"\s+", " ", html_raw).strip()
-
-    # g) si el texto completo está envuelto en un único <p>…</p>, lo quitamos
-    if re.fullmatch(r"<p[^>]*>.*?</p>", html_raw, flags=re.I | re.S):
-        html_raw = re.sub(r"^<p[^>]*>|</p>$", "", html_raw, flags=re.I).strip()
-
-    return html.unescape(html_raw)
-
-
 def obtener_fecha_en_letras():
     fecha_actual = datetime.now()
     dia = fecha_actual.day
@@ -430,6 +317,29 @@ def format_list_with_semicolons(items):
     return "; ".join(items[:-1]) + f"; y {items[-1]}"
 
 
+_RE_PUNTO_DOBLE = re.compile(r"(?<!\.)\.\.(?!\.)")
+_RE_PUNTO_TRAS_CIERRE = re.compile(
+    r"(?<!\.)"  # el char anterior NO es punto
+    r"\."  # un punto
+    r"(?:\s*</[^>]+>\s*)+"  # ≥1 etiquetas de cierre con posible white-space
+    r"\."  # otro punto
+    r"(?!\.)"  # el siguiente char NO es punto
+)
+
+
+def reducir_puntos_dobles(text: str) -> str:
+    """Pasos 1 y 2 de ``strip_trailing_single_dot`` (sin tocar la cola)."""
+    # ── 1)  “..” directos → “.”  (como antes)
+    text = _RE_PUNTO_DOBLE.sub(".", text)
+
+    # ── 2)  “.</tag>.”   ó   “.</tag></b> .”  → sólo un punto
+    #        (punto  + etiquetas de cierre/espacios  + punto)
+    return _RE_PUNTO_TRAS_CIERRE.sub(
+        lambda m: m.group(0)[:-1],  # suprime el último punto
+        text,
+    )
+
+
 def strip_trailing_single_dot(text: str | None) -> str:
     """
     Elimina puntos redundantes sin romper las elipsis.
@@ -444,26 +354,17 @@ def strip_trailing_single_dot(text: str | None) -> str:
     if not text:
         return ""
 
-    # ── 1)  “..” directos → “.”  (como antes)
-    text = re.sub(r"(?<!\.)\.\.(?!\.)", ".", text)
+    return normalizar_cola(reducir_puntos_dobles(text))
 
-    # ── 2)  “.</tag>.”   ó   “.</tag></b> .”  → sólo un punto
-    #        (punto  + etiquetas de cierre/espacios  + punto)
-    text = re.sub(
-        r"(?<!\.)"  # el char anterior NO es punto
-        r"\."  # un punto
-        r"(?:\s*</[^>]+>\s*)+"  # ≥1 etiquetas de cierre con posible white-space
-        r"\."  # otro punto
-        r"(?!\.)",  # el siguiente char NO es punto
-        lambda m: m.group(0)[:-1],  # suprime el último punto
-        text,
-    )
 
-    # ── 3)  Normalizar la cola (“…..” → “…” | “..” → “.”)
-    tail = re.search(r"\.*$", text).group(0)  # todos los puntos del final
+def normalizar_cola(text: str) -> str:
+    """Paso 3 de ``strip_trailing_single_dot``: “…..” → “…” | “..” → “.”."""
+    # todos los puntos del final (como el «$» de un regex: antes de un único
+    # salto de línea final)
+    fin = text[:-1] if text.endswith("\n") else text
+    tail = fin[len(fin.rstrip(".")):]
     if tail and tail not in ("...", "…"):
         text = text[: -len(tail)] + "."
-
     return text
 
 
@@ -493,25 +394,213 @@ def numero_romano(n: int) -> str:
     return romanos[n - 1] if 1 <= n <= len(romanos) else str(n)
 
 
-def anchor(texto, clave, placeholder=None):
-    """Genera una ancla editable para la plantilla."""
-    if not texto.strip():
-        texto = placeholder or f"[{clave}]"
-    return (
-        f'<a href="{clave}" '
-        f'style="color:blue;text-decoration:none;">'
-        f"{html.escape(texto)}</a>"
-    )
+# ───────────── secciones memorizadas de la sentencia ─────────────
+MAX_CACHE_SECCIONES = 256
 
-def anchor_html(html_text, clave, placeholder=None):
-    """Ancla que conserva HTML interno (negrita, p, etc.)."""
-    if not html_text.strip():
-        return anchor("", clave, placeholder)
-    return (
-        f'<a href="{clave}" '
-        f'style="color:blue;text-decoration:none;">'
-        f"{html_text}</a>"
-    )
+
+def memo_seccion(fn):
+    """Memoriza el fragmento que arma una sección según sus argumentos.
+
+    Los argumentos son valores inmutables leídos del formulario, así que la
+    sección sólo se vuelve a armar cuando cambió algo de lo que usa (editar
+    el fiscal rehace el párrafo de los intervinientes y nada más).
+    """
+    nombre = fn.__name__
+
+    @wraps(fn)
+    def envoltura(self, *args):
+        cache = self._cache_secciones
+        clave = (nombre, args)
+        if clave in cache:
+            cache.move_to_end(clave)
+            return cache[clave]
+        valor = cache[clave] = fn(self, *args)
+        if len(cache) > MAX_CACHE_SECCIONES:
+            cache.popitem(last=False)
+        return valor
+    return envoltura
+
+
+_puntos_reducidos = lru_cache(maxsize=MAX_CACHE_SECCIONES)(reducir_puntos_dobles)
+
+
+# Las secciones que son texto fijo con datos intercalados se escriben como
+# plantillas (ver ``motor_plantillas``). Los valores ya llegan como HTML
+# (anclas, cursivas del usuario), así que no se escapan.
+_AYUDANTES_SECCIONES = {
+    "anchor": anchor,
+    "anchor_html": anchor_html,
+    "sin_punto_final": strip_trailing_single_dot,
+}
+
+
+def _plantilla_seccion(nombre: str, fuente: str):
+    return compilar(fuente, nombre, escapar=False, ayudantes=_AYUDANTES_SECCIONES)
+
+
+SECCION_APERTURA = _plantilla_seccion("apertura", """
+<p align='justify'>En la ciudad de {{ anchor(localidad, "edit_localidad", "Localidad") }},
+el {{ anchor(fecha, "edit_fecha_audiencia", "Fecha") }}, se dan a conocer los
+fundamentos de la sentencia dictada en la causa
+<b>{{ anchor(caratula, "edit_caratula", "Carátula") }}</b>, juzgada por
+{% if juez_cargo == "juez" %}el{% else %}la{% endif %}
+{{ anchor(tribunal, "edit_tribunal", "Tribunal") }}, en la
+{{ anchor(sala, "edit_sala", "Sala") }} a cargo {{ "del" if juez_m else "de la" }}
+{{ anchor(cargo, "edit_cargo_juez", "Cargo") }} {{ anchor(juez_nombre, "edit_juez", "Juez") }}.</p>
+""")
+
+SECCION_INTERVINIENTES = _plantilla_seccion("intervinientes", """
+<p align='justify'>En el debate intervinieron {{ genero(fiscal_sexo, "el", "la") }}
+{{ anchor(fiscal_nombre, "edit_fiscal", "Fiscal") }}, y
+{{ concordar(sexos, "el imputado", "la imputada", "los imputados", "las imputadas") }}
+{{ lista_y(nombres) }},
+{{ concordar(sexos, "asistido", "asistida", "asistidos", "asistidas") }} por
+{{ defensa }}.</p>
+""")
+
+SECCION_ACUSADOS = _plantilla_seccion("acusados", """
+<p align='justify'>En esta causa {{ numero(len(sexos), "fue", "fueron") }}
+{{ concordar(sexos, "acusado", "acusada", "acusados", "acusadas") }}
+{{ datos }}.</p>
+""")
+
+SECCION_ATRIBUCION = _plantilla_seccion("atribucion", """
+<p align='justify'>{{ acusaciones }}
+{{ "atribuyeron" if n_acus > 1 else "atribuyó" }}
+{{ concordar(sexos, "al imputado", "a la imputada", "a los imputados", "a las imputadas") }}
+{{ numero(n_hec, "el siguiente hecho", "los siguientes hechos") }}:</p>
+""")
+
+SECCION_HECHO = _plantilla_seccion("hecho", """
+{% set desc = anchor_html(f"<i>{descripcion}</i>", f"edit_hecho_descripcion_{i}", "hecho") %}
+{% if aclaraciones %}
+{% set aclar = anchor(aclaraciones, f"edit_hecho_aclaraciones_{i}", "aclaración") %}
+{% endif %}
+{% if ordinal is None %}
+<p align='justify'>{{ desc }}{% if aclaraciones %} ({{ aclar }}){% endif %}</p>
+{% elif aclaraciones %}
+<p align='justify'><b>{{ ordinal }} hecho ({{ aclar }})</b>: {{ desc }}</p>
+{% else %}
+<p align='justify'><b>{{ ordinal }} hecho:</b> {{ desc }}</p>
+{% endif %}
+""")
+
+SECCION_CUESTIONES = _plantilla_seccion("cuestiones", """
+<p align='justify'>El tribunal se planteó las siguientes cuestiones a resolver:</p>
+<p align='justify'>&nbsp;&nbsp;&nbsp;&nbsp;<b>PRIMERA CUESTIÓN:</b> ¿Están
+probadas {{ numero(n_hec, "la existencia del hecho", "la existencia de los hechos") }}
+y la participación responsable
+{{ concordar(sexos, "del acusado", "de la acusada", "de los acusados", "de las acusadas") }}?</p>
+<p align='justify'>&nbsp;&nbsp;&nbsp;&nbsp;<b>SEGUNDA CUESTIÓN:</b> en su caso,
+¿qué calificación legal es aplicable?</p>
+<p align='justify'>&nbsp;&nbsp;&nbsp;&nbsp;<b>TERCERA CUESTIÓN:</b> ¿qué
+pronunciamiento corresponde dictar?</p>
+""")
+
+SECCION_TITULO_CUESTION = _plantilla_seccion("titulo_cuestion", """
+<p align='justify'><b>A LA {{ cuestion }}, {{ anchor(cargo_mayus, "edit_cargo_juez", "Cargo") }}
+{{ juez_nombre.upper() }} DIJO:</b></p>
+""")
+
+SECCION_ACUERDO = _plantilla_seccion("acuerdo", """
+<p align='justify'><b>2. Trámite de juicio abreviado (art. 415 CPP):</b></p>
+<p align='justify'><b>a) Acuerdo:</b> {{ "las defensas" if varias_defensas else "la defensa" }}
+y la fiscalía hicieron conocer los términos
+{{ numero(len(penas), "del acuerdo alcanzado", "de los acuerdos alcanzados") }} para
+la realización de un juicio abreviado que, en cuanto a la pena, determinó
+{% if len(penas) == 1 %}
+la de {{ penas[0][1] }}.</p>
+{% else %}
+{{ sin_punto_final(lista_punto_y_coma([f"para {n}, la de {p}" for n, p in penas])) }}.</p>
+{% endif %}
+""")
+
+SECCION_OPINION = _plantilla_seccion("opinion", """
+{% if sujeto or manifestacion %}
+<p align='justify'>Se le concedió la palabra a {{ sujeto }} para que exprese su
+opinión acerca del acuerdo informado, y manifestó: {{ manifestacion }}.</p>
+{% endif %}
+""")
+
+SECCION_EXPLICACION = _plantilla_seccion("explicacion", """
+<p align='justify'>Las características de esta modalidad de juzgamiento y del
+acuerdo mencionado fueron explicados por el tribunal
+{{ concordar(sexos, "al acusado", "a la acusada", "a los acusados", "a las acusadas") }},
+y se verificó así que {{ numero(len(sexos), "comprendía", "comprendían") }} su
+contenido y sus consecuencias, que {{ numero(len(sexos), "conocía", "conocían") }}
+su derecho a exigir un juicio oral, y que su conformidad era libre y
+voluntaria.</p>
+""")
+
+SECCION_VICTIMA = _plantilla_seccion("victima", """
+{% if manifestacion %}
+<p align='justify'>Además, el fiscal hizo saber que {{ victima }}
+{% if plural %}
+fueron previamente informadas acerca de dichos aspectos y que manifestaron
+{% else %}
+fue previamente informada acerca de dichos aspectos y que manifestó
+{% endif %}
+{{ manifestacion }}.</p>
+{% endif %}
+""")
+
+
+class _VistaImputado(NamedTuple):
+    """Lo que la sentencia lee de la sección de un imputado (ya con strip)."""
+    nombre: str
+    sexo: str
+    defensor: str
+    tipo_def: str           # en minúsculas
+    datos: str              # HTML
+    delitos: str
+    condena: str
+    condiciones: str        # HTML
+    sin_antecedentes: bool
+    antecedentes: str       # HTML
+    confesion: str
+    ultima: str
+    pautas: str             # HTML
+
+
+class _VistaHecho(NamedTuple):
+    """Lo que la sentencia lee de la sección de un hecho (ya con strip)."""
+    juzgado: bool
+    oficina: str
+    num_auto: str
+    fecha_elev: str
+    aclaraciones: str
+    descripcion: str        # HTML
+
+
+def _etiquetas_imputados(n_imp: int, sexos) -> tuple[str, str, str]:
+    """(el/la/los/las imputado/a/s, asistido/a/s, acusado/a/s)."""
+    cant_fem = n_imp - sum(1 for s in sexos if s == "M")
+    if n_imp == 1:
+        if sexos[0] == "M":
+            return "el imputado", "asistido", "acusado"
+        return "la imputada", "asistida", "acusada"
+    if cant_fem == n_imp:
+        # Todas mujeres
+        return "las imputadas", "asistidas", "acusadas"
+    return "los imputados", "asistidos", "acusados"
+
+
+def _anclas_nombres(nombres) -> list[str]:
+    return [
+        anchor(nm, f"edit_imp_nombre_{i}", "Nombre imputado")
+        for i, nm in enumerate(nombres)
+    ]
+
+
+def _agrupar_delitos(nombres, delitos) -> dict:
+    """delito → {"names": [imputados], "anchor": ancla del primero que lo tiene}."""
+    delitos_dict = {}
+    for i, (nm, delit_text) in enumerate(zip(nombres, delitos)):
+        if delit_text not in delitos_dict:
+            delit_anchor = anchor(delit_text, f"edit_imp_delitos_{i}", "Delitos")
+            delitos_dict[delit_text] = {"names": [], "anchor": delit_anchor}
+        delitos_dict[delit_text]["names"].append(nm)
+    return delitos_dict
 
 
 class CargoJuezDialog(QDialog):
@@ -688,11 +777,30 @@ class SentenciaWidget(QWidget):
         # listas que irán guardando los widgets dinámicos
         self.imputados: list = []
         self.hechos: list = []
+        self._secciones_imp = SeccionReconciliador(
+            self._crear_seccion_imputado,
+            lambda sec, idx: self._montar_seccion(self.imputados_layout, sec),
+            lambda sec, idx: self._desmontar_seccion(self.imputados_layout, sec),
+            self._reiniciar_imputado,
+        )
+        self._secciones_hechos = SeccionReconciliador(
+            self._crear_seccion_hecho,
+            lambda sec, idx: self._montar_seccion(self.hechos_layout, sec),
+            lambda sec, idx: self._desmontar_seccion(self.hechos_layout, sec),
+            self._reiniciar_hecho,
+        )
+        # todas las señales piden el render; se hace uno solo por ráfaga
+        self._render = RenderScheduler(
+            self._renderizar_plantilla, RENDER_DELAY_MS, RENDER_MAX_WAIT_MS, parent=self
+        )
 
+        # fragmentos ya armados de cada sección de la sentencia
+        self._cache_secciones: OrderedDict = OrderedDict()
         # para resaltar cambios en la plantilla
         self._prev_plain = ""
         # widgets que resaltarán secciones de la plantilla al enfocarse
         self._focus_highlight_map = {}
+        self._editores_ancla = None  # se arma en el primer clic
 
         self.data = data
         # ───────────────────────────────────────────────
@@ -722,13 +830,9 @@ class SentenciaWidget(QWidget):
             lambda t: setattr(self.data, "tribunal", t.strip())
         )
         self.var_tribunal.currentTextChanged.connect(self.actualizar_plantilla)
-        self.install_focus_highlight(
-            self.var_tribunal, lambda: self.var_tribunal.currentText()
-        )
+        self.install_focus_highlight(self.var_tribunal, "edit_tribunal")
         if self.var_tribunal.lineEdit():
-            self.install_focus_highlight(
-                self.var_tribunal.lineEdit(), lambda: self.var_tribunal.currentText()
-            )
+            self.install_focus_highlight(self.var_tribunal.lineEdit(), "edit_tribunal")
 
         # Sala
         self.var_sala = NoWheelComboBox()
@@ -741,11 +845,9 @@ class SentenciaWidget(QWidget):
         self.var_sala.currentTextChanged.connect(
             lambda t: setattr(self.data, "sala", t.strip())
         )
-        self.install_focus_highlight(self.var_sala, lambda: self.var_sala.currentText())
+        self.install_focus_highlight(self.var_sala, "edit_sala")
         if self.var_sala.lineEdit():
-            self.install_focus_highlight(
-                self.var_sala.lineEdit(), lambda: self.var_sala.currentText()
-            )
+            self.install_focus_highlight(self.var_sala.lineEdit(), "edit_sala")
 
         # ───────────────────────────────────────────────
         # 2) INTERVINIENTES
@@ -928,11 +1030,16 @@ class SentenciaWidget(QWidget):
         # ───────────────────────────────────────────────
         self.setup_ui()
         self.setup_connections()
+        # deshacer/rehacer de la causa: el mismo historial que la pantalla de trámites
+        for atajo, rehacer in (("Ctrl+Shift+Z", False), ("Ctrl+Shift+Y", True)):
+            self.addAction(QAction(self, shortcut=atajo,
+                                   triggered=partial(self._deshacer_causa, rehacer)))
 
         self.data.apply_to_sentencia(self)  # carga modelo
         self.update_imputados_section()  # crea pestañas imputados
         self.update_hechos_section()  # crea pestañas hechos
         self.actualizar_plantilla()  # ya existen ambas listas
+        self._render.flush()
 
     def _update_zoom_label(self, percent: int):
         self.lbl_zoom.setText(f"ZOOM {percent}%")
@@ -941,74 +1048,70 @@ class SentenciaWidget(QWidget):
 
     def _highlight_diff(self, old_text: str, new_text: str) -> None:
         """Resalta en amarillo los fragmentos modificados."""
-        from difflib import SequenceMatcher
-        from PySide6.QtGui import QTextCursor, QTextCharFormat, QBrush
-
-        # Cursor independiente para no mover la posición del usuario
-        cursor = QTextCursor(self.texto_plantilla.document())
-
-        # Limpia resaltados previos
-        fmt_clear = QTextCharFormat()
-        fmt_clear.setBackground(QBrush(Qt.transparent))
-        cursor.select(QTextCursor.Document)
-        cursor.mergeCharFormat(fmt_clear)
         self._clear_highlight_timer.stop()
+        if RESALTADO_EN_SEGUNDO_PLANO:
+            # el resultado llega por ``_resaltado_hilo.listo``
+            self._resaltado_hilo.pedir(old_text, new_text)
+        else:
+            self._mostrar_resaltado(
+                rangos_cambiados(old_text, new_text, RESALTADO_MAX_CARACTERES)
+            )
 
-        matcher = SequenceMatcher(None, old_text, new_text)
-        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
-            if tag == "equal" or j1 == j2:
-                continue
-            cursor.setPosition(j1)
-            cursor.setPosition(j2, QTextCursor.KeepAnchor)
-            fmt = QTextCharFormat()
-            fmt.setBackground(QBrush(Qt.yellow))
-            cursor.mergeCharFormat(fmt)
-
+    def _mostrar_resaltado(self, rangos) -> None:
+        self._resaltar_rangos(rangos)
         # El resaltado se limpiará automáticamente tras 3 segundos
         self._clear_highlight_timer.start(3000)
 
-    def _highlight_section_text(self, text: str) -> None:
-        """Resalta todas las apariciones de ``text`` en la plantilla."""
+    def _resaltar_rangos(self, rangos) -> None:
+        """Pinta ``rangos`` como selecciones extra (no toca el documento)."""
         from PySide6.QtGui import QTextCursor, QTextCharFormat, QBrush
 
-        cursor = QTextCursor(self.texto_plantilla.document())
-
-        fmt_clear = QTextCharFormat()
-        fmt_clear.setBackground(QBrush(Qt.transparent))
-        cursor.select(QTextCursor.Document)
-        cursor.mergeCharFormat(fmt_clear)
-        self._clear_highlight_timer.stop()
-
-        if not text:
-            return
-
-        plain = self.texto_plantilla.toPlainText()
-        text_lower = text.lower()
-        pos = plain.lower().find(text_lower)
+        doc = self.texto_plantilla.document()
+        fin_doc = doc.characterCount() - 1
         fmt = QTextCharFormat()
         fmt.setBackground(QBrush(Qt.yellow))
-        while pos != -1:
-            cursor.setPosition(pos)
-            cursor.setPosition(pos + len(text), QTextCursor.KeepAnchor)
-            cursor.mergeCharFormat(fmt)
-            pos = plain.lower().find(text_lower, pos + len(text))
+        selecciones = []
+        for inicio, fin in rangos:
+            fin = min(fin, fin_doc)
+            if inicio >= fin:
+                continue
+            sel = QTextEdit.ExtraSelection()
+            sel.cursor = QTextCursor(doc)
+            sel.cursor.setPosition(inicio)
+            sel.cursor.setPosition(fin, QTextCursor.KeepAnchor)
+            sel.format = fmt
+            selecciones.append(sel)
+        self.texto_plantilla.setExtraSelections(selecciones)
+
+    def _highlight_anchor(self, clave: str, mostrar: bool = False) -> None:
+        """Resalta los tramos de la plantilla del ancla ``clave``.
+
+        Usa el índice de enlaces del documento: no recorre el texto. Con
+        ``mostrar`` lleva el scroll hasta el primero si no está a la vista.
+        """
+        self._clear_highlight()
+        rangos = self._documento.rangos_ancla(ANCLAS.id_de(clave))
+        if not rangos:
+            return
+        self._resaltar_rangos(rangos)
+        if mostrar:
+            from PySide6.QtGui import QTextCursor
+
+            cursor = QTextCursor(self.texto_plantilla.document())
+            cursor.setPosition(rangos[0][0])
+            rect = self.texto_plantilla.cursorRect(cursor)
+            visible = self.texto_plantilla.viewport().rect()
+            if not visible.contains(rect):
+                sb = self.texto_plantilla.verticalScrollBar()
+                sb.setValue(sb.value() + rect.top() - visible.height() // 3)
 
         self._clear_highlight_timer.start(3000)
 
     def _clear_highlight(self) -> None:
-        """Quita el resaltado preservando la posición de scroll."""
-        from PySide6.QtGui import QTextCursor, QTextCharFormat, QBrush
-
-        sb = self.texto_plantilla.verticalScrollBar()
-        pos = sb.value()
-
-        cursor = QTextCursor(self.texto_plantilla.document())
-        fmt_clear = QTextCharFormat()
-        fmt_clear.setBackground(QBrush(Qt.transparent))
-        cursor.select(QTextCursor.Document)
-        cursor.mergeCharFormat(fmt_clear)
-
-        sb.setValue(pos)
+        """Quita el resaltado (el documento y el scroll quedan como estaban)."""
+        self._clear_highlight_timer.stop()
+        self._resaltado_hilo.cancelar()
+        self.texto_plantilla.setExtraSelections([])
 
     def editar_cargo_juez(self):
         """Permite elegir cargo (juez/vocal) y sexo."""
@@ -1036,33 +1139,16 @@ class SentenciaWidget(QWidget):
 
     @staticmethod
     def html_a_plano(html: str, mantener_saltos: bool = True) -> str:
-        if not html:
-            return ""
-
-        doc = QTextDocument()
-        doc.setHtml(html)
-        texto = doc.toPlainText()
-
-        # → equivale a &nbsp; y &nbsp; finos (202F)
-        texto = texto.replace("\u00a0", " ").replace("\u202f", " ")
-
-        if not mantener_saltos:
-            texto = texto.replace("\n", " ")
+        return _html_a_plano(html, mantener_saltos).strip()
 
-        return texto.strip()
-
-    def install_focus_highlight(self, widget, text_getter):
-        """Destaca la sección correspondiente al obtener foco."""
+    def install_focus_highlight(self, widget, clave: str):
+        """Destaca el ancla ``clave`` (``"edit_sala"``…) cuando ``widget`` toma foco."""
         widget.installEventFilter(self)
-        self._focus_highlight_map[widget] = text_getter
+        self._focus_highlight_map[widget] = clave
 
     def eventFilter(self, obj, event):
         if event.type() == QEvent.FocusIn and obj in self._focus_highlight_map:
-            try:
-                text = self._focus_highlight_map[obj]()
-            except Exception:
-                text = ""
-            self._highlight_section_text(text)
+            self._highlight_anchor(self._focus_highlight_map[obj], mostrar=True)
         return super().eventFilter(obj, event)
 
     def _rich_text_dialog_italic_only(self, title: str, initial_html: str, on_accept):
@@ -1085,7 +1171,7 @@ class SentenciaWidget(QWidget):
 
         def _on_ok():
             raw = editor.toHtml()
-            clean = _sanitize_html_italic_only(raw)
+            clean = sanitizar(raw, "cursiva")
             on_accept(clean)
             clean = html.unescape(clean)
             dlg.accept()
@@ -1101,7 +1187,7 @@ class SentenciaWidget(QWidget):
         • Acepta pegar desde Word/web conservando <b>/<i>/<u>.
         • Muestra Times New Roman 12 pt mientras editás.
         • Tiene botón/atajo Ctrl+B para alternar negrita.
-        • Al aceptar ➜ limpia HTML con _sanitize_html(...) y lo
+        • Al aceptar ➜ limpia HTML con sanitizar(...) y lo
             entrega al callback.
         """
         dlg = QDialog(self)
@@ -1147,7 +1233,7 @@ class SentenciaWidget(QWidget):
         # Cuando aprietan OK…
         def _on_ok():
             raw_html = editor.toHtml()
-            clean = _sanitize_html(raw_html)
+            clean = sanitizar(raw_html)
             clean = html.unescape(clean)
             # devolvemos HTML *limpio* al método que llamó
             on_accept_callback(clean)
@@ -1168,7 +1254,7 @@ class SentenciaWidget(QWidget):
             html_inicial,
             lambda html_limpio: (
                 qle.setProperty("html", html_limpio),
-                qle.setText(QTextDocument(html_limpio).toPlainText().replace("\n", " ")),
+                qle.setText(html_en_linea(html_limpio)),
                 self.actualizar_plantilla(),
             ),
         )
@@ -1208,7 +1294,7 @@ class SentenciaWidget(QWidget):
             return html.unescape(raw_html).strip()
 
         def _on_ok():
-            clean_html = _sanitize_html(editor.toHtml())  # tu sanitizador normal
+            clean_html = sanitizar(editor.toHtml())  # tu sanitizador normal
             clean_html = _remove_bold(clean_html)  # …pero sin negrita
             on_accept(clean_html)
             dlg.accept()
@@ -1229,13 +1315,15 @@ class SentenciaWidget(QWidget):
         from PySide6.QtWidgets import QApplication
         from PySide6.QtGui import QClipboard
 
+        if te is self.texto_plantilla:
+            self.flush_plantilla()
+
         # ---------- 1) texto sin formato --------------------------------------
         plain_text = te.toPlainText().strip()
 
         # ---------- 2) HTML limpio + CSS Times 12 -----------------------------
+        # (los tamaños en línea se van con los estilos, en el sanitizador)
         basic_html = te.toHtml()
-        # quitamos tamaños en línea para aplicar el nuestro
-        basic_html = re.sub(r'font-size\s*:[^;"]+;?', "", basic_html, flags=re.I)
         # forzamos que cada párrafo venga con align="justify"
         basic_html = re.sub(r"<p\b", '<p align="justify"', basic_html, flags=re.I)
 
@@ -1253,7 +1341,7 @@ class SentenciaWidget(QWidget):
             )
 
         # removemos estilos y anclas para evitar copiar resaltados
-        basic_html = _sanitize_html(basic_html)
+        basic_html = sanitizar(basic_html)
 
         html_full = (
             "<!DOCTYPE html><html><head><meta charset='UTF-8'>"
@@ -1288,54 +1376,18 @@ class SentenciaWidget(QWidget):
 
     def _flatten_inline(self, html_raw: str) -> str:
         """
-        Convierte un blo-HTML en inline-HTML:
-
-        • quita <p>, </p>, <div>, </div>, <br>
-        • elimina separadores U+2028/U+2029, NBSP, \\r, \\n
-        • colapsa espacios consecutivos
+        Convierte un blo-HTML en inline-HTML: sin <p>, <div> ni <br>, sin
+        saltos ocultos ni NBSP y con los espacios colapsados.
         """
-        import re, html
-
-        # print(repr(html_raw))
-        # A) fuera <p>, </p>, <div>, </div>
-        h = re.sub(r"</?p[^>]*>", " ", html_raw, flags=re.I)
-        h = re.sub(r"</?div[^>]*>", " ", h, flags=re.I)
+        return sanitizar(html_raw, "en_linea")
 
-        # B) fuera <br> y variantes
-        h = re.sub(r"(?i)<br\s*/?>", " ", h)
-
-        # C) fuera saltos ocultos y nbsp
-        h = re.sub(r"(\r\n|\r|\n|&#10;|&#13;|\u2028|\u2029|&nbsp;)", " ", h)
-
-        # D) compactar espacios
-        h = re.sub(r"\s+", " ", h).strip()
-
-        return html.unescape(h)
-    
     @staticmethod
     def _inline_with_paragraphs(html_raw: str) -> str:
         """
         Convierte un bloque HTML a inline conservando los saltos de párrafo
         como dos <br>. Mantiene <b>, <i> y <u>.
         """
-        import re, html
-
-        # A) Abrir párrafos fuera
-        html_raw = re.sub(r"(?i)<p[^>]*>", "", html_raw)
-        # B) Cerrar párrafos → <br><br>
-        html_raw = re.sub(r"(?i)</p>", "<br><br>", html_raw)
-
-        # C) Fuera <div> y <br> sueltos
-        html_raw = re.sub(r"(?i)</?div[^>]*>", "", html_raw)
-        html_raw = re.sub(r"(?i)<br\s*/?>", "<br>", html_raw)
-
-        # D) Limpieza de saltos invisibles y nbsp
-        html_raw = re.sub(r"(\r\n|\r|\n|&#10;|&#13;|\u2028|\u2029|&nbsp;)", " ", html_raw)
-
-        # E) Colapsar espacios
-        html_raw = re.sub(r"\s+", " ", html_raw).strip()
-
-        return html.unescape(html_raw)
+        return sanitizar(html_raw, "parrafos")
 
     def abrir_ventana_alegato_fiscal(self):
         self._rich_text_dialog(
@@ -1401,7 +1453,7 @@ class SentenciaWidget(QWidget):
         """Guarda ``html`` tal cual, generando un preview plano en el ``QLineEdit``."""
         h = html.strip()
         qlineedit.setProperty("html", h)
-        qlineedit.setText(QTextDocument(h).toPlainText().replace("\n", " "))
+        qlineedit.setText(html_en_linea(h))
         self.actualizar_plantilla()
 
     def abrir_ventana_descripcion(self, idx):
@@ -1465,7 +1517,7 @@ class SentenciaWidget(QWidget):
 
         def _on_accept(h: str):
             self._guardar_html_lineedit(qle, h)
-            has_text = bool(QTextDocument(h).toPlainText().strip())
+            has_text = bool(html_a_texto(h).strip())
             if has_text:
                 rb_si.setChecked(True)
             else:
@@ -1519,27 +1571,19 @@ class SentenciaWidget(QWidget):
             self._guardar_restriccion,
         )
 
-    from PySide6.QtGui import QTextDocument
-
     def _guardar_decomiso(self, html_limpio: str):
         clean = html_limpio.strip()
         # 1) guardo HTML completo
         self.var_decomiso_text.setProperty("html", clean)
         # 2) genero preview plano en el QLineEdit
-        doc = QTextDocument()
-        doc.setHtml(clean)
-        preview = doc.toPlainText().replace("\n", " ")
-        self.var_decomiso_text.setText(preview)
+        self.var_decomiso_text.setText(html_en_linea(clean))
         # 3) refresco la plantilla
         self.actualizar_plantilla()
 
     def _guardar_restriccion(self, html_limpio: str):
         clean = html_limpio.strip()
         self.var_restriccion_text.setProperty("html", clean)
-        doc = QTextDocument()
-        doc.setHtml(clean)
-        preview = doc.toPlainText().replace("\n", " ")
-        self.var_restriccion_text.setText(preview)
+        self.var_restriccion_text.setText(html_en_linea(clean))
         self.actualizar_plantilla()
 
     TEXTO_RESTRICCION_DEFECTO = (
@@ -1589,11 +1633,7 @@ class SentenciaWidget(QWidget):
         self.var_resuelvo.setProperty("html", clean)
 
         # 2) genero un preview de 0‒200 c (solo texto)
-        from PySide6.QtGui import QTextDocument
-
-        doc = QTextDocument()
-        doc.setHtml(clean)
-        preview = doc.toPlainText().replace("\n", " ")
+        preview = html_en_linea(clean)
         self.var_resuelvo.setText(preview)
 
         # 3) ***ACTUALIZO el modelo compartido***
@@ -1700,6 +1740,10 @@ class SentenciaWidget(QWidget):
         opt.setAlignment(Qt.AlignJustify)
         self.texto_plantilla.document().setDefaultTextOption(opt)
         self.texto_plantilla.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        # la sentencia se actualiza por bloques, sección por sección
+        self._documento = DocumentoEnBloques(
+            self.texto_plantilla, '<div style="text-align: justify;">', "</div>"
+        )
 
         right_layout = QVBoxLayout()
 
@@ -1717,6 +1761,8 @@ class SentenciaWidget(QWidget):
         self._clear_highlight_timer = QTimer(self)
         self._clear_highlight_timer.setSingleShot(True)
         self._clear_highlight_timer.timeout.connect(self._clear_highlight)
+        self._resaltado_hilo = CalculoEnHilo(RESALTADO_MAX_CARACTERES, self)
+        self._resaltado_hilo.listo.connect(self._mostrar_resaltado)
 
         # 3) El editor
         right_layout.addWidget(self.texto_plantilla)
@@ -1914,8 +1960,8 @@ class SentenciaWidget(QWidget):
         from PySide6.QtWidgets import QFileDialog, QMessageBox
 
         # 1) HTML en el mismo formato que usa "Copiar sentencia"
+        self.flush_plantilla()
         basic_html = self.texto_plantilla.toHtml()
-        basic_html = re.sub(r"font-size\s*:[^;\"]+;?", "", basic_html, flags=re.I)
         basic_html = re.sub(r"<p\b", '<p align="justify"', basic_html, flags=re.I)
 
         # Reemplazamos el ancla de «resuelvo» por su HTML real para conservar
@@ -1931,8 +1977,8 @@ class SentenciaWidget(QWidget):
                 flags=re.I | re.S,
             )
 
-        # Pasamos por _sanitize_html para quitar spans/estilos extra
-        raw_html = _sanitize_html(basic_html)
+        # Pasamos por el sanitizador para quitar spans/estilos extra
+        raw_html = sanitizar(basic_html)
         # ───── PARCHE: asegurar apertura de <p> ─────
         if not re.match(r"\s*<p\b", raw_html, flags=re.I):
             m = re.search(r"</p>", raw_html, flags=re.I)
@@ -2075,160 +2121,164 @@ class SentenciaWidget(QWidget):
         self.btn_toggle_extra.setText(f"{arrow} Otras opciones")
 
     def _on_anchor_clicked(self, url):
-        href = url.toString()
-
-        rich_map = {
-            "alegato_fiscal": self.abrir_ventana_alegato_fiscal,
-            "alegato_defensa": self.abrir_ventana_alegato_defensa,
-            "prueba": self.abrir_ventana_prueba,
-            "pruebas_importantes": self.abrir_ventana_pruebas_importantes,
-            "decomiso": self.abrir_ventana_decomiso,
-            "restriccion": self.abrir_ventana_restriccion,
-            "resuelvo": self.abrir_ventana_resuelvo,
-        }
-        if href in rich_map:
-            rich_map[href]()
+        ancla = ANCLAS.ancla(url.toString())
+        if ancla is None:
             return
+        # todas las apariciones del dato que se va a editar
+        self._highlight_anchor(ancla.clave)
+
+        if self._editores_ancla is None:
+            self._editores_ancla = self._armar_editores_ancla()
+        editor = self._editores_ancla.get((ancla.grupo, ancla.campo))
+        if editor is None and ancla.grupo:
+            editor = self._editar_campo_suelto
+        if editor is not None:
+            editor(ancla)
+            # cada edición desde un ancla es un paso propio del historial
+            self.data.from_sentencia(self)
+
+    def _deshacer_causa(self, rehacer: bool = False) -> None:
+        """Deshace (o rehace) el último paso de la causa y lo refleja acá.
+
+        Lo editado en esta pantalla llega al modelo recién con
+        ``from_sentencia``: se vuelca antes, así entra como el último paso.
+        """
+        self.data.from_sentencia(self)
+        hist = historial.de(self.data)
+        if hist.rehacer() if rehacer else hist.deshacer():
+            self.data.apply_to_sentencia(self)
+            self.actualizar_plantilla()
 
-        if href == "edit_cargo_juez":
-            self.editar_cargo_juez()
-            return
+    def _armar_editores_ancla(self) -> dict:
+        """(grupo, campo) → función que recibe el ``Ancla`` y abre su editor."""
 
-        if href == "edit_fiscal":
-            dlg = NombreSexoDialog(
-                self.var_fiscal.text(),
-                self.combo_fiscal_sexo.currentText(),
-                "Editar fiscal",
-                self,
-            )
-            if dlg.exec():
-                nombre, sexo = dlg.values()
-                self.var_fiscal.setText(nombre)
-                self.combo_fiscal_sexo.setCurrentText(sexo)
-                self.actualizar_plantilla()
-            return
+        def ventana(abrir):
+            return lambda ancla: abrir()
 
-        edit_map = {
-            "edit_localidad": (self.var_localidad.text, self.var_localidad.setText, "Localidad"),
-            "edit_fecha_audiencia": (self.var_dia_audiencia.text, self.var_dia_audiencia.setText, "Fecha de audiencia"),
-            "edit_caratula": (self.var_caratula.text, self.var_caratula.setText, "Carátula"),
-            "edit_tribunal": (self.var_tribunal.currentText, self.var_tribunal.setCurrentText, "Tribunal"),
-            "edit_sala": (self.var_sala.currentText, self.var_sala.setCurrentText, "Sala"),
-            "edit_juez": (self.var_juez.text, self.var_juez.setText, "Juez/jueza"),
-        }
+        def ventana_indice(abrir):
+            return lambda ancla: abrir(ancla.indice)
 
-        if href in edit_map:
-            getter, setter, prompt = edit_map[href]
-            if href == "edit_sala":
-                current = getter()
-                try:
-                    idx = SALAS_OPCIONES.index(current)
-                except ValueError:
-                    idx = 0
-                text, ok = QInputDialog.getItem(
-                    self,
-                    prompt,
-                    prompt,
-                    SALAS_OPCIONES,
-                    idx,
-                    True,
-                )
-            elif href == "edit_tribunal":
-                current = getter()
+        def texto(getter, setter, prompt):
+            def editar(ancla):
+                text, ok = QInputDialog.getText(self, prompt, prompt, text=getter())
+                if ok:
+                    setter(text.strip())
+                    self.actualizar_plantilla()
+            return editar
+
+        def lista(getter, setter, prompt, opciones):
+            def editar(ancla):
                 try:
-                    idx = TRIBUNALES.index(current)
+                    idx = opciones.index(getter())
                 except ValueError:
                     idx = 0
-                text, ok = QInputDialog.getItem(
-                    self,
-                    prompt,
-                    prompt,
-                    TRIBUNALES,
-                    idx,
-                    True,
-                )
-            else:
-                text, ok = QInputDialog.getText(self, prompt, prompt, text=getter())
-            if ok:
-                setter(text.strip())
+                text, ok = QInputDialog.getItem(self, prompt, prompt, opciones, idx, True)
+                if ok:
+                    setter(text.strip())
+                    self.actualizar_plantilla()
+            return editar
+
+        return {
+            ("", "alegato_fiscal"): ventana(self.abrir_ventana_alegato_fiscal),
+            ("", "alegato_defensa"): ventana(self.abrir_ventana_alegato_defensa),
+            ("", "prueba"): ventana(self.abrir_ventana_prueba),
+            ("", "pruebas_importantes"): ventana(self.abrir_ventana_pruebas_importantes),
+            ("", "decomiso"): ventana(self.abrir_ventana_decomiso),
+            ("", "restriccion"): ventana(self.abrir_ventana_restriccion),
+            ("", "resuelvo"): ventana(self.abrir_ventana_resuelvo),
+            ("", "cargo_juez"): ventana(self.editar_cargo_juez),
+            ("", "fiscal"): self._editar_fiscal,
+            ("", "localidad"): texto(self.var_localidad.text, self.var_localidad.setText, "Localidad"),
+            ("", "fecha_audiencia"): texto(self.var_dia_audiencia.text, self.var_dia_audiencia.setText, "Fecha de audiencia"),
+            ("", "caratula"): texto(self.var_caratula.text, self.var_caratula.setText, "Carátula"),
+            ("", "tribunal"): lista(self.var_tribunal.currentText, self.var_tribunal.setCurrentText, "Tribunal", TRIBUNALES),
+            ("", "sala"): lista(self.var_sala.currentText, self.var_sala.setCurrentText, "Sala", SALAS_OPCIONES),
+            ("", "juez"): texto(self.var_juez.text, self.var_juez.setText, "Juez/jueza"),
+            ("imp", "datos"): ventana_indice(self.abrir_ventana_datos),
+            ("imp", "condiciones"): ventana_indice(self.abrir_ventana_condiciones),
+            ("imp", "pautas"): ventana_indice(self.abrir_ventana_pautas),
+            ("imp", "antecedentes"): ventana_indice(self.abrir_ventana_antecedentes),
+            ("imp", "confesion"): ventana_indice(self.abrir_ventana_confesion),
+            ("imp", "ultima"): ventana_indice(self.abrir_ventana_ultima_palabra),
+            ("imp", "defensor"): self._editar_defensor,
+            ("imp", "nombre"): self._editar_nombre_imputado,
+            ("hecho", "descripcion"): ventana_indice(self.abrir_ventana_descripcion),
+        }
+
+    def _editar_fiscal(self, ancla: Ancla) -> None:
+        dlg = NombreSexoDialog(
+            self.var_fiscal.text(),
+            self.combo_fiscal_sexo.currentText(),
+            "Editar fiscal",
+            self,
+        )
+        if dlg.exec():
+            nombre, sexo = dlg.values()
+            self.var_fiscal.setText(nombre)
+            self.combo_fiscal_sexo.setCurrentText(sexo)
+            self.actualizar_plantilla()
+
+    def _editar_defensor(self, ancla: Ancla) -> None:
+        idx = ancla.indice
+        if idx >= len(self.imputados):
+            return
+        le = self.imputados[idx].get("defensor")
+        cb = self.imputados[idx].get("tipo_def")
+        if le and cb:
+            dlg = DefensorDialog(
+                le.text(), cb.currentText(), f"Editar defensor #{idx+1}", self
+            )
+            if dlg.exec():
+                nombre, tipo = dlg.values()
+                le.setText(nombre)
+                cb.setCurrentText(tipo)
                 self.actualizar_plantilla()
+
+    def _editar_nombre_imputado(self, ancla: Ancla) -> None:
+        idx = ancla.indice
+        if idx >= len(self.imputados):
             return
+        le = self.imputados[idx].get("nombre")
+        cb = self.imputados[idx]["sexo_cb"]
+        if not le:
+            return
+        dlg = NombreSexoDialog(
+            le.text(),
+            cb.currentText(),
+            f"Editar imputado #{idx+1}",
+            self,
+        )
+        if dlg.exec():
+            nombre, sexo = dlg.values()
+            le.setText(nombre)
+            cb.setCurrentText(sexo)
+            self.actualizar_plantilla()
 
-        if href.startswith("edit_imp_"):
-            prefix, idx_str = href.rsplit("_", 1)
-            idx = int(idx_str)
-            field = prefix[len("edit_imp_") :]
-            if field == "datos":
-                self.abrir_ventana_datos(idx)
-                return
-            if field == "condiciones":
-                self.abrir_ventana_condiciones(idx)
-                return
-            if field == "pautas":
-                self.abrir_ventana_pautas(idx)
-                return
-            if field == "antecedentes":
-                self.abrir_ventana_antecedentes(idx)
-                return
-            if field == "confesion":
-                self.abrir_ventana_confesion(idx)
-                return
-            if field == "ultima":
-                self.abrir_ventana_ultima_palabra(idx)
-                return
-            if field == "defensor":
-                le = self.imputados[idx].get("defensor")
-                cb = self.imputados[idx].get("tipo_def")
-                if le and cb:
-                    dlg = DefensorDialog(
-                        le.text(), cb.currentText(), f"Editar defensor #{idx+1}", self
-                    )
-                    if dlg.exec():
-                        nombre, tipo = dlg.values()
-                        le.setText(nombre)
-                        cb.setCurrentText(tipo)
-                        self.actualizar_plantilla()
-                return
-            le = self.imputados[idx].get(field)
-            if field == "nombre" and le:
-                cb = self.imputados[idx]["sexo_cb"]
-                dlg = NombreSexoDialog(
-                    le.text(),
-                    cb.currentText(),
-                    f"Editar imputado #{idx+1}",
-                    self,
-                )
-                if dlg.exec():
-                    nombre, sexo = dlg.values()
-                    le.setText(nombre)
-                    cb.setCurrentText(sexo)
-                    self.actualizar_plantilla()
-                return
-            if le:
-                text, ok = QInputDialog.getText(
-                    self,
-                    field.capitalize(),
-                    field.capitalize(),
-                    text=le.text(),
-                )
-                if ok:
-                    le.setText(text.strip())
-                    self.actualizar_plantilla()
+    def _editar_campo_suelto(self, ancla: Ancla) -> None:
+        """Un campo de texto de un imputado o de un hecho."""
+        filas = self.imputados if ancla.grupo == "imp" else self.hechos
+        if ancla.indice >= len(filas):
             return
+        le = filas[ancla.indice].get(ancla.campo)
+        if le:
+            prompt = ancla.campo.capitalize()
+            text, ok = QInputDialog.getText(self, prompt, prompt, text=le.text())
+            if ok:
+                le.setText(text.strip())
+                self.actualizar_plantilla()
 
-        if href.startswith("edit_hecho_"):
-            prefix, idx_str = href.rsplit("_", 1)
-            idx = int(idx_str)
-            field = prefix[len("edit_hecho_") :]
-            if field == "descripcion":
-                self.abrir_ventana_descripcion(idx)
-                return
-            le = self.hechos[idx].get(field)
-            if le:
-                text, ok = QInputDialog.getText(self, field.capitalize(), field.capitalize(), text=le.text())
-                if ok:
-                    le.setText(text.strip())
-                    self.actualizar_plantilla()
+    def tramos_editables(self) -> list[tuple[Ancla, int, int]]:
+        """Cada dato editable de la plantilla con su tramo ``(inicio, fin)``.
+
+        Ordenados por posición; para paneles de búsqueda, validaciones, etc.
+        """
+        tramos = []
+        for href, rangos in self._documento.anclas().items():
+            ancla = ANCLAS.ancla(href)
+            if ancla is not None:
+                tramos.extend((ancla, inicio, fin) for inicio, fin in rangos)
+        tramos.sort(key=lambda t: t[1])
+        return tramos
 
     def add_row(self, row, label_text, widget):
         lbl = QLabel(label_text)
@@ -2257,451 +2307,570 @@ class SentenciaWidget(QWidget):
         self.data.apply_to_sentencia(self)
 
     def update_imputados_section(self):
-        n = self.var_num_imputados.value()
-        while len(self.imputados) > n:
-            w = self.imputados.pop()
-            w["container"].deleteLater()
-        while len(self.imputados) < n:
-            idx = len(self.imputados) + 1
-            container = QWidget()
-            layout = QGridLayout(container)
-            layout.setVerticalSpacing(1)
-            layout.setVerticalSpacing(1)
-            lbl_nombre = QLabel(f"Imputado/a #{idx} - Nombre:")
-            le_nombre = QLineEdit()
-            layout.addWidget(lbl_nombre, 0, 0)
-            layout.addWidget(le_nombre, 0, 1, 1, 3)
-            le_nombre.textChanged.connect(
-                lambda txt, i=idx - 1: self._sync_imp(i, "nombre", txt)
-            )
-            lbl_sexo = QLabel("Sexo:")
-            combo_sexo = NoWheelComboBox()
-            combo_sexo.addItems(["M", "F"])
-            combo_sexo.setCurrentText(
-                self.data.imputados[idx - 1].get("sexo", "M")
-                if idx - 1 < len(self.data.imputados)
-                else "M"
-            )
-            layout.addWidget(lbl_sexo, 1, 0)
-            layout.addWidget(combo_sexo, 1, 1)
-            lbl_datos = QLabel("Datos personales:")
-            le_datos = QLineEdit()
-            btn_datos = QPushButton("Editar datos personales")
-            btn_datos.clicked.connect(partial(self.abrir_ventana_datos, idx - 1))
-            layout.addWidget(lbl_datos, 2, 0)
-            layout.addWidget(btn_datos, 2, 1, 1, 3)
-            le_datos.textChanged.connect(
-                lambda txt, i=idx - 1: self._sync_imp(i, "datos", txt)
-            )
-            lbl_defensor = QLabel("Defensor (nombre):")
-            le_defensor = QLineEdit()
-            layout.addWidget(lbl_defensor, 3, 0)
-            layout.addWidget(le_defensor, 3, 1, 1, 3)
-            le_defensor.textChanged.connect(
-                lambda txt, i=idx - 1: self._sync_imp(i, "defensa", txt)
-            )
-            lbl_tipo_def = QLabel("Tipo de Defensor:")
-            cb_tipo_def = NoWheelComboBox()
-            cb_tipo_def.addItems(["Público", "Privado"])
-            layout.addWidget(lbl_tipo_def, 4, 0)
-            layout.addWidget(cb_tipo_def, 4, 1)
-
-            lbl_delitos = QLabel("Delitos (con sus artículos):")
-            le_delitos = QLineEdit()
-            layout.addWidget(lbl_delitos, 6, 0)
-            layout.addWidget(le_delitos, 6, 1, 1, 3)
-            le_delitos.textChanged.connect(
-                lambda txt, i=idx - 1: self._sync_imp(i, "delitos", txt)
-            )
-            lbl_condena = QLabel("Condena:")
-            le_condena = QLineEdit()
-            layout.addWidget(lbl_condena, 7, 0)
-            layout.addWidget(le_condena, 7, 1, 1, 3)
-            le_condena.textChanged.connect(
-                lambda txt, i=idx - 1: self._sync_imp(i, "condena", txt)
-            )
-            lbl_cond = QLabel("Datos personales agregados:")
-            btn_cond = QPushButton("Editar datos agregados")
-            btn_cond.clicked.connect(partial(self.abrir_ventana_condiciones, idx - 1))
-            le_cond = QLineEdit()
-            layout.addWidget(lbl_cond, 8, 0)
-            # botón en columna 1, colspan=2
-            layout.addWidget(btn_cond, 8, 1, 1, 3)
-            lbl_ant = QLabel("¿Antecedentes penales?")
-            rb_ant_no = QRadioButton("No registra")
-            rb_ant_si = QRadioButton("Registra")
-            rb_ant_no.setChecked(True)
-            grupo_ant = QButtonGroup(container)
-            grupo_ant.addButton(rb_ant_no)
-            grupo_ant.addButton(rb_ant_si)
-            layout.addWidget(lbl_ant, 9, 0)
-            layout.addWidget(rb_ant_no, 9, 1)
-            layout.addWidget(rb_ant_si, 9, 2)
-            lbl_ant_text = QLabel("Antecedentes:")
-            le_ant = QLineEdit()
-            btn_ant = QPushButton("Editar antecedentes")
-            btn_ant.setEnabled(False)
-            rb_ant_si.toggled.connect(
-                lambda checked, w=le_ant, b=btn_ant: (
-                    w.setEnabled(checked),
-                    b.setEnabled(checked),
-                )
-            )
-            btn_ant.clicked.connect(partial(self.abrir_ventana_antecedentes, idx - 1))
-            layout.addWidget(lbl_ant_text, 10, 0)
-            layout.addWidget(btn_ant, 10, 1, 1, 3)
-
-            lbl_confesion = QLabel("Confesión:")
-            le_confesion = QLineEdit()
-            btn_confesion = QPushButton("Editar confesión")
-            btn_confesion.clicked.connect(
-                partial(self.abrir_ventana_confesion, idx - 1)
-            )
-            layout.addWidget(lbl_confesion, 11, 0)
-            layout.addWidget(btn_confesion, 11, 1, 1, 3)
-
-            lbl_ultima = QLabel("Última palabra:")
-            le_ultima = QLineEdit()
-            btn_ultima = QPushButton("Editar última palabra")
-            btn_ultima.clicked.connect(
-                partial(self.abrir_ventana_ultima_palabra, idx - 1)
-            )
-            layout.addWidget(lbl_ultima, 12, 0)
-            layout.addWidget(btn_ultima, 12, 1, 1, 3)
-            lbl_pautas = QLabel("Pautas de mensuración:")
-            le_pautas = QLineEdit()
-            btn_pautas = QPushButton("Añadir pautas de mensuración")
-
-            # Hacemos que abra el diálogo rico sobre el QLineEdit de pautas:
-            btn_pautas.clicked.connect(partial(self.abrir_ventana_pautas, idx - 1))
-
-            # Cuando el usuario edite el QLineEdit, refrescamos la plantilla:
-            le_pautas.textChanged.connect(self.actualizar_plantilla)
-
-            # Lo agregamos al layout, igual que 'datos' y 'condiciones':
-            layout.addWidget(lbl_pautas, 13, 0)
-            layout.addWidget(btn_pautas, 13, 1, 1, 3)
-
-            if idx - 1 < len(self.data.imputados):
-                dprev = self.data.imputados[idx - 1]
-                le_nombre.setText(dprev.get("nombre", ""))
-                le_datos.setText(dprev.get("datos", ""))
-                le_cond.setText(dprev.get("condiciones", ""))
-                le_defensor.setText(dprev.get("defensa", ""))
-                le_condena.setText(dprev.get("condena", ""))
-                le_delitos.setText(dprev.get("delitos", ""))
-                le_pautas.setText(dprev.get("pautas", ""))
-
-            container.setLayout(layout)
-            self.imputados_layout.addWidget(container)
-            for w in [
-                le_nombre,
-                le_datos,
-                le_defensor,
-                le_delitos,
-                le_condena,
-                le_cond,
-                le_ant,
-                le_confesion,
-                le_ultima,
-                le_pautas,
-            ]:
-                w.textChanged.connect(self.actualizar_plantilla)
-            for w in [rb_ant_no, rb_ant_si]:
-                w.toggled.connect(self.actualizar_plantilla)
-            combo_sexo.currentTextChanged.connect(self.actualizar_plantilla)
-            for w in [cb_tipo_def]:
-                w.currentTextChanged.connect(self.actualizar_plantilla)
-
-            self.imputados.append(
-                {
-                    "container": container,
-                    "nombre": le_nombre,
-                    "sexo_cb": combo_sexo,
-                    "datos": le_datos,
-                    "defensor": le_defensor,
-                    "tipo_def": cb_tipo_def,
-                    "delitos": le_delitos,
-                    "condena": le_condena,
-                    "condiciones": le_cond,
-                    "antecedentes_opcion": (rb_ant_no, rb_ant_si),
-                    "antecedentes": le_ant,
-                    "confesion": le_confesion,
-                    "ultima": le_ultima,
-                    "pautas": le_pautas,
-                }
-            )
+        """Ajusta las secciones de imputados al spinbox tocando sólo la diferencia.
+
+        Las que sobran se guardan en el pool del reconciliador y, si la
+        cantidad vuelve a crecer, se reusan ya limpias en la misma posición.
+        """
+        agregados, _ = self._secciones_imp.reconciliar(self.var_num_imputados.value())
+        self.imputados = [sec.widgets for sec in self._secciones_imp.secciones]
+        for i in agregados:
+            if i < len(self.data.imputados):
+                self._cargar_imputado(self.imputados[i], self.data.imputados[i])
         if (
             len(self.hechos) >= self.var_num_hechos.value()
         ):  # ya está lista la sección Hechos
             self.actualizar_plantilla()
 
-    def update_hechos_section(self):
-        n = self.var_num_hechos.value()
-        while len(self.hechos) > n:
-            w = self.hechos.pop()
-            w["container"].deleteLater()
-        # ——— Aquí creas los nuevos hechos ———
-        while len(self.hechos) < n:
-            idx = len(self.hechos)  # índice 0-based
-            container = QWidget()
-            layout = QGridLayout(container)
-
-            lbl_desc = QLabel(f"Descripción del suceso #{idx+1}:")
-            layout.addWidget(lbl_desc, 0, 0)
-            le_desc = QLineEdit()
-            # quitamos el le_desc completamente
-
-            btn_desc = QPushButton("Redactar el hecho")
-            btn_desc.clicked.connect(partial(self.abrir_ventana_descripcion, idx))
-            # Para que expanda en horizontal hasta llenar el espacio
-            btn_desc.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-            # Ahora abarca desde la columna 1 y ocupa 3 columnas (igual que tus QLineEdit con colspan=3)
-            layout.addWidget(btn_desc, 0, 1, 1, 1)
-
-            lbl_aclar = QLabel(f"Aclaraciones hecho #{idx}:")
-            le_aclar = QLineEdit()
-            layout.addWidget(lbl_aclar, 1, 0)
-            layout.addWidget(le_aclar, 1, 1, 1, 1)
-            next_row = 2
-            lbl_ofi = QLabel("Oficina que elevó:")
-            le_ofi = QLineEdit()
-            rb_j = QRadioButton("Juzgado")
-            rb_f = QRadioButton("Fiscalía")
-            rb_j.setChecked(True)
-            grupo_ofi = QButtonGroup(container)
-            grupo_ofi.addButton(rb_j)
-            grupo_ofi.addButton(rb_f)
-            layout.addWidget(lbl_ofi, next_row, 0)
-            layout.addWidget(le_ofi, next_row, 1)
-            layout.addWidget(rb_j, next_row, 2)
-            layout.addWidget(rb_f, next_row, 3)
-            next_row += 1
-            lbl_auto = QLabel("N° del auto:")
-            le_auto = QLineEdit()
-            layout.addWidget(lbl_auto, next_row, 0)
-            layout.addWidget(le_auto, next_row, 1, 1, 1)
-
-            next_row += 1
-            lbl_fec = QLabel("Fecha de elevación:")
-            le_fec = QLineEdit()
-            layout.addWidget(lbl_fec, next_row, 0)
-            layout.addWidget(le_fec, next_row, 1, 1, 1)
-
-            container.setLayout(layout)
-            self.hechos_layout.addWidget(container)
-            for w in [le_desc, le_aclar, le_ofi, le_auto, le_fec]:
-                w.textChanged.connect(self.actualizar_plantilla)
-            for w in [rb_j, rb_f]:
-                w.toggled.connect(self.actualizar_plantilla)
-
-            self.hechos.append(
-                {
-                    "container": container,
-                    "descripcion": le_desc,
-                    "aclaraciones": le_aclar,
-                    "oficina": le_ofi,
-                    "rb_j": rb_j,
-                    "rb_f": rb_f,
-                    "num_auto": le_auto,
-                    "fecha_elev": le_fec,
-                }
+    def _crear_seccion_imputado(self, i: int) -> Seccion:
+        """Arma (sin montar) la sección del imputado ``i`` (0-based)."""
+        idx = i + 1
+        container = QWidget()
+        layout = QGridLayout(container)
+        layout.setVerticalSpacing(1)
+        layout.setVerticalSpacing(1)
+        lbl_nombre = QLabel(f"Imputado/a #{idx} - Nombre:")
+        le_nombre = QLineEdit()
+        layout.addWidget(lbl_nombre, 0, 0)
+        layout.addWidget(le_nombre, 0, 1, 1, 3)
+        le_nombre.textChanged.connect(
+            lambda txt, i=idx - 1: self._sync_imp(i, "nombre", txt)
+        )
+        lbl_sexo = QLabel("Sexo:")
+        combo_sexo = NoWheelComboBox()
+        combo_sexo.addItems(["M", "F"])
+        layout.addWidget(lbl_sexo, 1, 0)
+        layout.addWidget(combo_sexo, 1, 1)
+        lbl_datos = QLabel("Datos personales:")
+        le_datos = QLineEdit()
+        btn_datos = QPushButton("Editar datos personales")
+        btn_datos.clicked.connect(partial(self.abrir_ventana_datos, idx - 1))
+        layout.addWidget(lbl_datos, 2, 0)
+        layout.addWidget(btn_datos, 2, 1, 1, 3)
+        le_datos.textChanged.connect(
+            lambda txt, i=idx - 1: self._sync_imp(i, "datos", txt)
+        )
+        lbl_defensor = QLabel("Defensor (nombre):")
+        le_defensor = QLineEdit()
+        layout.addWidget(lbl_defensor, 3, 0)
+        layout.addWidget(le_defensor, 3, 1, 1, 3)
+        le_defensor.textChanged.connect(
+            lambda txt, i=idx - 1: self._sync_imp(i, "defensa", txt)
+        )
+        lbl_tipo_def = QLabel("Tipo de Defensor:")
+        cb_tipo_def = NoWheelComboBox()
+        cb_tipo_def.addItems(["Público", "Privado"])
+        layout.addWidget(lbl_tipo_def, 4, 0)
+        layout.addWidget(cb_tipo_def, 4, 1)
+
+        lbl_delitos = QLabel("Delitos (con sus artículos):")
+        le_delitos = QLineEdit()
+        layout.addWidget(lbl_delitos, 6, 0)
+        layout.addWidget(le_delitos, 6, 1, 1, 3)
+        le_delitos.textChanged.connect(
+            lambda txt, i=idx - 1: self._sync_imp(i, "delitos", txt)
+        )
+        lbl_condena = QLabel("Condena:")
+        le_condena = QLineEdit()
+        layout.addWidget(lbl_condena, 7, 0)
+        layout.addWidget(le_condena, 7, 1, 1, 3)
+        le_condena.textChanged.connect(
+            lambda txt, i=idx - 1: self._sync_imp(i, "condena", txt)
+        )
+        lbl_cond = QLabel("Datos personales agregados:")
+        btn_cond = QPushButton("Editar datos agregados")
+        btn_cond.clicked.connect(partial(self.abrir_ventana_condiciones, idx - 1))
+        le_cond = QLineEdit()
+        layout.addWidget(lbl_cond, 8, 0)
+        # botón en columna 1, colspan=2
+        layout.addWidget(btn_cond, 8, 1, 1, 3)
+        lbl_ant = QLabel("¿Antecedentes penales?")
+        rb_ant_no = QRadioButton("No registra")
+        rb_ant_si = QRadioButton("Registra")
+        rb_ant_no.setChecked(True)
+        grupo_ant = QButtonGroup(container)
+        grupo_ant.addButton(rb_ant_no)
+        grupo_ant.addButton(rb_ant_si)
+        layout.addWidget(lbl_ant, 9, 0)
+        layout.addWidget(rb_ant_no, 9, 1)
+        layout.addWidget(rb_ant_si, 9, 2)
+        lbl_ant_text = QLabel("Antecedentes:")
+        le_ant = QLineEdit()
+        btn_ant = QPushButton("Editar antecedentes")
+        btn_ant.setEnabled(False)
+        rb_ant_si.toggled.connect(
+            lambda checked, w=le_ant, b=btn_ant: (
+                w.setEnabled(checked),
+                b.setEnabled(checked),
             )
+        )
+        btn_ant.clicked.connect(partial(self.abrir_ventana_antecedentes, idx - 1))
+        layout.addWidget(lbl_ant_text, 10, 0)
+        layout.addWidget(btn_ant, 10, 1, 1, 3)
+
+        lbl_confesion = QLabel("Confesión:")
+        le_confesion = QLineEdit()
+        btn_confesion = QPushButton("Editar confesión")
+        btn_confesion.clicked.connect(
+            partial(self.abrir_ventana_confesion, idx - 1)
+        )
+        layout.addWidget(lbl_confesion, 11, 0)
+        layout.addWidget(btn_confesion, 11, 1, 1, 3)
+
+        lbl_ultima = QLabel("Última palabra:")
+        le_ultima = QLineEdit()
+        btn_ultima = QPushButton("Editar última palabra")
+        btn_ultima.clicked.connect(
+            partial(self.abrir_ventana_ultima_palabra, idx - 1)
+        )
+        layout.addWidget(lbl_ultima, 12, 0)
+        layout.addWidget(btn_ultima, 12, 1, 1, 3)
+        lbl_pautas = QLabel("Pautas de mensuración:")
+        le_pautas = QLineEdit()
+        btn_pautas = QPushButton("Añadir pautas de mensuración")
+
+        # Hacemos que abra el diálogo rico sobre el QLineEdit de pautas:
+        btn_pautas.clicked.connect(partial(self.abrir_ventana_pautas, idx - 1))
+
+        # Cuando el usuario edite el QLineEdit, refrescamos la plantilla:
+        le_pautas.textChanged.connect(self.actualizar_plantilla)
+
+        # Lo agregamos al layout, igual que 'datos' y 'condiciones':
+        layout.addWidget(lbl_pautas, 13, 0)
+        layout.addWidget(btn_pautas, 13, 1, 1, 3)
+
+        container.setLayout(layout)
+        for w in [
+            le_nombre,
+            le_datos,
+            le_defensor,
+            le_delitos,
+            le_condena,
+            le_cond,
+            le_ant,
+            le_confesion,
+            le_ultima,
+            le_pautas,
+        ]:
+            w.textChanged.connect(self.actualizar_plantilla)
+        for w in [rb_ant_no, rb_ant_si]:
+            w.toggled.connect(self.actualizar_plantilla)
+        combo_sexo.currentTextChanged.connect(self.actualizar_plantilla)
+        for w in [cb_tipo_def]:
+            w.currentTextChanged.connect(self.actualizar_plantilla)
+
+        # el resto de los campos también va directo al registro del modelo
+        for campo, w in [
+            ("sexo", combo_sexo),
+            ("tipo_def", cb_tipo_def),
+            ("condiciones", le_cond),
+            ("anteced", le_ant),
+            ("confesion", le_confesion),
+            ("ultima", le_ultima),
+            ("pautas", le_pautas),
+        ]:
+            senal = w.currentTextChanged if isinstance(w, QComboBox) else w.textChanged
+            senal.connect(lambda _, i=idx - 1, c=campo, w=w: self._sync_imp(i, c, leer_valor(w)))
+        rb_ant_no.toggled.connect(
+            lambda checked, i=idx - 1: self._sync_imp(i, "anteced_no", checked)
+        )
+
+        return Seccion(
+            container,
+            {
+                "container": container,
+                "nombre": le_nombre,
+                "sexo_cb": combo_sexo,
+                "datos": le_datos,
+                "defensor": le_defensor,
+                "tipo_def": cb_tipo_def,
+                "delitos": le_delitos,
+                "condena": le_condena,
+                "condiciones": le_cond,
+                "antecedentes_opcion": (rb_ant_no, rb_ant_si),
+                "antecedentes": le_ant,
+                "confesion": le_confesion,
+                "ultima": le_ultima,
+                "pautas": le_pautas,
+            },
+        )
+
+    @staticmethod
+    def _reiniciar_imputado(sec: Seccion):
+        w = sec.widgets
+        reiniciar_valores(
+            {k: v for k, v in w.items() if k not in ("container", "antecedentes_opcion")}
+        )
+        # sin bloquear: el toggled vuelve a deshabilitar "Editar antecedentes"
+        w["antecedentes_opcion"][0].setChecked(True)
+
+    @staticmethod
+    def _cargar_imputado(w: dict, imp: Imputado):
+        """Vuelca al reusar/crear la sección lo que el modelo ya tenía."""
+        bloqueos = [
+            QSignalBlocker(v) for k, v in w.items()
+            if k != "container" and isinstance(v, QWidget)
+        ]
+        w["sexo_cb"].setCurrentText(imp.sexo)
+        w["nombre"].setText(imp.nombre)
+        w["datos"].setText(imp.datos)
+        w["condiciones"].setText(imp.condiciones)
+        w["defensor"].setText(imp.defensa)
+        w["condena"].setText(imp.condena)
+        w["delitos"].setText(imp.delitos)
+        w["pautas"].setText(imp.pautas)
+        del bloqueos
+
+    def update_hechos_section(self):
+        """Igual que ``update_imputados_section`` para las secciones de hechos."""
+        self._secciones_hechos.reconciliar(self.var_num_hechos.value())
+        self.hechos = [sec.widgets for sec in self._secciones_hechos.secciones]
         self.actualizar_plantilla()
 
+    def _crear_seccion_hecho(self, idx: int) -> Seccion:
+        """Arma (sin montar) la sección del hecho ``idx`` (0-based)."""
+        container = QWidget()
+        layout = QGridLayout(container)
+
+        lbl_desc = QLabel(f"Descripción del suceso #{idx+1}:")
+        layout.addWidget(lbl_desc, 0, 0)
+        le_desc = QLineEdit()
+        # quitamos el le_desc completamente
+
+        btn_desc = QPushButton("Redactar el hecho")
+        btn_desc.clicked.connect(partial(self.abrir_ventana_descripcion, idx))
+        # Para que expanda en horizontal hasta llenar el espacio
+        btn_desc.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        # Ahora abarca desde la columna 1 y ocupa 3 columnas (igual que tus QLineEdit con colspan=3)
+        layout.addWidget(btn_desc, 0, 1, 1, 1)
+
+        lbl_aclar = QLabel(f"Aclaraciones hecho #{idx}:")
+        le_aclar = QLineEdit()
+        layout.addWidget(lbl_aclar, 1, 0)
+        layout.addWidget(le_aclar, 1, 1, 1, 1)
+        next_row = 2
+        lbl_ofi = QLabel("Oficina que elevó:")
+        le_ofi = QLineEdit()
+        rb_j = QRadioButton("Juzgado")
+        rb_f = QRadioButton("Fiscalía")
+        rb_j.setChecked(True)
+        grupo_ofi = QButtonGroup(container)
+        grupo_ofi.addButton(rb_j)
+        grupo_ofi.addButton(rb_f)
+        layout.addWidget(lbl_ofi, next_row, 0)
+        layout.addWidget(le_ofi, next_row, 1)
+        layout.addWidget(rb_j, next_row, 2)
+        layout.addWidget(rb_f, next_row, 3)
+        next_row += 1
+        lbl_auto = QLabel("N° del auto:")
+        le_auto = QLineEdit()
+        layout.addWidget(lbl_auto, next_row, 0)
+        layout.addWidget(le_auto, next_row, 1, 1, 1)
+
+        next_row += 1
+        lbl_fec = QLabel("Fecha de elevación:")
+        le_fec = QLineEdit()
+        layout.addWidget(lbl_fec, next_row, 0)
+        layout.addWidget(le_fec, next_row, 1, 1, 1)
+
+        container.setLayout(layout)
+        for w in [le_desc, le_aclar, le_ofi, le_auto, le_fec]:
+            w.textChanged.connect(self.actualizar_plantilla)
+        for w in [rb_j, rb_f]:
+            w.toggled.connect(self.actualizar_plantilla)
+        for clave, w in [
+            ("descripcion", le_desc),
+            ("aclaraciones", le_aclar),
+            ("oficina", le_ofi),
+            ("num_auto", le_auto),
+            ("fecha_elev", le_fec),
+        ]:
+            w.textChanged.connect(lambda _, c=clave: self._sync_hecho(idx, c))
+        rb_j.toggled.connect(lambda _: self._sync_hecho(idx, "rb_j"))
+
+        return Seccion(
+            container,
+            {
+                "container": container,
+                "descripcion": le_desc,
+                "aclaraciones": le_aclar,
+                "oficina": le_ofi,
+                "rb_j": rb_j,
+                "rb_f": rb_f,
+                "num_auto": le_auto,
+                "fecha_elev": le_fec,
+            },
+        )
+
+    @staticmethod
+    def _reiniciar_hecho(sec: Seccion):
+        w = sec.widgets
+        reiniciar_valores({k: v for k, v in w.items() if k != "container"})
+        with QSignalBlocker(w["rb_j"]), QSignalBlocker(w["rb_f"]):
+            w["rb_j"].setChecked(True)
+
+    @staticmethod
+    def _montar_seccion(layout, sec: Seccion):
+        layout.addWidget(sec.contenedor)
+        sec.contenedor.setVisible(True)
+
+    @staticmethod
+    def _desmontar_seccion(layout, sec: Seccion):
+        layout.removeWidget(sec.contenedor)
+        sec.contenedor.setVisible(False)
+
     def get_sexos_imputados(self):
         sexos = []
         for imp in self.imputados:
             sexos.append(imp["sexo_cb"].currentText())
         return sexos
 
-    def actualizar_plantilla(self):
+    def actualizar_plantilla(self, *_):
+        """Pide un re-render; acepta (e ignora) los argumentos de las señales.
+
+        Varias llamadas seguidas (un cambio de cantidad, el tipeo) se agrupan
+        en un único ``_renderizar_plantilla`` diferido.
+        """
+        self._render.schedule()
+
+    def flush_plantilla(self):
+        """Aplica ya el render pendiente (antes de copiar o exportar)."""
+        self._render.flush()
+
+    def _renderizar_plantilla(self):
         sb = self.texto_plantilla.verticalScrollBar()
         pos = sb.value()
 
         if not self.imputados:
             return
 
+        # Se lee el formulario una sola vez; cada sección recibe sólo lo que
+        # usa y, si eso no cambió, devuelve el fragmento ya armado.
         n_imp = self.var_num_imputados.value()
         n_hec = self.var_num_hechos.value()
-        ...
-        # Puede ocurrir que la lista de hechos aún no tenga la cantidad
-        # indicada en el spinbox; nos limitamos a los que existan para evitar
-        # errores de índice.
-        for i in range(min(n_hec, len(self.hechos))):
-            desc_str = (
-                self.hechos[i]["descripcion"].property("html")
-                or self.hechos[i]["descripcion"].text()
-            ).strip()
-
-        # 1) Localidad
-        localidad = self.var_localidad.text().strip()
-        if not localidad:
-            localidad = "Córdoba"  # fallback
-        loc_anchor = anchor(localidad, "edit_localidad", "Localidad")
-
-        # 2) Fecha en letras
-        fecha_letras = self.var_dia_audiencia.text().strip()
-        fecha_anchor = anchor(fecha_letras, "edit_fecha_audiencia", "Fecha")
-
-        # 3) Causa/caratula
-        caratula = self.var_caratula.text().strip()
-        caratula_anchor = anchor(caratula, "edit_caratula", "Carátula")
-
-        # 4) Tribunal
-        tribunal = self.var_tribunal.currentText()
-        tribunal_anchor = anchor(tribunal, "edit_tribunal", "Tribunal")
-
-        # 5) Sala
-        sala = self.var_sala.currentText().strip()
-        sala_anchor = anchor(sala, "edit_sala", "Sala")
-
-        # 6) Juez
+        imps = tuple(self._vista_imputado(imp) for imp in self.imputados)
+        hechos = tuple(self._vista_hecho(h) for h in self.hechos)
+        nombres = tuple(imp.nombre or f"Imputado#{i+1}" for i, imp in enumerate(imps))
+        sexos = tuple(imp.sexo for imp in imps)
+        defensores = tuple(imp.defensor for imp in imps)
+        delitos = tuple(imp.delitos for imp in imps)
+        condenas = tuple(imp.condena for imp in imps)
         juez_nombre = self.var_juez.text().strip()
-        juez_anchor = anchor(juez_nombre, "edit_juez", "Juez")
+        cargo_mayus = self.cargo_juez_en_mayusculas()
+        calificacion = self.var_calificacion_legal.currentText()
+        caso_vf = self.var_caso_vf.currentText()
+        victima = self.var_victima.text().strip()
+
+        acus_unificado, n_acus = self._seccion_acusaciones(
+            tuple((h.juzgado, h.oficina, h.num_auto, h.fecha_elev) for h in hechos)
+        )
+
+        partes = [
+            self._seccion_apertura(
+                self.var_localidad.text().strip(),
+                self.var_dia_audiencia.text().strip(),
+                self.var_caratula.text().strip(),
+                self.var_tribunal.currentText(),
+                self.var_sala.currentText().strip(),
+                juez_nombre,
+                self.boton_cargo_juez.text().lower(),
+                self.rb_juez_m.isChecked(),
+            ),
+            self._seccion_intervinientes(
+                self.var_fiscal.text().strip(),
+                self.combo_fiscal_sexo.currentText(),
+                n_imp, sexos, nombres, defensores,
+            ),
+            self._seccion_acusados(
+                n_imp, sexos, nombres, tuple(imp.datos for imp in imps)
+            ),
+            self._seccion_atribucion(acus_unificado, n_acus, n_imp, sexos, n_hec),
+        ]
+        # Puede ocurrir que la lista de hechos aún no tenga la cantidad
+        # indicada en el spinbox; nos limitamos a los que existan.
+        for i in range(min(n_hec, len(hechos))):
+            partes.append(
+                self._seccion_hecho(i, n_hec == 1, hechos[i].descripcion, hechos[i].aclaraciones)
+            )
+        partes += [
+            self._seccion_cuestiones(n_hec, n_imp, sexos),
+            self._seccion_titulo_cuestion("PRIMERA CUESTIÓN PLANTEADA", cargo_mayus, juez_nombre),
+            self._seccion_acusacion(acus_unificado, n_hec, n_imp, nombres, delitos),
+            self._seccion_acuerdo(n_imp, nombres, defensores, condenas),
+            self._seccion_opinion(
+                self.var_sujeto_eventual.text().strip(),
+                self.var_manifestacion.text().strip(),
+            ),
+            self._seccion_explicacion(n_imp, sexos),
+            self._seccion_victima(
+                victima,
+                self.var_victima_manifestacion.text().strip(),
+                self.var_victima_plural.currentText().strip().lower() == "más",
+            ),
+            self._seccion_condiciones(
+                n_imp, sexos, nombres, tuple(imp.condiciones for imp in imps)
+            ),
+            self._seccion_antecedentes(
+                nombres, tuple((imp.sin_antecedentes, imp.antecedentes) for imp in imps)
+            ),
+            self._seccion_confesion(
+                n_imp, n_hec, sexos, nombres, tuple(imp.confesion for imp in imps)
+            ),
+            self._seccion_aceptacion(n_imp, n_hec, sexos, calificacion, defensores),
+            self._seccion_prueba(
+                self.var_prueba.strip(),
+                self.var_alegato_fiscal.strip(),
+                self.var_alegato_defensa.strip(),
+            ),
+            self._seccion_ultima_palabra(nombres, tuple(imp.ultima for imp in imps)),
+            self._seccion_valoracion(
+                caso_vf.strip(), n_hec, n_imp, sexos, self.var_pruebas_importantes.strip()
+            ),
+            self._seccion_conclusion(
+                nombres, n_hec, self.var_uso_terminos_potenciales.currentText() == "Sí"
+            ),
+            self._seccion_titulo_cuestion("SEGUNDA CUESTIÓN", cargo_mayus, juez_nombre),
+            self._seccion_calificacion(
+                nombres, delitos, calificacion, self.var_correccion_calif.text().strip()
+            ),
+            self._seccion_titulo_cuestion("TERCERA CUESTIÓN", cargo_mayus, juez_nombre),
+            self._seccion_pena(
+                n_imp, nombres, tuple(imp.pautas for imp in imps), condenas
+            ),
+        ]
 
-        juez_cargo = self.boton_cargo_juez.text().lower()  # "juez" o "vocal"
-        cargo_palabra = "vocal" if juez_cargo == "vocal" else (
-            "juez" if self.rb_juez_m.isChecked() else "jueza"
+        # Los puntos accesorios se numeran en romanos según cuáles aparezcan.
+        next_section = 2
+        if self.var_decomiso_option.currentText() == "Sí":
+            partes.append(self._seccion_decomiso(
+                next_section,
+                self.var_decomiso_text.property("html") or self.TEXTO_DECOMISO_DEFECTO,
+            ))
+            next_section += 1
+        honorarios, usados = self._seccion_honorarios(
+            next_section, nombres, sexos, defensores, tuple(imp.tipo_def for imp in imps)
         )
-        articulo = "del" if self.rb_juez_m.isChecked() else "de la"
-        cargo_anchor = anchor(cargo_palabra, "edit_cargo_juez", "Cargo")
-        juez_intro = f"{articulo} {cargo_anchor}"
-
-        texto_juez = strip_trailing_single_dot(f"{juez_intro} {juez_nombre}")
-
-        # 7) Fiscal
-        fiscal_nombre = self.var_fiscal.text().strip()
-        fiscal_anchor = anchor(fiscal_nombre, "edit_fiscal", "Fiscal")
-        fiscal_articulo = "el" if self.combo_fiscal_sexo.currentText() == "M" else "la"
+        partes.append(honorarios)
+        next_section += usados
+        if self.var_restriccion_option.currentText() == "Sí":
+            partes.append(self._seccion_restriccion(
+                next_section,
+                self.var_restriccion_text.property("html")
+                or self.TEXTO_RESTRICCION_DEFECTO,
+            ))
+            next_section += 1
+        partes.append(self._seccion_comunicaciones(next_section, caso_vf.lower(), victima))
+        partes.append(self._seccion_resuelvo(self.var_resuelvo.property("html") or ""))
+
+        # Los “..” nunca cruzan de una sección a otra (todas empiezan con un
+        # <p>), así que se reducen por fragmento, que queda en caché. (La cola
+        # del documento es siempre el </div> de cierre: no hay puntos que
+        # normalizar ahí.) En el editor se reemplazan sólo los bloques de
+        # las secciones que cambiaron.
+        old_plain = self._prev_plain
+        if not self._documento.mostrar([_puntos_reducidos(parte) for parte in partes]):
+            # se rehízo completo: setHtml deja el scroll arriba
+            self.texto_plantilla.setAlignment(Qt.AlignJustify)
+            QTimer.singleShot(
+                0, lambda: self.texto_plantilla.verticalScrollBar().setValue(pos)
+            )
 
-        # 8) Imputados => para “el/la/las/los imputado/a/as/os”,
-        n_imp = self.var_num_imputados.value()
-        sexos = self.get_sexos_imputados()
-        cant_masc = sum(1 for s in sexos if s == "M")
-        cant_fem = n_imp - cant_masc
+        new_plain = self.texto_plantilla.toPlainText()
+        if old_plain:
+            self._highlight_diff(old_plain, new_plain)
+        self._prev_plain = new_plain
 
-        #   “el/la/los/las” ...
-        if n_imp == 1:
-            # Solo uno
-            if sexos[0] == "M":
-                imput_label = "el imputado"
-                asistido_label = "asistido"
-                acusado_label = "acusado"
-            else:
-                imput_label = "la imputada"
-                asistido_label = "asistida"
-                acusado_label = "acusada"
-        else:
-            # Varios
-            if cant_fem == n_imp:
-                # Todas mujeres
-                imput_label = "las imputadas"
-                asistido_label = "asistidas"
-                accused_label = "acusadas"
-            elif cant_masc == n_imp:
-                imput_label = "los imputados"
-                asistido_label = "asistidos"
-                accused_label = "acusados"
-            else:
-                # Mixto
-                imput_label = "los imputados"
-                asistido_label = "asistidos"
-                accused_label = "acusados"
+    @staticmethod
+    def _vista_imputado(imp: dict) -> _VistaImputado:
+        def rico(w):
+            return (w.property("html") or w.text()).strip()
+
+        return _VistaImputado(
+            nombre=imp["nombre"].text().strip(),
+            sexo=imp["sexo_cb"].currentText(),
+            defensor=imp["defensor"].text().strip(),
+            tipo_def=imp["tipo_def"].currentText().strip().lower(),
+            datos=rico(imp["datos"]),
+            delitos=imp["delitos"].text().strip(),
+            condena=imp["condena"].text().strip(),
+            condiciones=rico(imp["condiciones"]),
+            sin_antecedentes=imp["antecedentes_opcion"][0].isChecked(),
+            antecedentes=rico(imp["antecedentes"]),
+            confesion=imp["confesion"].text().strip(),
+            ultima=imp["ultima"].text().strip(),
+            pautas=rico(imp["pautas"]),
+        )
 
-        if n_imp == 1:
-            acusado_label = acusado_label  # ya definimos en el if
-        else:
-            # Varios
-            if cant_fem == n_imp:
-                acusado_label = "acusadas"
-            elif cant_masc == n_imp:
-                acusado_label = "acusados"
-            else:
-                acusado_label = "acusados"
-
-        # 9) Nombre y Apellido => con conjunción
-        names_list = []
-        for i, imp in enumerate(self.imputados):
-            nm = imp["nombre"].text().strip()
-            if not nm:
-                nm = f"Imputado#{i+1}"
-            nm_anchor = anchor(nm, f"edit_imp_nombre_{i}", "Nombre imputado")
-            names_list.append(nm_anchor)
-        nombres_conj = format_list_for_sentence(names_list)
-
-        #    Recopilar
-        defenders_list = [imp["defensor"].text().strip() for imp in self.imputados]
+    @staticmethod
+    def _vista_hecho(h: dict) -> _VistaHecho:
+        return _VistaHecho(
+            juzgado=h["rb_j"].isChecked(),
+            oficina=h["oficina"].text().strip(),
+            num_auto=h["num_auto"].text().strip(),
+            fecha_elev=h["fecha_elev"].text().strip(),
+            aclaraciones=h["aclaraciones"].text().strip(),
+            descripcion=(
+                h["descripcion"].property("html") or h["descripcion"].text()
+            ).strip(),
+        )
+
+    # ───────────── secciones de la sentencia ─────────────
+    # Cada una es función pura de sus argumentos (textos, números y tuplas
+    # leídos del formulario) y queda memorizada con ``memo_seccion``.
+
+    @memo_seccion
+    def _seccion_apertura(self, localidad, fecha, caratula, tribunal, sala,
+                          juez_nombre, juez_cargo, juez_m):
+        return SECCION_APERTURA(
+            localidad=localidad or "Córdoba",  # fallback
+            fecha=fecha,
+            caratula=caratula,
+            tribunal=tribunal,
+            sala=sala,
+            juez_nombre=juez_nombre,
+            juez_cargo=juez_cargo,
+            juez_m=juez_m,
+            cargo="vocal" if juez_cargo == "vocal" else ("juez" if juez_m else "jueza"),
+        )
+
+    @memo_seccion
+    def _seccion_intervinientes(self, fiscal_nombre, fiscal_sexo, n_imp, sexos,
+                                nombres, defensores):
         def_dict = defaultdict(list)
-        for i, d in enumerate(defenders_list):
+        for i, d in enumerate(defensores):
             def_dict[d].append(i)
-
-        defensores_unicos = list(def_dict.keys())
         defensores_anchor = [
-            anchor(
-                d,
-                f"edit_imp_defensor_{def_dict[d][0]}",
-                "Defensor",
-            )
-            for d in defensores_unicos
+            anchor(d, f"edit_imp_defensor_{idxs[0]}", "Defensor")
+            for d, idxs in def_dict.items()
         ]
         defensa_final = strip_trailing_single_dot(
             format_list_for_sentence(defensores_anchor)
         )
+        return SECCION_INTERVINIENTES(
+            fiscal_nombre=fiscal_nombre,
+            fiscal_sexo=fiscal_sexo,
+            sexos=sexos[:n_imp],
+            nombres=_anclas_nombres(nombres),
+            defensa=defensa_final,
+        )
 
-        # 12) “{fue/ron} {acusado/a/as/os}”:
-        #   => “fue” si 1, “fueron” si >1
-        fue_ron = "fue" if n_imp == 1 else "fueron"
-
+    @memo_seccion
+    def _seccion_acusados(self, n_imp, sexos, nombres, datos):
         datos_personales_list = []
-        for i, imp in enumerate(self.imputados):
-            nm = imp["nombre"].text().strip()
-            if not nm:
-                nm = f"Imputado#{i+1}"
-            nm_anchor = anchor(nm, f"edit_imp_nombre_{i}", "Nombre imputado")
-            d_html = (imp["datos"].property("html") or imp["datos"].text()).strip()
+        for i, (nm_anchor, d_html) in enumerate(zip(_anclas_nombres(nombres), datos)):
             d_anchor = anchor_html(d_html, f"edit_imp_datos_{i}", "Datos")
-            comb = f"<b>{nm_anchor}</b>, {d_anchor}"
-            datos_personales_list.append(comb)
+            datos_personales_list.append(f"<b>{nm_anchor}</b>, {d_anchor}")
         datos_personales_str = strip_trailing_single_dot(
             format_list_with_semicolons(datos_personales_list)
         )
-        art_tribunal = "el" if self.boton_cargo_juez.text().lower() == "juez" else "la"
-        articulo_cargo = "del" if self.rb_juez_m.isChecked() else "de la"
-        primer_parrafo = (
-            f"En la ciudad de {loc_anchor}, el {fecha_anchor}, se dan a conocer "
-            f"los fundamentos de la sentencia dictada en la causa <b>{caratula_anchor}</b>, "
-            f"juzgada por {art_tribunal} {tribunal_anchor}, en la {sala_anchor} "
-            f"a cargo {articulo_cargo} {cargo_anchor} {juez_anchor}."
-        )
-
-        segundo_parrafo = (
-            f"En el debate intervinieron {fiscal_articulo} {fiscal_anchor}, "
-            f"y {imput_label} {nombres_conj}, {asistido_label} por {defensa_final}."
-        )
-
-        tercer_parrafo = (
-            f"En esta causa {fue_ron} {acusado_label} {datos_personales_str}."
-        )
-
-        # Construct final
-        nuevo_inicio = (
-            f"<p align='justify'>{primer_parrafo}</p>"
-            f"<p align='justify'>{segundo_parrafo}</p>"
-            f"<p align='justify'>{tercer_parrafo}</p>"
-        )
-
-        plantilla = nuevo_inicio
+        return SECCION_ACUSADOS(sexos=sexos[:n_imp], datos=datos_personales_str)
 
+    @memo_seccion
+    def _seccion_acusaciones(self, hechos):
+        """(piezas acusatorias unificadas, cuántas distintas hay)."""
         acusaciones_parciales = []
-        for idx, h in enumerate(self.hechos):
-            oficina_rb_val = "Juzgado" if h["rb_j"].isChecked() else "Fiscalía"
-            oficina_txt = h["oficina"].text().strip()
-            num_auto = h["num_auto"].text().strip()
-            fecha_elev = h["fecha_elev"].text().strip()
-            aclaraciones = h["aclaraciones"].text().strip()
-
-            if oficina_rb_val == "Juzgado":
+        for idx, (juzgado, oficina_txt, num_auto, fecha_elev) in enumerate(hechos):
+            if juzgado:
                 base = "El auto de elevación a juicio"
                 if num_auto and fecha_elev:
                     texto = f"{base} n° {anchor(num_auto, f'edit_hecho_num_auto_{idx}', 'n°')} de fecha {anchor(fecha_elev, f'edit_hecho_fecha_elev_{idx}', 'fecha')}"
@@ -2717,9 +2886,7 @@ class SentenciaWidget(QWidget):
 
             if oficina_txt:
                 texto += f", dictado por {anchor(oficina_txt, f'edit_hecho_oficina_{idx}', 'oficina')},"
-            texto_aclar = f" ({aclaraciones})" if aclaraciones else ""
-
-            acusaciones_parciales.append(f"{texto}")
+            acusaciones_parciales.append(texto)
 
         # Dedupl
         unique_acusaciones = []
@@ -2758,156 +2925,57 @@ class SentenciaWidget(QWidget):
 
             unique_acusaciones[i] = uacc
 
-        acus_unificado = format_list_with_semicolons(unique_acusaciones)
-
-        if len(unique_acusaciones) > 1:
-            verbo_atribuir = "atribuyeron"
-        else:
-            verbo_atribuir = "atribuyó"
-
-        n_hec = self.var_num_hechos.value()
-
-        sexos = self.get_sexos_imputados()
-        n_imp = self.var_num_imputados.value()
-        cant_masc = sum(1 for s in sexos if s == "M")
-        cant_fem = n_imp - cant_masc
+        return format_list_with_semicolons(unique_acusaciones), len(unique_acusaciones)
 
-        acus_final = f" en {acus_unificado}" if acus_unificado else ""
-        sexos = self.get_sexos_imputados()
-        cant_masc = sum(1 for s in sexos if s == "M")
-        cant_fem = n_imp - cant_masc
-        if n_imp == 1:
-            if sexos[0] == "M":
-                al_imput_label = "al imputado"
-            else:
-                al_imput_label = "a la imputada"
-        else:
-            if cant_fem == n_imp:
-                al_imput_label = "a las imputadas"
-            else:
-                al_imput_label = "a los imputados"
-
-        # Y definimos "hechos_label" (o puedes reusar tu "frase_hechos"):
-        if self.var_num_hechos.value() == 1:
-            hechos_label = "el siguiente hecho"
-        else:
-            hechos_label = "los siguientes hechos"
-
-        plantilla += (
-            f"<p align='justify'>"
-            f"{acus_unificado} {verbo_atribuir} {al_imput_label} {hechos_label}:"
-            f"</p>"
-        )
-
-        # Listado de hechos
-        for i in range(min(n_hec, len(self.hechos))):
-            desc_html = (
-                self.hechos[i]["descripcion"].property("html")
-                or self.hechos[i]["descripcion"].text()
-            ).strip()
-            desc_html = self._inline_with_paragraphs(desc_html)
-            aclar_str = self.hechos[i]["aclaraciones"].text().strip()
-            desc_anchor = anchor_html(
-                f"<i>{desc_html}</i>",
-                f"edit_hecho_descripcion_{i}",
-                "hecho",
-            )
-            aclar_anchor = anchor(aclar_str, f"edit_hecho_aclaraciones_{i}", "aclaración") if aclar_str else ""
-            if n_hec == 1:
-                if aclar_str:
-                    plantilla += f"<p align='justify'>{desc_anchor} ({aclar_anchor})</p>"
-                else:
-                    plantilla += f"<p align='justify'>{desc_anchor}</p>"
-            else:
-                ordinal = (
-                    ORDINALES_HECHOS[i] if i < len(ORDINALES_HECHOS) else f"{i+1}°"
-                )
-                if aclar_str:
-                    plantilla += f"<p align='justify'><b>{ordinal} hecho ({aclar_anchor})</b>: {desc_anchor}</p>"
-                else:
-                    plantilla += f"<p align='justify'><b>{ordinal} hecho:</b> {desc_anchor}</p>"
-
-        # Determinamos si decimos "la existencia del hecho" o "la existencia de los hechos"
-        if n_hec == 1:
-            exist_label = "la existencia del hecho"
-        else:
-            exist_label = "la existencia de los hechos"
+    @memo_seccion
+    def _seccion_atribucion(self, acus_unificado, n_acus, n_imp, sexos, n_hec):
+        return SECCION_ATRIBUCION(
+            acusaciones=acus_unificado, n_acus=n_acus, sexos=sexos[:n_imp], n_hec=n_hec
+        )
 
-        if n_imp == 1:
-            # Solo un imputado
-            if sexos[0] == "F":
-                resp_label = "de la acusada"
-            else:
-                resp_label = "del acusado"
+    @memo_seccion
+    def _seccion_hecho(self, i, unico, descripcion, aclaraciones):
+        if unico:
+            ordinal = None
         else:
-            # Varios imputados
-            if cant_fem == n_imp:
-                resp_label = "de las acusadas"
-            else:
-                resp_label = "de los acusados"
-
-        primera_cuestion = f"¿Están probadas {exist_label} y la participación responsable {resp_label}?"
-        plantilla += (
-            f"<p align='justify'>El tribunal se planteó las siguientes cuestiones a resolver:</p>"
-            f"<p align='justify'>&nbsp;&nbsp;&nbsp;&nbsp;<b>PRIMERA CUESTIÓN:</b> {primera_cuestion}</p>"
-            f"<p align='justify'>&nbsp;&nbsp;&nbsp;&nbsp;<b>SEGUNDA CUESTIÓN:</b> en su caso, ¿qué calificación legal es aplicable?</p>"
-            f"<p align='justify'>&nbsp;&nbsp;&nbsp;&nbsp;<b>TERCERA CUESTIÓN:</b> ¿qué pronunciamiento corresponde dictar?</p>"
-            f"<p align='justify'><b>A LA PRIMERA CUESTIÓN PLANTEADA, {anchor(self.cargo_juez_en_mayusculas(), 'edit_cargo_juez', 'Cargo')} {juez_nombre.upper()} DIJO:</b></p>"
+            ordinal = ORDINALES_HECHOS[i] if i < len(ORDINALES_HECHOS) else f"{i+1}°"
+        return SECCION_HECHO(
+            i=i,
+            ordinal=ordinal,
+            descripcion=self._inline_with_paragraphs(descripcion),
+            aclaraciones=aclaraciones,
         )
 
-        acus_unificado_minus = acus_unificado
+    @memo_seccion
+    def _seccion_cuestiones(self, n_hec, n_imp, sexos):
+        return SECCION_CUESTIONES(n_hec=n_hec, sexos=sexos[:n_imp])
 
-        import re
+    @memo_seccion
+    def _seccion_titulo_cuestion(self, cuestion, cargo_mayus, juez_nombre):
+        return SECCION_TITULO_CUESTION(
+            cuestion=cuestion, cargo_mayus=cargo_mayus, juez_nombre=juez_nombre
+        )
 
+    @memo_seccion
+    def _seccion_acusacion(self, acus_unificado, n_hec, n_imp, nombres, delitos):
         acus_unificado_minus = re.sub(
             r"^(El|La|Los|Las)\b",
             lambda m: m.group(1).lower(),
-            acus_unificado_minus.strip(),
+            acus_unificado.strip(),
         )
-
-        if n_hec == 1:
-            hecho_label2 = "del hecho contenido"
-        else:
-            hecho_label2 = "de los hechos contenidos"
-
-        # Ahora armás el nuevo párrafo, usando la versión con minúscula:
-        plantilla += (
+        hecho_label2 = "del hecho contenido" if n_hec == 1 else "de los hechos contenidos"
+        plantilla = (
             f"<p align='justify'><b>1. Acusación:</b> la exigencia impuesta en el artículo 408, inc. 1º del CPP "
             f"se encuentra satisfecha con la enunciación al comienzo de la sentencia {hecho_label2} "
             f"en {acus_unificado_minus}, a donde me remito para ser breve.</p>"
         )
-        accusations = []
-        for i, imp in enumerate(self.imputados):
-            nm = imp["nombre"].text().strip()
-            if not nm:
-                nm = f"Imputado#{i+1}"
-            delit_text = imp["delitos"].text().strip()
-            delit_anchor = anchor(delit_text, f"edit_imp_delitos_{i}", "Delitos")
-            accusations.append(f"{nm} bajo la calificación legal de {delit_anchor}")
-
-        if n_imp == 1 and n_hec == 1:
-            acusacion_prefix = "Por tal conducta se acusa"
-        else:
-            acusacion_prefix = "Por tales conductas se acusa"
-
-        delitos_dict = {}
-        for i, imp in enumerate(self.imputados):
-            nm = imp["nombre"].text().strip()
-            if not nm:
-                nm = f"Imputado#{i+1}"
-            delit_text = imp["delitos"].text().strip()
-            delit_anchor = anchor(delit_text, f"edit_imp_delitos_{i}", "Delitos")
-            if delit_text not in delitos_dict:
-                delitos_dict[delit_text] = {"names": [], "anchor": delit_anchor}
-            delitos_dict[delit_text]["names"].append(nm)
 
         accusations_grouped = []
-        for delito, info in delitos_dict.items():
+        for delito, info in _agrupar_delitos(nombres, delitos).items():
             lista_nombres = info["names"]
             delito_anchor = info["anchor"]
             if len(lista_nombres) == 1:
-                unica_persona = lista_nombres[0]
-                fragmento = f"{unica_persona} bajo la calificación legal de {delito_anchor}"
+                fragmento = f"{lista_nombres[0]} bajo la calificación legal de {delito_anchor}"
             else:
                 nombres_unidos = format_list_for_sentence(lista_nombres)
                 fragmento = f"{nombres_unidos} bajo la calificación legal de {delito_anchor}"
@@ -2918,186 +2986,94 @@ class SentenciaWidget(QWidget):
         else:
             acusacion_prefix = "Por tales conductas se acusa"
 
-        if not accusations_grouped:
-            pass
-        elif len(accusations_grouped) == 1:
+        if len(accusations_grouped) == 1:
             plantilla += (
                 f"<p align='justify'>{acusacion_prefix} a {accusations_grouped[0]}.</p>"
             )
-        else:
+        elif accusations_grouped:
             accusations_with_a = [f"a {x}" for x in accusations_grouped]
             last = accusations_with_a.pop()
             joined = "; ".join(accusations_with_a)
             plantilla += (
                 f"<p align='justify'>{acusacion_prefix} {joined}; y {last}.</p>"
             )
+        return plantilla
 
-        # Siguientes secciones “II. Trámite de juicio abreviado...”, etc.
-        # (Las copio sin tocar)
-
-        if n_imp == 1:
-            defense_text = "la defensa"
-            agreement_text = "del acuerdo alcanzado"
-        else:
-            unique_defenders = {
-                imp["defensor"].text().strip()
-                for imp in self.imputados
-                if imp["defensor"].text().strip()
-            }
-            defense_text = "las defensas" if len(unique_defenders) > 1 else "la defensa"
-            agreement_text = "de los acuerdos alcanzados"
-
-        plantilla += (
-            f"<p align='justify'><b>2. Trámite de juicio abreviado (art. 415 CPP):</b></p>"
-            f"<p align='justify'><b>a) Acuerdo:</b> {defense_text} y la fiscalía hicieron conocer los términos {agreement_text} para la realización de un juicio abreviado que, en cuanto a la pena, "
+    @memo_seccion
+    def _seccion_acuerdo(self, n_imp, nombres, defensores, condenas):
+        # “II. Trámite de juicio abreviado...”
+        penas = tuple(
+            (nombres[i], anchor(strip_trailing_single_dot(condenas[i]),
+                                f"edit_imp_condena_{i}", "Condena"))
+            for i in range(n_imp)
         )
+        varias_defensas = n_imp > 1 and len({d for d in defensores if d}) > 1
+        return SECCION_ACUERDO(penas=penas, varias_defensas=varias_defensas)
 
-        if n_imp == 1:
-            condena_unica = strip_trailing_single_dot(
-                self.imputados[0]["condena"].text().strip()
-            )
-            condena_unica = anchor(condena_unica, "edit_imp_condena_0", "Condena")
-            plantilla += f"determinó la de {condena_unica}.</p>"
-        else:
-            frag_penas = []
-            for i in range(n_imp):
-                nombre_tmp = self.imputados[i]["nombre"].text().strip()
-                if not nombre_tmp:
-                    nombre_tmp = f"Imputado#{i+1}"
-                pena_text = strip_trailing_single_dot(self.imputados[i]["condena"].text().strip())
-                pena_anchor = anchor(pena_text, f"edit_imp_condena_{i}", "Condena")
-                frag_penas.append(
-                    f"para {nombre_tmp}, la de {pena_anchor}"
-                )
-            acuerdo_str = strip_trailing_single_dot(
-                format_list_with_semicolons(frag_penas)
-            )
-            plantilla += f"determinó {acuerdo_str}.</p>"
-
-        sujeto_str = strip_trailing_single_dot(self.var_sujeto_eventual.text().strip())
-        mani_str = strip_trailing_single_dot(self.var_manifestacion.text().strip())
-        if sujeto_str or mani_str:
-            plantilla += (
-                f"<p align='justify'>Se le concedió la palabra a {sujeto_str} "
-                f"para que exprese su opinión acerca del acuerdo informado, y manifestó: {mani_str}.</p>"
-            )
-
-        if n_imp == 1:
-            if sexos[0] == "M":
-                acus_label = "al acusado"
-                verb_comp = "comprendía"
-                verb_con = "conocía"
-            else:
-                acus_label = "a la acusada"
-                verb_comp = "comprendía"
-                verb_con = "conocía"
-        else:
-            if cant_fem == n_imp:
-                acus_label = "a las acusadas"
-            else:
-                acus_label = "a los acusados"
-            verb_comp = "comprendían"
-            verb_con = "conocían"
+    @memo_seccion
+    def _seccion_opinion(self, sujeto, manifestacion):
+        return SECCION_OPINION(
+            sujeto=strip_trailing_single_dot(sujeto),
+            manifestacion=strip_trailing_single_dot(manifestacion),
+        )
 
-        plantilla += f"<p align='justify'>Las características de esta modalidad de juzgamiento y del acuerdo mencionado fueron explicados por el tribunal {acus_label}, y se verificó así que {verb_comp} su contenido y sus consecuencias, que {verb_con} su derecho a exigir un juicio oral, y que su conformidad era libre y voluntaria.</p>"
+    @memo_seccion
+    def _seccion_explicacion(self, n_imp, sexos):
+        return SECCION_EXPLICACION(sexos=sexos[:n_imp])
 
-        victim = strip_trailing_single_dot(
-            self.var_victima.text().strip()
-            if self.var_victima.text().strip()
-            else "la víctima"
-        )
-        manifest_victim = strip_trailing_single_dot(
-            self.var_victima_manifestacion.text().strip()
+    @memo_seccion
+    def _seccion_victima(self, victima, manifestacion, plural):
+        return SECCION_VICTIMA(
+            victima=strip_trailing_single_dot(victima if victima else "la víctima"),
+            manifestacion=strip_trailing_single_dot(manifestacion),
+            plural=plural,
         )
-        victim_plural_mode = (
-            self.var_victima_plural.currentText().strip().lower() == "más"
-        )
-        if manifest_victim:
-            if victim_plural_mode:
-                plantilla += f"<p align='justify'>Además, el fiscal hizo saber que {victim} fueron previamente informadas acerca de dichos aspectos y que manifestaron {manifest_victim}.</p>"
-            else:
-                plantilla += f"<p align='justify'>Además, el fiscal hizo saber que {victim} fue previamente informada acerca de dichos aspectos y que manifestó {manifest_victim}.</p>"
 
+    @memo_seccion
+    def _seccion_condiciones(self, n_imp, sexos, nombres, condiciones):
         # (b) Declaración del imputado
         if n_imp == 1:
             if sexos[0] == "M":
-                header = "<p align='justify'><b>b) Declaración del imputado:</b></p>"
-            else:
-                header = "<p align='justify'><b>b) Declaración de la imputada:</b></p>"
-        else:
-            if all(s == "F" for s in sexos):
-                header = (
-                    "<p align='justify'><b>b) Declaración de las imputadas:</b></p>"
-                )
-            else:
-                header = (
-                    "<p align='justify'><b>b) Declaración de los imputados:</b></p>"
-                )
-
-        plantilla += header
-
-        if n_imp == 1:
-            if sexos[0] == "M":
+                plantilla = "<p align='justify'><b>b) Declaración del imputado:</b></p>"
                 interrogado = "al ser interrogado"
             else:
+                plantilla = "<p align='justify'><b>b) Declaración de la imputada:</b></p>"
                 interrogado = "al ser interrogada"
+        elif all(s == "F" for s in sexos):
+            plantilla = "<p align='justify'><b>b) Declaración de las imputadas:</b></p>"
+            interrogado = "al ser interrogadas"
         else:
-            if all(s == "F" for s in sexos):
-                interrogado = "al ser interrogadas"
-            elif all(s == "M" for s in sexos):
-                interrogado = "al ser interrogados"
-            else:
-                interrogado = "al ser interrogados"
+            plantilla = "<p align='justify'><b>b) Declaración de los imputados:</b></p>"
+            interrogado = "al ser interrogados"
 
         plantilla += f"<p align='justify'><b>Condiciones personales:</b> {interrogado} por el tribunal y las partes, además de los datos consignados al comienzo de esta resolución, "
 
         prefixes = ["A su vez, ", "Por su parte, ", "A su turno, ", "También, "]
         verbs = ["agregó", "dijo", "mencionó", "añadió"]
-
-        final_names_list = []
-        for i, imp in enumerate(self.imputados):
-            nm = imp["nombre"].text().strip()
-            if not nm:
-                nm = f"Imputado#{i+1}"
-            final_names_list.append(anchor(nm, f"edit_imp_nombre_{i}", "Nombre imputado"))
-
-        for i, imp in enumerate(self.imputados):
-            name_i = f"<b>{final_names_list[i]}</b>"
-            condiciones = strip_trailing_single_dot(
-                (
-                    imp["condiciones"].property("html")
-                    or imp["condiciones"].text()
-                ).strip()
-            )
-            condiciones = self._inline_with_paragraphs(condiciones)
-            condiciones = anchor_html(
-                condiciones or "[condiciones]",
+        for i, (nm, cond) in enumerate(zip(_anclas_nombres(nombres), condiciones)):
+            name_i = f"<b>{nm}</b>"
+            cond = self._inline_with_paragraphs(strip_trailing_single_dot(cond))
+            cond = anchor_html(
+                cond or "[condiciones]",
                 f"edit_imp_condiciones_{i}",
                 "Condiciones",
             )
             verb = verbs[i % len(verbs)]
-
             if i == 0:
-                plantilla += f"{name_i} {verb} que {condiciones}."
+                plantilla += f"{name_i} {verb} que {cond}."
             else:
                 prefix = prefixes[(i - 1) % len(prefixes)]
-                plantilla += f" {prefix}{name_i} {verb} que {condiciones}."
-
-        plantilla += "</p>"
+                plantilla += f" {prefix}{name_i} {verb} que {cond}."
+        return plantilla + "</p>"
 
+    @memo_seccion
+    def _seccion_antecedentes(self, nombres, antecedentes):
         mentions = []
         has_no = False
         has_si = False
-        for i, imp in enumerate(self.imputados):
-            nm = final_names_list[i]
+        for i, (nm, (no_registra, ant_html)) in enumerate(zip(_anclas_nombres(nombres), antecedentes)):
             name_i = f"<b>{nm}</b>"
-            no_registra = imp["antecedentes_opcion"][0].isChecked()
-            ant_html = (
-                imp["antecedentes"].property("html")
-                or imp["antecedentes"].text()
-            ).strip()
-            ant_html = strip_trailing_single_dot(ant_html)
-            ant_html = self._inline_with_paragraphs(ant_html)
+            ant_html = self._inline_with_paragraphs(strip_trailing_single_dot(ant_html))
             if no_registra:
                 has_no = True
                 ant_anchor = anchor(
@@ -3105,7 +3081,7 @@ class SentenciaWidget(QWidget):
                     f"edit_imp_antecedentes_{i}",
                     "Antecedentes",
                 )
-                mentions.append(("no", f"{name_i} {ant_anchor}."))
+                mentions.append(f"{name_i} {ant_anchor}.")
             else:
                 has_si = True
                 if ant_html:
@@ -3114,144 +3090,115 @@ class SentenciaWidget(QWidget):
                         f"edit_imp_antecedentes_{i}",
                         "Antecedentes",
                     )
-                    mentions.append(
-                        ("si", f"{name_i} registra los siguientes antecedentes: {ant_anchor}.")
-                    )
+                    mentions.append(f"{name_i} registra los siguientes antecedentes: {ant_anchor}.")
                 else:
                     ant_anchor = anchor(
                         "registra antecedentes penales (sin detalle).",
                         f"edit_imp_antecedentes_{i}",
                         "Antecedentes",
                     )
-                    mentions.append(("si", f"{name_i} {ant_anchor}"))
+                    mentions.append(f"{name_i} {ant_anchor}")
 
         if not mentions:
-            plantilla += (
+            return (
                 "<p align='justify'>En cuanto a sus antecedentes penales, por Secretaría no se cuenta con "
                 "información alguna o no hubo datos cargados.</p>"
             )
-        else:
-            texto_antecedentes = "<p align='justify'>En cuanto a sus antecedentes penales, por Secretaría se informó que "
-            total_m = len(mentions)
-            prefixes_cycle = ["A su vez,", "Separadamente,", "Asimismo,"]
-
-            for i, (_, mention) in enumerate(mentions):
-                if i == 0:
-                    texto_antecedentes += mention
+        texto_antecedentes = "<p align='justify'>En cuanto a sus antecedentes penales, por Secretaría se informó que "
+        total_m = len(mentions)
+        prefixes_cycle = ["A su vez,", "Separadamente,", "Asimismo,"]
+        for i, mention in enumerate(mentions):
+            if i == 0:
+                texto_antecedentes += mention
+            else:
+                es_ultima = i == total_m - 1
+                if i == 1 and has_no and has_si:
+                    prefix = "Por su parte,"
                 else:
-                    es_ultima = i == total_m - 1
-                    if i == 1 and has_no and has_si:
-                        prefix = "Por su parte,"
-                    else:
-                        prefix = "Finalmente," if es_ultima else prefixes_cycle[(i - 1) % len(prefixes_cycle)]
-                    texto_antecedentes += f" {prefix} {mention}"
-
-            texto_antecedentes += "</p>"
-            plantilla += texto_antecedentes
-
-        plantilla += "<p align='justify'><b>Confesión:</b> "
-
+                    prefix = "Finalmente," if es_ultima else prefixes_cycle[(i - 1) % len(prefixes_cycle)]
+                texto_antecedentes += f" {prefix} {mention}"
+        return texto_antecedentes + "</p>"
+
+    @memo_seccion
+    def _seccion_confesion(self, n_imp, n_hec, sexos, nombres, confesiones):
+        final_names_list = _anclas_nombres(nombres)
+        plantilla = "<p align='justify'><b>Confesión:</b> "
         if n_imp == 1:
             nm = final_names_list[0]
             if sexos[0] == "M":
+                sujeto = "el imputado"
                 info_text = "fue informado"
-                atrib_text = "se le atribuye" if n_hec == 1 else "se le atribuyen"
-                facto_text = "del hecho" if n_hec == 1 else "de los hechos"
-                plantilla += (
-                    f"A fin de ratificar la voluntad manifestada en el acuerdo previo para la realización del juicio abreviado, "
-                    f"el imputado {info_text} detalladamente {facto_text} que {atrib_text}, "
-                    f"de las pruebas existentes en su contra y de la facultad que le acuerda la ley de abstenerse de prestar declaración "
-                    f"sin que su silencio implique una presunción de culpabilidad (arts. 385 y 259 CPP) sino la sola consecuencia "
-                    f"de impedir el trámite del art. 415 CPP."
-                )
             else:
+                sujeto = "la imputada"
                 info_text = "fue informada"
-                atrib_text = "se le atribuye" if n_hec == 1 else "se le atribuyen"
-                facto_text = "del hecho" if n_hec == 1 else "de los hechos"
-                plantilla += (
-                    f"A fin de ratificar la voluntad manifestada en el acuerdo previo para la realización del juicio abreviado, "
-                    f"la imputada {info_text} detalladamente {facto_text} que {atrib_text}, "
-                    f"de las pruebas existentes en su contra y de la facultad que le acuerda la ley de abstenerse de prestar declaración "
-                    f"sin que su silencio implique una presunción de culpabilidad (arts. 385 y 259 CPP) sino la sola consecuencia "
-                    f"de impedir el trámite del art. 415 CPP."
-                )
-
-            conf_text = strip_trailing_single_dot(
-                self.imputados[0]["confesion"].text().strip()
-            )
-            conf_text = anchor(
-                conf_text or "[confesión]", "edit_imp_confesion_0", "Confesión"
-            )
-            plantilla += f" Ante ello, {nm} dijo: “{conf_text}”.</p>"
-        else:
-            # Caso de varios imputados: se imprime una parte colectiva y luego las confesiones individuales.
-            if all(s == "F" for s in sexos):
-                collective = "las imputadas fueron informadas"
-                atrib_text = "se les atribuye" if n_hec == 1 else "se les atribuyen"
-            else:
-                collective = "los imputados fueron informados"
-                atrib_text = "se les atribuye" if n_hec == 1 else "se les atribuyen"
+            atrib_text = "se le atribuye" if n_hec == 1 else "se le atribuyen"
             facto_text = "del hecho" if n_hec == 1 else "de los hechos"
             plantilla += (
                 f"A fin de ratificar la voluntad manifestada en el acuerdo previo para la realización del juicio abreviado, "
-                f"{collective} detalladamente {facto_text} que {atrib_text}, "
-                f"de las pruebas existentes en su contra y de la facultad que la ley les acuerda de abstenerse de prestar declaración "
+                f"{sujeto} {info_text} detalladamente {facto_text} que {atrib_text}, "
+                f"de las pruebas existentes en su contra y de la facultad que le acuerda la ley de abstenerse de prestar declaración "
                 f"sin que su silencio implique una presunción de culpabilidad (arts. 385 y 259 CPP) sino la sola consecuencia "
-                f"de impedir el trámite del art. 415 CPP.</p>"
+                f"de impedir el trámite del art. 415 CPP."
             )
-            # Ciclo para agregar las confesiones individuales usando prefijos y verbos cíclicos
-            prefixes_cycle = ["Ante ello,", "A su turno,", "Luego,", "Después,"]
-            verbs_cycle = ["expresó", "manifestó", "refirió", "declaró", "afirmó"]
-            for i, imp in enumerate(self.imputados):
-                nm = final_names_list[i]
-                conf_text = strip_trailing_single_dot(imp["confesion"].text().strip())
-                conf_text = anchor(
-                    conf_text or "[confesión]",
-                    f"edit_imp_confesion_{i}",
-                    "Confesión",
-                )
-                prefix = prefixes_cycle[i % len(prefixes_cycle)]
-                verb = verbs_cycle[i % len(verbs_cycle)]
-                plantilla += (
-                    f"<p align='justify'>{prefix} {nm} {verb}: “{conf_text}”.</p>"
-                )
+            conf_text = strip_trailing_single_dot(confesiones[0])
+            conf_text = anchor(
+                conf_text or "[confesión]", "edit_imp_confesion_0", "Confesión"
+            )
+            return plantilla + f" Ante ello, {nm} dijo: “{conf_text}”.</p>"
 
+        # Varios imputados: una parte colectiva y luego las confesiones individuales.
+        if all(s == "F" for s in sexos):
+            collective = "las imputadas fueron informadas"
+        else:
+            collective = "los imputados fueron informados"
+        atrib_text = "se les atribuye" if n_hec == 1 else "se les atribuyen"
+        facto_text = "del hecho" if n_hec == 1 else "de los hechos"
+        plantilla += (
+            f"A fin de ratificar la voluntad manifestada en el acuerdo previo para la realización del juicio abreviado, "
+            f"{collective} detalladamente {facto_text} que {atrib_text}, "
+            f"de las pruebas existentes en su contra y de la facultad que la ley les acuerda de abstenerse de prestar declaración "
+            f"sin que su silencio implique una presunción de culpabilidad (arts. 385 y 259 CPP) sino la sola consecuencia "
+            f"de impedir el trámite del art. 415 CPP.</p>"
+        )
+        # prefijos y verbos cíclicos para las confesiones individuales
+        prefixes_cycle = ["Ante ello,", "A su turno,", "Luego,", "Después,"]
+        verbs_cycle = ["expresó", "manifestó", "refirió", "declaró", "afirmó"]
+        for i, (nm, conf) in enumerate(zip(final_names_list, confesiones)):
+            conf_text = anchor(
+                strip_trailing_single_dot(conf) or "[confesión]",
+                f"edit_imp_confesion_{i}",
+                "Confesión",
+            )
+            prefix = prefixes_cycle[i % len(prefixes_cycle)]
+            verb = verbs_cycle[i % len(verbs_cycle)]
+            plantilla += f"<p align='justify'>{prefix} {nm} {verb}: “{conf_text}”.</p>"
+        return plantilla
+
+    @memo_seccion
+    def _seccion_aceptacion(self, n_imp, n_hec, sexos, calificacion, defensores):
+        cant_fem = n_imp - sum(1 for s in sexos if s == "M")
         # c) Aceptación
         if n_imp == 1:
-            if sexos[0] == "M":
-                suj_label = "el imputado"
-                ha_sido = "ha sido"
-                informado = "informado"
-                han_expresado = "ha expresado"
-                han_reconocido = "ha reconocido"
-            else:
-                suj_label = "la imputada"
-                ha_sido = "ha sido"
-                informado = "informada"
-                han_expresado = "ha expresado"
-                han_reconocido = "ha reconocido"
+            suj_label = "el imputado" if sexos[0] == "M" else "la imputada"
+            ha_sido = "ha sido"
+            informado = "informado" if sexos[0] == "M" else "informada"
+            han_expresado = "ha expresado"
+            han_reconocido = "ha reconocido"
         else:
-            if cant_fem == n_imp:
-                suj_label = "las acusadas"
-            else:
-                suj_label = "los acusados"
+            suj_label = "las acusadas" if cant_fem == n_imp else "los acusados"
             ha_sido = "han sido"
             informado = "informados"
             han_expresado = "han expresado"
             han_reconocido = "han reconocido"
 
-        plantilla += (
+        plantilla = (
             f"<p align='justify'><b>c) Aceptación del Tribunal:</b> de la reseña que precede surge que se han cumplimentado los requisitos de ley, "
             f"pues se ha corroborado que {suj_label} {ha_sido} acabadamente {informado} de los términos del acuerdo y que {han_expresado} su conformidad "
             f"de manera libre y voluntaria. Asimismo, {han_reconocido} lisa y llanamente su responsabilidad en los mismos términos en que se les ha sido "
             f"atribuida por la acusación.</p>"
         )
 
-        calif_es_correcta = self.var_calificacion_legal.currentText() == "Correcta"
-
-        n_hec = self.var_num_hechos.value()
-        # (Tramo idéntico al original)
-        if calif_es_correcta:
+        if calificacion == "Correcta":
             if n_imp == 1 and n_hec == 1:
                 calif_text = (
                     "La calificación legal asignada por la fiscalía es correcta "
@@ -3305,34 +3252,12 @@ class SentenciaWidget(QWidget):
                     "acordados porque estos se encuentran dentro de la escala penal "
                     "prevista para los delitos aplicables (art. 415 CPP)."
                 )
-
         plantilla += f"<p align='justify'>{calif_text}</p>"
-        # Placeholder para “{la/s solicitud/es formulada/s}”
-        if n_imp == 1:
-            solicitudes_str = "la solicitud formulada"
-        else:
-            solicitudes_str = "las solicitudes formuladas"
 
-        defenders_list = [imp["defensor"].text().strip() for imp in self.imputados]
-        def_dict = defaultdict(list)
-        for i, d in enumerate(defenders_list):
-            if d:
-                def_dict[d].append(i)
-
-        defensores_unicos = list(def_dict.keys())
-        defensores_anchor = [
-            anchor(
-                d,
-                f"edit_imp_defensor_{def_dict[d][0]}",
-                "Defensor",
-            )
-            for d in defensores_unicos
-        ]
-        defensa_final = strip_trailing_single_dot(
-            format_list_for_sentence(defensores_anchor)
-        )
-
-        # Ahora, para el placeholder {su/s defensa/s}:
+        # “{la/s solicitud/es formulada/s}” y “{su/s defensa/s}”
+        solicitudes_str = "la solicitud formulada" if n_imp == 1 else "las solicitudes formuladas"
+        imput_label = _etiquetas_imputados(n_imp, sexos)[0]
+        defensores_unicos = list(dict.fromkeys(d for d in defensores if d))
         if not defensores_unicos:
             # Si ninguno ingresó defensor, usamos la forma singular por defecto
             defensa_str = "la defensa"
@@ -3341,8 +3266,7 @@ class SentenciaWidget(QWidget):
         else:
             defensa_str = "sus defensas"
 
-        # Ahora construyes la cadena final reemplazando las partes entre llaves:
-        plantilla += (
+        return plantilla + (
             f"Tales constataciones son las únicas habilitadas por la ley al Tribunal en el marco del juicio abreviado "
             f'(TSJ, Sala Penal, S. n° 124, 19/04/2017, "Cabrera", entre otros; Jaime, Marcelo Nicolás, "El juicio abreviado", '
             f"en AAVV, Comentarios a la reforma del Código Procesal Penal, dir. Maximiliano Hairabedián, Advocatus, 2017, págs. 161/162; "
@@ -3350,25 +3274,12 @@ class SentenciaWidget(QWidget):
             f"{imput_label} y {defensa_str}."
         )
 
-        aleg_fiscal = anchor(
-            self.var_alegato_fiscal.strip(),
-            "alegato_fiscal",
-            "alegato fiscal",
-        )
-
-        aleg_defensa = anchor(
-            self.var_alegato_defensa.strip(),
-            "alegato_defensa",
-            "alegato defensa",
-        )
-
-        prueba_anchor = anchor(
-            self.var_prueba.strip(),
-            "prueba",
-            "pruebas",
-        )
-
-        plantilla += (
+    @memo_seccion
+    def _seccion_prueba(self, prueba, alegato_fiscal, alegato_defensa):
+        aleg_fiscal = anchor(alegato_fiscal, "alegato_fiscal", "alegato fiscal")
+        aleg_defensa = anchor(alegato_defensa, "alegato_defensa", "alegato defensa")
+        prueba_anchor = anchor(prueba, "prueba", "pruebas")
+        return (
             f"<p align='justify'><b>3. Enumeración de la prueba:</b> "
             f"según lo dispuesto por el artículo 415 CPP y a pedido de las partes, "
             f"se incorporó la prueba recolectada durante la investigación penal preparatoria y la investigación preliminar: {prueba_anchor}</p>"
@@ -3377,33 +3288,16 @@ class SentenciaWidget(QWidget):
             f"Por su parte, la defensa expuso {aleg_defensa}.</p>"
         )
 
-        # ======================================
-        # BLOQUE PARA MOSTRAR "ÚLTIMA PALABRA"
-        # ======================================
-        speakers_2 = []
-        non_speakers_2 = []
+    @memo_seccion
+    def _seccion_ultima_palabra(self, nombres, ultimas):
+        final_names_list = _anclas_nombres(nombres)
+        speakers_2 = [(i, u) for i, u in enumerate(ultimas) if u]      # sí hablaron
+        non_speakers_2 = [i for i, u in enumerate(ultimas) if not u]   # no hablaron
+        plantilla = ""
 
-        for i, imp in enumerate(self.imputados):
-            ultima_str = imp["ultima"].text().strip()
-            if ultima_str:
-                speakers_2.append((i, ultima_str))  # este imputado sí habló
-            else:
-                non_speakers_2.append(i)  # este imputado NO habló
-
-        def nombre(idx):
-            return final_names_list[
-                idx
-            ]  # asumes que arriba tenés la lista final_names_list
-
-        # Si NADIE dijo nada y NADIE existe, no hacemos nada
-        if not speakers_2 and not non_speakers_2:
-            pass
-
-        # Si NADIE dijo nada, pero sí hay imputados (non_speakers_2 no vacío)
-        elif not speakers_2 and non_speakers_2:
-            # Todos guardaron silencio
+        if not speakers_2:
+            # Todos guardaron silencio (o no hay imputados)
             for idx in non_speakers_2:
-                nm = nombre(idx)
                 enlace = anchor(
                     "manifestó que no haría uso de ella",
                     f"edit_imp_ultima_{idx}",
@@ -3411,66 +3305,52 @@ class SentenciaWidget(QWidget):
                 )
                 plantilla += (
                     f"<p align='justify'>Finalmente, al concederse la última palabra, "
-                    f"{nm} {enlace}.</p>"
+                    f"{final_names_list[idx]} {enlace}.</p>"
                 )
+            return plantilla
+
+        # CASO A: Solo uno habló y ninguno guardó silencio
+        if len(speakers_2) == 1 and not non_speakers_2:
+            idx_speaker, text_speaker = speakers_2[0]
+            text_speaker = anchor(
+                strip_trailing_single_dot(text_speaker) or "[última palabra]",
+                f"edit_imp_ultima_{idx_speaker}",
+                "Última palabra",
+            )
+            return (
+                f"<p align='justify'>Finalmente, al concederse la última palabra, "
+                f"{final_names_list[idx_speaker]} dijo: “{text_speaker}”.</p>"
+            )
 
-        # Si AL MENOS UNO dijo algo
-        else:
-            total_speakers = len(speakers_2)
-            # CASO A: Solo uno habló y ninguno guardó silencio
-            if total_speakers == 1 and not non_speakers_2:
-                idx_speaker, text_speaker = speakers_2[0]
-                text_speaker = strip_trailing_single_dot(text_speaker)
-                text_speaker = anchor(
-                    text_speaker or "[última palabra]",
-                    f"edit_imp_ultima_{idx_speaker}",
-                    "Última palabra",
-                )
-                nm = nombre(idx_speaker)
+        # CASO B: Más de uno habló, o hay alguno que no habló
+        for i, (idx_speaker, text_speaker) in enumerate(speakers_2):
+            text_speaker = anchor(
+                strip_trailing_single_dot(text_speaker) or "[última palabra]",
+                f"edit_imp_ultima_{idx_speaker}",
+                "Última palabra",
+            )
+            nm = final_names_list[idx_speaker]
+            if i == 0:
                 plantilla += (
                     f"<p align='justify'>Finalmente, al concederse la última palabra, "
                     f"{nm} dijo: “{text_speaker}”.</p>"
                 )
-
-            # CASO B: Más de uno habló, o hay alguno que no habló
             else:
-                # Imprimimos ordenadamente a cada uno de los que sí hablaron
-                for i, (idx_speaker, text_speaker) in enumerate(speakers_2):
-                    text_speaker = strip_trailing_single_dot(text_speaker)
-                    text_speaker = anchor(
-                        text_speaker or "[última palabra]",
-                        f"edit_imp_ultima_{idx_speaker}",
-                        "Última palabra",
-                    )
-                    nm = nombre(idx_speaker)
-                    if i == 0:
-                        # Primer orador
-                        plantilla += (
-                            f"<p align='justify'>Finalmente, al concederse la última palabra, "
-                            f"{nm} dijo: “{text_speaker}”.</p>"
-                        )
-                    else:
-                        # Siguientes oradores
-                        plantilla += (
-                            f"<p align='justify'>Seguidamente, {nm} dijo: “{text_speaker}”.</p>"
-                        )
-
-                # Ahora mencionamos a los que NO hablaron
-                if non_speakers_2:
-                    for idx in non_speakers_2:
-                        nm = nombre(idx)
-                        enlace = anchor(
-                            "manifestó que no haría uso de la palabra",
-                            f"edit_imp_ultima_{idx}",
-                            "Última palabra",
-                        )
-                        plantilla += (
-                            f"<p align='justify'>Por último, {nm} {enlace}.</p>"
-                        )
-
-        # Valoración de la prueba (corto y pego):
-        plantilla += f"<p><b>5. Valoración de la prueba:</b> "
-        caso_vf = self.var_caso_vf.currentText().strip()
+                plantilla += f"<p align='justify'>Seguidamente, {nm} dijo: “{text_speaker}”.</p>"
+        # y después los que NO hablaron
+        for idx in non_speakers_2:
+            enlace = anchor(
+                "manifestó que no haría uso de la palabra",
+                f"edit_imp_ultima_{idx}",
+                "Última palabra",
+            )
+            plantilla += f"<p align='justify'>Por último, {final_names_list[idx]} {enlace}.</p>"
+        return plantilla
+
+    @memo_seccion
+    def _seccion_valoracion(self, caso_vf, n_hec, n_imp, sexos, pruebas_importantes):
+        cant_fem = n_imp - sum(1 for s in sexos if s == "M")
+        plantilla = "<p><b>5. Valoración de la prueba:</b> "
         if n_hec == 1:
             el_los_hecho_s = "el hecho"
             ocurrio_eron = "ocurrió"
@@ -3513,7 +3393,7 @@ class SentenciaWidget(QWidget):
                     plantilla += f"{el_los_hecho_s} motivo de juzgamiento configuran un caso de {caso_vf}. Los elementos de juicio enunciados y los argumentos desarrollados en la acusación base del juicio de la causa aquí juzgada, sumados a la argumentación del fiscal al momento emitir las conclusiones, en las que solicitó la condena –todo lo cual hago mío por razones de brevedad– satisfacen plenamente el estándar probatorio requerido para tener por acreditada la plataforma fáctica y la intervención {imputado_phrase} tal como {le_les} ha sido atribuida.</p>"
 
         pruebas_text = anchor(
-            self.var_pruebas_importantes.strip(),
+            pruebas_importantes,
             "pruebas_importantes",
             "pruebas relevantes",
         )
@@ -3564,8 +3444,11 @@ class SentenciaWidget(QWidget):
             f"que no existen causales de inimputabilidad o de justificación (adviértase que ninguna de las partes ha hecho invocación alguna en "
             f"ese sentido), por lo que {acusado_singular_plural} {es_son} penalmente {responsable_s} y como {tal_es} {debe_s} responder.</p>"
         )
+        return plantilla
 
-        nombres_imputados_conjunction = format_list_for_sentence(final_names_list)
+    @memo_seccion
+    def _seccion_conclusion(self, nombres, n_hec, potenciales):
+        nombres_imputados_conjunction = format_list_for_sentence(_anclas_nombres(nombres))
         if n_hec == 1:
             el_los_hechos = "el hecho"
             dejarlo_s = "dejarlo"
@@ -3578,47 +3461,26 @@ class SentenciaWidget(QWidget):
             ha_n_sido = "han sido transcriptos"
 
         texto_potenciales = ""
-        if self.var_uso_terminos_potenciales.currentText() == "Sí":
+        if potenciales:
             texto_potenciales = (
                 ", debiendo entenderse que, con motivo de haberse arribado al grado de certeza exigido "
                 "en esta instancia procesal, los términos potenciales allí utilizados deben ser comprendidos "
                 "aquí de modo indicativo"
             )
 
-        plantilla += (
+        return (
             f"<p align='justify'><b>6. Conclusión:</b> en función de lo expuesto, corresponde dar por acreditada la responsabilidad "
             f"de {nombres_imputados_conjunction} en {el_los_hechos} motivo de juicio y {dejarlo_s} {fijado_s} tal como {ha_n_sido}"
             f"{texto_potenciales}. Dejo así satisfecha la exigencia impuesta en el artículo 408 inc. 3° del CPP y respondo afirmativamente "
             f"a esta primera cuestión.</p>"
         )
 
-        frag_cal = []
-        for i, imp in enumerate(self.imputados):
-            nm = final_names_list[i]
-            delit = imp["delitos"].text().strip()
-            frag_cal.append(f"{nm} debe responder bajo el encuadre legal de {delit}")
-
-        if len(frag_cal) == 1:
-            final_calif_str = frag_cal[0]
-        else:
-            final_calif_str = "; ".join(frag_cal[:-1]) + "; y " + frag_cal[-1]
-
-        salvedad = ""
-        if self.var_calificacion_legal.currentText() == "Incorrecta":
-            corr = strip_trailing_single_dot(self.var_correccion_calif.text().strip())
-            if corr:
-                salvedad = f", con la salvedad de que {corr}"
-
-        plantilla += f"<p align='justify'><b>A LA SEGUNDA CUESTIÓN, {anchor(self.cargo_juez_en_mayusculas(), 'edit_cargo_juez', 'Cargo')} {juez_nombre.upper()} DIJO:</b></p>"
-        calif_es_correcta = self.var_calificacion_legal.currentText() == "Correcta"
-        corr = strip_trailing_single_dot(
-            self.var_correccion_calif.text().strip()
-            if self.var_calificacion_legal.currentText() == "Incorrecta"
-            else ""
-        )
+    @memo_seccion
+    def _seccion_calificacion(self, nombres, delitos, calificacion, correccion):
+        corr = strip_trailing_single_dot(correccion if calificacion == "Incorrecta" else "")
 
         calif_list = []
-        for delito, imput_names in delitos_dict.items():
+        for delito, imput_names in _agrupar_delitos(nombres, delitos).items():
             imput_str = format_list_for_sentence(imput_names)
             if len(imput_names) > 1:
                 verbo = "deben responder"
@@ -3631,7 +3493,7 @@ class SentenciaWidget(QWidget):
         else:
             final_calif_str2 = "; ".join(calif_list[:-1]) + "; y " + calif_list[-1]
 
-        if calif_es_correcta:
+        if calificacion == "Correcta":
             subsuncion_line = (
                 "La subsunción legal propuesta por la Fiscalía al emitir sus conclusiones resulta correcta. "
                 "Dado que la subsunción legal propuesta por la Fiscalía coincide con la de la acusación base "
@@ -3651,21 +3513,22 @@ class SentenciaWidget(QWidget):
                 f"{salvedad_text}."
             )
 
-        plantilla += (
+        return (
             f"<p align='justify'>En función del modo en que se ha dado respuesta al primer interrogante, "
             f"{final_calif_str2}. {subsuncion_line}</p>"
             f"<p align='justify'>Así respondo a la presente cuestión.</p>"
         )
 
-        plantilla += f"<p align='justify'><b>A LA TERCERA CUESTIÓN, {anchor(self.cargo_juez_en_mayusculas(), 'edit_cargo_juez', 'Cargo')} {juez_nombre.upper()} DIJO:</b></p>"
-
+    @memo_seccion
+    def _seccion_pena(self, n_imp, nombres, pautas, condenas):
+        final_names_list = _anclas_nombres(nombres)
         if n_imp == 1:
-            plantilla += (
+            plantilla = (
                 "<p align='justify'><b>1. Pena:</b> Para graduar la sanción a imponer, tengo en cuenta las pautas "
                 "objetivas y subjetivas de mensuración de la pena establecidas en los arts. 40 y 41 del CP.</p>"
             )
         else:
-            plantilla += (
+            plantilla = (
                 "<p align='justify'><b>1. Pena:</b> Para graduar las sanciones a imponer, tengo en cuenta las pautas "
                 "objetivas y subjetivas de mensuración de la pena establecidas en los arts. 40 y 41 del CP.</p>"
             )
@@ -3677,12 +3540,7 @@ class SentenciaWidget(QWidget):
             "en lo relativo a",
         ]
         valuation_verbs = ["estimo", "valoro", "pondero", "considero"]
-
-        for i, imp in enumerate(self.imputados):
-            nm = final_names_list[i]
-            pautas_str = (
-                imp["pautas"].property("html") or imp["pautas"].text()
-            ).strip()
+        for i, (nm, pautas_str) in enumerate(zip(final_names_list, pautas)):
             pautas_str = anchor(
                 pautas_str or "[pautas]",
                 f"edit_imp_pautas_{i}",
@@ -3691,14 +3549,10 @@ class SentenciaWidget(QWidget):
             intro = introductions[i % len(introductions)]
             verb = valuation_verbs[i % len(valuation_verbs)]
             if i == 0:
-                plantilla += (
-                    f"<p align='justify'>Así, {intro} {nm}, {verb} {pautas_str}.</p>"
-                )
+                plantilla += f"<p align='justify'>Así, {intro} {nm}, {verb} {pautas_str}.</p>"
             else:
                 capital_intro = intro[0].upper() + intro[1:]
-                plantilla += (
-                    f"<p align='justify'>{capital_intro} {nm}, {verb} {pautas_str}.</p>"
-                )
+                plantilla += f"<p align='justify'>{capital_intro} {nm}, {verb} {pautas_str}.</p>"
 
         introductions_2 = [
             "Asimismo,",
@@ -3706,11 +3560,10 @@ class SentenciaWidget(QWidget):
             "De igual manera,",
             "Del mismo modo,",
         ]
-
-        for i, imp in enumerate(self.imputados):
-            nm = final_names_list[i]
-            condena_text = strip_trailing_single_dot(imp["condena"].text().strip())
-            condena_anchor = anchor(condena_text, f"edit_imp_condena_{i}", "Condena")
+        for i, (nm, condena) in enumerate(zip(final_names_list, condenas)):
+            condena_anchor = anchor(
+                strip_trailing_single_dot(condena), f"edit_imp_condena_{i}", "Condena"
+            )
             if i == 0:
                 plantilla += (
                     f"<p align='justify'>Por ello, teniendo en especial consideración el límite máximo que "
@@ -3723,95 +3576,80 @@ class SentenciaWidget(QWidget):
             else:
                 intro2 = introductions_2[(i - 1) % len(introductions_2)]
                 plantilla += f"<p align='justify'>{intro2} corresponde imponerle a {nm} la pena de {condena_anchor}.</p>"
+        return plantilla
 
-        next_section = 2
+    @memo_seccion
+    def _seccion_decomiso(self, numero, html_decomiso):
+        html_decomiso = anchor(html_decomiso, "decomiso", None)
+        return f"<p align='justify'><b>{numero_romano(numero)}. Decomiso:</b> {html_decomiso}</p>"
 
-        if self.var_decomiso_option.currentText() == "Sí":
-            html_decomiso = anchor(
-                self.var_decomiso_text.property("html") or self.TEXTO_DECOMISO_DEFECTO,
-                "decomiso",
-                None,
-            )
-            plantilla += f"<p align='justify'><b>{numero_romano(next_section)}. Decomiso:</b> {html_decomiso}</p>"
-            next_section += 1
-
-        # Honorarios
+    @memo_seccion
+    def _seccion_honorarios(self, numero, nombres, sexos, defensores, tipos_def):
+        """(honorarios y/o tasa de justicia, cuántos puntos numerados ocupan)."""
         imputados_publicos = []
         sexos_publicos = []
         defensores_publicos = set()
         imputados_privados = []
-        for i, imp in enumerate(self.imputados):
-            nm = final_names_list[i]
-            tipo = imp["tipo_def"].currentText().strip().lower()
-            def_name = imp["defensor"].text().strip()
+        for nm, sexo, def_name, tipo in zip(_anclas_nombres(nombres), sexos, defensores, tipos_def):
             if tipo.startswith("púb"):
                 imputados_publicos.append(nm)
-                sexos_publicos.append(
-                    "M" if imp["sexo_cb"].currentText() == "M" else "F"
-                )
+                sexos_publicos.append("M" if sexo == "M" else "F")
                 if def_name:
                     defensores_publicos.add(def_name)
             else:
                 imputados_privados.append(nm)
 
+        plantilla = ""
+        usados = 0
         if imputados_publicos:
             lista_def_pub = sorted(defensores_publicos)
             if lista_def_pub:
                 nombres_defensa_publica = format_list_for_sentence(lista_def_pub)
             else:
                 nombres_defensa_publica = "la Asesoría Letrada"
-            cant_pub = len(imputados_publicos)
-            if cant_pub == 1:
+            if len(imputados_publicos) == 1:
                 if sexos_publicos[0] == "M":
                     phrase_al = "al imputado"
                     phrase_benef = "beneficiario"
                 else:
                     phrase_al = "a la imputada"
                     phrase_benef = "beneficiaria"
+            elif all(s == "F" for s in sexos_publicos):
+                phrase_al = "a las imputadas"
+                phrase_benef = "beneficiarias"
             else:
-                if all(s == "M" for s in sexos_publicos):
-                    phrase_al = "a los imputados"
-                    phrase_benef = "beneficiarios"
-                elif all(s == "F" for s in sexos_publicos):
-                    phrase_al = "a las imputadas"
-                    phrase_benef = "beneficiarias"
-                else:
-                    phrase_al = "a los imputados"
-                    phrase_benef = "beneficiarios"
+                phrase_al = "a los imputados"
+                phrase_benef = "beneficiarios"
             plantilla += (
-                f"<p align='justify'><b>{numero_romano(next_section)}. Honorarios y eximición de tasa de justicia:</b> "
+                f"<p align='justify'><b>{numero_romano(numero)}. Honorarios y eximición de tasa de justicia:</b> "
                 f"por otra parte, debe retribuirse la labor prestada por la defensa pública a cargo de "
                 f"{nombres_defensa_publica}, la que, conforme las reglas cualitativas del artículo 39 de la ley arancelaria, "
                 f"estimo adecuado fijar en la suma de 30 jus (arts. 24, 36, 39, 89, 90 y cc. Ley 9459), y a la vez eximir {phrase_al} "
                 f"del pago de la tasa de justicia por ser {phrase_benef} de la asistencia jurídica gratuita (art. 31 ley 7982).</p>"
             )
-            next_section += 1
+            usados += 1
 
         if imputados_privados:
-            cant_priv = len(imputados_privados)
-            verbo_abonar = "abone" if cant_priv == 1 else "abonen"
+            verbo_abonar = "abone" if len(imputados_privados) == 1 else "abonen"
             nombres_privados_str = format_list_for_sentence(imputados_privados)
             plantilla += (
-                f"<p align='justify'><b>{numero_romano(next_section)}. Tasa de justicia:</b> corresponde emplazar a {nombres_privados_str} "
+                f"<p align='justify'><b>{numero_romano(numero + usados)}. Tasa de justicia:</b> corresponde emplazar a {nombres_privados_str} "
                 f"para que, en el plazo de quince días desde que quede firme la presente sentencia, {verbo_abonar} la suma equivalente a 1,5 "
                 f"jus en concepto de Tasa de Justicia, bajo apercibimiento de certificarse su existencia y librarse título para su remisión "
                 f"a la Oficina de Tasa de Justicia del Área Administración del Poder Judicial a los fines de su ejecución (arts. 295 y cc "
                 f"del Código Tributario Provincial, ley 6006 y sus modificatorias).</p>"
             )
-            next_section += 1
+            usados += 1
+        return plantilla, usados
 
-        if self.var_restriccion_option.currentText() == "Sí":
-            html_restriccion = anchor(
-                self.var_restriccion_text.property("html")
-                or self.TEXTO_RESTRICCION_DEFECTO,
-                "restriccion",
-                None,
-            )
-            plantilla += f"<p align='justify'><b>{numero_romano(next_section)}. Restricción de contacto y acercamiento:</b> {html_restriccion}</p>"
-            next_section += 1
+    @memo_seccion
+    def _seccion_restriccion(self, numero, html_restriccion):
+        html_restriccion = anchor(html_restriccion, "restriccion", None)
+        return f"<p align='justify'><b>{numero_romano(numero)}. Restricción de contacto y acercamiento:</b> {html_restriccion}</p>"
 
-        caso_vf_lower = self.var_caso_vf.currentText().lower()
-        if caso_vf_lower in (
+    @memo_seccion
+    def _seccion_comunicaciones(self, numero, caso_vf, victima):
+        if caso_vf in (
             "violencia de género",
             "violencia de género doméstica",
             "violencia familiar",
@@ -3820,72 +3658,44 @@ class SentenciaWidget(QWidget):
         else:
             extra_ley = ""
 
-        victima_text = self.var_victima.text().strip()
-        if not victima_text:
+        if len([v for v in victima.split(",") if v.strip()]) <= 1:
             victims_pronoun = "la persona damnificada"
             require_phrase = "requerírsele"
             volunt_phrase = "manifieste su voluntad"
         else:
-            splitted = [v.strip() for v in victima_text.split(",") if v.strip()]
-            if len(splitted) <= 1:
-                victims_pronoun = "la persona damnificada"
-                require_phrase = "requerírsele"
-                volunt_phrase = "manifieste su voluntad"
-            else:
-                victims_pronoun = "las personas damnificadas"
-                require_phrase = "requerírseles"
-                volunt_phrase = "manifiesten su voluntad"
+            victims_pronoun = "las personas damnificadas"
+            require_phrase = "requerírseles"
+            volunt_phrase = "manifiesten su voluntad"
 
-        plantilla += (
-            f"<p align='justify'><b>{numero_romano(next_section)}. Comunicaciones:</b> finalmente, de conformidad a lo dispuesto "
+        # Mantener el cierre y título de “RESUELVO”
+        return (
+            f"<p align='justify'><b>{numero_romano(numero)}. Comunicaciones:</b> finalmente, de conformidad a lo dispuesto "
             f"por el art. 11 bis –penúltimo párrafo– de la Ley 24660{extra_ley}, así como por el art. 96 del CPP, debe informarse "
             f"lo resuelto a {victims_pronoun} y {require_phrase} que {volunt_phrase} en relación a las facultades que les corresponde "
             f"a partir del dictado de esta sentencia. También se deberá efectuar el cómputo de pena y formar el legajo de ejecución "
             f"(art. 4 del Acuerdo Reglamentario nº 896, Serie A, del Excmo. Tribunal Superior de Justicia) y, una vez que quede firme "
             f"la presente sentencia, oficiar al Registro Nacional de Reincidencia a los fines del art. 2° de la Ley 22117.</p>"
-        )
-        next_section += 1
-
-        # Mantener el cierre y título de “RESUELVO”
-        plantilla += (
             "<p align='justify'>Así respondo a la presente cuestión.</p>"
             "<p align='justify'>Por todo lo expuesto, y normas legales citadas, <b>RESUELVO:</b></p>"
         )
 
-        # ── Resuelvo ───────────────────────────────────────────
-        html_resuelvo = self.var_resuelvo.property("html") or ""
-        doc_tmp = QTextDocument();  doc_tmp.setHtml(html_resuelvo)
-        plain_resuelvo = doc_tmp.toPlainText().strip()
-
-        if not plain_resuelvo:
+    @memo_seccion
+    def _seccion_resuelvo(self, html_resuelvo):
+        if not html_a_texto(html_resuelvo).strip():
             resuelvo_anchor = anchor("[Editar resuelvo]", "resuelvo")
         else:
-            clean_inline = self._inline_with_paragraphs(html_resuelvo)
-            resuelvo_anchor = anchor_html(clean_inline, "resuelvo")
-
-        # ♦ cambio: lo metemos dentro de un <p>
-        plantilla += f"<p align='justify'>{resuelvo_anchor}</p>"
-
-        plantilla = f'<div style="text-align: justify;">{plantilla}</div>'
-
-        old_plain = self._prev_plain
-        plantilla = strip_trailing_single_dot(plantilla)
-        self.texto_plantilla.setHtml(plantilla)
-        self.texto_plantilla.setAlignment(Qt.AlignJustify)
-
-        new_plain = self.texto_plantilla.toPlainText()
-        if old_plain:
-            self._highlight_diff(old_plain, new_plain)
-        self._prev_plain = new_plain
-
-        QTimer.singleShot(
-            0, lambda: self.texto_plantilla.verticalScrollBar().setValue(pos)
-        )
-
-    def _sync_imp(self, idx: int, key: str, value: str):
-        while len(self.data.imputados) <= idx:
-            self.data.imputados.append({})
-        self.data.imputados[idx][key] = value.strip()
+            resuelvo_anchor = anchor_html(self._inline_with_paragraphs(html_resuelvo), "resuelvo")
+        return f"<p align='justify'>{resuelvo_anchor}</p>"
+
+    def _sync_imp(self, idx: int, key: str, value):
+        if isinstance(value, str):
+            value = value.strip()
+        setattr(self.data.imputado(idx), key, value)
+
+    def _sync_hecho(self, idx: int, clave: str):
+        if idx < len(self.hechos):
+            campo, valor = campo_hecho(self.hechos[idx], clave, limpiar=True)
+            setattr(self.data.hecho(idx), campo, valor)
 
 def confirm_and_quit(widget) -> None:
     """Muestra un QMessageBox; si el usuario acepta, cierra TODA la app."""
@@ -1,4 +1,4 @@
-from PySide6.QtWidgets import QComboBox, QSpinBox
+from PySide6.QtWidgets import QComboBox, QSpinBox, QLineEdit, QCheckBox, QAbstractButton
 
 class NoWheelComboBox(QComboBox):
     """QComboBox que ignora la rueda del rat\u00f3n cuando el desplegable est\u00e1 cerrado."""
@@ -14,3 +14,49 @@ class NoWheelSpinBox(QSpinBox):
 
     def wheelEvent(self, event):
         event.ignore()
+
+
+def leer_valor(widget):
+    """Valor «de modelo» de un widget de formulario (texto, opción o tildado)."""
+    if isinstance(widget, QLineEdit):
+        return widget.text()
+    if isinstance(widget, QComboBox):
+        return widget.currentText()
+    if isinstance(widget, QAbstractButton):
+        return widget.isChecked()
+    return None
+
+
+def poner_valor(widget, valor) -> bool:
+    """Escribe ``valor`` en el widget sólo si difiere; devuelve si cambió."""
+    if isinstance(widget, QLineEdit):
+        valor = valor or ""
+        if widget.text() != valor:
+            widget.setText(valor)
+            return True
+    elif isinstance(widget, QComboBox):
+        valor = valor or ""
+        if widget.currentText() != valor:
+            widget.setCurrentText(valor)
+            return widget.currentText() == valor   # un combo fijo puede rechazarlo
+    elif isinstance(widget, QAbstractButton):
+        if widget.isChecked() != bool(valor):
+            widget.setChecked(bool(valor))
+            return True
+    return False
+
+
+def reiniciar_valores(widgets: dict) -> None:
+    """Deja en blanco (sin emitir señales) los widgets de una sección reusada."""
+    for widget in widgets.values():
+        blocked = widget.blockSignals(True)
+        if isinstance(widget, QLineEdit):
+            widget.clear()
+            widget.setProperty("html", None)
+        elif isinstance(widget, QComboBox):
+            widget.setCurrentIndex(0)
+            if widget.isEditable():
+                widget.setEditText(widget.itemText(0))
+        elif isinstance(widget, QCheckBox):
+            widget.setChecked(False)
+        widget.blockSignals(blocked)